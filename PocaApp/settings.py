@@ -40,6 +40,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 세션/인증 미들웨어의 쿼리도 계측하도록 가장 먼저 실행
+    "poca.application.adapter.api.http.query_instrumentation.QueryInstrumentationMiddleware",
+    "poca.application.adapter.api.http.request_deadline.RequestDeadlineMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -91,6 +94,140 @@ DATABASES = {
 
 AUTH_USER_MODEL = "poca.User"
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+# 로컬 환경은 LocMemCache, 운영 환경에서는 여러 프로세스가 공유하는 캐시(redis 등)로 교체
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# 포토카드 판매 조회 캐시
+# 조회 결과는 프로세스의 오더북에서 채우므로 항상 프로세스 로컬 LRU에 저장한다.
+# 다른 프로세스의 판매 등록/거래 완료는 오더북 보정 주기(60초)와 TTL이 지난 이후에 반영된다.
+# BACKEND: 판매 정보 버전 카운터 저장소, local(프로세스 로컬 LRU) | django(CACHES["default"])
+POCA_SALE_CACHE = {
+    "BACKEND": "local",
+    "MAX_ENTRIES": 10000,
+    "TTL": 30,
+}
+
+# 인증된 유저(principal) 캐시, 인증된 요청마다 유저를 조회하지 않도록 user id로 캐시
+# BACKEND: local(프로세스 로컬 LRU) | django(CACHES["default"])
+#   변경된 유저는 변경한 프로세스에서만 캐시에서 삭제되므로, local은 다른 프로세스에서
+#   비밀번호 변경(세션 무효화)/비활성화/잔액 변경이 최대 TTL 동안 반영되지 않는다.
+#   여러 프로세스가 같은 캐시를 공유하도록 django를 기본으로 사용한다.
+# TTL: 캐시 항목 유지 시간(초), local 백엔드에서는 다른 프로세스의 변경이 반영되는 최대 시간
+POCA_PRINCIPAL_CACHE = {
+    "BACKEND": "django",
+    "MAX_ENTRIES": 10000,
+    "TTL": 30,
+}
+
+# 세션은 캐시에서 조회하고 DB에는 저장(write-through)만 하여, 캐시가 비워져도 로그인이 유지된다.
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+
+# 서명 토큰 인증, 세션 저장소 없이 access 토큰의 서명만 검증한다.
+# KEYS: 키 id별 HMAC 비밀키, 새 키를 추가하고 ACTIVE_KEY로 지정한 뒤 이전 키는 REFRESH_TTL 이후에 제거
+# ACCESS_TTL/REFRESH_TTL: 토큰 유효 시간(초), 폐기된 access 토큰은 다른 프로세스에서 ACCESS_TTL 동안 유효할 수 있다.
+# 폐기된 토큰은 DB(revoked_tokens)에 저장하고, 만료된 토큰은 purge_revoked_tokens 명령으로 주기적으로 삭제한다.
+POCA_TOKEN_AUTH = {
+    "KEYS": {"k1": SECRET_KEY},
+    "ACTIVE_KEY": "k1",
+    "ACCESS_TTL": 300,
+    "REFRESH_TTL": 14 * 24 * 60 * 60,
+}
+
+# 세션 인증을 먼저 확인하므로 인증되지 않은 요청의 응답(403)은 유지된다.
+REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "rest_framework.authentication.SessionAuthentication",
+        "poca.application.adapter.api.http.token_authentication.SignedTokenAuthentication",
+        "rest_framework.authentication.BasicAuthentication",
+    ],
+}
+
+# 포토카드별 최근 거래 링 버퍼
+# CAPACITY: 포토카드별로 유지하는 최근 거래 수, 더 많은 거래 조회는 DB에서 처리
+# MAX_CARDS: 버퍼를 유지하는 최대 포토카드 수, 넘으면 가장 오래 조회되지 않은 포토카드부터 축출
+# MAX_AGE: 다른 프로세스에서 완료된 거래를 반영하기 위해 버퍼를 다시 적재하는 주기(초)
+POCA_RECENT_TRADES = {
+    "CAPACITY": 10,
+    "MAX_CARDS": 10000,
+    "MAX_AGE": 60,
+}
+
+# 포토카드 구매 주문 매칭 엔진
+# WORKERS: 포토카드를 나누어 처리하는 워커 스레드 수 (0이면 요청 스레드에서 바로 처리)
+# BATCH_SIZE: 하나의 트랜잭션으로 처리하는 최대 매칭 요청 수
+POCA_MATCHING_ENGINE = {
+    "WORKERS": 4,
+    "BATCH_SIZE": 50,
+}
+
+# 포토카드 시세 구독(SSE)
+# INTERVAL: 포토카드별 변경을 모아서 전송하는 주기(초)
+# MAX_PENDING: 연결별 대기 알림 수, 넘으면 느린 구독자로 보고 연결을 종료
+# MAX_TRADES: 한 알림에 담는 포토카드별 최근 거래 수
+POCA_PRICE_FEED = {
+    "INTERVAL": 0.1,
+    "MAX_PENDING": 64,
+    "MAX_TRADES": 20,
+}
+
+# 요청별 SQL 계측 (쿼리 수, DB 실행 시간, 반복된 쿼리 형태, 가장 느린 쿼리)
+# HEADERS: 응답 헤더(X-DB-*)로 전달, 쿼리 형태가 노출되므로 개발 환경에서만 사용
+# LOG: 요청마다 구조화 로그(JSON)로 기록, 둘 다 False라면 미들웨어를 사용하지 않는다.
+# N_PLUS_ONE_THRESHOLD: 같은 형태의 쿼리가 이 횟수 이상 실행된 요청은 N+1로 보고 WARNING으로 기록
+POCA_QUERY_INSTRUMENTATION = {
+    "HEADERS": DEBUG,
+    "LOG": not DEBUG,
+    "N_PLUS_ONE_THRESHOLD": 5,
+}
+
+# 낙관적 락 충돌 재시도 (지수 백오프 + jitter)
+# MAX_ATTEMPTS: 최대 시도 횟수, BUDGET: 재시도 한번(run)의 처리 시간 예산(초)
+# REQUEST_BUDGET: 요청 하나의 모든 재시도가 공유하는 처리 시간 예산(초), None이라면 미들웨어를 사용하지 않는다.
+POCA_CONTENTION = {
+    "MAX_ATTEMPTS": 3,
+    "BUDGET": 0.5,
+    "REQUEST_BUDGET": 1.0,
+}
+
+# 메트릭 노출(/metrics, Prometheus text format)
+# ALLOWED_NETWORKS: 인증 없이 메트릭을 조회할 수 있는 네트워크(수집 서버), 그 외의 요청은 403
+POCA_METRICS = {
+    "ALLOWED_NETWORKS": ["127.0.0.0/8", "::1/128", "10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16"],
+}
+
+# 포토카드 이미지 저장소
+# BACKEND: local(로컬 파일시스템) | s3(S3 호환 저장소, boto3 필요)
+POCA_OBJECT_STORE = {
+    "BACKEND": "local",
+    "LOCAL_ROOT": str(BASE_DIR / "media" / "photo-cards"),
+    "LOCAL_BASE_URL": "/media/photo-cards/",
+    "S3_BUCKET": "photo-cards",
+    "S3_REGION": "ap-northeast-2",
+    "S3_ENDPOINT_URL": None,
+}
+
+# 포토카드 이미지 업로드
+# CHUNK_SIZE: 업로드 파일을 읽고 쓰는 단위, 업로드 처리 중 메모리 사용량은 파일 크기가 아닌 청크 크기로 제한된다.
+# WORKERS: 업로드 워커 스레드 수 (0이면 요청 스레드에서 바로 처리)
+# MAX_PENDING: 대기 가능한 최대 업로드 수, 넘으면 요청 스레드가 대기한다.
+# DERIVATIVE_WORKERS: 썸네일/미리보기 생성 프로세스 수 (Pillow 필요, 0이면 업로드 워커에서 바로 처리)
+POCA_IMAGE_UPLOAD = {
+    "CHUNK_SIZE": 256 * 1024,
+    "WORKERS": 4,
+    "MAX_PENDING": 64,
+    "DERIVATIVE_WORKERS": 2,
+}
+
+# 청크 크기보다 큰 업로드 파일은 메모리가 아닌 임시 파일에 기록
+FILE_UPLOAD_MAX_MEMORY_SIZE = POCA_IMAGE_UPLOAD["CHUNK_SIZE"]
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
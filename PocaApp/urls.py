@@ -16,7 +16,10 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
+from poca.application.adapter.api.http import metrics_views
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include("poca.urls")),
+    path("metrics", metrics_views.metrics_view, name="metrics"),
 ]
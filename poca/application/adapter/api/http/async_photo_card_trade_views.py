@@ -0,0 +1,150 @@
+import json
+from typing import AsyncIterator
+
+from asgiref.sync import sync_to_async
+from dependency_injector.wiring import Provide, inject
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+
+from poca.application.adapter.api.http.serializer.photo_card_trade_deserializer import OnSalePageDeSerializer, \
+    PhotoCardPriceFeedDeSerializer, encode_on_sale_cursor
+from poca.application.adapter.api.http.serializer.photo_card_trade_serializer import \
+    encode_photo_card_price_update, encode_photo_card_trade_on_sale, encode_photo_card_trade_on_sale_list, \
+    encode_photo_card_trade_recently_trade
+from poca.application.domain.model import photo_card_trade_result
+from poca.application.domain.model.photo_card import OnSaleQueryStrategy
+from poca.application.port.api.async_photo_card_trade_use_case import AsyncPhotoCardTradeUseCase
+from poca.application.port.api.photo_card_price_feed_use_case import PhotoCardPriceFeedLaggedException, \
+    PhotoCardPriceFeedUseCase, PhotoCardPriceSubscription
+
+
+def _json_response(data, status: int) -> JsonResponse:
+    # DRF JSONRenderer와 같이 유니코드를 escape하지 않는다.
+    return JsonResponse(data, status=status, safe=False, json_dumps_params={"ensure_ascii": False})
+
+
+class AsyncAuthenticatedView(View):
+    """
+    ASGI 조회 경로의 상위 View, 인증된 유저만 허용한다.
+    DRF APIView는 비동기 핸들러를 지원하지 않으므로 Django View를 사용하며 세션 인증만 지원한다.
+    """
+    use_case: AsyncPhotoCardTradeUseCase
+    http_method_names = ['get']
+
+    @inject
+    def __init__(self,
+                 async_photo_card_trade_use_case: AsyncPhotoCardTradeUseCase = Provide["async_photo_card_trade_use_case"],
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.use_case = async_photo_card_trade_use_case
+
+    async def dispatch(self, request, *args, **kwargs):
+        # 세션 유저 조회는 동기 ORM을 사용
+        if not await sync_to_async(lambda: request.user.is_authenticated)():
+            return _json_response({"detail": "자격 인증데이터(authentication credentials)가 제공되지 않았습니다."},
+                                  status=403)
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncPhotoCardTradeView(AsyncAuthenticatedView):
+    """
+    판매중인 포토카드 페이지 조회 (PhotoCardTradeAPIView.get)
+    """
+
+    async def get(self, request):
+        serializer = OnSalePageDeSerializer(data=request.GET)
+        if not serializer.is_valid():
+            return _json_response(serializer.errors, status=400)
+
+        query = serializer.create()
+        result = await self.use_case.on_sale_photo_card_page(OnSaleQueryStrategy.MIN_PRICE_RENEWAL_LATE_FIRST,
+                                                             cursor=query['cursor'], limit=query['limit'])
+        data = {
+            "results": encode_photo_card_trade_on_sale_list(result.records),
+            "next": encode_on_sale_cursor(result.next_cursor),
+        }
+        return _json_response(data, status=200)
+
+
+class AsyncPhotoCardDetailView(AsyncAuthenticatedView):
+    """
+    최근 판매된 포토카드 조회 (PhotoCardDetailAPIView.get)
+    """
+
+    async def get(self, request, card_id: int):
+        result = await self.use_case.get_recently_sold_photo_card(card_id=card_id)
+
+        response = None
+        match result:
+            case photo_card_trade_result.NoPhotoCardOnSaleResult():
+                response = _json_response({"message": result.to_message()}, status=404)
+            case photo_card_trade_result.PhotoCardTradeRecentlySoldResult():
+                response = _json_response(encode_photo_card_trade_recently_trade(result), status=200)
+
+        return response
+
+
+class AsyncPhotoCardMinPriceView(AsyncAuthenticatedView):
+    """
+    최저 가격 포토카드 조회 (PhotoCardMinPriceAPIView.get)
+    """
+
+    async def get(self, request, card_id: int):
+        result = await self.use_case.get_min_price_photo_card_on_sale(card_id=card_id)
+
+        response = None
+        match result:
+            case photo_card_trade_result.NoPhotoCardOnSaleResult():
+                response = _json_response(result.to_message(), status=404)
+            case photo_card_trade_result.PhotoCardTradeResultObject():
+                response = _json_response(encode_photo_card_trade_on_sale(result.record), status=200)
+
+        return response
+
+
+class AsyncPhotoCardPriceFeedView(AsyncAuthenticatedView):
+    """
+    포토카드 시세 구독 (Server-Sent Events)
+    구독한 포토카드의 최소 가격 매물과 완료된 거래를 price 이벤트로 전달한다. 첫 이벤트는 포토카드별 현재 최소 가격 매물이다.
+    알림을 제때 읽지 못하면 lagged 이벤트를 보내고 연결을 종료하므로, 클라이언트는 다시 연결한다.
+    :info: 연결마다 요청을 점유하므로 ASGI 서버에서만 사용한다.
+    """
+    # 프록시/로드밸런서가 유휴 연결을 끊지 않도록 주기적으로 주석 전송
+    keepalive = 15
+
+    @inject
+    def __init__(self,
+                 photo_card_price_feed: PhotoCardPriceFeedUseCase = Provide["photo_card_price_feed"],
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.price_feed = photo_card_price_feed
+
+    async def get(self, request):
+        serializer = PhotoCardPriceFeedDeSerializer(data=request.GET)
+        if not serializer.is_valid():
+            return _json_response(serializer.errors, status=400)
+
+        subscription = await self.price_feed.subscribe(serializer.create())
+        response = StreamingHttpResponse(self._stream(subscription), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # nginx 응답 버퍼링 해제
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def _stream(self, subscription: PhotoCardPriceSubscription) -> AsyncIterator[str]:
+        # 연결이 끊어지면 제너레이터가 닫히면서 구독을 해지한다.
+        try:
+            yield 'retry: 3000\n\n'
+            while True:
+                try:
+                    update = await subscription.get(timeout=self.keepalive)
+                except PhotoCardPriceFeedLaggedException:
+                    yield 'event: lagged\ndata: {}\n\n'
+                    return
+                if update is None:
+                    yield ': keepalive\n\n'
+                    continue
+                data = json.dumps(encode_photo_card_price_update(update), ensure_ascii=False, separators=(',', ':'))
+                yield f'event: price\ndata: {data}\n\n'
+        finally:
+            subscription.close()
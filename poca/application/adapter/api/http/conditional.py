@@ -0,0 +1,41 @@
+import hashlib
+from functools import wraps
+
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+# 프록시는 저장한 응답을 매번 ETag로 재검증(no-cache)하며, 인증은 재검증 요청마다 view에서 처리된다.
+CACHE_CONTROL = 'public, no-cache'
+
+
+def conditional_get(handler):
+    """
+    APIView GET 핸들러의 조건부 요청(If-None-Match) 처리 데코레이터
+    ETag는 실제로 응답한 본문(렌더링 결과)의 해시이므로, 프로세스마다 다른 오더북/최근 거래 버퍼에서 응답하더라도
+    본문이 바뀌었다면 304를 반환하지 않는다. 본문이 같다면 304로 본문 전송만 생략한다.
+    인증/권한 확인 이후(APIView.initial)에 호출되므로 인증되지 않은 요청은 304를 받을 수 없다.
+    """
+    @wraps(handler)
+    def wrapper(view, request: Request, *args, **kwargs):
+        response = handler(view, request, *args, **kwargs)
+        if response.status_code != status.HTTP_200_OK or not isinstance(response, Response):
+            return response
+
+        # If-None-Match는 weak 비교 (W/ 접두어 무시)
+        etags = [e.removeprefix('W/') for e in parse_etags(request.headers.get('If-None-Match', ''))]
+
+        def tag_rendered(rendered: Response):
+            tag = quote_etag(hashlib.sha1(rendered.content).hexdigest())
+            if tag in etags or '*' in etags:
+                rendered = HttpResponseNotModified()
+            rendered['ETag'] = tag
+            rendered['Cache-Control'] = CACHE_CONTROL
+            return rendered
+
+        # 본문은 APIView.finalize_response 이후에 선택된 renderer로 렌더링된다.
+        response.add_post_render_callback(tag_rendered)
+        return response
+    return wrapper
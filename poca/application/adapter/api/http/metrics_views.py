@@ -0,0 +1,28 @@
+import ipaddress
+from typing import List
+
+from dependency_injector.wiring import Provide, inject
+from django.http import HttpResponse, HttpResponseForbidden, HttpResponseNotAllowed
+
+from poca.application.util.metrics import MetricsRegistry
+
+
+@inject
+def metrics_view(request,
+                 registry: MetricsRegistry = Provide["metrics_registry"],
+                 allowed_networks: List[str] = Provide["config.metrics.allowed_networks"]):
+    """
+    Prometheus text format 메트릭 노출, 인증 없이 허용된 네트워크(settings.POCA_METRICS)에서만 조회할 수 있다.
+    :info: 리버스 프록시 뒤에서는 REMOTE_ADDR이 프록시 주소이므로 프록시에서 /metrics 경로를 차단해야 한다.
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+
+    try:
+        address = ipaddress.ip_address(request.META.get('REMOTE_ADDR', ''))
+    except ValueError:
+        return HttpResponseForbidden()
+    if not any(address in ipaddress.ip_network(network) for network in allowed_networks):
+        return HttpResponseForbidden()
+
+    return HttpResponse(registry.expose(), content_type=MetricsRegistry.CONTENT_TYPE)
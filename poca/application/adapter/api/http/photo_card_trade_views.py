@@ -1,16 +1,25 @@
 from dependency_injector.wiring import Provide, inject
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from poca.application.adapter.api.http.conditional import conditional_get
+from poca.application.adapter.api.http.renderer import FastJSONRenderer
 from poca.application.adapter.api.http.serializer.photo_card_trade_deserializer import \
-    RegisterPhotoCardTradeDeSerializer, BuyPhotoCardTradeDeSerializer
-from poca.application.adapter.api.http.serializer.photo_card_trade_serializer import PhotoCardTradeOnSaleListSerializer, \
-    PhotoCardTradeRecentlyTradeListSerializer
+    RegisterPhotoCardTradeDeSerializer, BuyPhotoCardTradeDeSerializer, BuyBestPhotoCardTradeDeSerializer, \
+    CheckoutPhotoCardTradeDeSerializer, \
+    OnSalePageDeSerializer, PhotoCardPriceCandleDeSerializer, PlacePhotoCardBidDeSerializer, RegisterPhotoCardTradeBulkDeSerializer, \
+    encode_on_sale_cursor
+from poca.application.adapter.api.http.serializer.photo_card_trade_serializer import PhotoCardPriceCandleListSerializer, \
+    encode_photo_card_trade_on_sale, encode_photo_card_trade_on_sale_list, encode_photo_card_trade_recently_trade
 from poca.application.domain.model import photo_card_trade_result
 from poca.application.domain.model.photo_card import OnSaleQueryStrategy
-from poca.application.port.api.command.photo_card_trade_command import RegisterPhotoCardOnSaleCommand
+from poca.application.port.api.command.photo_card_trade_command import PlacePhotoCardBidCommand, \
+    RegisterPhotoCardOnSaleCommand
+from poca.application.port.api.photo_card_bid_use_case import PhotoCardBidUseCase
+from poca.application.port.api.photo_card_price_candle_use_case import PhotoCardPriceCandleUseCase
 from poca.application.port.api.photo_card_trade_use_case import PhotoCardTradeUseCase
 
 
@@ -18,6 +27,7 @@ class PhotoCardTradeAPIView(APIView):
     use_case: PhotoCardTradeUseCase
     http_method_names = ['get', 'post']  # 리스트 조회, 판매 등록
     permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     # 의존성 주입
     @inject
@@ -27,8 +37,12 @@ class PhotoCardTradeAPIView(APIView):
         super().__init__(*args, **kwargs)
         self.use_case = photo_card_trade_use_case
 
+    # 응답 본문이 바뀌지 않았다면 304 응답
+    @conditional_get
     def get(self, request):
-        result = self.use_case.on_sale_photo_card(OnSaleQueryStrategy.MIN_PRICE_RENEWAL_LATE_FIRST)
+        query = self._read_page_query(request)
+        result = self.use_case.on_sale_photo_card_page(OnSaleQueryStrategy.MIN_PRICE_RENEWAL_LATE_FIRST,
+                                                       cursor=query['cursor'], limit=query['limit'])
         return self._build_response(result)
 
     def post(self, request):
@@ -40,8 +54,14 @@ class PhotoCardTradeAPIView(APIView):
     def _build_response(self, result: photo_card_trade_result.PhotoCardTradeResult) -> Response:
         response = None
         match result:
+            case photo_card_trade_result.PhotoCardTradeOnSalePageResult():
+                data = {
+                    "results": encode_photo_card_trade_on_sale_list(result.records),
+                    "next": encode_on_sale_cursor(result.next_cursor),
+                }
+                response = Response(data=data, status=200)
             case list():
-                data = PhotoCardTradeOnSaleListSerializer(result, many=True).data
+                data = encode_photo_card_trade_on_sale_list(result)
                 response = Response(data=data, status=200)
             case photo_card_trade_result.PhotoCardSaleRegisterFailResult():
                 response = Response(data={"message": result.to_message()}, status=400)
@@ -57,11 +77,65 @@ class PhotoCardTradeAPIView(APIView):
 
         return serializer.create()
 
+    # query string을 페이지 조회 조건으로 변환
+    def _read_page_query(self, request) -> dict:
+        serializer = OnSalePageDeSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.create()
+
+
+class PhotoCardTradeBulkAPIView(APIView):
+    """
+    포토카드 판매 일괄 등록 API View
+    항목별 등록 결과를 요청 순서대로 반환하며, 일부 항목이 실패하면 207 응답
+    """
+    use_case: PhotoCardTradeUseCase
+    http_method_names = ['post']  # 판매 일괄 등록
+    permission_classes = [IsAuthenticated]
+
+    @inject
+    def __init__(self,
+                 photo_card_trade_use_case: PhotoCardTradeUseCase = Provide["photo_card_trade_use_case"],
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_case = photo_card_trade_use_case
+
+    def post(self, request):
+        commands, errors = self._read_commands(request)
+        results = {index: {"index": index, "status": 400, "message": error} for index, error in errors}
+        if commands:
+            result = self.use_case.register_photo_card_on_sale_bulk([command for _, command in commands])
+            for (index, _), item in zip(commands, result.results):
+                results[index] = self._build_item(index, item)
+
+        data = {"results": [results[index] for index in sorted(results)]}
+        all_registered = all(item["status"] == 201 for item in data["results"])
+        return Response(data=data, status=status.HTTP_201_CREATED if all_registered else status.HTTP_207_MULTI_STATUS)
+
+    @staticmethod
+    def _build_item(index: int, result: photo_card_trade_result.PhotoCardTradeResult) -> dict:
+        item = None
+        match result:
+            case photo_card_trade_result.PhotoCardSaleRegisteredResult():
+                item = {"index": index, "status": 201, "message": result.to_message(), "record_id": result.record_id}
+            case photo_card_trade_result.PhotoCardSaleRegisterFailResult():
+                item = {"index": index, "status": 400, "message": result.to_message()}
+
+        return item
+
+    def _read_commands(self, request) -> tuple:
+        serializer = RegisterPhotoCardTradeBulkDeSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.create()
+
 
 class PhotoCardDetailAPIView(APIView):
     use_case: PhotoCardTradeUseCase
     http_method_names = ['get']  # 최근 판매된 포토카드 조회
     permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     @inject
     def __init__(self,
@@ -70,6 +144,7 @@ class PhotoCardDetailAPIView(APIView):
         super().__init__(*args, **kwargs)
         self.use_case = photo_card_trade_use_case
 
+    @conditional_get
     def get(self, request, card_id: int):
         result = self.use_case.get_recently_sold_photo_card(card_id=card_id)
         return self._build_response(result)
@@ -80,7 +155,7 @@ class PhotoCardDetailAPIView(APIView):
             case photo_card_trade_result.NoPhotoCardOnSaleResult():
                 response = Response(data={"message": result.to_message()}, status=404)
             case photo_card_trade_result.PhotoCardTradeRecentlySoldResult():
-                data = PhotoCardTradeRecentlyTradeListSerializer(result).data
+                data = encode_photo_card_trade_recently_trade(result)
                 response = Response(data=data, status=200)
 
         return response
@@ -90,6 +165,7 @@ class PhotoCardMinPriceAPIView(APIView):
     use_case: PhotoCardTradeUseCase
     http_method_names = ['get']  # 최저 가격 포토카드 조회
     permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
     @inject
     def __init__(self,
@@ -98,6 +174,7 @@ class PhotoCardMinPriceAPIView(APIView):
         super().__init__(*args, **kwargs)
         self.use_case = photo_card_trade_use_case
 
+    @conditional_get
     def get(self, request, card_id: int):
         result = self.use_case.get_min_price_photo_card_on_sale(card_id=card_id)
         return self._build_response(result)
@@ -108,7 +185,39 @@ class PhotoCardMinPriceAPIView(APIView):
             case photo_card_trade_result.NoPhotoCardOnSaleResult():
                 response = Response(data=result.to_message(), status=404)
             case photo_card_trade_result.PhotoCardTradeResultObject():
-                data = PhotoCardTradeOnSaleListSerializer(result.record).data
+                data = encode_photo_card_trade_on_sale(result.record)
+                response = Response(data=data, status=200)
+
+        return response
+
+
+class PhotoCardPriceCandleAPIView(APIView):
+    use_case: PhotoCardPriceCandleUseCase
+    http_method_names = ['get']  # 포토카드 거래가 캔들 조회
+    permission_classes = [IsAuthenticated]
+
+    @inject
+    def __init__(self,
+                 photo_card_price_candle_use_case: PhotoCardPriceCandleUseCase = Provide[
+                     "photo_card_price_candle_use_case"],
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_case = photo_card_price_candle_use_case
+
+    def get(self, request, card_id: int):
+        serializer = PhotoCardPriceCandleDeSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(data=serializer.errors, status=400)
+        result = self.use_case.get_photo_card_price_candles(card_id, **serializer.create())
+        return self._build_response(result)
+
+    def _build_response(self, result: photo_card_trade_result.PhotoCardTradeResult) -> Response:
+        response = None
+        match result:
+            case photo_card_trade_result.NoPhotoCardOnSaleResult():
+                response = Response(data={"message": result.to_message()}, status=404)
+            case photo_card_trade_result.PhotoCardPriceCandleResult():
+                data = PhotoCardPriceCandleListSerializer(result).data
                 response = Response(data=data, status=200)
 
         return response
@@ -143,7 +252,8 @@ class PhotoCardPurchaseItemAPIView(APIView):
                 response = Response(data={"message": result.to_message()}, status=status.HTTP_417_EXPECTATION_FAILED)
             case photo_card_trade_result.PhotoCardTradeProcessedResult():
                 response = Response(data={"message": result.to_message()}, status=status.HTTP_200_OK)
-            case photo_card_trade_result.PhotoCardTradeNotProcessedResult():
+            case photo_card_trade_result.PhotoCardTradeNotProcessedResult() | \
+                    photo_card_trade_result.PhotoCardPurchaseNotProcessedResult():
                 response = Response(data={"message": result.to_message()}, status=status.HTTP_409_CONFLICT)
 
         return response
@@ -154,3 +264,110 @@ class PhotoCardPurchaseItemAPIView(APIView):
         serializer.is_valid(raise_exception=True)
 
         return serializer.create()
+
+
+class PhotoCardPurchaseBestItemAPIView(PhotoCardPurchaseItemAPIView):
+    """
+    포토카드 최저가 매물 구매 API View
+    매물 id 대신 포토카드 id를 받아 판매중인 가장 저렴한 매물을 구매한다.
+    """
+
+    def post(self, request):
+        command = self._read_command(request)
+        result = self.use_case.buy_min_price_photo_card(card_id=command['card_id'], buyer_id=command['buyer_id'])
+        return self._build_response(result)
+
+    def _read_command(self, request) -> dict:
+        serializer = BuyBestPhotoCardTradeDeSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.create()
+
+
+class PhotoCardCheckoutAPIView(APIView):
+    """
+    포토카드 일괄 구매 API View
+    모두 구매하면 200, 일부만 구매하면(BEST_EFFORT) 207, 구매한 항목이 없다면 409 응답
+    """
+    use_case: PhotoCardTradeUseCase
+    http_method_names = ['post']  # 일괄 구매
+    permission_classes = [IsAuthenticated]
+
+    @inject
+    def __init__(self,
+                 photo_card_trade_use_case: PhotoCardTradeUseCase = Provide["photo_card_trade_use_case"],
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_case = photo_card_trade_use_case
+
+    def post(self, request):
+        command = self._read_command(request)
+        result = self.use_case.checkout_photo_cards(record_ids=command['record_ids'], buyer_id=command['buyer_id'],
+                                                    mode=command['mode'])
+        return self._build_response(result)
+
+    def _build_response(self, result: photo_card_trade_result.PhotoCardTradeResult) -> Response:
+        response = None
+        match result:
+            case photo_card_trade_result.PhotoCardCheckoutResult():
+                checkout = result.checkout
+                data = {
+                    "message": result.to_message(),
+                    "total_price": checkout.total_price,
+                    "items": [{"record_id": purchase.record_id, "outcome": purchase.outcome.value}
+                              for purchase in checkout.purchases],
+                }
+                if checkout.is_all_purchased():
+                    response = Response(data=data, status=status.HTTP_200_OK)
+                elif checkout.purchased():
+                    response = Response(data=data, status=status.HTTP_207_MULTI_STATUS)
+                else:
+                    response = Response(data=data, status=status.HTTP_409_CONFLICT)
+            case photo_card_trade_result.PhotoCardTradeNotProcessedResult():
+                response = Response(data={"message": result.to_message()}, status=status.HTTP_409_CONFLICT)
+
+        return response
+
+    def _read_command(self, request) -> dict:
+        serializer = CheckoutPhotoCardTradeDeSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.create()
+
+
+class PhotoCardBidAPIView(APIView):
+    """
+    포토카드 구매 주문 API View
+    """
+    use_case: PhotoCardBidUseCase
+    http_method_names = ['post']  # 구매 주문 등록
+    permission_classes = [IsAuthenticated]
+
+    @inject
+    def __init__(self,
+                 photo_card_bid_use_case: PhotoCardBidUseCase = Provide["photo_card_bid_use_case"],
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_case = photo_card_bid_use_case
+
+    def post(self, request):
+        command = self._read_command(request)
+        result = self.use_case.place_photo_card_bid(command)
+        return self._build_response(result)
+
+    def _build_response(self, result: photo_card_trade_result.PhotoCardTradeResult) -> Response:
+        response = None
+        match result:
+            case photo_card_trade_result.PhotoCardBidPlaceFailResult():
+                response = Response(data={"message": result.to_message()}, status=status.HTTP_400_BAD_REQUEST)
+            case photo_card_trade_result.PhotoCardBidPlacedResult():
+                data = {"message": result.to_message(), "bid_id": result.bid_id}
+                response = Response(data=data, status=status.HTTP_202_ACCEPTED)
+
+        return response
+
+    def _read_command(self, request) -> PlacePhotoCardBidCommand:
+        serializer = PlacePhotoCardBidDeSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.create()
@@ -1,29 +1,39 @@
+from dependency_injector.wiring import Provide, inject
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from poca.application.adapter.spi.persistence.repository.photo_card_repository import PhotoCardRepository
+from poca.application.adapter.api.http.serializer.photo_card_deserializer import PhotoCardSearchDeSerializer
+from poca.application.adapter.api.http.serializer.photo_card_serializer import PhotoCardSearchHitSerializer
 from poca.application.port.api.command.photo_card_command import CreatePhotoCardCommand
+from poca.application.port.api.photo_card_search_use_case import PhotoCardSearchUseCase
+from poca.application.port.api.photo_card_use_case import PhotoCardUseCase
 
 
 class PhotoCardAPIView(APIView):
     """
-    PhotoCardTradeAPIView는 PhotoCardTradeUseCase를 사용하여 판매중인 포토카드 목록을 조회하는 APIView입니다.
+    PhotoCardAPIView는 PhotoCardUseCase를 사용하여 포토카드를 등록하는 APIView입니다.
     """
+    use_case: PhotoCardUseCase
     http_method_names = ['get', 'post']  # 리스트 조회, 판매 등록
     permission_classes = [IsAuthenticated]
 
-    def business_logic(self, cmd: CreatePhotoCardCommand):
+    # 의존성 주입
+    @inject
+    def __init__(self,
+                 photo_card_use_case: PhotoCardUseCase = Provide["photo_card_use_case"],
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_case = photo_card_use_case
+
+    def business_logic(self, cmd: CreatePhotoCardCommand) -> int:
         """
         포토카드 등록 비즈니스 로직을 수행합니다.
         :param cmd: CreatePhotoCardCommand 포토카드 등록 명령
-        :info 이미지 업로드는 celery를 사용하여 비동기로 처리할 수 있습니다.
+        :info 이미지 업로드는 응답 이후 백그라운드 워커에서 처리되고, image_url은 업로드가 끝나면 채워집니다.
         """
-        repo = PhotoCardRepository()
-
-        # todo: 이미지 업로드는 async로 처리
-        repo.register_new_photo_card(cmd)
+        return self.use_case.register_new_photo_card(cmd)
 
     def post(self, request):
         """
@@ -38,14 +48,41 @@ class PhotoCardAPIView(APIView):
             return Response({'status': 'error', 'message': 'All fields are required'},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        image_data = image_file.read()
-
+        # 파일 전체를 읽지 않고 청크 단위로 전달
         cmd = CreatePhotoCardCommand(
             name=request.data['name'],
             description=request.data['description'],
-            image_data=image_data,
+            image_chunks=image_file.chunks(),
+            content_type=getattr(image_file, 'content_type', None),
         )
 
         self.business_logic(cmd)
         return Response({'status': 'success', 'message': 'Photo card registered successfully'},
                         status=status.HTTP_201_CREATED)
+
+
+class PhotoCardSearchAPIView(APIView):
+    """
+    포토카드 이름/설명 검색 API View, 판매중인 최소 가격 매물을 함께 반환합니다.
+    """
+    use_case: PhotoCardSearchUseCase
+    http_method_names = ['get']  # 포토카드 검색
+    permission_classes = [IsAuthenticated]
+
+    @inject
+    def __init__(self,
+                 photo_card_search_use_case: PhotoCardSearchUseCase = Provide["photo_card_search_use_case"],
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_case = photo_card_search_use_case
+
+    def get(self, request):
+        serializer = PhotoCardSearchDeSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(data=serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        query = serializer.create()
+        hits = self.use_case.search_photo_cards(query)
+        return Response(data={
+            'query': query.normalized,
+            'results': PhotoCardSearchHitSerializer(hits, many=True).data,
+        }, status=status.HTTP_200_OK)
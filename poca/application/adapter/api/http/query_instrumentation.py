@@ -0,0 +1,82 @@
+import json
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db.backends.signals import connection_created
+
+from poca.application.util import query_profile
+from poca.application.util.query_profile import QueryProfile
+
+
+class QueryInstrumentationMiddleware:
+    """
+    요청별 SQL 계측 미들웨어
+    쿼리 수, DB 실행 시간, 반복된 쿼리 형태(N+1), 가장 느린 쿼리를 개발 환경에서는 응답 헤더(X-DB-*)로,
+    운영 환경에서는 구조화 로그로 전달한다. 설정은 settings.POCA_QUERY_INSTRUMENTATION
+    :info: 스트리밍 응답은 응답 헤더를 만들기 전까지 실행된 쿼리만 계측한다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, get_response):
+        config = settings.POCA_QUERY_INSTRUMENTATION
+        self.headers = config['HEADERS']
+        self.log = config['LOG']
+        self.n_plus_one_threshold = config['N_PLUS_ONE_THRESHOLD']
+        if not (self.headers or self.log):
+            raise MiddlewareNotUsed()
+
+        connection_created.connect(query_profile.install, dispatch_uid='poca_query_profile')
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with query_profile.profile_queries() as profile:
+            response = self.get_response(request)
+        self._report(request, response, profile)
+        return response
+
+    async def __acall__(self, request):
+        with query_profile.profile_queries() as profile:
+            response = await self.get_response(request)
+        self._report(request, response, profile)
+        return response
+
+    def _report(self, request, response, profile: QueryProfile) -> None:
+        duplicates = profile.duplicates()
+        if self.headers:
+            response['X-DB-Query-Count'] = str(profile.count)
+            response['X-DB-Time-Ms'] = f'{profile.duration * 1000:.3f}'
+            response['X-DB-Duplicate-Queries'] = str(sum(count - 1 for _, count in duplicates))
+            if profile.slowest_sql is not None:
+                response['X-DB-Slowest-Ms'] = f'{profile.slowest_duration * 1000:.3f}'
+                response['X-DB-Slowest-Query'] = _header_value(profile.slowest_sql)
+            if duplicates:
+                response['X-DB-Top-Duplicate'] = f'{duplicates[0][1]}x {_header_value(duplicates[0][0])}'
+
+        if self.log:
+            n_plus_one = bool(duplicates) and duplicates[0][1] >= self.n_plus_one_threshold
+            match = getattr(request, 'resolver_match', None)
+            payload = {
+                'method': request.method,
+                'path': request.path,
+                'route': match.route if match else None,
+                'status': response.status_code,
+                'n_plus_one': n_plus_one,
+                **profile.to_dict(),
+            }
+            # 반복된 쿼리가 N+1 기준 이상이라면 WARNING으로 기록
+            self.logger.log(logging.WARNING if n_plus_one else logging.INFO,
+                            json.dumps(payload, ensure_ascii=False), extra={'query_profile': payload})
+
+
+def _header_value(sql: str, limit: int = 200) -> str:
+    # 헤더 값은 한 줄의 latin-1 문자열만 허용
+    return sql[:limit].encode('ascii', 'backslashreplace').decode('ascii')
@@ -0,0 +1,32 @@
+import importlib.util
+
+from rest_framework.renderers import JSONRenderer
+
+# orjson이 설치되지 않은 환경에서는 DRF JSONRenderer로 처리
+orjson = importlib.import_module('orjson') if importlib.util.find_spec('orjson') else None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson으로 직렬화하는 JSONRenderer, 출력은 JSONRenderer(compact, UNICODE_JSON)와 같은 바이트이다.
+    orjson이 직접 처리하는 datetime/dataclass는 DRF JSONEncoder로 변환하여 형식을 유지하고,
+    들여쓰기를 요청하거나 orjson이 처리할 수 없는 값(64비트를 넘는 정수 등)은 JSONRenderer로 처리한다.
+    :info: float의 지수 표기(1e16, 1e+16)는 json 모듈과 다르므로 float이 없는 응답(판매 목록 등)에만 사용한다.
+    """
+    _options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS \
+        if orjson is not None else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or not self._is_default_format(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self._options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # JSONRenderer와 같이 \u2028, \u2029는 escape
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+    def _is_default_format(self, accepted_media_type, renderer_context) -> bool:
+        return (self.compact and not self.ensure_ascii and self.strict
+                and self.get_indent(accepted_media_type, renderer_context or {}) is None)
@@ -0,0 +1,34 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from poca.application.util.contention import deadline_scope
+
+
+class RequestDeadlineMiddleware:
+    """
+    요청별 처리 시간 예산 미들웨어
+    요청 안의 모든 낙관적 락 충돌 재시도(ContentionManager)가 하나의 예산(settings.POCA_CONTENTION["REQUEST_BUDGET"])을 공유하여
+    재시도 대기로 요청 스레드를 오래 점유하지 않는다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.budget = settings.POCA_CONTENTION['REQUEST_BUDGET']
+        if not self.budget:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with deadline_scope(self.budget):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with deadline_scope(self.budget):
+            return await self.get_response(request)
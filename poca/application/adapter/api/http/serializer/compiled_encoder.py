@@ -0,0 +1,100 @@
+import decimal
+from typing import Any, Callable, Dict, List
+
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+
+def compile_encoder(serializer_class: type, many: bool = False) -> Callable[[Any], Any]:
+    """
+    DRF Serializer 정의로 인코더 함수를 생성한다.
+    필드마다 get_attribute/to_representation을 호출하는 대신, 필드 목록을 펼친 함수 하나로 컴파일하여
+    도메인 객체를 serializer_class(instance).data와 같은 값으로 변환한다.
+    :param serializer_class: 인코딩 형식을 정의한 Serializer 클래스
+    :param many: True라면 목록을 인코딩하는 함수를 반환
+    :info: 속성으로 조회하는 도메인 객체(dataclass)만 지원하며, dict나 callable 속성은 Serializer를 사용해야 한다.
+    """
+    encode = _compile(serializer_class())
+    if not many:
+        return encode
+    return lambda instances: [encode(instance) for instance in instances]
+
+
+def _compile(serializer: serializers.Serializer) -> Callable[[Any], Dict[str, Any]]:
+    # to_representation을 재정의한 Serializer는 컴파일하지 않는다.
+    if type(serializer).to_representation is not serializers.Serializer.to_representation:
+        return serializer.to_representation
+
+    namespace: Dict[str, Any] = {}
+    lines: List[str] = ['def encode(obj):', '    ret = {}']
+    for i, field in enumerate(serializer._readable_fields):
+        if field.source == '*':
+            getter = 'obj'
+        elif len(field.source_attrs) == 1 and field.source_attrs[0].isidentifier():
+            getter = f'obj.{field.source_attrs[0]}'
+        else:
+            namespace[f'_get{i}'] = field.get_attribute
+            getter = f'_get{i}(obj)'
+        lines.append(f'    v = {getter}')
+        # Serializer.to_representation과 같이 None은 필드 변환 없이 None으로 인코딩
+        lines.append(f'    ret[{field.field_name!r}] = None if v is None else {_converter(serializer, field, i, namespace)}')
+    lines.append('    return ret')
+
+    exec(compile('\n'.join(lines), f'<compiled {type(serializer).__name__}>', 'exec'), namespace)
+    return namespace['encode']
+
+
+def _converter(serializer: serializers.Serializer, field: serializers.Field, i: int, namespace: Dict[str, Any]) -> str:
+    """
+    필드 값 v를 변환하는 표현식
+    """
+    field_type = type(field)
+    if field_type is serializers.IntegerField:
+        return 'int(v)'
+    if field_type is serializers.CharField:
+        return 'str(v)'
+    if field_type is serializers.DecimalField and (encoder := _decimal_encoder(field)) is not None:
+        namespace[f'_decimal{i}'] = encoder
+        return f'_decimal{i}(v)'
+    if field_type is serializers.SerializerMethodField:
+        namespace[f'_method{i}'] = getattr(serializer, field.method_name)
+        return f'_method{i}(v)'
+    if isinstance(field, serializers.ListSerializer) and type(field).to_representation is \
+            serializers.ListSerializer.to_representation and not isinstance(field.child, serializers.ListSerializer):
+        namespace[f'_child{i}'] = _compile(field.child) if isinstance(field.child, serializers.Serializer) \
+            else field.child.to_representation
+        return f'[_child{i}(item) for item in v]'
+    if isinstance(field, serializers.Serializer):
+        namespace[f'_nested{i}'] = _compile(field)
+        return f'_nested{i}(v)'
+
+    namespace[f'_field{i}'] = field.to_representation
+    return f'_field{i}(v)'
+
+
+def _decimal_encoder(field: serializers.DecimalField) -> Callable[[Any], str]:
+    """
+    DecimalField.to_representation과 같은 문자열 변환, 반올림 context는 한번만 생성한다.
+    문자열 이외의 형식(coerce_to_string=False, localize, normalize_output)은 None을 반환하여 필드 변환을 사용한다.
+    """
+    coerce_to_string = getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+    if not coerce_to_string or field.localize or field.normalize_output or field.decimal_places is None:
+        return None
+
+    exponent = decimal.Decimal('.1') ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    rounding = field.rounding
+    Decimal = decimal.Decimal
+    # 원 단위 정수 금액(Won)은 반올림 없이 그대로 출력
+    integral = field.decimal_places == 0
+
+    def encode(value) -> str:
+        if integral and type(value) is int:
+            return str(value)
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value).strip())
+        return f'{value.quantize(exponent, rounding=rounding, context=context):f}'
+
+    return encode
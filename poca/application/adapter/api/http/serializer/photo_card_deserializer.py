@@ -0,0 +1,24 @@
+from rest_framework import serializers
+
+from poca.application.domain.model.photo_card_search import PhotoCardSearchQuery, SearchOrder, tokenize
+
+
+class PhotoCardSearchDeSerializer(serializers.Serializer[PhotoCardSearchQuery]):
+    q = serializers.CharField(max_length=100)
+    limit = serializers.IntegerField(required=False, default=20, min_value=1, max_value=100)
+    order = serializers.ChoiceField(choices=[o.value for o in SearchOrder], required=False,
+                                   default=SearchOrder.RELEVANCE.value)
+    on_sale = serializers.BooleanField(required=False, default=False)
+
+    def validate_q(self, value):
+        if not tokenize(value):
+            raise serializers.ValidationError('검색어를 입력해야 합니다.')
+        return value
+
+    def create(self) -> PhotoCardSearchQuery:
+        return PhotoCardSearchQuery(
+            text=self.validated_data['q'],
+            limit=self.validated_data['limit'],
+            order=SearchOrder(self.validated_data['order']),
+            on_sale_only=self.validated_data['on_sale'],
+        )
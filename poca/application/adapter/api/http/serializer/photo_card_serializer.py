@@ -5,3 +5,16 @@ class PhotoCardSerializer(serializers.Serializer):
     id = serializers.IntegerField(read_only=True)
     name = serializers.CharField(max_length=255)
     description = serializers.CharField()
+    # 목록 응답에는 원본 대신 썸네일 url, 썸네일이 아직 없다면 원본 url
+    thumbnail_url = serializers.SerializerMethodField()
+
+    def get_thumbnail_url(self, photo_card):
+        return photo_card.thumbnail_url or photo_card.image_url or None
+
+
+class PhotoCardSearchHitSerializer(serializers.Serializer):
+    photo_card = PhotoCardSerializer()
+    score = serializers.IntegerField()
+    # 판매중인 매물이 없다면 null
+    min_price_record_id = serializers.IntegerField(allow_null=True)
+    min_total_price = serializers.DecimalField(max_digits=10, decimal_places=0, allow_null=True)
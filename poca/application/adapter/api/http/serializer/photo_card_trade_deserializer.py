@@ -1,6 +1,16 @@
+import base64
+import binascii
+import datetime
+import json
+from typing import List, Optional, Tuple
+
 from rest_framework import serializers
 
-from poca.application.port.api.command.photo_card_trade_command import RegisterPhotoCardOnSaleCommand
+from poca.application.domain.model.money import to_won
+from poca.application.domain.model.photo_card import CheckoutMode, OnSaleCursor
+from poca.application.domain.model.photo_card_price_candle import CandleResolution
+from poca.application.port.api.command.photo_card_trade_command import PlacePhotoCardBidCommand, \
+    RegisterPhotoCardOnSaleCommand
 
 
 class RegisterPhotoCardTradeDeSerializer(serializers.Serializer[RegisterPhotoCardOnSaleCommand]):
@@ -16,6 +26,27 @@ class RegisterPhotoCardTradeDeSerializer(serializers.Serializer[RegisterPhotoCar
         return RegisterPhotoCardOnSaleCommand(**self.validated_data)
 
 
+class RegisterPhotoCardTradeBulkDeSerializer(serializers.Serializer):
+    """
+    판매 일괄 등록 요청, 항목별로 검증하여 올바르지 않은 항목만 제외한다.
+    """
+    listings = serializers.ListField(child=serializers.DictField(), allow_empty=False, max_length=1000)
+
+    def create(self) -> Tuple[List[Tuple[int, RegisterPhotoCardOnSaleCommand]], List[Tuple[int, dict]]]:
+        """
+        :return: (요청 순서의 (index, command) 목록, (index, 검증 오류) 목록)
+        """
+        commands, errors = [], []
+        for index, listing in enumerate(self.validated_data['listings']):
+            serializer = RegisterPhotoCardTradeDeSerializer(data=listing, context=self.context)
+            if serializer.is_valid():
+                commands.append((index, serializer.create()))
+            else:
+                errors.append((index, serializer.errors))
+
+        return commands, errors
+
+
 class BuyPhotoCardTradeDeSerializer(serializers.Serializer):
     buyer_id = serializers.IntegerField(required=False)
     record_id = serializers.IntegerField()
@@ -25,3 +56,108 @@ class BuyPhotoCardTradeDeSerializer(serializers.Serializer):
         validated_data['buyer_id'] = self.context['request'].user.id
 
         return validated_data
+
+
+class BuyBestPhotoCardTradeDeSerializer(serializers.Serializer):
+    buyer_id = serializers.IntegerField(required=False)
+    card_id = serializers.IntegerField()
+
+    def create(self):
+        validated_data = self.validated_data
+        validated_data['buyer_id'] = self.context['request'].user.id
+
+        return validated_data
+
+
+class PlacePhotoCardBidDeSerializer(serializers.Serializer[PlacePhotoCardBidCommand]):
+    card_id = serializers.IntegerField()
+    buyer_id = serializers.IntegerField(required=False)
+    max_price = serializers.DecimalField(max_digits=10, decimal_places=0, min_value=1)
+
+    def create(self) -> PlacePhotoCardBidCommand:
+        validated_data = self.validated_data
+        validated_data['buyer_id'] = self.context['request'].user.id
+
+        return PlacePhotoCardBidCommand(**self.validated_data)
+
+
+class CheckoutPhotoCardTradeDeSerializer(serializers.Serializer):
+    buyer_id = serializers.IntegerField(required=False)
+    record_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=100)
+    mode = serializers.ChoiceField(choices=[mode.value for mode in CheckoutMode],
+                                   required=False, default=CheckoutMode.ALL_OR_NOTHING.value)
+
+    def create(self):
+        validated_data = self.validated_data
+        validated_data['buyer_id'] = self.context['request'].user.id
+        validated_data['mode'] = CheckoutMode(validated_data['mode'])
+
+        return validated_data
+
+
+def encode_on_sale_cursor(cursor: Optional[OnSaleCursor]) -> Optional[str]:
+    """
+    커서를 클라이언트에 전달할 불투명 문자열로 변환
+    """
+    if cursor is None:
+        return None
+    raw = json.dumps([str(cursor.total_price), cursor.renewal_date.isoformat(), cursor.id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+class OnSalePageDeSerializer(serializers.Serializer):
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(required=False, default=20, min_value=1, max_value=100)
+
+    def validate_cursor(self, value: str) -> OnSaleCursor:
+        try:
+            raw = base64.urlsafe_b64decode(value + '=' * (-len(value) % 4))
+            total_price, renewal_date, record_id = json.loads(raw)
+            cursor = OnSaleCursor(
+                total_price=to_won(total_price),
+                renewal_date=datetime.datetime.fromisoformat(renewal_date),
+                id=int(record_id),
+            )
+        except (binascii.Error, ValueError, TypeError):
+            raise serializers.ValidationError('올바르지 않은 커서입니다.')
+        # 정렬키(renewal_date)는 시간대가 있는 시각이므로 시간대가 없는 커서는 비교할 수 없다.
+        if cursor.renewal_date.tzinfo is None:
+            raise serializers.ValidationError('올바르지 않은 커서입니다.')
+        return cursor
+
+    def create(self) -> dict:
+        return {
+            'cursor': self.validated_data.get('cursor'),
+            'limit': self.validated_data['limit'],
+        }
+
+
+class PhotoCardPriceFeedDeSerializer(serializers.Serializer):
+    """
+    시세 구독 요청, card_id=1&card_id=2 형식으로 포토카드를 지정한다.
+    """
+    card_id = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=100)
+
+    def create(self) -> List[int]:
+        return self.validated_data['card_id']
+
+
+class PhotoCardPriceCandleDeSerializer(serializers.Serializer):
+    resolution = serializers.ChoiceField(choices=[r.value for r in CandleResolution], required=False,
+                                         default=CandleResolution.HOUR.value)
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+    limit = serializers.IntegerField(required=False, default=100, min_value=1, max_value=1000)
+
+    def validate(self, attrs):
+        if 'start' in attrs and 'end' in attrs and attrs['start'] >= attrs['end']:
+            raise serializers.ValidationError('start는 end보다 이전이어야 합니다.')
+        return attrs
+
+    def create(self) -> dict:
+        return {
+            'resolution': CandleResolution(self.validated_data['resolution']),
+            'start': self.validated_data.get('start'),
+            'end': self.validated_data.get('end'),
+            'limit': self.validated_data['limit'],
+        }
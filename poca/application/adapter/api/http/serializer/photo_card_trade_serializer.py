@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from poca.application.adapter.api.http.serializer.compiled_encoder import compile_encoder
 from poca.application.adapter.api.http.serializer.photo_card_serializer import PhotoCardSerializer
 
 
@@ -20,3 +21,41 @@ class PhotoCardTradeTradeListSerializer(serializers.Serializer):
 class PhotoCardTradeRecentlyTradeListSerializer(serializers.Serializer):
     photo_card = PhotoCardSerializer()
     photo_card_sales = PhotoCardTradeTradeListSerializer(many=True)
+
+
+# 목록 응답은 Serializer 필드 처리 대신 컴파일된 인코더를 사용, 출력은 Serializer(...).data와 같다.
+encode_photo_card_trade_on_sale = compile_encoder(PhotoCardTradeOnSaleListSerializer)
+encode_photo_card_trade_on_sale_list = compile_encoder(PhotoCardTradeOnSaleListSerializer, many=True)
+encode_photo_card_trade_recently_trade = compile_encoder(PhotoCardTradeRecentlyTradeListSerializer)
+
+
+class PhotoCardTradeCompletedSerializer(serializers.Serializer):
+    id = serializers.IntegerField(source='record_id')
+    price = serializers.DecimalField(max_digits=10, decimal_places=0)
+    fee = serializers.DecimalField(max_digits=10, decimal_places=0)
+    sold_date = serializers.DateTimeField()
+
+
+class PhotoCardPriceUpdateSerializer(serializers.Serializer):
+    card_id = serializers.IntegerField(source='photo_card_id')
+    min_price = PhotoCardTradeOnSaleListSerializer(allow_null=True)
+    trades = PhotoCardTradeCompletedSerializer(many=True)
+
+
+# 시세 알림은 구독자마다 전송되므로 컴파일된 인코더 사용
+encode_photo_card_price_update = compile_encoder(PhotoCardPriceUpdateSerializer)
+
+
+class PhotoCardPriceCandleSerializer(serializers.Serializer):
+    bucket = serializers.DateTimeField()
+    open = serializers.DecimalField(max_digits=10, decimal_places=0)
+    high = serializers.DecimalField(max_digits=10, decimal_places=0)
+    low = serializers.DecimalField(max_digits=10, decimal_places=0)
+    close = serializers.DecimalField(max_digits=10, decimal_places=0)
+    volume = serializers.IntegerField()
+
+
+class PhotoCardPriceCandleListSerializer(serializers.Serializer):
+    photo_card_id = serializers.IntegerField()
+    resolution = serializers.CharField(source='resolution.value')
+    candles = PhotoCardPriceCandleSerializer(many=True)
@@ -0,0 +1,58 @@
+import dataclasses
+
+from dependency_injector.wiring import Provide, inject
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+
+from poca.application.adapter.spi.cache.token_revocation_list import TokenRevocationList
+from poca.application.util.signed_token import InvalidTokenException, TokenSigner, TokenType
+
+
+@dataclasses.dataclass(frozen=True)
+class TokenPrincipal:
+    """
+    access 토큰으로 인증된 요청의 request.user, 유저 모델이 아니므로 id 외의 컬럼(잔액, 이메일 등)을 읽거나 저장할 수 없다.
+    잔액 등은 id로 레포지토리에서 조회해야 한다.
+    """
+    id: int
+
+    is_authenticated = True
+    is_anonymous = False
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """
+    Authorization: Bearer <access token> 인증, 세션 저장소와 DB를 조회하지 않고 서명만 검증한다.
+    request.user는 id만 가진 TokenPrincipal이다.
+    """
+    keyword = b'bearer'
+
+    @inject
+    def __init__(self,
+                 token_signer: TokenSigner = Provide["token_signer"],
+                 token_revocation_list: TokenRevocationList = Provide["token_revocation_list"]):
+        self.token_signer = token_signer
+        self.revocation_list = token_revocation_list
+
+    def authenticate(self, request):
+        header = get_authorization_header(request).split()
+        if not header or header[0].lower() != self.keyword:
+            return None
+        if len(header) != 2:
+            raise AuthenticationFailed('Invalid Authorization header')
+
+        try:
+            claims = self.token_signer.verify(header[1].decode('ascii'), TokenType.ACCESS)
+        except (InvalidTokenException, UnicodeDecodeError) as e:
+            raise AuthenticationFailed(str(e))
+        if self.revocation_list.is_revoked_locally(claims.jti):
+            raise AuthenticationFailed('Token has been revoked')
+
+        return TokenPrincipal(id=claims.user_id), claims
+
+    def authenticate_header(self, request):
+        return 'Bearer'
@@ -1,11 +1,15 @@
 import json
 
+from dependency_injector.wiring import Provide, inject
 from django.contrib.auth import authenticate, login
 from django.http import JsonResponse
 from django.middleware.csrf import get_token
 from django.views.decorators.csrf import csrf_exempt
+from rest_framework.authentication import get_authorization_header
 
+from poca.application.adapter.spi.cache.token_revocation_list import TokenRevocationList
 from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.util.signed_token import InvalidTokenException, TokenSigner, TokenType
 
 
 @csrf_exempt
@@ -54,3 +58,101 @@ def register_view(request):
         return JsonResponse({'status': 'success', 'message': 'User registered successfully'})
 
     return JsonResponse({'status': 'error', 'message': 'Invalid request method'}, status=400)
+
+
+@csrf_exempt
+@inject
+def token_view(request, token_signer: TokenSigner = Provide["token_signer"]):
+    """
+    세션 대신 서명 토큰 발급, access 토큰은 Authorization: Bearer 헤더로 전달한다.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'status': 'error', 'message': 'Invalid request method'}, status=400)
+    data = _read_json(request)
+    user_email = data.get('user_email')
+    password = data.get('password')
+
+    if not user_email or not password:
+        return JsonResponse({'status': 'error', 'message': 'Invalid request body'}, status=400)
+
+    user = authenticate(request, user_email=user_email, password=password)
+    if user is None or not user.is_active:
+        return JsonResponse({'status': 'error', 'message': 'Invalid credentials'}, status=400)
+    return _token_response(token_signer, user.id)
+
+
+@csrf_exempt
+@inject
+def token_refresh_view(request,
+                       token_signer: TokenSigner = Provide["token_signer"],
+                       token_revocation_list: TokenRevocationList = Provide["token_revocation_list"]):
+    """
+    refresh 토큰으로 토큰 재발급, 사용한 refresh 토큰은 폐기되어 다시 사용할 수 없다.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'status': 'error', 'message': 'Invalid request method'}, status=400)
+    try:
+        claims = token_signer.verify(_read_json(request).get('refresh_token') or '', TokenType.REFRESH)
+    except InvalidTokenException as e:
+        return JsonResponse({'status': 'error', 'message': str(e)}, status=401)
+
+    # 동시에 같은 refresh 토큰으로 요청해도 한번만 재발급
+    if token_revocation_list.is_revoked(claims.jti) or not token_revocation_list.revoke(claims.jti, claims.expires_at):
+        return JsonResponse({'status': 'error', 'message': 'Token has been revoked'}, status=401)
+    # 비활성화된 유저는 access 토큰 만료 이후 재발급 받을 수 없다.
+    if not User.objects.filter(id=claims.user_id, is_active=True).exists():
+        return JsonResponse({'status': 'error', 'message': 'Invalid credentials'}, status=401)
+    return _token_response(token_signer, claims.user_id)
+
+
+@csrf_exempt
+@inject
+def token_revoke_view(request,
+                      token_signer: TokenSigner = Provide["token_signer"],
+                      token_revocation_list: TokenRevocationList = Provide["token_revocation_list"]):
+    """
+    로그아웃, refresh 토큰과 Authorization 헤더의 access 토큰을 폐기한다.
+    """
+    if request.method != 'POST':
+        return JsonResponse({'status': 'error', 'message': 'Invalid request method'}, status=400)
+
+    tokens = [(_read_json(request).get('refresh_token'), TokenType.REFRESH)]
+    header = get_authorization_header(request).split()
+    if len(header) == 2 and header[0].lower() == b'bearer':
+        tokens.append((header[1].decode('ascii', 'ignore'), TokenType.ACCESS))
+
+    revoked = 0
+    for token, token_type in tokens:
+        try:
+            claims = token_signer.verify(token or '', token_type)
+        except InvalidTokenException:
+            continue
+        token_revocation_list.revoke(claims.jti, claims.expires_at)
+        revoked += 1
+
+    if not revoked:
+        return JsonResponse({'status': 'error', 'message': 'No valid token to revoke'}, status=400)
+    return JsonResponse({'status': 'success', 'message': 'Token revoked successfully'})
+
+
+def _token_response(token_signer: TokenSigner, user_id: int) -> JsonResponse:
+    access_token, _ = token_signer.issue(user_id, TokenType.ACCESS)
+    refresh_token, _ = token_signer.issue(user_id, TokenType.REFRESH)
+    return JsonResponse({
+        'status': 'success',
+        'token_type': 'Bearer',
+        'access_token': access_token,
+        'expires_in': token_signer.ttl(TokenType.ACCESS),
+        'refresh_token': refresh_token,
+    })
+
+
+def _read_json(request) -> dict:
+    """
+    JSON 요청 본문, 본문이 없거나 JSON 객체가 아니라면 빈 dict
+    """
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
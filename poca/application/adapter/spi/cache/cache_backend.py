@@ -0,0 +1,155 @@
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Protocol, Tuple
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """
+    캐시 적중/미스/축출 횟수
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CacheBackend(Protocol):
+    stats: CacheStats
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회, 없거나 만료된 경우 None
+        """
+        raise NotImplementedError()
+
+    def set(self, key: str, value: Any) -> None:
+        raise NotImplementedError()
+
+    def add(self, key: str, value: Any) -> bool:
+        """
+        키가 없을 때만 저장
+        :return: bool 저장 여부
+        """
+        raise NotImplementedError()
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError()
+
+    def incr(self, key: str) -> int:
+        """
+        값을 1 증가, 키가 없는 경우 ValueError
+        """
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        """
+        모든 항목 삭제
+        """
+        raise NotImplementedError()
+
+
+class LocalLRUCacheBackend(CacheBackend):
+    """
+    프로세스 로컬 LRU 캐시, 최대 갯수를 넘으면 가장 오래 사용되지 않은 항목부터 축출한다.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 30, clock: Callable[[], float] = time.monotonic):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._put(key, value)
+
+    def add(self, key: str, value: Any) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                return False
+            self._put(key, value)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                raise ValueError(f'Key {key} not found')
+            self._put(key, entry[1] + 1)
+            return entry[1] + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _put(self, key: str, value: Any) -> None:
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+
+class DjangoCacheBackend(CacheBackend):
+    """
+    Django 캐시 프레임워크 백엔드, 여러 프로세스가 같은 캐시(redis, memcached 등)를 공유할 때 사용한다.
+    로컬 환경에서는 settings.CACHES의 LocMemCache가 대신 사용된다.
+    """
+    _MISSING = object()
+
+    def __init__(self, alias: str = 'default', ttl: float = 30):
+        from django.core.cache import caches
+
+        self._cache = caches[alias]
+        self._ttl = ttl
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._cache.get(key, self._MISSING)
+        if value is self._MISSING:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._cache.set(key, value, self._ttl)
+
+    def add(self, key: str, value: Any) -> bool:
+        return self._cache.add(key, value, self._ttl)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def incr(self, key: str) -> int:
+        return self._cache.incr(key)
+
+    def clear(self) -> None:
+        # 같은 alias를 사용하는 다른 캐시 항목(세션 등)도 삭제된다.
+        self._cache.clear()
@@ -0,0 +1,66 @@
+import dataclasses
+from typing import Callable, List, Optional, TypeVar
+
+from poca.application.adapter.spi.cache.cache_backend import CacheBackend
+from poca.application.adapter.spi.cache.photo_card_sale_version import PhotoCardSaleVersion
+from poca.application.domain.model.photo_card import OnSaleCursor, OnSalePage, PhotoCard, PhotoCardSale
+from poca.application.port.spi.repository.product.find_photo_card_port import FindPhotoCardSalePort
+
+T = TypeVar('T')
+
+
+class CachedFindPhotoCardSalePort(FindPhotoCardSalePort):
+    """
+    포토카드 id 기준 조회 결과를 캐시하는 FindPhotoCardSalePort
+    캐시 키에 포토카드별 버전을 포함하여 판매 등록/거래 완료 이후에는 이전 결과가 조회되지 않는다.
+    구매 처리에 사용되는 판매 기록 단건 조회와 목록 조회는 캐시하지 않는다.
+    최근 거래 조회는 저장소의 최근 거래 링 버퍼에서 처리하므로 캐시하지 않는다.
+    :info: 조회 결과는 프로세스의 오더북에서 채우므로 backend는 프로세스 로컬 캐시를 사용해야 한다.
+           공유 캐시에 저장하면 다른 프로세스의 변경을 아직 보정하지 않은 오더북의 결과가 모든 프로세스에 조회된다.
+           다른 프로세스의 변경은 오더북 보정 주기와 TTL이 지난 이후에 반영된다.
+    :info: 캐시된 도메인 객체는 여러 요청이 공유하므로 복사본을 반환한다.
+    """
+    def __init__(self, delegate: FindPhotoCardSalePort, backend: CacheBackend, versions: PhotoCardSaleVersion):
+        self._delegate = delegate
+        self._backend = backend
+        self._versions = versions
+
+    def find_photo_card_renewal_old(self) -> List[PhotoCardSale]:
+        return self._delegate.find_photo_card_renewal_old()
+
+    def find_photo_card_renewal_old_page(self, cursor: Optional[OnSaleCursor], limit: int) -> OnSalePage:
+        return self._delegate.find_photo_card_renewal_old_page(cursor, limit)
+
+    def find_photo_card_by_card_id(self, card_id: int) -> Optional[PhotoCard]:
+        return self._read_through(card_id, 'card', lambda: self._delegate.find_photo_card_by_card_id(card_id))
+
+    def find_recently_sold_photo_card(self, card_id: int, number_of_cards: int = 5) -> List[PhotoCardSale]:
+        return self._delegate.find_recently_sold_photo_card(card_id, number_of_cards)
+
+    def find_sales_record_by_id(self, record_id: int) -> PhotoCardSale:
+        return self._delegate.find_sales_record_by_id(record_id)
+
+    def find_min_price_photo_card_on_sale(self, card_id: int) -> Optional[PhotoCardSale]:
+        return self._read_through(card_id, 'min-price',
+                                  lambda: self._delegate.find_min_price_photo_card_on_sale(card_id))
+
+    def _read_through(self, card_id: int, name: str, load: Callable[[], T]) -> T:
+        key = f'poca:sale:{card_id}:{self._versions.card_version(card_id)}:{name}'
+        # 조회 결과가 없는 경우(None)도 캐시할 수 있도록 튜플로 감싸서 저장
+        if (cached := self._backend.get(key)) is not None:
+            return self._copy(cached[0])
+
+        value = load()
+        self._backend.set(key, (value,))
+        return self._copy(value)
+
+    @staticmethod
+    def _copy(value: T) -> T:
+        # PhotoCard는 frozen이므로 그대로 반환, 판매 기록은 판매자/구매자까지 복사
+        if not isinstance(value, PhotoCardSale):
+            return value
+        return dataclasses.replace(
+            value,
+            seller=dataclasses.replace(value.seller) if value.seller is not None else None,
+            buyer=dataclasses.replace(value.buyer) if value.buyer is not None else None,
+        )
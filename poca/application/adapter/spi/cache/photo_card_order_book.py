@@ -0,0 +1,164 @@
+import bisect
+import dataclasses
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from poca.application.domain.model.photo_card import PhotoCardSale as PhotoCardSaleDomain
+
+# (photo_card_id, record_id, 정렬키(price, renewal_date, id), 도메인 객체)
+OrderBookEntry = Tuple[int, int, Tuple[Any, ...], PhotoCardSaleDomain]
+
+
+class PhotoCardOrderBook:
+    """
+    포토카드별 판매중 매물 오더북(메모리)
+    photo_card_id 별로 (price, renewal_date, id) 정렬키를 가진 정렬 리스트를 유지한다.
+    최초 조회시 DB에서 한번 적재하고 이후에는 저장/구매 시점에 갱신한다.
+    다른 프로세스에서 발생한 변경은 reconcile_interval 주기로 DB와 비교하여 보정한다.
+    """
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, reconcile_interval: float = 0):
+        self._lock = threading.RLock()
+        self._books: Dict[int, List[Tuple[Any, ...]]] = {}
+        self._records: Dict[int, PhotoCardSaleDomain] = {}
+        self._index: Dict[int, Tuple[int, Tuple[Any, ...]]] = {}
+        self._loaded = False
+        # 보정 중 DB 스냅샷을 읽는 동안 반영된 추가/삭제, 스냅샷으로 교체한 뒤 다시 반영한다.
+        self._journals: List[List[Tuple]] = []
+        self._reconcile_interval = reconcile_interval
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def ensure_loaded(self, loader: Callable[[], Iterable[OrderBookEntry]]) -> None:
+        """
+        오더북이 비어있다면 loader로 한번 적재한다.
+        :param loader: 판매중 매물 전체를 반환하는 함수
+        """
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._replace(loader())
+            self._loaded = True
+
+        if self._reconcile_interval > 0:
+            self._schedule_reconcile(loader)
+
+    def add(self, card_id: int, record_id: int, sort_key: Tuple[Any, ...], record: PhotoCardSaleDomain) -> None:
+        """
+        판매중 매물 추가, 이미 존재하는 매물이라면 정렬키를 갱신한다.
+        """
+        with self._lock:
+            if not self._loaded:
+                return
+            self._insert(card_id, record_id, sort_key, record)
+            for journal in self._journals:
+                journal.append((card_id, record_id, sort_key, record))
+
+    def remove(self, record_id: int) -> None:
+        """
+        판매 완료 등으로 더 이상 판매중이 아닌 매물 제거
+        """
+        with self._lock:
+            self._discard(record_id)
+            for journal in self._journals:
+                journal.append((record_id,))
+
+    def best(self, card_id: int) -> Optional[PhotoCardSaleDomain]:
+        """
+        포토카드의 최우선 매물(최소 가격, 리뉴얼이 오래된 순) 조회
+        """
+        with self._lock:
+            book = self._books.get(card_id)
+            if not book:
+                return None
+            return dataclasses.replace(self._records[book[0][-1]])
+
+    def best_of_each(self) -> List[PhotoCardSaleDomain]:
+        """
+        포토카드별 최우선 매물 목록 조회
+        """
+        with self._lock:
+            return [dataclasses.replace(self._records[book[0][-1]])
+                    for book in self._books.values() if book]
+
+    def reconcile(self, loader: Callable[[], Iterable[OrderBookEntry]]) -> int:
+        """
+        DB의 판매중 매물과 비교하여 오더북을 보정한다.
+        스냅샷을 읽는 동안 반영된 추가/삭제는 스냅샷보다 최신이므로 교체한 뒤 다시 반영한다.
+        :return: int 불일치가 발견된 포토카드 수
+        """
+        journal: List[Tuple] = []
+        with self._lock:
+            self._journals.append(journal)
+        try:
+            entries = list(loader())
+        finally:
+            with self._lock:
+                self._journals.remove(journal)
+
+        with self._lock:
+            current = self._books
+            self._replace(entries)
+            for change in journal:
+                if len(change) == 1:
+                    self._discard(change[0])
+                else:
+                    self._insert(*change)
+            drifted = sum(1 for card_id in current.keys() | self._books.keys()
+                          if current.get(card_id, []) != self._books.get(card_id, []))
+
+        if drifted:
+            self.logger.warning(f'PhotoCardOrderBook drift detected on {drifted} photo cards')
+        return drifted
+
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _replace(self, entries: Iterable[OrderBookEntry]) -> None:
+        self._books, self._records, self._index = {}, {}, {}
+        for card_id, record_id, sort_key, record in entries:
+            self._books.setdefault(card_id, []).append(sort_key)
+            self._records[record_id] = record
+            self._index[record_id] = (card_id, sort_key)
+        for book in self._books.values():
+            book.sort()
+
+    def _insert(self, card_id: int, record_id: int, sort_key: Tuple[Any, ...], record: PhotoCardSaleDomain) -> None:
+        self._discard(record_id)
+        bisect.insort(self._books.setdefault(card_id, []), sort_key)
+        self._records[record_id] = record
+        self._index[record_id] = (card_id, sort_key)
+
+    def _discard(self, record_id: int) -> None:
+        if record_id not in self._index:
+            return
+        card_id, sort_key = self._index.pop(record_id)
+        self._records.pop(record_id, None)
+        book = self._books[card_id]
+        position = bisect.bisect_left(book, sort_key)
+        if position < len(book) and book[position] == sort_key:
+            del book[position]
+        if not book:
+            del self._books[card_id]
+
+    def _schedule_reconcile(self, loader: Callable[[], Iterable[OrderBookEntry]]) -> None:
+        def run():
+            try:
+                self.reconcile(loader)
+            except Exception as e:
+                self.logger.error(f'PhotoCardOrderBook reconcile error: {e}')
+            finally:
+                self._schedule_reconcile(loader)
+
+        self._timer = threading.Timer(self._reconcile_interval, run)
+        self._timer.daemon = True
+        self._timer.start()
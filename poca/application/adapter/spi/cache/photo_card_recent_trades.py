@@ -0,0 +1,162 @@
+import bisect
+import datetime
+import decimal
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Iterable, List, NamedTuple, Optional
+
+from poca.application.domain.model.money import to_won
+from poca.application.domain.model.photo_card import PhotoCardSale as PhotoCardSaleDomain, PhotoCardState
+from poca.application.domain.model.photo_card_trade_event import PhotoCardSaleCompletedEvent, \
+    PhotoCardSaleRegisteredEvent
+from poca.application.port.spi.event.photo_card_trade_event_listener import PhotoCardTradeEventListener
+
+
+class RecentTrade(NamedTuple):
+    """
+    최근 거래 응답에 필요한 값만 담은 판매 기록
+    """
+    record_id: int
+    price: decimal.Decimal
+    fee: decimal.Decimal
+    sold_date: datetime.datetime
+
+    def to_domain(self, photo_card_id: int) -> PhotoCardSaleDomain:
+        return PhotoCardSaleDomain(
+            id=self.record_id,
+            state=PhotoCardState.SOLD,
+            price=to_won(self.price),
+            fee=to_won(self.fee),
+            renewal_date=None,
+            sold_date=str(self.sold_date),
+            photo_card_id=photo_card_id,
+        ).set_total_price()
+
+
+class _Buffer:
+    __slots__ = ('trades', 'loaded_at', 'appended')
+
+    def __init__(self):
+        # 거래 시각 순서, 가장 최근 거래가 마지막
+        self.trades: Optional[Deque[RecentTrade]] = None
+        self.loaded_at = 0.0
+        # 마지막으로 거래가 반영된 순번, 적재 중에 반영된 거래를 덮어쓰지 않기 위해 사용
+        self.appended = 0
+
+
+class PhotoCardRecentTrades(PhotoCardTradeEventListener):
+    """
+    포토카드별 최근 거래 링 버퍼(메모리)
+    포토카드별로 최근 capacity 건의 거래를 유지하며, 거래 완료 이벤트로 갱신한다.
+    버퍼가 없는 포토카드는 조회시 DB에서 적재하고, max_cards 개를 넘으면 가장 오래 조회되지 않은 포토카드부터 축출한다.
+    다른 프로세스에서 완료된 거래는 반영되지 않으므로 max_age 초가 지난 버퍼는 다시 적재한다.
+    """
+
+    def __init__(self, capacity: int = 10, max_cards: int = 10000, max_age: float = 60,
+                 clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self._max_cards = max_cards
+        self._max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buffers: OrderedDict[int, _Buffer] = OrderedDict()
+        self._sequence = 0
+
+    def recent(self, card_id: int, limit: int,
+               loader: Callable[[int], Iterable[RecentTrade]]) -> Optional[List[RecentTrade]]:
+        """
+        최근 거래를 최신순으로 조회, 버퍼가 없거나 오래되었다면 loader로 적재한다.
+        :param card_id: int
+        :param limit: int capacity 보다 크다면 None
+        :param loader: 포토카드의 최근 capacity 건의 거래를 반환하는 함수
+        :return: Optional[List[RecentTrade]]
+        """
+        if limit > self.capacity:
+            return None
+
+        with self._lock:
+            if (trades := self._peek(card_id, limit)) is not None:
+                return trades
+            since = self._sequence
+
+        trades = deque(sorted(loader(card_id), key=self._sort_key), maxlen=self.capacity)
+        with self._lock:
+            buffer = self._entry(card_id)
+            # 적재하는 동안 거래가 반영되었다면 적재 결과를 저장하지 않고 다음 조회에서 다시 적재한다.
+            if buffer.appended <= since:
+                buffer.trades = trades
+                buffer.loaded_at = self._clock()
+        return self._latest(trades, limit)
+
+    def peek(self, card_id: int, limit: int) -> Optional[List[RecentTrade]]:
+        """
+        적재되어 있는 경우에만 최근 거래를 최신순으로 조회 (DB 조회 없음)
+        :return: Optional[List[RecentTrade]] 버퍼가 없거나 오래되었다면 None
+        """
+        if limit > self.capacity:
+            return None
+        with self._lock:
+            return self._peek(card_id, limit)
+
+    def append(self, card_id: int, trade: RecentTrade) -> None:
+        """
+        완료된 거래 반영, 버퍼가 없는 포토카드는 다음 조회에서 적재한다.
+        """
+        with self._lock:
+            self._sequence += 1
+            buffer = self._entry(card_id)
+            buffer.appended = self._sequence
+            if buffer.trades is None:
+                return
+            if not buffer.trades or self._sort_key(trade) >= self._sort_key(buffer.trades[-1]):
+                buffer.trades.append(trade)
+            else:
+                # 커밋 순서와 거래 시각이 다른 경우
+                trades = list(buffer.trades)
+                bisect.insort(trades, trade, key=self._sort_key)
+                buffer.trades = deque(trades[-self.capacity:], maxlen=self.capacity)
+
+    def on_sale_registered(self, event: PhotoCardSaleRegisteredEvent) -> None:
+        pass
+
+    def on_sale_completed(self, event: PhotoCardSaleCompletedEvent) -> None:
+        if event.price is None or event.sold_date is None:
+            # 거래 정보가 없다면 다음 조회에서 다시 적재
+            self.invalidate(event.photo_card_id)
+            return
+        self.append(event.photo_card_id, RecentTrade(event.record_id, event.price, event.fee, event.sold_date))
+
+    def invalidate(self, card_id: int) -> None:
+        with self._lock:
+            self._sequence += 1
+            buffer = self._entry(card_id)
+            buffer.appended = self._sequence
+            buffer.trades = None
+
+    def _peek(self, card_id: int, limit: int) -> Optional[List[RecentTrade]]:
+        buffer = self._buffers.get(card_id)
+        if buffer is None or buffer.trades is None or self._expired(buffer):
+            return None
+        self._buffers.move_to_end(card_id)
+        return self._latest(buffer.trades, limit)
+
+    def _entry(self, card_id: int) -> _Buffer:
+        buffer = self._buffers.get(card_id)
+        if buffer is None:
+            buffer = self._buffers[card_id] = _Buffer()
+            while len(self._buffers) > self._max_cards:
+                self._buffers.popitem(last=False)
+        self._buffers.move_to_end(card_id)
+        return buffer
+
+    def _expired(self, buffer: _Buffer) -> bool:
+        return self._max_age > 0 and self._clock() - buffer.loaded_at >= self._max_age
+
+    @staticmethod
+    def _latest(trades: Deque[RecentTrade], limit: int) -> List[RecentTrade]:
+        return [trades[-i] for i in range(1, min(limit, len(trades)) + 1)]
+
+    @staticmethod
+    def _sort_key(trade: RecentTrade) -> tuple:
+        return trade.sold_date, trade.record_id
@@ -0,0 +1,42 @@
+import time
+
+from poca.application.adapter.spi.cache.cache_backend import CacheBackend
+from poca.application.domain.model.photo_card_trade_event import PhotoCardSaleCompletedEvent, \
+    PhotoCardSaleRegisteredEvent
+from poca.application.port.spi.event.photo_card_trade_event_listener import PhotoCardTradeEventListener
+
+
+class PhotoCardSaleVersion(PhotoCardTradeEventListener):
+    """
+    포토카드별 판매 정보 버전 카운터
+    판매 등록/거래 완료 시 버전을 올려 이전 버전으로 저장된 캐시 항목이 조회되지 않도록 한다.
+    버전이 만료/축출되더라도 이전 값과 겹치지 않도록 현재 시각(ns)으로 초기화한다.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self._backend = backend
+
+    def card_version(self, card_id: int) -> int:
+        key = self._key(card_id)
+        if (version := self._backend.get(key)) is None:
+            version = time.time_ns()
+            if not self._backend.add(key, version):
+                version = self._backend.get(key) or version
+        return version
+
+    def bump(self, card_id: int) -> None:
+        key = self._key(card_id)
+        try:
+            self._backend.incr(key)
+        except ValueError:
+            self._backend.set(key, time.time_ns())
+
+    def on_sale_registered(self, event: PhotoCardSaleRegisteredEvent) -> None:
+        self.bump(event.photo_card_id)
+
+    def on_sale_completed(self, event: PhotoCardSaleCompletedEvent) -> None:
+        self.bump(event.photo_card_id)
+
+    @staticmethod
+    def _key(card_id: int) -> str:
+        return f'poca:sale-version:{card_id}'
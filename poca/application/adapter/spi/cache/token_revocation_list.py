@@ -0,0 +1,57 @@
+import heapq
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from poca.application.port.spi.repository.token.find_revoked_token_port import FindRevokedTokenPort
+from poca.application.port.spi.repository.token.save_revoked_token_port import SaveRevokedTokenPort
+
+
+class TokenRevocationList:
+    """
+    폐기된 토큰 id(jti) 목록, 토큰은 만료되면 검증되지 않으므로 만료 시각까지만 유지한다.
+    access 토큰 검증은 프로세스 메모리만 조회하고(다른 프로세스에서 폐기된 access 토큰은 만료 시각까지 유효),
+    refresh 토큰은 DB에 저장된 폐기 목록도 조회하여 모든 프로세스에서 한번만 사용할 수 있다.
+    :info: 축출되는 캐시에 저장하면 축출된 refresh 토큰을 다시 사용할 수 있으므로 폐기 목록은 DB에 저장한다.
+    """
+
+    def __init__(self, find_port: FindRevokedTokenPort, save_port: SaveRevokedTokenPort,
+                 clock: Callable[[], float] = time.time):
+        self._find_port = find_port
+        self._save_port = save_port
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._revoked: Dict[str, int] = {}
+        # (만료 시각, jti) 최소 힙, 만료된 항목부터 삭제
+        self._expiry: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def revoke(self, jti: str, expires_at: int) -> bool:
+        """
+        :return: bool 이번 호출로 폐기되었는지 여부, 이미 폐기된 토큰이라면 False
+        """
+        self._revoke_locally(jti, expires_at)
+        return self._save_port.save_revoked_token(jti, expires_at)
+
+    def is_revoked_locally(self, jti: str) -> bool:
+        with self._lock:
+            return jti in self._revoked
+
+    def is_revoked(self, jti: str) -> bool:
+        if self.is_revoked_locally(jti):
+            return True
+        if (expires_at := self._find_port.find_revoked_token_expires_at(jti)) is None:
+            return False
+        self._revoke_locally(jti, expires_at)
+        return True
+
+    def _revoke_locally(self, jti: str, expires_at: int) -> None:
+        with self._lock:
+            now = self._clock()
+            while self._expiry and self._expiry[0][0] <= now:
+                self._revoked.pop(heapq.heappop(self._expiry)[1], None)
+            if expires_at > now and jti not in self._revoked:
+                self._revoked[jti] = expires_at
+                heapq.heappush(self._expiry, (expires_at, jti))
@@ -0,0 +1,50 @@
+from typing import Any, Dict, Optional
+
+from django.db import transaction
+
+from poca.application.adapter.spi.cache.cache_backend import CacheBackend, CacheStats
+
+
+class UserPrincipalCache:
+    """
+    인증된 유저(principal) 캐시, 요청마다 유저를 조회하지 않도록 principal 컬럼 값과 세션 검증 해시를 user id로 저장한다.
+    잔액은 저장하지 않으므로 거래로 잔액이 바뀌어도 삭제하지 않는다. 활성 상태/비밀번호가 바뀌면 커밋 이후에 항목을 삭제한다.
+    :info: 삭제는 변경한 프로세스의 백엔드에만 적용되므로, 프로세스 로컬 백엔드(LocalLRUCacheBackend)에서는
+           다른 프로세스의 비밀번호 변경/비활성화가 최대 TTL 동안 반영되지 않는다. (운영은 공유 백엔드 사용)
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self._backend = backend
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._backend.stats
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """
+        :return: Optional[Dict[str, Any]] {'fields': 컬럼(attname)별 값, 'session_auth_hash': 세션 검증 해시},
+                 없거나 만료된 경우 None
+        """
+        return self._backend.get(self._key(user_id))
+
+    def set(self, user_id: int, fields: Dict[str, Any]) -> None:
+        self._backend.set(self._key(user_id), fields)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        트랜잭션 안에서 호출되면 커밋 이후에 삭제하여, 커밋 전에 이전 값이 다시 저장되지 않도록 한다.
+        """
+        transaction.on_commit(lambda: self._backend.delete(self._key(user_id)))
+
+    def clear(self) -> None:
+        self._backend.clear()
+
+    def on_user_changed(self, sender, instance, **kwargs) -> None:
+        """
+        유저 post_save/post_delete 시그널 수신
+        """
+        self.invalidate(instance.pk)
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f'poca:principal:{user_id}'
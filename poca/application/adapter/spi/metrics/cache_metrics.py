@@ -0,0 +1,32 @@
+from typing import Iterable, Mapping, Tuple
+
+from poca.application.adapter.spi.cache.cache_backend import CacheBackend
+from poca.application.util.metrics import MetricsRegistry
+
+
+class CacheMetrics:
+    """
+    캐시 적중률 gauge, 수집할 때마다 캐시 백엔드의 지표(CacheStats)를 읽는다.
+    지표는 프로세스별로 집계되므로 공유 캐시(django)도 프로세스마다 따로 노출된다.
+    """
+
+    def __init__(self, registry: MetricsRegistry, backends: Mapping[str, CacheBackend]):
+        """
+        :param backends: 캐시 이름(cache label)별 백엔드
+        """
+        self._backends = backends
+        registry.gauge('poca_cache_hit_ratio', '캐시 적중률 (hits / (hits + misses))', ('cache',),
+                       self._collect_hit_ratio)
+        registry.gauge('poca_cache_events', '캐시 이벤트별 누적 횟수 (hit, miss, eviction)', ('cache', 'event'),
+                       self._collect_events)
+
+    def _collect_hit_ratio(self) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        for name, backend in self._backends.items():
+            yield (name,), backend.stats.hit_ratio
+
+    def _collect_events(self) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        for name, backend in self._backends.items():
+            stats = backend.stats
+            yield (name, 'hit'), stats.hits
+            yield (name, 'miss'), stats.misses
+            yield (name, 'eviction'), stats.evictions
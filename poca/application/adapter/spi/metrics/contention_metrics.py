@@ -0,0 +1,33 @@
+from typing import Iterable, Tuple
+
+from poca.application.util.contention import ContentionManager
+from poca.application.util.metrics import MetricsRegistry
+
+
+class ContentionMetrics:
+    """
+    낙관적 락 충돌 gauge, 수집할 때마다 충돌 관리자의 지표(ConflictMetrics)를 읽는다.
+    충돌이 많은 레코드는 label 수를 제한하기 위해 상위 top_records 개만 노출한다.
+    """
+
+    def __init__(self, registry: MetricsRegistry, manager: ContentionManager, top_records: int = 10):
+        self._metrics = manager.metrics
+        self._top_records = top_records
+        registry.gauge('poca_optimistic_lock_events', '낙관적 락 이벤트별 누적 횟수 (attempt, conflict, wait, give_up)',
+                       ('event',), self._collect_events)
+        registry.gauge('poca_optimistic_lock_wait_seconds', '낙관적 락 충돌 재시도 대기 누적 시간(초)', (),
+                       lambda: [((), self._metrics.totals().wait_seconds)])
+        registry.gauge('poca_optimistic_lock_record_conflicts', '충돌이 많은 레코드의 최근 충돌 횟수', ('key',),
+                       self._collect_records)
+
+    def _collect_events(self) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        totals = self._metrics.totals()
+        yield ('attempt',), totals.attempts
+        yield ('conflict',), totals.conflicts
+        yield ('wait',), totals.waits
+        yield ('give_up',), totals.give_ups
+
+    def _collect_records(self) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        for key, stats in self._metrics.most_conflicted(self._top_records):
+            if stats.conflicts:
+                yield (key,), stats.conflicts
@@ -0,0 +1,21 @@
+from poca.application.domain.model.photo_card_trade_result import PhotoCardTradeResult
+from poca.application.util.metrics import MetricsRegistry, instrument
+
+
+def instrumented_use_case(target, interface: type, registry: MetricsRegistry):
+    """
+    유즈케이스 메서드별 지연시간과 반환된 PhotoCardTradeResult 타입별 횟수를 기록하는 유즈케이스
+    """
+    latency = registry.histogram('poca_use_case_duration_seconds', '유즈케이스 메서드 처리 시간(초)',
+                                 ('component', 'method'))
+    results = registry.counter('poca_use_case_results', '유즈케이스 메서드가 반환한 결과 타입별 횟수',
+                               ('component', 'method', 'result'))
+    return instrument(target, interface, latency, results, PhotoCardTradeResult)
+
+
+def instrumented_port(target, interface: type, registry: MetricsRegistry):
+    """
+    포트 메서드별 지연시간을 기록하는 포트, 같은 객체가 여러 포트를 구현한다면 포트별로 감싼다.
+    """
+    latency = registry.histogram('poca_port_duration_seconds', '포트 호출 처리 시간(초)', ('component', 'method'))
+    return instrument(target, interface, latency)
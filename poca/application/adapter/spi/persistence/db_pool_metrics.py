@@ -0,0 +1,59 @@
+import sys
+from typing import Dict, Iterable, Tuple
+
+from poca.application.util.metrics import MetricsRegistry
+
+
+class DatabasePoolMetrics:
+    """
+    DB 커넥션 풀 gauge, 수집할 때마다 풀의 현재 상태를 읽는다.
+    django-db-connection-pool(SQLAlchemy QueuePool)과 Django postgresql 백엔드의 커넥션 풀(psycopg_pool)을 지원하며,
+    풀을 사용하지 않는 DB(sqlite 등)는 수집하지 않는다.
+    """
+
+    def __init__(self, registry: MetricsRegistry):
+        registry.gauge('poca_db_pool_size', 'DB 커넥션 풀에 열려 있는 커넥션 수', ('alias',),
+                       lambda: self._collect('size'))
+        registry.gauge('poca_db_pool_connections', 'DB 커넥션 풀의 상태별 커넥션 수 (checked_out, idle, overflow)',
+                       ('alias', 'state'), self._collect_connections)
+        registry.gauge('poca_db_pool_waiting', 'DB 커넥션 풀에서 커넥션을 기다리는 요청 수', ('alias',),
+                       lambda: self._collect('waiting'))
+
+    def _collect(self, key: str) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        for alias, stats in self.pool_stats().items():
+            if key in stats:
+                yield (alias,), stats[key]
+
+    def _collect_connections(self) -> Iterable[Tuple[Tuple[str, ...], float]]:
+        for alias, stats in self.pool_stats().items():
+            for state in ('checked_out', 'idle', 'overflow'):
+                if state in stats:
+                    yield (alias, state), stats[state]
+
+    @classmethod
+    def pool_stats(cls) -> Dict[str, Dict[str, float]]:
+        """
+        DB alias별 커넥션 풀 상태, 풀을 사용하는 백엔드 모듈이 로드되지 않았다면 조회하지 않는다.
+        """
+        stats = {}
+        # django-db-connection-pool: alias별 QueuePool
+        if (core := sys.modules.get('dj_db_conn_pool.core')) is not None:
+            for alias, pool in list(getattr(core, 'pool_container', {}).items()):
+                stats[alias] = queue_pool_stats(pool)
+        # Django postgresql 백엔드 OPTIONS["pool"]: alias별 psycopg_pool.ConnectionPool
+        if (base := sys.modules.get('django.db.backends.postgresql.base')) is not None:
+            for alias, pool in list(getattr(base.DatabaseWrapper, '_connection_pools', {}).items()):
+                stats[alias] = psycopg_pool_stats(pool)
+        return stats
+
+
+def queue_pool_stats(pool) -> Dict[str, float]:
+    checked_out = pool.checkedout()
+    idle = pool.checkedin()
+    return {'size': checked_out + idle, 'checked_out': checked_out, 'idle': idle, 'overflow': max(pool.overflow(), 0)}
+
+
+def psycopg_pool_stats(pool) -> Dict[str, float]:
+    stats = pool.get_stats()
+    size, idle = stats.get('pool_size', 0), stats.get('pool_available', 0)
+    return {'size': size, 'checked_out': size - idle, 'idle': idle, 'waiting': stats.get('requests_waiting', 0)}
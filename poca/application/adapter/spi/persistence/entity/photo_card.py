@@ -1,14 +1,22 @@
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
 
 from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.domain.model.money import to_won
 from poca.application.domain.model.photo_card import PhotoCard as PhotoCardDomain, PhotoCardState
 from poca.application.domain.model.photo_card import PhotoCardSale as PhotoCardSaleDomain
+from poca.application.domain.model.user import UserDomain
 
 
 class PhotoCard(models.Model):
     name = models.CharField(max_length=100)
     description = models.TextField()
     image_url = models.CharField(max_length=255, blank=True, null=True)
+    # 이미지 내용의 SHA-256, 같은 이미지는 한번만 저장한다.
+    image_hash = models.CharField(max_length=64, blank=True, null=True, db_index=True)
+    thumbnail_url = models.CharField(max_length=255, blank=True, null=True)
+    preview_url = models.CharField(max_length=255, blank=True, null=True)
     release_date = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -20,6 +28,8 @@ class PhotoCard(models.Model):
             name=self.name,
             description=self.description,
             image_url=self.image_url,
+            thumbnail_url=self.thumbnail_url,
+            preview_url=self.preview_url,
             release_date=str(self.release_date)
         )
 
@@ -47,18 +57,28 @@ class PhotoCardSale(models.Model):
         # 자주 조회되는 조건이므로 인덱스를 추가
         indexes = [
             models.Index(fields=['photo_card', 'price', 'renewal_date']),
+            # 판매중 목록 keyset 페이지네이션 정렬키 (total_price, renewal_date, id)
+            models.Index(
+                F('price') + F('fee'), Coalesce('renewal_date', 'create_date'), F('id'),
+                name='photo_card_sale_on_sale_page',
+                condition=Q(state='판매중'),
+            ),
         ]
 
-    def to_domain(self):
+    def to_domain(self, photo_card: PhotoCardDomain = None, seller: UserDomain = None, buyer: UserDomain = None):
+        """
+        도메인 객체로 변환, 미리 조회된 연관 도메인 객체가 주어지면 지연 로딩 없이 사용한다.
+        """
         return PhotoCardSaleDomain(
             id=self.id,
-            photo_card=self.photo_card.to_domain(),
+            photo_card=photo_card or self.photo_card.to_domain(),
             state=PhotoCardState(self.state),
-            price=self.price,
-            fee=self.fee,
-            seller=self.seller.to_domain(),
-            buyer=self.buyer.to_domain() if self.buyer else None,
+            price=to_won(self.price),
+            fee=to_won(self.fee),
+            seller=seller or self.seller.to_domain(),
+            buyer=buyer or (self.buyer.to_domain() if self.buyer_id else None),
             create_date=str(self.create_date),
             renewal_date=str(self.renewal_date),
-            sold_date=str(self.sold_date)
+            sold_date=str(self.sold_date),
+            version=self.version
         )
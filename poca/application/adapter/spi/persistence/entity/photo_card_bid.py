@@ -0,0 +1,45 @@
+from django.db import models
+from django.db.models import Q
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard, PhotoCardSale
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.domain.model.money import to_won
+from poca.application.domain.model.photo_card_bid import PhotoCardBid as PhotoCardBidDomain, PhotoCardBidState
+
+
+class PhotoCardBid(models.Model):
+    STATE_CHOICES = {
+        ('대기', 'Open'),
+        ('체결', 'Filled'),
+        ('취소', 'Cancelled'),
+    }
+
+    photo_card = models.ForeignKey(PhotoCard, on_delete=models.CASCADE)
+    buyer = models.ForeignKey(User, related_name='bids', on_delete=models.CASCADE)
+    max_price = models.DecimalField(max_digits=10, decimal_places=0)
+    state = models.CharField(max_length=10, choices=STATE_CHOICES, default='대기')
+    # 체결된 판매 기록
+    record = models.ForeignKey(PhotoCardSale, related_name='bids', on_delete=models.SET_NULL, null=True, blank=True)
+    create_date = models.DateTimeField(auto_now_add=True)
+    filled_date = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'photo_card_bids'
+
+        # 매칭 엔진이 포토카드별 대기 주문을 적재할 때 사용
+        indexes = [
+            models.Index(fields=['photo_card', 'create_date'], name='photo_card_bid_open',
+                         condition=Q(state='대기')),
+        ]
+
+    def to_domain(self):
+        return PhotoCardBidDomain(
+            id=self.id,
+            photo_card_id=self.photo_card_id,
+            buyer_id=self.buyer_id,
+            max_price=to_won(self.max_price),
+            state=PhotoCardBidState(self.state),
+            create_date=str(self.create_date),
+            record_id=self.record_id,
+            filled_date=str(self.filled_date) if self.filled_date else None,
+        )
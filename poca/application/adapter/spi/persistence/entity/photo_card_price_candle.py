@@ -0,0 +1,49 @@
+from django.db import models
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard
+from poca.application.domain.model.money import to_won
+from poca.application.domain.model.photo_card_price_candle import CandleResolution, \
+    PhotoCardPriceCandle as PhotoCardPriceCandleDomain
+
+
+class PhotoCardPriceCandle(models.Model):
+    RESOLUTION_CHOICES = {
+        ('1m', 'Minute'),
+        ('1h', 'Hour'),
+        ('1d', 'Day'),
+    }
+
+    photo_card = models.ForeignKey(PhotoCard, on_delete=models.CASCADE)
+    resolution = models.CharField(max_length=2, choices=RESOLUTION_CHOICES)
+    # 구간 시작 시각
+    bucket = models.DateTimeField()
+    open = models.DecimalField(max_digits=10, decimal_places=0)
+    high = models.DecimalField(max_digits=10, decimal_places=0)
+    low = models.DecimalField(max_digits=10, decimal_places=0)
+    close = models.DecimalField(max_digits=10, decimal_places=0)
+    volume = models.PositiveIntegerField(default=0)
+    # 시가/종가를 결정한 거래 시각, 거래가 늦게 반영되어도 시가/종가 순서를 유지하기 위해 사용
+    open_at = models.DateTimeField()
+    close_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'photo_card_price_candles'
+
+        # 포토카드/해상도별 구간 조회와 거래 반영시 구간 조회에 사용
+        constraints = [
+            models.UniqueConstraint(fields=['photo_card', 'resolution', 'bucket'], name='photo_card_price_candle_bucket'),
+        ]
+
+    def to_domain(self):
+        return PhotoCardPriceCandleDomain(
+            photo_card_id=self.photo_card_id,
+            resolution=CandleResolution(self.resolution),
+            bucket=self.bucket,
+            open=to_won(self.open),
+            high=to_won(self.high),
+            low=to_won(self.low),
+            close=to_won(self.close),
+            volume=self.volume,
+            open_at=self.open_at,
+            close_at=self.close_at,
+        )
@@ -0,0 +1,19 @@
+from django.db import models
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard
+
+
+class PhotoCardSearchGram(models.Model):
+    """
+    포토카드 이름/설명의 글자 n-gram 역색인, 포토카드 등록시 함께 저장된다.
+    """
+    gram = models.CharField(max_length=2)
+    photo_card = models.ForeignKey(PhotoCard, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = 'photo_card_search_grams'
+
+        # n-gram으로 포토카드를 찾으므로 gram을 선행 컬럼으로 사용
+        constraints = [
+            models.UniqueConstraint(fields=['gram', 'photo_card'], name='photo_card_search_gram'),
+        ]
@@ -0,0 +1,18 @@
+from django.db import models
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard
+
+
+class PhotoCardSearchText(models.Model):
+    """
+    n-gram 색인과 같은 방식으로 정규화(NFKC, casefold)한 포토카드 이름/설명, 포토카드 등록시 함께 저장된다.
+    색인으로 찾은 후보 포토카드는 원본 컬럼 대신 정규화된 컬럼으로 다시 확인한다.
+    """
+    photo_card = models.OneToOneField(PhotoCard, primary_key=True, related_name='search_text',
+                                      on_delete=models.CASCADE)
+    # NFKC 정규화로 길어질 수 있으므로(예: '㈜' -> '(주)') 길이를 제한하지 않는다.
+    name = models.TextField()
+    description = models.TextField()
+
+    class Meta:
+        db_table = 'photo_card_search_texts'
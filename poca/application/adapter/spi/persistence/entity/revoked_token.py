@@ -0,0 +1,18 @@
+from django.db import models
+
+
+class RevokedToken(models.Model):
+    """
+    폐기된 서명 토큰 id(jti), 모든 프로세스가 공유하며 토큰 만료 시각까지 유지한다.
+    """
+    jti = models.CharField(max_length=64, primary_key=True)
+    # 토큰 만료 시각(epoch 초)
+    expires_at = models.BigIntegerField()
+
+    class Meta:
+        db_table = 'revoked_tokens'
+
+        # 만료된 토큰 삭제에 사용
+        indexes = [
+            models.Index(fields=['expires_at'], name='revoked_token_expires_at'),
+        ]
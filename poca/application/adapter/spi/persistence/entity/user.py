@@ -1,6 +1,7 @@
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.db import models
 
+from poca.application.domain.model.money import to_won
 from poca.application.domain.model.user import UserDomain
 
 
@@ -35,14 +36,24 @@ class User(AbstractBaseUser, PermissionsMixin):
     objects = UserManager()
 
     USERNAME_FIELD = 'user_email'
+    # principal 캐시에 저장하는 컬럼(attname), 비밀번호 해시와 잔액은 저장하지 않는다.
+    PRINCIPAL_FIELDS = ('id', 'user_email', 'is_active', 'is_admin', 'is_staff', 'is_superuser', 'last_login')
+
+    # principal 캐시에서 만든 유저의 세션 검증 해시, password 컬럼을 조회하지 않기 위해 사용
+    cached_session_auth_hash = None
 
     def __str__(self):
         return self.user_email
 
+    def get_session_auth_hash(self):
+        if self.cached_session_auth_hash is not None:
+            return self.cached_session_auth_hash
+        return super().get_session_auth_hash()
+
     def to_domain(self):
         return UserDomain(
             user_id=self.id,
             email=self.user_email,
-            balance=self.balance,
+            balance=to_won(self.balance),
             active=self.is_active
         )
@@ -0,0 +1,68 @@
+from typing import List, Optional
+
+from asgiref.sync import sync_to_async
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard, PhotoCardSale
+from poca.application.adapter.spi.persistence.repository.photo_card_sale_loader import PhotoCardSaleLoader
+from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
+from poca.application.domain.model.photo_card import PhotoCard as PhotoCardDomain
+from poca.application.domain.model.photo_card import PhotoCardSale as PhotoCardSaleDomain
+from poca.application.domain.model.photo_card import OnSaleCursor, OnSalePage, PhotoCardState
+from poca.application.port.spi.repository.product.async_find_photo_card_port import AsyncFindPhotoCardSalePort
+
+
+class AsyncPhotoCardSaleRepository(
+    PhotoCardSaleRepository,
+    AsyncFindPhotoCardSalePort
+):
+    """
+    Django async ORM(aget, afirst, async for)을 사용하는 판매 기록 조회 레포지토리
+    조회 쿼리와 오더북, 최근 거래 링 버퍼 처리는 PhotoCardSaleRepository와 공유한다.
+    """
+
+    async def afind_photo_card_renewal_old_page(self, cursor: Optional[OnSaleCursor], limit: int) -> OnSalePage:
+        # 동기 조회와 같이 오더북이 주입되어도 정렬키 인덱스로 조회
+        sales, next_cursor = self._split_on_sale_page(
+            [sale async for sale in self._on_sale_page_query(cursor, limit)], limit)
+        return OnSalePage(
+            records=[record.set_total_price() for record in await PhotoCardSaleLoader().aload(sales)],
+            next_cursor=next_cursor,
+        )
+
+    async def afind_photo_card_by_card_id(self, card_id: int) -> Optional[PhotoCardDomain]:
+        try:
+            return (await PhotoCard.objects.aget(id=card_id)).to_domain()
+        except PhotoCard.DoesNotExist:
+            return None
+
+    async def afind_recently_sold_photo_card(self, card_id: int, number_of_cards: int = 5) -> List[PhotoCardSaleDomain]:
+        if self._recent_trades is not None and number_of_cards <= self._recent_trades.capacity:
+            # 버퍼에 있다면 이벤트 루프에서 바로 반환, 없다면 적재만 스레드에서 실행
+            trades = self._recent_trades.peek(card_id, number_of_cards)
+            if trades is None:
+                trades = await sync_to_async(self._recent_trades.recent)(
+                    card_id, number_of_cards, self._recent_trades_snapshot)
+            return [trade.to_domain(card_id) for trade in trades]
+
+        result = PhotoCardSale.objects.filter(
+            photo_card_id=card_id,
+            sold_date__isnull=False).order_by('-sold_date')[:number_of_cards]
+
+        return [record.set_total_price()
+                for record in await PhotoCardSaleLoader().aload([sale async for sale in result])]
+
+    async def afind_min_price_photo_card_on_sale(self, card_id: int) -> Optional[PhotoCardSaleDomain]:
+        if self._order_book is not None:
+            await self._aensure_order_book_loaded()
+            return self._order_book.best(card_id)
+
+        sale = await PhotoCardSale.objects.select_related('photo_card', 'seller', 'buyer').filter(
+            photo_card_id=card_id,
+            state=PhotoCardState.ON_SALE.value
+        ).order_by('price').afirst()
+        return sale.to_domain() if sale else None
+
+    async def _aensure_order_book_loaded(self) -> None:
+        # 최초 적재만 동기 ORM을 사용하므로 스레드에서 실행하고, 이후 조회는 메모리에서 처리
+        if not self._order_book.loaded:
+            await sync_to_async(self._order_book.ensure_loaded)(self._order_book_snapshot)
@@ -0,0 +1,57 @@
+import logging
+from typing import List, Optional
+
+from django.db import IntegrityError
+from django.utils.timezone import now
+
+from poca.application.adapter.spi.persistence.entity.photo_card_bid import PhotoCardBid
+from poca.application.domain.model.photo_card_bid import PhotoCardBid as PhotoCardBidDomain, PhotoCardBidState
+from poca.application.port.spi.repository.bid.find_photo_card_bid_port import FindPhotoCardBidPort
+from poca.application.port.spi.repository.bid.save_photo_card_bid_port import SavePhotoCardBidPort
+
+
+class PhotoCardBidRepository(
+    FindPhotoCardBidPort,
+    SavePhotoCardBidPort
+):
+    logger = logging.getLogger(__name__)
+
+    def find_open_photo_card_bids(self, card_id: int) -> List[PhotoCardBidDomain]:
+        bids = PhotoCardBid.objects.filter(
+            photo_card_id=card_id,
+            state=PhotoCardBidState.OPEN.value
+        ).order_by('create_date', 'id')
+
+        return [bid.to_domain() for bid in bids]
+
+    def save_photo_card_bid(self, bid: PhotoCardBidDomain) -> Optional[PhotoCardBidDomain]:
+        try:
+            entity = PhotoCardBid.objects.create(
+                photo_card_id=bid.photo_card_id,
+                buyer_id=bid.buyer_id,
+                max_price=bid.max_price,
+                state=PhotoCardBidState.OPEN.value,
+            )
+            return entity.to_domain()
+        except IntegrityError:
+            self.logger.error(f'PhotoCardBid save error {bid}')
+            return None
+
+    def fill_photo_card_bid(self, bid_id: int, record_id: int) -> bool:
+        # 대기 상태 조건으로 갱신하므로 이미 처리된 주문은 다시 체결되지 않는다.
+        updated_count = PhotoCardBid.objects.filter(
+            id=bid_id,
+            state=PhotoCardBidState.OPEN.value
+        ).update(
+            state=PhotoCardBidState.FILLED.value,
+            record_id=record_id,
+            filled_date=now()
+        )
+        return updated_count > 0
+
+    def cancel_photo_card_bid(self, bid_id: int) -> bool:
+        updated_count = PhotoCardBid.objects.filter(
+            id=bid_id,
+            state=PhotoCardBidState.OPEN.value
+        ).update(state=PhotoCardBidState.CANCELLED.value)
+        return updated_count > 0
@@ -0,0 +1,117 @@
+import datetime
+import functools
+import operator
+from typing import Dict, Iterable, List, Optional
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Greatest, Least
+from django.utils.timezone import localtime
+
+from poca.application.adapter.spi.persistence.entity.photo_card_price_candle import PhotoCardPriceCandle
+from poca.application.domain.model.money import Won
+from poca.application.domain.model.photo_card_price_candle import CandleResolution, \
+    PhotoCardPriceCandle as PhotoCardPriceCandleDomain
+from poca.application.port.spi.repository.candle.find_photo_card_price_candle_port import \
+    FindPhotoCardPriceCandlePort
+from poca.application.port.spi.repository.candle.record_photo_card_price_candle_port import \
+    RecordPhotoCardPriceCandlePort
+
+
+class PhotoCardPriceCandleRepository(
+    FindPhotoCardPriceCandlePort,
+    RecordPhotoCardPriceCandlePort
+):
+    """
+    거래 완료시 해상도별 캔들을 갱신하므로 거래가 이력 조회는 판매 기록(photo_card_sales)을 조회하지 않는다.
+    """
+
+    def find_photo_card_price_candles(self, card_id: int, resolution: CandleResolution,
+                                      start: Optional[datetime.datetime] = None,
+                                      end: Optional[datetime.datetime] = None,
+                                      limit: int = 100) -> List[PhotoCardPriceCandleDomain]:
+        candles = PhotoCardPriceCandle.objects.filter(photo_card_id=card_id, resolution=resolution.value)
+        if start is not None:
+            candles = candles.filter(bucket__gte=start)
+        if end is not None:
+            candles = candles.filter(bucket__lt=end)
+
+        return [candle.to_domain() for candle in reversed(candles.order_by('-bucket')[:limit])]
+
+    def record_photo_card_trade(self, photo_card_id: int, price: Won, traded_at: datetime.datetime) -> None:
+        """
+        거래가 속한 구간의 캔들을 갱신하고, 구간의 첫 거래라면 캔들을 생성한다.
+        모든 해상도의 캔들이 있다면 한번의 UPDATE로 처리한다.
+        """
+        local = localtime(traded_at)
+        buckets = {resolution: resolution.floor(local) for resolution in CandleResolution}
+
+        # 거래 완료 커밋 이후에 호출되므로 캔들 행 락은 이 짧은 트랜잭션 동안만 유지된다.
+        # (이미 트랜잭션 안이라면 savepoint를 만들지 않고 참여)
+        with transaction.atomic(savepoint=False):
+            self._record(photo_card_id, buckets, price, traded_at)
+
+    def _record(self, photo_card_id: int, buckets: Dict[CandleResolution, datetime.datetime],
+                price: Won, traded_at: datetime.datetime) -> None:
+        updated_count = self._merge(photo_card_id, buckets, price, traded_at)
+        if updated_count == len(buckets):
+            return
+
+        existing = set(self._buckets(photo_card_id, buckets).values_list('resolution', flat=True))
+        for resolution, bucket in buckets.items():
+            if resolution.value in existing:
+                continue
+            try:
+                with transaction.atomic():
+                    self._create(PhotoCardPriceCandleDomain.first_trade(
+                        photo_card_id, resolution, price, traded_at, bucket=bucket))
+            except IntegrityError:
+                # 다른 트랜잭션이 같은 구간의 캔들을 먼저 생성한 경우
+                self._merge(photo_card_id, {resolution: bucket}, price, traded_at)
+
+    @transaction.atomic
+    def replace_photo_card_price_candles(self, photo_card_id: int,
+                                         candles: Iterable[PhotoCardPriceCandleDomain]) -> int:
+        PhotoCardPriceCandle.objects.filter(photo_card_id=photo_card_id).delete()
+        created = PhotoCardPriceCandle.objects.bulk_create(
+            [self._entity(candle) for candle in candles], batch_size=500)
+        return len(created)
+
+    def _merge(self, photo_card_id: int, buckets: Dict[CandleResolution, datetime.datetime],
+               price: Won, traded_at: datetime.datetime) -> int:
+        # UPDATE의 우변은 갱신 이전 값을 참조하므로 open/open_at, close/close_at을 함께 갱신할 수 있다.
+        price = Value(price, output_field=models.DecimalField(max_digits=10, decimal_places=0))
+        traded = Value(traded_at, output_field=models.DateTimeField())
+        return self._buckets(photo_card_id, buckets).update(
+            high=Greatest(F('high'), price),
+            low=Least(F('low'), price),
+            open=Case(When(open_at__gt=traded_at, then=price), default=F('open')),
+            open_at=Least(F('open_at'), traded),
+            close=Case(When(close_at__lte=traded_at, then=price), default=F('close')),
+            close_at=Greatest(F('close_at'), traded),
+            volume=F('volume') + 1,
+        )
+
+    @staticmethod
+    def _buckets(photo_card_id: int, buckets: Dict[CandleResolution, datetime.datetime]):
+        condition = functools.reduce(operator.or_, (
+            Q(resolution=resolution.value, bucket=bucket) for resolution, bucket in buckets.items()))
+        return PhotoCardPriceCandle.objects.filter(condition, photo_card_id=photo_card_id)
+
+    def _create(self, candle: PhotoCardPriceCandleDomain) -> None:
+        self._entity(candle).save(force_insert=True)
+
+    @staticmethod
+    def _entity(candle: PhotoCardPriceCandleDomain) -> PhotoCardPriceCandle:
+        return PhotoCardPriceCandle(
+            photo_card_id=candle.photo_card_id,
+            resolution=candle.resolution.value,
+            bucket=candle.bucket,
+            open=candle.open,
+            high=candle.high,
+            low=candle.low,
+            close=candle.close,
+            volume=candle.volume,
+            open_at=candle.open_at,
+            close_at=candle.close_at,
+        )
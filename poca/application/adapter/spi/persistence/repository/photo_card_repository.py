@@ -1,48 +1,59 @@
+from typing import Optional
+
 from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard
+from poca.application.domain.model.photo_card import PhotoCardImage
 from poca.application.port.api.command.photo_card_command import CreatePhotoCardCommand
+from poca.application.port.spi.repository.product.register_photo_card_port import RegisterPhotoCardPort
+from poca.application.port.spi.repository.search.index_photo_card_search_port import IndexPhotoCardSearchPort
 
 
-class PhotoCardRepository:
+class PhotoCardRepository(RegisterPhotoCardPort):
     """
     포토카드 관련 데이터베이스 처리를 위한 Repository
     """
+    _search_index: Optional[IndexPhotoCardSearchPort]
+
+    def __init__(self, search_index: IndexPhotoCardSearchPort = None):
+        self._search_index = search_index
 
-    def register_new_photo_card(self, photo_card: CreatePhotoCardCommand) -> int:
+    def register_new_photo_card(self, photo_card: CreatePhotoCardCommand, image: PhotoCardImage = None) -> int:
         """
         새로운 포토카드를 등록한다.
         :param photo_card: PhotoCardDomain 포토카드 도메인객체
-        :info: 이미지 url은 async로 처리, 이미지 url은 빈값으로 처리한다.
-
+        :param image: PhotoCardImage 포토카드 이미지
+        :info: 저장되지 않은 이미지는 PhotoCardService가 요청 밖에서 업로드하므로 이미지 url은 빈값으로 처리한다.
+        :info: 검색 색인은 포토카드와 같은 트랜잭션에서 추가된다.
         """
+        image = image or PhotoCardImage(image_hash=None)
         photo_card_id = PhotoCard.objects.create(
             name=photo_card.name,
             description=photo_card.description,
+            image_hash=image.image_hash,
+            image_url=image.image_url,
+            thumbnail_url=image.thumbnail_url,
+            preview_url=image.preview_url,
         )
-        # async로 이미지 url 처리
-        self.upload_image_to_s3(photo_card_id.id, photo_card.image_data)
+        if self._search_index is not None:
+            self._search_index.index_photo_card(photo_card_id.id, photo_card.name, photo_card.description)
         return photo_card_id.id
 
-    def upload_image_to_s3(self, photo_card_id: int, image_data: bytes) -> str:
-        """
-        비동기로 이미지를 S3에 업로드한다.
-        :param photo_card_id: int 포토카드 id
-        :param image_data: bytes 이미지 데이터
-        :return: str 이미지 url
-        """
-        # S3에 이미지 업로드
-        # celery를 사용하여 비동기로 처리 가능
-        # 우선은 임시로 temp를 반환하도록 처리
-        temp_url = f"https://s3.ap-northeast-2.amazonaws.com/photo-cards/{photo_card_id}"
-        self.update_photo_card_image_url(photo_card_id, temp_url)
-        return temp_url
+    def find_photo_card_image(self, image_hash: str) -> Optional[PhotoCardImage]:
+        photo_card = PhotoCard.objects.filter(image_hash=image_hash, image_url__isnull=False) \
+            .only('image_hash', 'image_url', 'thumbnail_url', 'preview_url') \
+            .first()
+        if photo_card is None:
+            return None
+        return PhotoCardImage(photo_card.image_hash, photo_card.image_url, photo_card.thumbnail_url,
+                              photo_card.preview_url)
 
-    def update_photo_card_image_url(self, photo_card_id: int, image_url: str) -> None:
+    def update_photo_card_image(self, image: PhotoCardImage) -> int:
         """
         포토카드 이미지 url을 업데이트한다.
-        :param photo_card_id: int 포토카드 id
-        :param image_url: str 이미지 url
+        :param image: PhotoCardImage 저장된 이미지
+        :info: 업로드 중에 같은 이미지로 등록된 포토카드도 함께 갱신한다.
         """
-
-        # celery를 사용하여 비동기로 처리 가능
-        # 우선은 임시 동기처리
-        PhotoCard.objects.filter(id=photo_card_id).update(image_url=image_url)
+        return PhotoCard.objects.filter(image_hash=image.image_hash).update(
+            image_url=image.image_url,
+            thumbnail_url=image.thumbnail_url,
+            preview_url=image.preview_url,
+        )
@@ -0,0 +1,81 @@
+from typing import Dict, Iterable, List, Set
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard, PhotoCardSale
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.domain.model.photo_card import PhotoCard as PhotoCardDomain
+from poca.application.domain.model.photo_card import PhotoCardSale as PhotoCardSaleDomain
+from poca.application.domain.model.user import UserDomain
+
+
+class PhotoCardSaleLoader:
+    """
+    판매 기록 엔티티 목록을 도메인 객체로 일괄 변환하는 로더
+    연관된 포토카드, 유저는 테이블당 한번의 쿼리로 조회하고(N+1 방지)
+    identity map을 통해 같은 id의 도메인 객체는 하나의 인스턴스를 공유한다.
+    """
+
+    def __init__(self):
+        self._photo_cards: Dict[int, PhotoCardDomain] = {}
+        self._users: Dict[int, UserDomain] = {}
+
+    def load(self, sales: Iterable[PhotoCardSale]) -> List[PhotoCardSaleDomain]:
+        """
+        :param sales: Iterable[PhotoCardSale] 판매 기록 엔티티
+        :return: [domain] List:PhotoCardSale
+        """
+        sales = list(sales)
+        self._fetch_photo_cards({sale.photo_card_id for sale in sales})
+        self._fetch_users(self._user_ids(sales))
+
+        return self._to_domain(sales)
+
+    async def aload(self, sales: Iterable[PhotoCardSale]) -> List[PhotoCardSaleDomain]:
+        """
+        load의 비동기 버전, 연관 객체는 async ORM으로 조회한다.
+        :param sales: Iterable[PhotoCardSale] 이미 조회된 판매 기록 엔티티
+        :return: [domain] List:PhotoCardSale
+        """
+        sales = list(sales)
+        await self._afetch_photo_cards({sale.photo_card_id for sale in sales})
+        await self._afetch_users(self._user_ids(sales))
+
+        return self._to_domain(sales)
+
+    @staticmethod
+    def _user_ids(sales: List[PhotoCardSale]) -> Set[int]:
+        return ({sale.seller_id for sale in sales} |
+                {sale.buyer_id for sale in sales if sale.buyer_id is not None})
+
+    def _to_domain(self, sales: List[PhotoCardSale]) -> List[PhotoCardSaleDomain]:
+        return [
+            sale.to_domain(
+                photo_card=self._photo_cards[sale.photo_card_id],
+                seller=self._users[sale.seller_id],
+                buyer=self._users.get(sale.buyer_id),
+            )
+            for sale in sales
+        ]
+
+    def _fetch_photo_cards(self, card_ids: Set[int]) -> None:
+        missing = card_ids - self._photo_cards.keys()
+        if missing:
+            for photo_card in PhotoCard.objects.filter(id__in=missing):
+                self._photo_cards[photo_card.id] = photo_card.to_domain()
+
+    def _fetch_users(self, user_ids: Set[int]) -> None:
+        missing = user_ids - self._users.keys()
+        if missing:
+            for user in User.objects.filter(id__in=missing).only('id', 'user_email', 'balance', 'is_active'):
+                self._users[user.id] = user.to_domain()
+
+    async def _afetch_photo_cards(self, card_ids: Set[int]) -> None:
+        missing = card_ids - self._photo_cards.keys()
+        if missing:
+            async for photo_card in PhotoCard.objects.filter(id__in=missing):
+                self._photo_cards[photo_card.id] = photo_card.to_domain()
+
+    async def _afetch_users(self, user_ids: Set[int]) -> None:
+        missing = user_ids - self._users.keys()
+        if missing:
+            async for user in User.objects.filter(id__in=missing).only('id', 'user_email', 'balance', 'is_active'):
+                self._users[user.id] = user.to_domain()
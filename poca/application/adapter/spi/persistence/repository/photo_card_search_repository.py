@@ -0,0 +1,123 @@
+import itertools
+from typing import Iterable, List
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Q, Subquery, Value, When
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard, PhotoCardSale
+from poca.application.adapter.spi.persistence.entity.photo_card_search_gram import PhotoCardSearchGram
+from poca.application.adapter.spi.persistence.entity.photo_card_search_text import PhotoCardSearchText
+from poca.application.domain.model.photo_card import PhotoCardState
+from poca.application.domain.model.photo_card_search import PhotoCardSearchHit, PhotoCardSearchQuery, SearchOrder, \
+    index_grams, search_text
+from poca.application.port.spi.repository.search.index_photo_card_search_port import IndexPhotoCardSearchPort
+from poca.application.port.spi.repository.search.search_photo_card_port import SearchPhotoCardPort
+
+
+class PhotoCardSearchRepository(
+    IndexPhotoCardSearchPort,
+    SearchPhotoCardPort
+):
+    """
+    글자 n-gram 역색인(photo_card_search_grams)으로 후보 포토카드를 찾고,
+    색인과 같은 방식으로 정규화된 이름/설명(photo_card_search_texts)으로 다시 확인한다.
+    """
+
+    def index_photo_card(self, card_id: int, name: str, description: str) -> int:
+        PhotoCardSearchText.objects.create(photo_card_id=card_id, name=search_text(name),
+                                           description=search_text(description))
+        grams = PhotoCardSearchGram.objects.bulk_create(
+            [PhotoCardSearchGram(gram=gram, photo_card_id=card_id) for gram in index_grams(name, description)])
+        return len(grams)
+
+    def rebuild_photo_card_search_index(self, chunk_size: int = 1000) -> int:
+        count = 0
+        photo_cards = PhotoCard.objects.only('id', 'name', 'description').order_by('id').iterator(chunk_size)
+        # 포토카드 chunk_size개 단위로 색인을 교체하여 메모리 사용량과 트랜잭션 크기를 제한
+        while chunk := list(itertools.islice(photo_cards, chunk_size)):
+            with transaction.atomic():
+                card_ids = [card.id for card in chunk]
+                PhotoCardSearchGram.objects.filter(photo_card_id__in=card_ids).delete()
+                PhotoCardSearchText.objects.filter(photo_card_id__in=card_ids).delete()
+                PhotoCardSearchText.objects.bulk_create(self._texts(chunk), batch_size=chunk_size)
+                PhotoCardSearchGram.objects.bulk_create(self._grams(chunk), batch_size=chunk_size)
+            count += len(chunk)
+        return count
+
+    def search_photo_cards(self, query: PhotoCardSearchQuery) -> List[PhotoCardSearchHit]:
+        grams = query.grams()
+        if not grams:
+            return []
+
+        # 모든 n-gram을 가진 포토카드가 후보
+        candidates = PhotoCardSearchGram.objects.filter(gram__in=grams) \
+            .values('photo_card_id') \
+            .annotate(hits=Count('id')) \
+            .filter(hits=len(grams)) \
+            .values('photo_card_id')
+
+        # n-gram이 떨어져 있어도 후보가 되므로 토큰이 실제로 포함되어 있는지 확인
+        # 원본 컬럼은 정규화 전이므로(전각, 호환 문자) 색인과 같은 정규화된 컬럼과 비교
+        photo_cards = PhotoCard.objects.filter(id__in=candidates)
+        for token in query.tokens:
+            photo_cards = photo_cards.filter(
+                Q(search_text__name__contains=token) | Q(search_text__description__contains=token))
+
+        # 판매중인 최소 가격 매물, 판매 목록과 같은 순서 (total_price, renewal_date, id)
+        cheapest = PhotoCardSale.objects.filter(photo_card=OuterRef('pk'), state=PhotoCardState.ON_SALE.value) \
+            .annotate(total_price=F('price') + F('fee')) \
+            .order_by('total_price', 'renewal_date', 'id')
+        photo_cards = photo_cards.annotate(
+            score=self._score(query),
+            min_price_record_id=Subquery(cheapest.values('id')[:1]),
+            min_total_price=Subquery(cheapest.values('total_price')[:1]),
+        )
+        if query.on_sale_only:
+            photo_cards = photo_cards.filter(min_price_record_id__isnull=False)
+
+        min_total_price = F('min_total_price').asc(nulls_last=True)
+        if query.order == SearchOrder.PRICE:
+            ordering = [min_total_price, F('score').desc(), 'id']
+        else:
+            ordering = [F('score').desc(), min_total_price, 'id']
+
+        return [
+            PhotoCardSearchHit(
+                photo_card=photo_card.to_domain(),
+                score=photo_card.score,
+                min_price_record_id=photo_card.min_price_record_id,
+                min_total_price=photo_card.min_total_price,
+            )
+            for photo_card in photo_cards.order_by(*ordering)[:query.limit]
+        ]
+
+    @staticmethod
+    def _score(query: PhotoCardSearchQuery) -> Case:
+        """
+        이름 일치 > 이름 접두어 > 이름 부분 일치 > 토큰이 모두 이름에 포함 > 설명에서만 일치 순서
+        """
+        text = query.normalized
+        in_name = Q()
+        for token in query.tokens:
+            in_name &= Q(search_text__name__contains=token)
+
+        return Case(
+            When(search_text__name=text, then=Value(100)),
+            When(search_text__name__startswith=text, then=Value(60)),
+            When(search_text__name__contains=text, then=Value(40)),
+            When(in_name, then=Value(20)),
+            default=Value(10),
+            output_field=IntegerField(),
+        )
+
+    @staticmethod
+    def _texts(photo_cards: Iterable[PhotoCard]) -> Iterable[PhotoCardSearchText]:
+        for photo_card in photo_cards:
+            yield PhotoCardSearchText(photo_card_id=photo_card.id, name=search_text(photo_card.name),
+                                      description=search_text(photo_card.description))
+
+    @staticmethod
+    def _grams(photo_cards: Iterable[PhotoCard]) -> Iterable[PhotoCardSearchGram]:
+        for photo_card in photo_cards:
+            for gram in index_grams(photo_card.name, photo_card.description):
+                yield PhotoCardSearchGram(gram=gram, photo_card_id=photo_card.id)
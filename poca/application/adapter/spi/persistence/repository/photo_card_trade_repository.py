@@ -1,27 +1,62 @@
+import datetime
+import decimal
 import logging
-from typing import List, Optional
+import threading
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
 
-from django.db import IntegrityError, transaction
-from django.db.models import OuterRef, Subquery
-from django.utils.timezone import now
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.timezone import is_naive, localtime, make_aware, now
 
+from poca.application.adapter.spi.cache.photo_card_order_book import OrderBookEntry, PhotoCardOrderBook
+from poca.application.adapter.spi.cache.photo_card_recent_trades import PhotoCardRecentTrades, RecentTrade
 from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCardSale, PhotoCard
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.adapter.spi.persistence.repository.photo_card_sale_loader import PhotoCardSaleLoader
+from poca.application.domain.model.money import Won, to_won
 from poca.application.domain.model.photo_card import PhotoCard as PhotoCardDomain
 from poca.application.domain.model.photo_card import PhotoCardSale as PhotoCardSaleDomain
-from poca.application.domain.model.photo_card import PhotoCardState
-from poca.application.port.api.command.photo_card_trade_command import UpdatePhotoCardCommand
+from poca.application.domain.model.photo_card import CheckoutMode, OnSaleCursor, OnSalePage, PhotoCardCheckout, \
+    PhotoCardPurchase, PhotoCardState, PurchaseOutcome
+from poca.application.domain.model.photo_card_trade_event import PhotoCardSaleCompletedEvent, \
+    PhotoCardSaleRegisteredEvent
+from poca.application.port.api.command.photo_card_trade_command import CheckoutPhotoCardCommand, \
+    PurchasePhotoCardCommand, UpdatePhotoCardCommand
+from poca.application.port.spi.event.photo_card_trade_event_listener import PhotoCardTradeEventListener
+from poca.application.port.spi.repository.candle.find_photo_card_trade_port import FindPhotoCardTradePort
+from poca.application.port.spi.repository.candle.record_photo_card_price_candle_port import \
+    RecordPhotoCardPriceCandlePort
 from poca.application.port.spi.repository.product.find_photo_card_port import FindPhotoCardSalePort
 from poca.application.port.spi.repository.product.save_photo_card_port import SavePhotoCardSalePort
-from poca.application.util.transactional import retry_optimistic_locking, OptimisticLockException
+from poca.application.util.transactional import OptimisticLockException
 
 
 class PhotoCardSaleRepository(
     FindPhotoCardSalePort,
+    FindPhotoCardTradePort,
     SavePhotoCardSalePort
 ):
     logger = logging.getLogger(__name__)
 
+    def __init__(self, order_book: Optional[PhotoCardOrderBook] = None,
+                 listeners: Sequence[PhotoCardTradeEventListener] = (),
+                 candles: Optional[RecordPhotoCardPriceCandlePort] = None,
+                 recent_trades: Optional[PhotoCardRecentTrades] = None):
+        # 오더북이 주입되면 판매중 매물 조회를 메모리에서 처리한다.
+        self._order_book = order_book
+        # 판매 등록/거래 완료 이벤트 수신자, 커밋 이후에 호출된다.
+        self._listeners = listeners
+        # 거래가 캔들, 거래 완료 커밋 이후에 갱신한다.
+        self._candles = candles
+        # 최근 거래 링 버퍼가 주입되면 최근 거래 조회를 메모리에서 처리한다. (거래 완료 이벤트 수신자로도 등록되어야 한다.)
+        self._recent_trades = recent_trades
+
     def find_photo_card_renewal_old(self) -> List[PhotoCardSaleDomain]:
+        if self._order_book is not None:
+            self._order_book.ensure_loaded(self._order_book_snapshot)
+            return [record.set_total_price() for record in self._order_book.best_of_each()]
+
         # 최소 가격, 리뉴얼을 만족하는 쿼리를 찾는 서브 쿼리
         subquery = PhotoCardSale.objects.filter(
             state=PhotoCardState.ON_SALE.value,
@@ -31,35 +66,100 @@ class PhotoCardSaleRepository(
         # 각 photo_card_id별로 조건을 만족하는 객체를 찾는 쿼리
         result = PhotoCardSale.objects.filter(id__in=Subquery(subquery))
 
-        return [photo_card.to_domain().set_total_price()
-                for photo_card in result]
+        return [photo_card.set_total_price()
+                for photo_card in PhotoCardSaleLoader().load(result)]
+
+    def find_photo_card_renewal_old_page(self, cursor: Optional[OnSaleCursor], limit: int) -> OnSalePage:
+        """
+        오더북이 주입되어도 정렬키 인덱스로 조회한다.
+        오더북에서 조회하면 요청마다 모든 포토카드의 최우선 매물을 정렬해야 한다. (O(N log N))
+        """
+        sales, next_cursor = self._split_on_sale_page(list(self._on_sale_page_query(cursor, limit)), limit)
+        return OnSalePage(
+            records=[record.set_total_price() for record in PhotoCardSaleLoader().load(sales)],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _on_sale_page_query(cursor: Optional[OnSaleCursor], limit: int):
+        # 포토카드별 최소 가격, 리뉴얼이 오래된 매물 id
+        best_id = PhotoCardSale.objects.filter(
+            state=PhotoCardState.ON_SALE.value,
+            photo_card_id=OuterRef('photo_card_id')
+        ).order_by('price', 'renewal_date', 'id').values('id')[:1]
+
+        # 정렬키 인덱스(photo_card_sale_on_sale_page)를 커서 위치부터 순서대로 읽으며
+        # 포토카드별 최우선 매물만 limit + 1 건까지 조회하므로 페이지 깊이와 무관하게 비용이 일정하다.
+        query = PhotoCardSale.objects.filter(
+            state=PhotoCardState.ON_SALE.value
+        ).annotate(
+            total=F('price') + F('fee'),
+            renewal=Coalesce('renewal_date', 'create_date'),
+        )
+        if cursor is not None:
+            # OR 조건만으로는 인덱스 탐색 범위를 정할 수 없으므로 첫번째 정렬키 조건(total >= 커서)을 함께 걸어
+            # 인덱스를 커서 위치부터 읽도록 한다. (같은 total 안에서만 OR 조건으로 거른다.)
+            query = query.filter(total__gte=cursor.total_price).filter(
+                Q(total__gt=cursor.total_price) |
+                Q(total=cursor.total_price, renewal__gt=cursor.renewal_date) |
+                Q(total=cursor.total_price, renewal=cursor.renewal_date, id__gt=cursor.id)
+            )
+        return query.filter(id=Subquery(best_id)).order_by('total', 'renewal', 'id')[:limit + 1]
+
+    @staticmethod
+    def _split_on_sale_page(sales: List[PhotoCardSale], limit: int) -> tuple:
+        """
+        limit + 1 건 조회 결과를 (현재 페이지, 다음 페이지 커서)로 분리
+        """
+        if len(sales) <= limit:
+            return sales, None
+        sales = sales[:limit]
+        last = sales[-1]
+        return sales, OnSaleCursor(total_price=to_won(last.total), renewal_date=last.renewal, id=last.id)
 
     def find_recently_sold_photo_card(self, card_id: int, number_of_cards: int = 5) -> List[PhotoCardSaleDomain]:
-        return [
-            record.to_domain().set_total_price() for record in PhotoCardSale.objects.filter(
-                photo_card_id=card_id,
-                sold_date__isnull=False).order_by('-sold_date')[:number_of_cards]
-        ]
+        if self._recent_trades is not None:
+            trades = self._recent_trades.recent(card_id, number_of_cards, self._recent_trades_snapshot)
+            if trades is not None:
+                return [trade.to_domain(card_id) for trade in trades]
+
+        result = PhotoCardSale.objects.filter(
+            photo_card_id=card_id,
+            sold_date__isnull=False).order_by('-sold_date')[:number_of_cards]
+
+        return [record.set_total_price() for record in PhotoCardSaleLoader().load(result)]
+
+    def iter_photo_card_trades(self, chunk_size: int = 2000) -> Iterator[Tuple[int, Won, datetime.datetime]]:
+        trades = PhotoCardSale.objects.filter(
+            state=PhotoCardState.SOLD.value,
+            sold_date__isnull=False
+        ).order_by('photo_card_id', 'sold_date', 'id').values_list('photo_card_id', 'price', 'sold_date')
+
+        # 전체 결과를 메모리에 올리지 않도록 chunk_size 단위로 조회 (PostgreSQL은 서버 사이드 커서)
+        for photo_card_id, price, sold_date in trades.iterator(chunk_size=chunk_size):
+            yield photo_card_id, to_won(price), localtime(sold_date)
 
     def find_sales_record_by_id(self, record_id: int) -> PhotoCardSaleDomain:
         """
         판매 기록 id를 가진 판매 기록 조회
         :param record_id: int
         """
-        return PhotoCardSale.objects.get(id=record_id).to_domain()
+        return PhotoCardSale.objects.select_related('photo_card', 'seller', 'buyer').get(id=record_id).to_domain()
 
     def find_min_price_photo_card_on_sale(self, card_id: int) -> Optional[PhotoCardSale]:
         """
         최소 가격의 판매중인 포토카드 조회
         :param card_id: int
         """
-        query = PhotoCardSale.objects.filter(
+        if self._order_book is not None:
+            self._order_book.ensure_loaded(self._order_book_snapshot)
+            return self._order_book.best(card_id)
+
+        sale = PhotoCardSale.objects.select_related('photo_card', 'seller', 'buyer').filter(
             photo_card_id=card_id,
             state=PhotoCardState.ON_SALE.value
-        ).order_by('price')
-        if query.exists():
-            return query.first().to_domain()
-        return None
+        ).order_by('price').first()
+        return sale.to_domain() if sale else None
 
     def save_photo_card_sale(self, photo_card: PhotoCardSaleDomain) -> PhotoCardSaleDomain:
         """
@@ -76,17 +176,78 @@ class PhotoCardSaleRepository(
                 renewal_date=photo_card.renewal_date
             )
             sale.save()
-            return sale.to_domain()
+            domain = sale.to_domain()
+            self._on_sale_registered(sale, domain)
+            return domain
 
         except IntegrityError:
             self.logger.error(f'PhotoCardSale save error {photo_card}')
             return None
 
-    @retry_optimistic_locking(retries=2)
+    def save_photo_card_sales(self, photo_cards: List[PhotoCardSaleDomain],
+                              batch_size: int = 500) -> List[Optional[PhotoCardSaleDomain]]:
+        """
+        신규 포토카드 판매 정보 일괄 저장
+        존재하지 않는 포토카드/판매자는 INSERT 전에 걸러내고, 나머지는 batch_size 건씩 bulk_create로 저장한다.
+        :param photo_cards: List[PhotoCardSaleDomain]
+        :param batch_size: int
+        """
+        card_ids = set(PhotoCard.objects.filter(
+            id__in={photo_card.photo_card_id for photo_card in photo_cards}).values_list('id', flat=True))
+        seller_ids = set(User.objects.filter(
+            id__in={photo_card.seller_id for photo_card in photo_cards}).values_list('id', flat=True))
+
+        pending = [
+            (index, PhotoCardSale(
+                state=PhotoCardState.ON_SALE.value,
+                price=photo_card.price,
+                fee=photo_card.fee,
+                seller_id=photo_card.seller_id,
+                photo_card_id=photo_card.photo_card_id,
+                renewal_date=photo_card.renewal_date
+            ))
+            for index, photo_card in enumerate(photo_cards)
+            if photo_card.photo_card_id in card_ids and photo_card.seller_id in seller_ids
+        ]
+
+        saved = []
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            inserted = self._bulk_insert([sale for _, sale in chunk])
+            saved.extend((index, sale) for (index, _), sale in zip(chunk, inserted) if sale is not None)
+
+        results: List[Optional[PhotoCardSaleDomain]] = [None] * len(photo_cards)
+        loaded = PhotoCardSaleLoader().load(sale for _, sale in saved)
+        for (index, sale), domain in zip(saved, loaded):
+            self._on_sale_registered(sale, domain)
+            results[index] = domain
+
+        if failed := len(photo_cards) - len(saved):
+            self.logger.error(f'PhotoCardSale bulk save error {failed}/{len(photo_cards)} items')
+        return results
+
+    def _bulk_insert(self, sales: List[PhotoCardSale]) -> List[Optional[PhotoCardSale]]:
+        try:
+            with transaction.atomic():
+                return PhotoCardSale.objects.bulk_create(sales)
+        except IntegrityError:
+            # 청크 저장에 실패하면 한 건씩 저장하여 실패한 항목만 제외
+            return [self._insert(sale) for sale in sales]
+
+    @staticmethod
+    def _insert(sale: PhotoCardSale) -> Optional[PhotoCardSale]:
+        try:
+            with transaction.atomic():
+                sale.save()
+            return sale
+        except IntegrityError:
+            return None
+
     @transaction.atomic
     def update_photo_card_sale(self, command: UpdatePhotoCardCommand):
         """
         포토 카드 구매 정보 업데이트 version을 이용한 동시성 제어
+        command.version이 다르면 같은 version으로 다시 시도해도 성공할 수 없으므로 재시도하지 않고 OptimisticLockException을 발생시킨다.
         :param command: UpdatePhotoCardCommand
         """
         sold_date = now()
@@ -106,12 +267,227 @@ class PhotoCardSaleRepository(
             if updated_count == 0:
                 raise OptimisticLockException('PhotoCardSale version mismatch')
 
+            photo_card_id, price, fee = command.photo_card_id, None, None
+            if self._candles is not None or self._listeners:
+                photo_card_id, price, fee = PhotoCardSale.objects.filter(
+                    id=command.record_id).values_list('photo_card_id', 'price', 'fee').first()
+            self._on_sale_completed(photo_card_id, command.record_id, command.buyer_id, price, sold_date, fee)
+
         except PhotoCardSale.DoesNotExist:
             self.logger.error(f'PhotoCardSale not found {command.record_id}')
             # return False
         except Exception as e:
             raise e
 
+    def purchase_photo_card_sale(self, command: PurchasePhotoCardCommand) -> PhotoCardPurchase:
+        """
+        판매완료 처리와 구매자 잔액 차감을 하나의 트랜잭션으로 처리
+        PostgreSQL은 한번의 쿼리(CTE)로 처리하며, 잔액 차감은 balance >= total 조건의 UPDATE로 처리하므로
+        같은 유저의 동시 구매에서도 잔액 갱신이 유실되지 않는다.
+        :param command: PurchasePhotoCardCommand
+        """
+        sold_date = now()
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                total, debited, photo_card_id, state, price = self._purchase_in_single_statement(command, sold_date)
+            else:
+                total, debited, photo_card_id, state, price = self._purchase_in_conditional_updates(command, sold_date)
+
+            if total is None:
+                # 판매 기록을 갱신하지 못한 경우 조회된 현재 상태로 실패 원인을 구분
+                if state is None:
+                    outcome = PurchaseOutcome.NOT_FOUND
+                elif state != PhotoCardState.ON_SALE.value:
+                    outcome = PurchaseOutcome.NOT_ON_SALE
+                else:
+                    outcome = PurchaseOutcome.VERSION_CONFLICT
+                return PhotoCardPurchase(outcome=outcome, record_id=command.record_id)
+
+            if debited is None:
+                # 잔액 부족시 판매완료 처리도 롤백
+                transaction.set_rollback(True)
+                return PhotoCardPurchase(outcome=PurchaseOutcome.INSUFFICIENT_BALANCE, record_id=command.record_id)
+
+            self._on_sale_completed(photo_card_id, command.record_id, command.buyer_id, price, sold_date,
+                                    total - price)
+
+        return PhotoCardPurchase(outcome=PurchaseOutcome.PURCHASED, record_id=command.record_id,
+                                 photo_card_id=photo_card_id, total_price=to_won(total))
+
+    def checkout_photo_card_sales(self, command: CheckoutPhotoCardCommand) -> PhotoCardCheckout:
+        """
+        여러 판매 기록 일괄 구매
+        구매자 잠금, 판매 기록 잠금(record_id 순), 판매완료 처리, 잔액 차감을 각각 한번의 쿼리로 처리한다.
+        :param command: CheckoutPhotoCardCommand
+        """
+        record_ids = sorted(set(command.record_ids))
+        sold_date = now()
+        with transaction.atomic():
+            # 항상 구매자 -> 판매 기록(id 순) 순서로 잠가 동시 일괄 구매 간의 교착 상태를 방지
+            balance = User.objects.select_for_update().filter(
+                id=command.buyer_id).values_list('balance', flat=True).first() or 0
+            sales = {sale['id']: sale for sale in PhotoCardSale.objects.select_for_update().filter(
+                id__in=record_ids).order_by('id').values('id', 'photo_card_id', 'state', 'price', 'fee')}
+
+            outcomes, total = self._checkout_outcomes(record_ids, sales, balance, command.mode)
+            buy_ids = [record_id for record_id in record_ids if outcomes[record_id] == PurchaseOutcome.PURCHASED]
+
+            if buy_ids:
+                updated_count = PhotoCardSale.objects.filter(
+                    id__in=buy_ids,
+                    state=PhotoCardState.ON_SALE.value
+                ).update(
+                    buyer_id=command.buyer_id,
+                    sold_date=sold_date,
+                    state=PhotoCardState.SOLD.value,
+                    version=F('version') + 1
+                )
+                debited_count = User.objects.filter(
+                    id=command.buyer_id, balance__gte=total).update(balance=F('balance') - total)
+
+                # 행 잠금을 지원하지 않는 DB에서 다른 트랜잭션이 먼저 처리한 경우
+                if updated_count != len(buy_ids) or debited_count == 0:
+                    transaction.set_rollback(True)
+                    return PhotoCardCheckout(mode=command.mode, purchases=[
+                        PhotoCardPurchase(outcome=PurchaseOutcome.VERSION_CONFLICT, record_id=record_id)
+                        for record_id in record_ids])
+
+                for record_id in buy_ids:
+                    self._on_sale_completed(sales[record_id]['photo_card_id'], record_id, command.buyer_id,
+                                            sales[record_id]['price'], sold_date, sales[record_id]['fee'])
+
+        purchases = [
+            PhotoCardPurchase(outcome=PurchaseOutcome.PURCHASED, record_id=record_id,
+                              photo_card_id=sales[record_id]['photo_card_id'],
+                              total_price=to_won(sales[record_id]['price']) + to_won(sales[record_id]['fee']))
+            if outcomes[record_id] == PurchaseOutcome.PURCHASED
+            else PhotoCardPurchase(outcome=outcomes[record_id], record_id=record_id)
+            for record_id in record_ids
+        ]
+        return PhotoCardCheckout(mode=command.mode, purchases=purchases, total_price=total)
+
+    @staticmethod
+    def _checkout_outcomes(record_ids: List[int], sales: dict, balance, mode: CheckoutMode) -> tuple:
+        """
+        잠근 판매 기록과 잔액으로 항목별 구매 여부 결정
+        :return: (record_id별 PurchaseOutcome, 차감할 합계 금액)
+        """
+        outcomes = {}
+        for record_id in record_ids:
+            sale = sales.get(record_id)
+            if sale is None:
+                outcomes[record_id] = PurchaseOutcome.NOT_FOUND
+            elif sale['state'] != PhotoCardState.ON_SALE.value:
+                outcomes[record_id] = PurchaseOutcome.NOT_ON_SALE
+            else:
+                outcomes[record_id] = PurchaseOutcome.PURCHASED
+
+        buyable = [record_id for record_id in record_ids if outcomes[record_id] == PurchaseOutcome.PURCHASED]
+        prices = {record_id: to_won(sales[record_id]['price']) + to_won(sales[record_id]['fee']) for record_id in buyable}
+
+        if mode == CheckoutMode.ALL_OR_NOTHING:
+            total = Won(sum(prices.values()))
+            if len(buyable) != len(record_ids):
+                failure = None
+            elif total > balance:
+                failure = PurchaseOutcome.INSUFFICIENT_BALANCE
+            else:
+                return outcomes, total
+            # 하나라도 구매할 수 없다면 나머지 항목도 구매하지 않는다.
+            for record_id in buyable:
+                outcomes[record_id] = failure or PurchaseOutcome.ABORTED
+            return outcomes, Won(0)
+
+        # BEST_EFFORT: record_id 순으로 잔액 한도까지 구매
+        total = Won(0)
+        for record_id in buyable:
+            if total + prices[record_id] > balance:
+                outcomes[record_id] = PurchaseOutcome.INSUFFICIENT_BALANCE
+            else:
+                total += prices[record_id]
+        return outcomes, total
+
+    def claim_min_price_photo_card_sale(self, card_id: int) -> Optional[PhotoCardSaleDomain]:
+        """
+        SELECT ... FOR UPDATE SKIP LOCKED 로 최우선 매물 잠금, transaction.atomic 안에서 호출해야 한다.
+        :param card_id: int
+        """
+        sale = PhotoCardSale.objects.select_for_update(skip_locked=True).filter(
+            photo_card_id=card_id,
+            state=PhotoCardState.ON_SALE.value
+        ).order_by('price', 'renewal_date', 'id').first()
+        if sale is None:
+            return None
+
+        # 연관 테이블까지 잠그지 않도록 판매 기록 컬럼만으로 도메인 생성
+        return PhotoCardSaleDomain(
+            id=sale.id,
+            state=PhotoCardState(sale.state),
+            price=to_won(sale.price),
+            fee=to_won(sale.fee),
+            renewal_date=str(sale.renewal_date),
+            version=sale.version,
+            photo_card_id=sale.photo_card_id,
+            seller_id=sale.seller_id,
+        )
+
+    def _purchase_in_single_statement(self, command: PurchasePhotoCardCommand, sold_date) -> tuple:
+        sale_table = connection.ops.quote_name(PhotoCardSale._meta.db_table)
+        user_table = connection.ops.quote_name(User._meta.db_table)
+        # current는 갱신 이전 스냅샷을 조회하므로 실패한 경우 원인 구분에 사용한다.
+        sql = f"""
+            WITH sale AS (
+                UPDATE {sale_table}
+                SET state = %(sold)s, buyer_id = %(buyer_id)s, sold_date = %(sold_date)s, version = version + 1
+                WHERE id = %(record_id)s AND state = %(on_sale)s
+                  AND (%(version)s::integer IS NULL OR version = %(version)s::integer)
+                RETURNING photo_card_id, price + fee AS total
+            ), debit AS (
+                UPDATE {user_table} AS buyer
+                SET balance = buyer.balance - sale.total
+                FROM sale
+                WHERE buyer.id = %(buyer_id)s AND buyer.balance >= sale.total
+                RETURNING buyer.balance
+            )
+            SELECT sale.total, debit.balance, current.photo_card_id, current.state, current.price
+            FROM (SELECT 1) AS one
+            LEFT JOIN sale ON TRUE
+            LEFT JOIN debit ON TRUE
+            LEFT JOIN {sale_table} AS current ON current.id = %(record_id)s
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, {
+                'sold': PhotoCardState.SOLD.value,
+                'on_sale': PhotoCardState.ON_SALE.value,
+                'buyer_id': command.buyer_id,
+                'record_id': command.record_id,
+                'version': command.version,
+                'sold_date': sold_date,
+            })
+            return cursor.fetchone()
+
+    def _purchase_in_conditional_updates(self, command: PurchasePhotoCardCommand, sold_date) -> tuple:
+        # data-modifying CTE를 지원하지 않는 DB(sqlite 등)를 위한 조건부 UPDATE 처리
+        sale = PhotoCardSale.objects.filter(id=command.record_id).values('photo_card_id', 'state', 'price', 'fee').first()
+        if sale is None:
+            return None, None, None, None, None
+
+        target = PhotoCardSale.objects.filter(id=command.record_id, state=PhotoCardState.ON_SALE.value)
+        if command.version is not None:
+            target = target.filter(version=command.version)
+        updated_count = target.update(
+            buyer_id=command.buyer_id,
+            sold_date=sold_date,
+            state=PhotoCardState.SOLD.value,
+            version=F('version') + 1
+        )
+        if updated_count == 0:
+            return None, None, sale['photo_card_id'], sale['state'], sale['price']
+
+        total = sale['price'] + sale['fee']
+        debited_count = User.objects.filter(id=command.buyer_id, balance__gte=total).update(balance=F('balance') - total)
+        return total, debited_count or None, sale['photo_card_id'], sale['state'], sale['price']
+
     def find_photo_card_by_card_id(self, card_id: int) -> Optional[PhotoCardDomain]:
         """
          포토카드 id를 가진 포토카드 조회
@@ -122,3 +498,78 @@ class PhotoCardSaleRepository(
             return PhotoCard.objects.get(id=card_id).to_domain()
         except PhotoCard.DoesNotExist:
             return None
+
+    def _on_sale_registered(self, sale: PhotoCardSale, domain: PhotoCardSaleDomain) -> None:
+        if self._order_book is not None:
+            transaction.on_commit(lambda: self._order_book.add(
+                sale.photo_card_id, sale.id, self._order_book_key(sale), domain))
+        self._publish(lambda listener: listener.on_sale_registered(PhotoCardSaleRegisteredEvent(
+            photo_card_id=sale.photo_card_id, record_id=sale.id, price=domain.price, fee=domain.fee)))
+
+    def _on_sale_completed(self, photo_card_id: int, record_id: int, buyer_id: int,
+                           price: decimal.Decimal = None, sold_date=None, fee: decimal.Decimal = None) -> None:
+        if price is not None:
+            # 이벤트 수신자에게는 원 단위 정수로 전달
+            price, fee = to_won(price), to_won(fee)
+        if self._candles is not None and price is not None:
+            # 캔들 행 락을 구매 트랜잭션에서 잡지 않도록 커밋 이후 별도의 트랜잭션에서 갱신
+            transaction.on_commit(lambda: self._record_candle(photo_card_id, price, sold_date))
+        if self._order_book is not None:
+            transaction.on_commit(lambda: self._order_book.remove(record_id))
+        self._publish(lambda listener: listener.on_sale_completed(PhotoCardSaleCompletedEvent(
+            photo_card_id=photo_card_id, record_id=record_id, buyer_id=buyer_id,
+            price=price, fee=fee, sold_date=sold_date)))
+
+    def _record_candle(self, photo_card_id: int, price: Won, sold_date) -> None:
+        """
+        커밋된 거래를 캔들에 반영, 실패해도 거래 결과에는 영향을 주지 않으며 백필(backfill_price_candles)로 복구한다.
+        """
+        try:
+            self._candles.record_photo_card_trade(photo_card_id, price, sold_date)
+        except Exception as e:
+            self.logger.error(f'PhotoCardPriceCandle record error {photo_card_id}: {e}')
+
+    def _publish(self, notify: Callable[[PhotoCardTradeEventListener], None]) -> None:
+        """
+        커밋 이후 이벤트 수신자에게 전달, 수신자 오류는 저장 결과에 영향을 주지 않는다.
+        """
+        def run():
+            for listener in self._listeners:
+                try:
+                    notify(listener)
+                except Exception as e:
+                    self.logger.error(f'PhotoCardTradeEventListener error {listener}: {e}')
+
+        if self._listeners:
+            transaction.on_commit(run)
+
+    @staticmethod
+    def _order_book_key(sale: PhotoCardSale) -> tuple:
+        # 리뉴얼 일자가 없는 매물은 등록일 기준으로 정렬
+        renewal_date = PhotoCardSale._meta.get_field('renewal_date').to_python(sale.renewal_date or sale.create_date)
+        if is_naive(renewal_date):
+            renewal_date = make_aware(renewal_date)
+        return to_won(sale.price), renewal_date, sale.id
+
+    def _recent_trades_snapshot(self, card_id: int) -> List[RecentTrade]:
+        """
+        최근 거래 링 버퍼 적재를 위한 최근 거래 조회, 응답에 필요한 컬럼만 조회한다.
+        """
+        trades = PhotoCardSale.objects.filter(
+            photo_card_id=card_id,
+            sold_date__isnull=False
+        ).order_by('-sold_date').values_list('id', 'price', 'fee', 'sold_date')[:self._recent_trades.capacity]
+        return [RecentTrade(*trade) for trade in trades]
+
+    def _order_book_snapshot(self) -> Iterator[OrderBookEntry]:
+        """
+        오더북 적재/보정을 위한 판매중 매물 전체 조회
+        """
+        try:
+            sales = list(PhotoCardSale.objects.filter(state=PhotoCardState.ON_SALE.value))
+            for sale, record in zip(sales, PhotoCardSaleLoader().load(sales)):
+                yield sale.photo_card_id, sale.id, self._order_book_key(sale), record.set_total_price()
+        finally:
+            # 보정 타이머 스레드는 매번 새로 생성되므로 스레드의 커넥션을 정리
+            if isinstance(threading.current_thread(), threading.Timer):
+                connection.close()
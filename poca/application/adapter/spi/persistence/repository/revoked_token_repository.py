@@ -0,0 +1,28 @@
+from typing import Optional
+
+from django.db import IntegrityError, transaction
+
+from poca.application.adapter.spi.persistence.entity.revoked_token import RevokedToken
+from poca.application.port.spi.repository.token.find_revoked_token_port import FindRevokedTokenPort
+from poca.application.port.spi.repository.token.save_revoked_token_port import SaveRevokedTokenPort
+
+
+class RevokedTokenRepository(
+    FindRevokedTokenPort,
+    SaveRevokedTokenPort
+):
+    def find_revoked_token_expires_at(self, jti: str) -> Optional[int]:
+        return RevokedToken.objects.filter(jti=jti).values_list('expires_at', flat=True).first()
+
+    def save_revoked_token(self, jti: str, expires_at: int) -> bool:
+        # jti가 기본키이므로 동시에 같은 토큰을 폐기해도 하나의 요청만 저장에 성공한다.
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(jti=jti, expires_at=expires_at)
+            return True
+        except IntegrityError:
+            return False
+
+    def delete_expired_revoked_tokens(self, now: int) -> int:
+        deleted_count, _ = RevokedToken.objects.filter(expires_at__lte=now).delete()
+        return deleted_count
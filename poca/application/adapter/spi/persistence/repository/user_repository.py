@@ -1,7 +1,7 @@
-import decimal
 import logging
 
 from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.domain.model.money import Won, to_won
 from poca.application.domain.model.user import UserDomain
 from poca.application.port.spi.repository.user.find_user_port import FindUserPort
 from poca.application.port.spi.repository.user.save_user_port import SaveUserPort
@@ -23,17 +23,16 @@ class UserRepository(
     def get_user_by_user_id(self, user_id: int) -> UserDomain:
         try:
             user = User.objects.get(id=user_id)
-            return UserDomain(email=user.user_email, user_id=user.id, active=user.is_active, balance=user.balance)
+            return UserDomain(email=user.user_email, user_id=user.id, active=user.is_active, balance=to_won(user.balance))
         except User.DoesNotExist:
             return None
 
-    def save_user_balance(self, user_id: int, balance: decimal.Decimal) -> bool:
+    def save_user_balance(self, user_id: int, balance: Won) -> bool:
         try:
-            user = User.objects.get(id=user_id)
-            user.balance = balance
-            user.save()
+            # 조회 후 전체 컬럼 저장 대신 잔액 컬럼만 갱신
+            updated_count = User.objects.filter(id=user_id).update(balance=balance)
         except Exception as e:
             self.logger.error(f"Failed to save user balance: {e}")
             return False
 
-        return True
+        return updated_count > 0
@@ -0,0 +1,106 @@
+import dataclasses
+import importlib.util
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from poca.application.port.spi.storage.image_derivative_port import ImageDerivativePort
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class DerivativeSpec:
+    """
+    파생 이미지 규격, 원본 비율을 유지한 채 size 안에 들어가도록 축소한다.
+    """
+    name: str
+    size: Tuple[int, int]
+    format: str = 'JPEG'
+    quality: int = 85
+
+    @property
+    def extension(self) -> str:
+        return 'jpg' if self.format == 'JPEG' else self.format.lower()
+
+
+# 포토카드 비율(2:3) 기준 썸네일, 미리보기
+DEFAULT_DERIVATIVES = (
+    DerivativeSpec('thumbnail', (160, 240)),
+    DerivativeSpec('preview', (480, 720)),
+)
+
+
+def _render(source_path: str, specs: Sequence[DerivativeSpec]) -> Dict[str, str]:
+    # 프로세스 풀에서 실행되므로 모듈 최상위 함수로 정의
+    from PIL import Image
+
+    rendered = {}
+    try:
+        with Image.open(source_path) as source:
+            source.draft('RGB', max(spec.size for spec in specs))
+            image = source.convert('RGB')
+        for spec in specs:
+            derivative = image.copy()
+            derivative.thumbnail(spec.size)
+            fd, path = tempfile.mkstemp(prefix=f'poca-{spec.name}-', suffix=f'.{spec.extension}')
+            rendered[spec.name] = path
+            with os.fdopen(fd, 'wb') as file:
+                derivative.save(file, spec.format, quality=spec.quality)
+    except BaseException:
+        for path in rendered.values():
+            os.unlink(path)
+        raise
+    return rendered
+
+
+class ImageDerivativePipeline(ImageDerivativePort):
+    """
+    Pillow로 파생 이미지를 생성하는 파이프라인
+    디코딩/리사이즈는 CPU 작업이므로 GIL의 영향을 받지 않도록 프로세스 풀에서 처리한다.
+    Pillow가 설치되어 있지 않다면 파생 이미지를 생성하지 않는다. max_workers가 0이라면 호출한 스레드에서 바로 처리한다.
+    """
+
+    def __init__(self, specs: Sequence[DerivativeSpec] = DEFAULT_DERIVATIVES, max_workers: int = 2):
+        self._specs = {spec.name: spec for spec in specs}
+        self._max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._available = self._pillow_available()
+
+    def names(self) -> Iterable[str]:
+        return self._specs.keys()
+
+    def extension(self, name: str) -> str:
+        return self._specs[name].extension
+
+    def render(self, source_path: str, names: Iterable[str]) -> Dict[str, str]:
+        specs = [self._specs[name] for name in names]
+        if not specs or not self._available:
+            return {}
+        if self._max_workers <= 0:
+            return _render(source_path, specs)
+        return self._pool().submit(_render, source_path, specs).result()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 워커 스레드가 있는 프로세스에서 fork 하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(self._max_workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+            return self._executor
+
+    @staticmethod
+    def _pillow_available() -> bool:
+        if importlib.util.find_spec('PIL') is None:
+            logger.warning('Pillow is not installed, photo card image derivatives are disabled')
+            return False
+        return True
@@ -0,0 +1,48 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+from poca.application.port.spi.storage.object_store import ObjectStore
+
+
+class LocalObjectStore(ObjectStore):
+    """
+    로컬 파일시스템 저장소 (개발/테스트 환경)
+    임시 파일에 청크를 기록한 뒤 rename 하므로 저장 중인 객체는 조회되지 않는다.
+    """
+
+    def __init__(self, root: str, base_url: str = '/media/'):
+        self._root = Path(root)
+        self._base_url = base_url if base_url.endswith('/') else base_url + '/'
+
+    def put(self, key: str, chunks: Iterable[bytes], content_type: Optional[str] = None) -> str:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                for chunk in chunks:
+                    file.write(chunk)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return self.url(key)
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def url(self, key: str) -> str:
+        return self._base_url + key
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        path = (self._root / key).resolve()
+        # key로 저장소 밖의 경로에 접근하지 않도록 제한
+        if self._root.resolve() not in path.parents:
+            raise ValueError(f'Invalid object key {key}')
+        return path
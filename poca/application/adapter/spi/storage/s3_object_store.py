@@ -0,0 +1,91 @@
+import logging
+from typing import Iterable, Optional
+
+from poca.application.port.spi.storage.object_store import ObjectStore
+
+
+class S3ObjectStore(ObjectStore):
+    """
+    S3 호환 저장소 (운영 환경)
+    청크를 part_size 만큼 모아 multipart upload 하므로 업로드 중 메모리 사용량은 part_size로 제한된다.
+    boto3가 설치되어 있어야 하며, 테스트에서는 client를 주입할 수 있다.
+    """
+    # S3 multipart upload의 최소 part 크기
+    MIN_PART_SIZE = 5 * 1024 * 1024
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, bucket: str, region: str = None, endpoint_url: str = None, prefix: str = '',
+                 part_size: int = 8 * 1024 * 1024, client=None):
+        if client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise ImportError('S3ObjectStore를 사용하려면 boto3를 설치해야 합니다.') from e
+            client = boto3.client('s3', region_name=region, endpoint_url=endpoint_url)
+
+        self._client = client
+        self._bucket = bucket
+        self._region = region
+        self._endpoint_url = endpoint_url
+        self._prefix = prefix.strip('/')
+        self._part_size = max(part_size, self.MIN_PART_SIZE)
+
+    def put(self, key: str, chunks: Iterable[bytes], content_type: Optional[str] = None) -> str:
+        object_key = self._object_key(key)
+        extra = {'ContentType': content_type} if content_type else {}
+
+        buffer = bytearray()
+        upload_id = None
+        parts = []
+        try:
+            for chunk in chunks:
+                buffer += chunk
+                if len(buffer) >= self._part_size:
+                    if upload_id is None:
+                        upload_id = self._client.create_multipart_upload(
+                            Bucket=self._bucket, Key=object_key, **extra)['UploadId']
+                    parts.append(self._upload_part(object_key, upload_id, len(parts) + 1, bytes(buffer)))
+                    buffer.clear()
+
+            if upload_id is None:
+                # part_size 보다 작은 객체는 한번에 업로드
+                self._client.put_object(Bucket=self._bucket, Key=object_key, Body=bytes(buffer), **extra)
+            else:
+                if buffer:
+                    parts.append(self._upload_part(object_key, upload_id, len(parts) + 1, bytes(buffer)))
+                self._client.complete_multipart_upload(
+                    Bucket=self._bucket, Key=object_key, UploadId=upload_id, MultipartUpload={'Parts': parts})
+        except BaseException:
+            if upload_id is not None:
+                self.logger.error(f'S3 multipart upload aborted {object_key}')
+                self._client.abort_multipart_upload(Bucket=self._bucket, Key=object_key, UploadId=upload_id)
+            raise
+        return self.url(key)
+
+    def exists(self, key: str) -> bool:
+        try:
+            self._client.head_object(Bucket=self._bucket, Key=self._object_key(key))
+        except Exception as e:
+            # botocore ClientError, 없는 객체라면 404
+            code = getattr(e, 'response', {}).get('Error', {}).get('Code')
+            if code in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+        return True
+
+    def url(self, key: str) -> str:
+        if self._endpoint_url:
+            return f'{self._endpoint_url.rstrip("/")}/{self._bucket}/{self._object_key(key)}'
+        return f'https://{self._bucket}.s3.{self._region}.amazonaws.com/{self._object_key(key)}'
+
+    def delete(self, key: str) -> None:
+        self._client.delete_object(Bucket=self._bucket, Key=self._object_key(key))
+
+    def _object_key(self, key: str) -> str:
+        return f'{self._prefix}/{key}' if self._prefix else key
+
+    def _upload_part(self, object_key: str, upload_id: str, part_number: int, body: bytes) -> dict:
+        response = self._client.upload_part(
+            Bucket=self._bucket, Key=object_key, UploadId=upload_id, PartNumber=part_number, Body=body)
+        return {'ETag': response['ETag'], 'PartNumber': part_number}
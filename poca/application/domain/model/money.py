@@ -0,0 +1,31 @@
+import decimal
+from typing import NewType, Union
+
+# 원 단위 정수 금액, 금액 컬럼은 모두 decimal_places=0 이므로 정수로 정확히 표현된다.
+# int와 같은 타입이므로 덧셈/비교에 Decimal 연산 비용이 없다.
+Won = NewType('Won', int)
+
+
+def to_won(value: Union[int, decimal.Decimal, str]) -> Won:
+    """
+    금액을 원 단위 정수로 변환, 어댑터(DB, 요청)에서 받은 값을 도메인 객체로 옮길 때 사용한다.
+    :param value: int, Decimal, str 금액
+    :raise ValueError: 원 미만 금액이나 숫자가 아닌 값
+    """
+    if type(value) is int:
+        return Won(value)
+    try:
+        amount = value if isinstance(value, decimal.Decimal) else decimal.Decimal(str(value).strip())
+        if amount == amount.to_integral_value():
+            return Won(int(amount))
+    except (decimal.InvalidOperation, ValueError, TypeError):
+        pass
+    raise ValueError(f'{value!r} is not a whole won amount')
+
+
+def fraction_of(amount: Won, numerator: int, denominator: int) -> Won:
+    """
+    amount * numerator / denominator 를 원 단위로 반올림(ROUND_HALF_UP)한 정수 금액
+    정수 연산만 사용하므로 Decimal 객체를 만들지 않는다.
+    """
+    return Won((2 * amount * numerator + denominator) // (2 * denominator))
@@ -1,8 +1,10 @@
 import dataclasses
-import decimal
+import datetime
 import enum
 from decimal import Decimal
+from typing import Iterable, List, Optional
 
+from poca.application.domain.model.money import Won, fraction_of, to_won
 from poca.application.domain.model.user import UserDomain
 
 
@@ -15,36 +17,84 @@ class PhotoCardState(enum.Enum):
     SOLD = "판매완료"
 
 
+class PurchaseOutcome(enum.Enum):
+    PURCHASED = "PURCHASED"
+    NOT_FOUND = "NOT_FOUND"
+    NOT_ON_SALE = "NOT_ON_SALE"
+    VERSION_CONFLICT = "VERSION_CONFLICT"
+    INSUFFICIENT_BALANCE = "INSUFFICIENT_BALANCE"
+    # 일괄 구매(ALL_OR_NOTHING)에서 다른 항목의 실패로 구매하지 않음
+    ABORTED = "ABORTED"
+
+
+class CheckoutMode(enum.Enum):
+    # 하나라도 구매할 수 없다면 모두 구매하지 않는다.
+    ALL_OR_NOTHING = "ALL_OR_NOTHING"
+    # 구매할 수 있는 항목만 record_id 순으로 잔액 한도까지 구매한다.
+    BEST_EFFORT = "BEST_EFFORT"
+
+
 class FeePolicy:
     """
     수수료 정책 설정. 수수료 정책은 서비스 클래스로 분리하여 관리할 수 있게 추후에 도메인 정책 클래스로 확장 고려
+    수수료는 원 단위로 반올림(ROUND_HALF_UP)하며, 수수료율은 생성할 때 정수 분수로 한번만 변환한다.
     """
+    __slots__ = ('discount_percentage', '_numerator', '_denominator')
 
     def __init__(self, discount_percentage: Decimal):
         self.discount_percentage = discount_percentage
+        numerator, denominator = Decimal(discount_percentage).as_integer_ratio()
+        self._numerator, self._denominator = numerator, denominator * 100
 
-    def apply(self, price):
-        fee = price * (self.discount_percentage / Decimal('100'))
-        return decimal.Decimal(fee)
+    def apply(self, price) -> Won:
+        return fraction_of(to_won(price), self._numerator, self._denominator)
+
+    def apply_many(self, prices: Iterable) -> List[Won]:
+        """
+        여러 가격의 수수료를 한번에 계산
+        :param prices: Iterable 원 단위 가격
+        :return: List[Won] prices 순서의 수수료
+        """
+        numerator, denominator = self._numerator, self._denominator
+        return [fraction_of(to_won(price), numerator, denominator) for price in prices]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class PhotoCard:
     id: int
     name: str
     description: str
     release_date: str
     image_url: str = ""
+    thumbnail_url: str = None
+    preview_url: str = None
 
     def __str__(self):
         return f'Id:{self.id} | 카드 이름: {self.name}'
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
+class PhotoCardImage:
+    """
+    내용 해시(SHA-256)로 식별되는 포토카드 이미지, 같은 이미지를 사용하는 포토카드는 저장소의 객체를 공유한다.
+    """
+    image_hash: str
+    image_url: str = None
+    thumbnail_url: str = None
+    preview_url: str = None
+
+    def is_stored(self) -> bool:
+        return self.image_url is not None
+
+
+@dataclasses.dataclass(slots=True)
 class PhotoCardSale:
+    """
+    판매 기록, 금액(price, fee, total_price)은 원 단위 정수(Won)
+    """
     state: PhotoCardState
-    price: decimal.Decimal
-    fee: decimal.Decimal
+    price: Won
+    fee: Won
     renewal_date: str
     version: int = 0
     id: int = None
@@ -53,7 +103,7 @@ class PhotoCardSale:
     seller: UserDomain = None
     buyer: UserDomain = None
     create_date: str = None
-    total_price: decimal.Decimal = None
+    total_price: Won = None
     photo_card_id: int = None
     buyer_id: int = None
     seller_id: int = None
@@ -79,3 +129,53 @@ class PhotoCardSale:
 
     def __str__(self):
         return f'Id:{self.id} | 카드: {self.photo_card.name} |가격: {self.price} | 판매자: {self.seller.email} | 구매자: {self.buyer.email}'
+
+
+@dataclasses.dataclass(slots=True)
+class PhotoCardPurchase:
+    """
+    판매 기록 구매 처리 결과, 구매에 성공한 경우에만 photo_card_id, total_price가 채워진다.
+    """
+    outcome: PurchaseOutcome
+    record_id: int
+    photo_card_id: int = None
+    total_price: Won = None
+
+    def is_purchased(self) -> bool:
+        return self.outcome == PurchaseOutcome.PURCHASED
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class OnSaleCursor:
+    """
+    판매중 목록 keyset 페이지네이션 커서, (total_price, renewal_date, id) 순서상 이후의 매물부터 조회한다.
+    """
+    total_price: Won
+    renewal_date: datetime.datetime
+    id: int
+
+
+@dataclasses.dataclass(slots=True)
+class OnSalePage:
+    """
+    판매중 목록 한 페이지, 다음 페이지가 없다면 next_cursor는 None
+    """
+    records: List[PhotoCardSale]
+    next_cursor: Optional[OnSaleCursor] = None
+
+
+@dataclasses.dataclass(slots=True)
+class PhotoCardCheckout:
+    """
+    판매 기록 일괄 구매 처리 결과
+    purchases는 record_id 순서의 항목별 구매 결과, total_price는 실제로 차감된 금액
+    """
+    mode: CheckoutMode
+    purchases: List[PhotoCardPurchase]
+    total_price: Won = Won(0)
+
+    def purchased(self) -> List[PhotoCardPurchase]:
+        return [purchase for purchase in self.purchases if purchase.is_purchased()]
+
+    def is_all_purchased(self) -> bool:
+        return all(purchase.is_purchased() for purchase in self.purchases)
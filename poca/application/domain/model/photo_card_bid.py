@@ -0,0 +1,35 @@
+import dataclasses
+import enum
+
+from poca.application.domain.model.money import Won
+
+
+class PhotoCardBidState(enum.Enum):
+    OPEN = "대기"
+    FILLED = "체결"
+    CANCELLED = "취소"
+
+
+@dataclasses.dataclass
+class PhotoCardBid:
+    """
+    포토카드 구매 주문(매수 호가), max_price 이하의 총 가격(price + fee)으로 등록된 매물과 체결된다.
+    """
+    photo_card_id: int
+    buyer_id: int
+    max_price: Won
+    state: PhotoCardBidState = PhotoCardBidState.OPEN
+    id: int = None
+    create_date: str = None
+    record_id: int = None
+    filled_date: str = None
+
+    def is_open(self) -> bool:
+        return self.state == PhotoCardBidState.OPEN
+
+    def can_fill(self, total_price: Won) -> bool:
+        """
+        매물의 총 가격으로 체결 가능한지 확인
+        :param total_price: Won 매물의 price + fee
+        """
+        return self.is_open() and total_price <= self.max_price
@@ -0,0 +1,64 @@
+import dataclasses
+import datetime
+import enum
+
+from poca.application.domain.model.money import Won
+
+
+class CandleResolution(enum.Enum):
+    MINUTE = "1m"
+    HOUR = "1h"
+    DAY = "1d"
+
+    def floor(self, traded_at: datetime.datetime) -> datetime.datetime:
+        """
+        거래 시각이 속한 구간의 시작 시각, 구간은 traded_at의 시간대 기준으로 나눈다.
+        :param traded_at: datetime.datetime
+        """
+        traded_at = traded_at.replace(second=0, microsecond=0)
+        if self == CandleResolution.MINUTE:
+            return traded_at
+        traded_at = traded_at.replace(minute=0)
+        if self == CandleResolution.HOUR:
+            return traded_at
+        return traded_at.replace(hour=0)
+
+
+@dataclasses.dataclass
+class PhotoCardPriceCandle:
+    """
+    포토카드 거래가 캔들(시가/고가/저가/종가/거래량), 구간 안의 거래 가격(price)으로 집계한다.
+    """
+    photo_card_id: int
+    resolution: CandleResolution
+    bucket: datetime.datetime
+    open: Won
+    high: Won
+    low: Won
+    close: Won
+    volume: int
+    open_at: datetime.datetime
+    close_at: datetime.datetime
+
+    @classmethod
+    def first_trade(cls, photo_card_id: int, resolution: CandleResolution, price: Won,
+                    traded_at: datetime.datetime, bucket: datetime.datetime = None) -> 'PhotoCardPriceCandle':
+        """
+        구간의 첫 거래로 캔들 생성
+        :param bucket: datetime.datetime 구간 시작 시각, 없다면 traded_at으로 계산
+        """
+        return cls(photo_card_id=photo_card_id, resolution=resolution,
+                   bucket=bucket or resolution.floor(traded_at),
+                   open=price, high=price, low=price, close=price, volume=1, open_at=traded_at, close_at=traded_at)
+
+    def merge(self, price: Won, traded_at: datetime.datetime) -> None:
+        """
+        구간 안의 거래 반영, 거래 순서와 무관하게 시가/종가는 가장 이른/늦은 거래로 결정된다.
+        """
+        self.high = max(self.high, price)
+        self.low = min(self.low, price)
+        if traded_at < self.open_at:
+            self.open, self.open_at = price, traded_at
+        if traded_at >= self.close_at:
+            self.close, self.close_at = price, traded_at
+        self.volume += 1
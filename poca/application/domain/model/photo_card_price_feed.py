@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from poca.application.domain.model.photo_card import PhotoCardSale
+from poca.application.domain.model.photo_card_trade_event import PhotoCardSaleCompletedEvent
+
+
+@dataclass(frozen=True)
+class PhotoCardPriceUpdate:
+    """
+    포토카드 시세 변경 알림, 전송 주기 동안의 변경을 포토카드별로 하나로 합친 최신 상태
+    """
+    photo_card_id: int
+    # 판매중인 최소 가격 매물, 판매중인 매물이 없다면 None
+    min_price: Optional[PhotoCardSale]
+    # 전송 주기 동안 완료된 거래, 완료된 순서
+    trades: Tuple[PhotoCardSaleCompletedEvent, ...] = ()
@@ -0,0 +1,91 @@
+import dataclasses
+import decimal
+import enum
+import unicodedata
+from typing import List, Optional, Set
+
+from poca.application.domain.model.photo_card import PhotoCard
+
+
+def normalize(text: Optional[str]) -> str:
+    """
+    검색용 정규화, 전각/반각과 대소문자 차이를 없앤다. 한글은 완성형 음절로 유지된다.
+    """
+    return unicodedata.normalize('NFKC', text or '').casefold().strip()
+
+
+def search_text(text: Optional[str]) -> str:
+    """
+    검색어와 비교할 정규화된 본문, 연속된 공백은 한 칸으로 합친다.
+    """
+    return ' '.join(normalize(text).split())
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return list(dict.fromkeys(normalize(text).split()))
+
+
+def token_grams(token: str) -> Set[str]:
+    """
+    검색어 토큰의 n-gram, 한 글자 토큰은 글자 자체를, 두 글자 이상은 bigram을 사용한다.
+    예) '뉴진스' -> {'뉴진', '진스'}
+    """
+    if len(token) == 1:
+        return {token}
+    return {token[i:i + 2] for i in range(len(token) - 1)}
+
+
+def index_grams(*texts: Optional[str]) -> Set[str]:
+    """
+    색인할 n-gram, 한 글자 검색도 가능하도록 글자(unigram)와 bigram을 함께 색인한다.
+    한글 이름은 대부분 2~4 음절이므로 trigram 대신 bigram을 사용한다.
+    예) '뉴진스' -> {'뉴', '진', '스', '뉴진', '진스'}
+    """
+    grams = set()
+    for text in texts:
+        for token in tokenize(text):
+            grams.update(token)
+            grams.update(token_grams(token))
+    return grams
+
+
+class SearchOrder(enum.Enum):
+    RELEVANCE = "relevance"
+    PRICE = "price"
+
+
+@dataclasses.dataclass(frozen=True)
+class PhotoCardSearchQuery:
+    """
+    포토카드 검색 조건, 모든 토큰이 이름 또는 설명에 포함된 포토카드를 찾는다.
+    """
+    text: str
+    limit: int = 20
+    order: SearchOrder = SearchOrder.RELEVANCE
+    # 판매중인 매물이 있는 포토카드만 조회
+    on_sale_only: bool = False
+
+    @property
+    def normalized(self) -> str:
+        return ' '.join(self.tokens)
+
+    @property
+    def tokens(self) -> List[str]:
+        return tokenize(self.text)
+
+    def grams(self) -> Set[str]:
+        """
+        후보 포토카드는 모든 n-gram을 색인에 가지고 있어야 한다.
+        """
+        return {gram for token in self.tokens for gram in token_grams(token)}
+
+
+@dataclasses.dataclass
+class PhotoCardSearchHit:
+    """
+    검색 결과, 판매중인 매물이 있다면 최소 가격 매물을 함께 반환한다.
+    """
+    photo_card: PhotoCard
+    score: int
+    min_price_record_id: Optional[int] = None
+    min_total_price: Optional[decimal.Decimal] = None
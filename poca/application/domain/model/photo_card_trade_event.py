@@ -0,0 +1,28 @@
+import datetime
+from dataclasses import dataclass
+
+from poca.application.domain.model.money import Won
+
+
+@dataclass(frozen=True, slots=True)
+class PhotoCardSaleRegisteredEvent:
+    """
+    포토카드 판매 등록 완료 이벤트
+    """
+    photo_card_id: int
+    record_id: int
+    price: Won
+    fee: Won
+
+
+@dataclass(frozen=True, slots=True)
+class PhotoCardSaleCompletedEvent:
+    """
+    포토카드 거래(구매) 완료 이벤트
+    """
+    photo_card_id: int
+    record_id: int
+    buyer_id: int
+    price: Won = None
+    fee: Won = None
+    sold_date: datetime.datetime = None
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
-from poca.application.domain.model.photo_card import PhotoCardSale, PhotoCard
+from poca.application.domain.model.photo_card import OnSaleCursor, PhotoCardCheckout, PhotoCardSale, PhotoCard
+from poca.application.domain.model.photo_card_price_candle import CandleResolution, PhotoCardPriceCandle
 
 
 class PhotoCardTradeResult:
@@ -24,6 +25,30 @@ class PhotoCardTradeRecentlySoldResult(PhotoCardTradeResult):
     photo_card: PhotoCard
 
 
+@dataclass
+class PhotoCardPriceCandleResult(PhotoCardTradeResult):
+    """
+    포토카드 거래가 캔들 조회 결과
+    :params photo_card_id: int
+    :params resolution: CandleResolution
+    :params candles: List[PhotoCardPriceCandle] 시간 순서
+    """
+    photo_card_id: int
+    resolution: CandleResolution
+    candles: List[PhotoCardPriceCandle]
+
+
+@dataclass
+class PhotoCardTradeOnSalePageResult(PhotoCardTradeResult):
+    """
+    판매중인 포토카드 페이지 조회 결과
+    :params records: List[PhotoCardSale]
+    :params next_cursor: Optional[OnSaleCursor] 마지막 페이지라면 None
+    """
+    records: List[PhotoCardSale]
+    next_cursor: Optional[OnSaleCursor]
+
+
 @dataclass
 class PhotoCardTradeResultObject(PhotoCardTradeResult):
     record: PhotoCardSale
@@ -54,11 +79,24 @@ class PhotoCardSaleRegisteredResult(PhotoCardTradeResult):
     판매 등록 성공
     """
     photo_card_id: int
+    record_id: int = None
 
     def to_message(self) -> str:
         return f"photo_card_id:{self.photo_card_id} 판매 등록이 완료되었습니다."
 
 
+@dataclass
+class PhotoCardSaleBulkRegisteredResult(PhotoCardTradeResult):
+    """
+    판매 일괄 등록 결과
+    :params results: List[PhotoCardTradeResult] 요청 순서의 등록 성공(PhotoCardSaleRegisteredResult)/실패(PhotoCardSaleRegisterFailResult)
+    """
+    results: List[PhotoCardTradeResult]
+
+    def is_all_registered(self) -> bool:
+        return all(isinstance(result, PhotoCardSaleRegisteredResult) for result in self.results)
+
+
 @dataclass
 class NoPhotoCardOnSaleResult(PhotoCardTradeResult):
     photo_card_id: int
@@ -75,9 +113,57 @@ class PhotoCardTradeProcessedResult(PhotoCardTradeResult):
         return f"record_id:{self.record_id} 거래가 성공적으로 처리되었습니다."
 
 
+@dataclass
+class PhotoCardCheckoutResult(PhotoCardTradeResult):
+    """
+    일괄 구매 결과
+    :params checkout: PhotoCardCheckout 항목별 구매 결과
+    """
+    checkout: PhotoCardCheckout
+
+    def to_message(self) -> str:
+        purchased = self.checkout.purchased()
+        return (f"{len(self.checkout.purchases)}건 중 {len(purchased)}건의 거래가 처리되었습니다. "
+                f"(결제 금액: {self.checkout.total_price})")
+
+
 @dataclass
 class PhotoCardTradeNotProcessedResult(PhotoCardTradeResult):
     record_id: int
 
     def to_message(self) -> str:
         return f"record_id:{self.record_id} 거래가 처리되지 않았습니다. 재시도 해주세요."
+
+
+@dataclass
+class PhotoCardPurchaseNotProcessedResult(PhotoCardTradeResult):
+    """
+    포토카드 id로 구매(최저가 매물 구매)가 처리되지 않음
+    """
+    photo_card_id: int
+
+    def to_message(self) -> str:
+        return f"photo_card_id:{self.photo_card_id} 거래가 처리되지 않았습니다. 재시도 해주세요."
+
+
+@dataclass
+class PhotoCardBidPlacedResult(PhotoCardTradeResult):
+    """
+    구매 주문 등록 성공, 체결은 매칭 엔진에서 비동기로 처리된다.
+    """
+    bid_id: int
+    photo_card_id: int
+
+    def to_message(self) -> str:
+        return f"photo_card_id:{self.photo_card_id} 구매 주문(bid_id:{self.bid_id})이 등록되었습니다."
+
+
+@dataclass
+class PhotoCardBidPlaceFailResult(PhotoCardTradeResult):
+    """
+    구매 주문 등록 실패
+    """
+    photo_card_id: int
+
+    def to_message(self) -> str:
+        return f"photo_card_id:{self.photo_card_id} 구매 주문 등록에 실패하였습니다."
@@ -1,17 +1,19 @@
 import dataclasses
-import decimal
 
+from poca.application.domain.model.money import Won
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class UserDomain:
     user_id: int
-    balance: decimal.Decimal
+    # 원 단위 정수 잔액
+    balance: Won
     email: str
     active: bool
 
-    def is_user_can_purchase(self, price: decimal.Decimal) -> bool:
+    def is_user_can_purchase(self, price: Won) -> bool:
         return self.balance >= price
 
-    def buy_photo_card(self, price: decimal.Decimal):
+    def buy_photo_card(self, price: Won):
         self.balance -= price
         return self
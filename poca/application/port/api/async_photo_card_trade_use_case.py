@@ -0,0 +1,39 @@
+from typing import Optional, Protocol
+
+from poca.application.domain.model import photo_card_trade_result
+from poca.application.domain.model.photo_card import OnSaleCursor, OnSaleQueryStrategy
+
+
+class AsyncPhotoCardTradeUseCase(Protocol):
+    """
+    PhotoCardTradeUseCase 조회 기능의 비동기 버전
+    """
+
+    async def on_sale_photo_card_page(self, method: OnSaleQueryStrategy, cursor: Optional[OnSaleCursor] = None,
+                                      limit: int = 20) -> photo_card_trade_result.PhotoCardTradeResult:
+        """
+        조회 정책에 따라 판매중인 포토카드를 커서 기반으로 페이지 조회
+        :param method: OnSaleQueryStrategy
+        :param cursor: Optional[OnSaleCursor] 이전 페이지의 next_cursor
+        :param limit: int default: 20
+        :return: PhotoCardTradeOnSalePageResult
+        """
+        raise NotImplementedError()
+
+    async def get_recently_sold_photo_card(self, card_id,
+                                           number_of_cards=5) -> photo_card_trade_result.PhotoCardTradeResult:
+        """
+        포토카드 정보 및 최근 거래된 지정된 갯수 만큼의 포토카드 거래 내역 조회
+        :param card_id: int
+        :param number_of_cards: int default: 5
+        :return: 조회에 성공했을 경우 PhotoCardTradeRecentlySoldResult, 포토카드가 없다면 NoPhotoCardOnSaleResult
+        """
+        raise NotImplementedError()
+
+    async def get_min_price_photo_card_on_sale(self, card_id) -> photo_card_trade_result.PhotoCardTradeResult:
+        """
+        최소 가격의 판매중인 포토카드 조회
+        :param card_id: int
+        :return: 조회에 성공했을 경우 PhotoCardTradeResultObject, 없다면 NoPhotoCardOnSaleResult
+        """
+        raise NotImplementedError()
@@ -1,11 +1,14 @@
 from dataclasses import dataclass
+from typing import Iterable, Optional
 
 
 @dataclass
 class CreatePhotoCardCommand:
     """
     사진 카드 등록을 위한 시그니처 클래스
+    image_chunks: 이미지 데이터 청크, 업로드 파일 전체를 메모리에 올리지 않도록 청크 단위로 전달한다.
     """
     name: str
     description: str
-    image_data: bytes
+    image_chunks: Iterable[bytes] = ()
+    content_type: Optional[str] = None
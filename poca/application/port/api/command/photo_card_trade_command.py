@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import List
+
+from poca.application.domain.model.photo_card import CheckoutMode
 
 
 @dataclass
@@ -9,6 +12,28 @@ class UpdatePhotoCardCommand:
     record_id: int
     buyer_id: int
     version: int
+    photo_card_id: int = None
+
+
+@dataclass
+class PurchasePhotoCardCommand:
+    """
+    판매 기록 구매를 위한 시그니처 클래스
+    version이 없으면 판매중 상태만으로 구매 가능 여부를 판단한다.
+    """
+    record_id: int
+    buyer_id: int
+    version: int = None
+
+
+@dataclass
+class CheckoutPhotoCardCommand:
+    """
+    여러 판매 기록 일괄 구매를 위한 시그니처 클래스
+    """
+    record_ids: List[int]
+    buyer_id: int
+    mode: CheckoutMode = CheckoutMode.ALL_OR_NOTHING
 
 
 @dataclass
@@ -20,3 +45,13 @@ class RegisterPhotoCardOnSaleCommand:
     seller_id: int
     price: int
     fee: int = 0
+
+
+@dataclass
+class PlacePhotoCardBidCommand:
+    """
+    포토카드 구매 주문 등록을 위한 시그니처 클래스
+    """
+    card_id: int
+    buyer_id: int
+    max_price: int
@@ -0,0 +1,14 @@
+from typing import Protocol
+
+from poca.application.domain.model import photo_card_trade_result
+from poca.application.port.api.command.photo_card_trade_command import PlacePhotoCardBidCommand
+
+
+class PhotoCardBidUseCase(Protocol):
+    def place_photo_card_bid(self, command: PlacePhotoCardBidCommand) -> photo_card_trade_result.PhotoCardTradeResult:
+        """
+        포토카드 구매 주문 등록, max_price 이하의 매물이 있거나 등록되면 가격-시간 우선 순서로 체결된다.
+        :param command: PlacePhotoCardBidCommand
+        :return: 등록에 성공했을 경우 PhotoCardBidPlacedResult, 실패했을 경우 PhotoCardBidPlaceFailResult 반환
+        """
+        raise NotImplementedError()
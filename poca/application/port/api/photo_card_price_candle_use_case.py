@@ -0,0 +1,29 @@
+import datetime
+from typing import Optional, Protocol
+
+from poca.application.domain.model import photo_card_trade_result
+from poca.application.domain.model.photo_card_price_candle import CandleResolution
+
+
+class PhotoCardPriceCandleUseCase(Protocol):
+    def get_photo_card_price_candles(self, card_id: int, resolution: CandleResolution,
+                                     start: Optional[datetime.datetime] = None,
+                                     end: Optional[datetime.datetime] = None,
+                                     limit: int = 100) -> photo_card_trade_result.PhotoCardTradeResult:
+        """
+        포토카드 거래가 캔들 조회
+        :param card_id: int
+        :param resolution: CandleResolution 1m, 1h, 1d
+        :param start: Optional[datetime.datetime] 조회 구간 시작 (포함)
+        :param end: Optional[datetime.datetime] 조회 구간 끝 (미포함)
+        :param limit: int 구간 안에서 가장 최근 limit개
+        :return: 성공시 PhotoCardPriceCandleResult, 포토카드가 없는 경우 NoPhotoCardOnSaleResult 반환
+        """
+        raise NotImplementedError()
+
+    def backfill_photo_card_price_candles(self) -> int:
+        """
+        완료된 거래 전체를 한번 스트리밍 조회하여 포토카드별 캔들을 다시 생성
+        :return: int 생성된 캔들 수
+        """
+        raise NotImplementedError()
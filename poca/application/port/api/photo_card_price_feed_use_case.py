@@ -0,0 +1,38 @@
+from typing import Iterable, Optional, Protocol
+
+from poca.application.domain.model.photo_card_price_feed import PhotoCardPriceUpdate
+
+
+class PhotoCardPriceFeedLaggedException(Exception):
+    """
+    구독자가 알림을 제때 읽지 않아 대기 알림이 가득 찬 경우, 구독은 해지된다.
+    """
+    pass
+
+
+class PhotoCardPriceSubscription(Protocol):
+    async def get(self, timeout: float) -> Optional[PhotoCardPriceUpdate]:
+        """
+        다음 시세 변경 알림
+        :param timeout: float 최대 대기 시간(초)
+        :return: Optional[PhotoCardPriceUpdate] timeout 동안 알림이 없다면 None
+        :raise PhotoCardPriceFeedLaggedException: 대기 알림이 가득 차 구독이 해지된 경우
+        """
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        """
+        구독 해지
+        """
+        raise NotImplementedError()
+
+
+class PhotoCardPriceFeedUseCase(Protocol):
+    async def subscribe(self, card_ids: Iterable[int]) -> PhotoCardPriceSubscription:
+        """
+        포토카드 시세(최소 가격 매물, 완료된 거래) 변경 구독
+        첫 알림으로 포토카드별 현재 최소 가격 매물을 전달한다.
+        :param card_ids: Iterable[int] 구독할 포토카드 id
+        :return: PhotoCardPriceSubscription
+        """
+        raise NotImplementedError()
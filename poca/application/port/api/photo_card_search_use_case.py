@@ -0,0 +1,20 @@
+from typing import List, Protocol
+
+from poca.application.domain.model.photo_card_search import PhotoCardSearchHit, PhotoCardSearchQuery
+
+
+class PhotoCardSearchUseCase(Protocol):
+    def search_photo_cards(self, query: PhotoCardSearchQuery) -> List[PhotoCardSearchHit]:
+        """
+        포토카드 이름/설명 검색
+        :param query: PhotoCardSearchQuery 검색어, 정렬(relevance, price), 판매중 여부
+        :return: List[PhotoCardSearchHit] 판매중인 최소 가격 매물을 함께 반환한다.
+        """
+        raise NotImplementedError()
+
+    def rebuild_photo_card_search_index(self) -> int:
+        """
+        전체 포토카드의 검색 색인을 다시 생성
+        :return: int 색인된 포토카드 수
+        """
+        raise NotImplementedError()
@@ -1,7 +1,7 @@
-from typing import Protocol
+from typing import List, Optional, Protocol
 
 from poca.application.domain.model import photo_card_trade_result
-from poca.application.domain.model.photo_card import OnSaleQueryStrategy
+from poca.application.domain.model.photo_card import CheckoutMode, OnSaleCursor, OnSaleQueryStrategy
 from poca.application.port.api.command.photo_card_trade_command import RegisterPhotoCardOnSaleCommand
 
 
@@ -13,6 +13,17 @@ class PhotoCardTradeUseCase(Protocol):
         """
         raise NotImplementedError()
 
+    def on_sale_photo_card_page(self, method: OnSaleQueryStrategy, cursor: Optional[OnSaleCursor] = None,
+                                limit: int = 20) -> photo_card_trade_result.PhotoCardTradeResult:
+        """
+        조회 정책에 따라 판매중인 포토카드를 커서 기반으로 페이지 조회
+        :param method: OnSaleQueryStrategy
+        :param cursor: Optional[OnSaleCursor] 이전 페이지의 next_cursor
+        :param limit: int default: 20
+        :return: PhotoCardTradeOnSalePageResult
+        """
+        raise NotImplementedError()
+
     def register_photo_card_on_sale(self, command: RegisterPhotoCardOnSaleCommand):
         """
         포토카드 판매 등록
@@ -21,6 +32,15 @@ class PhotoCardTradeUseCase(Protocol):
         """
         raise NotImplementedError()
 
+    def register_photo_card_on_sale_bulk(
+            self, commands: List[RegisterPhotoCardOnSaleCommand]) -> photo_card_trade_result.PhotoCardTradeResult:
+        """
+        포토카드 판매 일괄 등록, 수수료 정책은 일괄로 적용한다.
+        :param commands: List[RegisterPhotoCardOnSaleCommand]
+        :return: PhotoCardSaleBulkRegisteredResult 요청 순서의 항목별 등록 결과
+        """
+        raise NotImplementedError()
+
     def get_recently_sold_photo_card(self, card_id, number_of_cards=5) -> photo_card_trade_result.PhotoCardTradeResult:
         """
         포토카드 정보 및 최근 거래된 지정된 갯수 만큼의 포토카드 거래 내역 조회
@@ -47,3 +67,25 @@ class PhotoCardTradeUseCase(Protocol):
         :return: 구매에 성공했을 경우 성공객체 반환, 실패했을 경우 실패객체(NoPhotoCardOnSaleResult, InsufficientBalanceResult, PhotoCardTradeNotProcessedResult) 반환
         """
         raise NotImplementedError()
+
+    def buy_min_price_photo_card(self, card_id: int, buyer_id: int) -> photo_card_trade_result.PhotoCardTradeResult:
+        """
+        포토카드의 판매중인 매물 중 가장 저렴한 매물을 구매합니다
+        동시에 구매하는 구매자들은 서로 다른 매물을 잠그므로 충돌 없이 처리됩니다.
+        :param card_id: int 포토카드 id
+        :param buyer_id: int 구매자 id
+        :return: 구매에 성공했을 경우 성공객체 반환, 실패했을 경우 실패객체(NoPhotoCardOnSaleResult, InsufficientBalanceResult,
+                 PhotoCardPurchaseNotProcessedResult) 반환
+        """
+        raise NotImplementedError()
+
+    def checkout_photo_cards(self, record_ids: List[int], buyer_id: int,
+                             mode: CheckoutMode = CheckoutMode.ALL_OR_NOTHING) -> photo_card_trade_result.PhotoCardTradeResult:
+        """
+        여러 판매중인 포토카드를 하나의 트랜잭션으로 구매합니다
+        :param record_ids: List[int] 판매 기록 id 목록
+        :param buyer_id: int 구매자 id
+        :param mode: CheckoutMode ALL_OR_NOTHING: 모두 구매하거나 모두 구매하지 않음, BEST_EFFORT: 구매 가능한 항목만 구매
+        :return: PhotoCardCheckoutResult 항목별 구매 결과, 처리 중 오류가 발생한 경우 PhotoCardTradeNotProcessedResult
+        """
+        raise NotImplementedError()
@@ -0,0 +1,13 @@
+from typing import Protocol
+
+from poca.application.port.api.command.photo_card_command import CreatePhotoCardCommand
+
+
+class PhotoCardUseCase(Protocol):
+    def register_new_photo_card(self, command: CreatePhotoCardCommand) -> int:
+        """
+        신규 포토카드 등록, 이미지는 요청이 끝난 뒤 저장소에 업로드되고 image_url은 업로드가 끝나면 채워진다.
+        :param command: CreatePhotoCardCommand
+        :return: int 포토카드 id
+        """
+        raise NotImplementedError()
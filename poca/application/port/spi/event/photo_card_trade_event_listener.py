@@ -0,0 +1,24 @@
+from typing import Protocol
+
+from poca.application.domain.model.photo_card_trade_event import PhotoCardSaleCompletedEvent, \
+    PhotoCardSaleRegisteredEvent
+
+
+class PhotoCardTradeEventListener(Protocol):
+    """
+    판매 기록 변경 이벤트 수신자, 트랜잭션 커밋 이후에 호출된다.
+    """
+
+    def on_sale_registered(self, event: PhotoCardSaleRegisteredEvent) -> None:
+        """
+        포토카드 판매 등록 완료
+        :param event: PhotoCardSaleRegisteredEvent
+        """
+        raise NotImplementedError()
+
+    def on_sale_completed(self, event: PhotoCardSaleCompletedEvent) -> None:
+        """
+        포토카드 거래 완료
+        :param event: PhotoCardSaleCompletedEvent
+        """
+        raise NotImplementedError()
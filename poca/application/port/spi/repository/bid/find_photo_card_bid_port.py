@@ -0,0 +1,13 @@
+from typing import List, Protocol
+
+from poca.application.domain.model.photo_card_bid import PhotoCardBid
+
+
+class FindPhotoCardBidPort(Protocol):
+    def find_open_photo_card_bids(self, card_id: int) -> List[PhotoCardBid]:
+        """
+        포토카드의 대기중인 구매 주문 조회
+        :param card_id: int
+        :return: [domain] List:PhotoCardBid 등록 순
+        """
+        raise NotImplementedError()
@@ -0,0 +1,30 @@
+from typing import Optional, Protocol
+
+from poca.application.domain.model.photo_card_bid import PhotoCardBid
+
+
+class SavePhotoCardBidPort(Protocol):
+    def save_photo_card_bid(self, bid: PhotoCardBid) -> Optional[PhotoCardBid]:
+        """
+        신규 구매 주문 저장
+        :param bid: PhotoCardBid
+        :return: [domain] Optional[PhotoCardBid] 저장에 실패한 경우 None
+        """
+        raise NotImplementedError()
+
+    def fill_photo_card_bid(self, bid_id: int, record_id: int) -> bool:
+        """
+        대기중인 구매 주문을 체결 처리
+        :param bid_id: int
+        :param record_id: int 체결된 판매 기록 id
+        :return: bool 대기중이 아니라면 False
+        """
+        raise NotImplementedError()
+
+    def cancel_photo_card_bid(self, bid_id: int) -> bool:
+        """
+        대기중인 구매 주문을 취소 처리
+        :param bid_id: int
+        :return: bool 대기중이 아니라면 False
+        """
+        raise NotImplementedError()
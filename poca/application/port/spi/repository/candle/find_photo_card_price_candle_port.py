@@ -0,0 +1,21 @@
+import datetime
+from typing import List, Optional, Protocol
+
+from poca.application.domain.model.photo_card_price_candle import CandleResolution, PhotoCardPriceCandle
+
+
+class FindPhotoCardPriceCandlePort(Protocol):
+    def find_photo_card_price_candles(self, card_id: int, resolution: CandleResolution,
+                                      start: Optional[datetime.datetime] = None,
+                                      end: Optional[datetime.datetime] = None,
+                                      limit: int = 100) -> List[PhotoCardPriceCandle]:
+        """
+        포토카드 캔들 조회, 구간 [start, end) 안에서 가장 최근 limit개를 시간 순서로 반환한다.
+        :param card_id: int
+        :param resolution: CandleResolution
+        :param start: Optional[datetime.datetime]
+        :param end: Optional[datetime.datetime]
+        :param limit: int
+        :return: [domain] List[PhotoCardPriceCandle]
+        """
+        raise NotImplementedError()
@@ -0,0 +1,14 @@
+import datetime
+from typing import Iterator, Protocol, Tuple
+
+from poca.application.domain.model.money import Won
+
+
+class FindPhotoCardTradePort(Protocol):
+    def iter_photo_card_trades(self, chunk_size: int = 2000) -> Iterator[Tuple[int, Won, datetime.datetime]]:
+        """
+        완료된 거래 전체를 (포토카드 id, 거래 시각) 순서로 스트리밍 조회, 캔들 백필에 사용한다.
+        :param chunk_size: int DB에서 한번에 가져오는 행 수
+        :return: Iterator[(photo_card_id, price, sold_date)] sold_date는 현재 시간대 기준
+        """
+        raise NotImplementedError()
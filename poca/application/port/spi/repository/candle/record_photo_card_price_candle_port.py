@@ -0,0 +1,25 @@
+import datetime
+from typing import Iterable, Protocol
+
+from poca.application.domain.model.money import Won
+from poca.application.domain.model.photo_card_price_candle import PhotoCardPriceCandle
+
+
+class RecordPhotoCardPriceCandlePort(Protocol):
+    def record_photo_card_trade(self, photo_card_id: int, price: Won, traded_at: datetime.datetime) -> None:
+        """
+        완료된 거래를 모든 해상도의 캔들에 반영, 거래 완료 트랜잭션의 커밋 이후에 호출한다.
+        :param photo_card_id: int
+        :param price: Won 거래 가격
+        :param traded_at: datetime.datetime 거래 시각
+        """
+        raise NotImplementedError()
+
+    def replace_photo_card_price_candles(self, photo_card_id: int, candles: Iterable[PhotoCardPriceCandle]) -> int:
+        """
+        포토카드의 캔들을 모두 교체 (백필)
+        :param photo_card_id: int
+        :param candles: Iterable[PhotoCardPriceCandle]
+        :return: int 저장된 캔들 수
+        """
+        raise NotImplementedError()
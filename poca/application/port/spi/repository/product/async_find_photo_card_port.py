@@ -0,0 +1,43 @@
+from typing import List, Optional, Protocol
+
+from poca.application.domain.model.photo_card import OnSaleCursor, OnSalePage, PhotoCard, PhotoCardSale
+
+
+class AsyncFindPhotoCardSalePort(Protocol):
+    """
+    FindPhotoCardSalePort의 비동기 버전, ASGI 요청 경로에서 이벤트 루프를 막지 않고 조회한다.
+    """
+
+    async def afind_photo_card_renewal_old_page(self, cursor: Optional[OnSaleCursor], limit: int) -> OnSalePage:
+        """
+        판매중인 포토카드를 (total_price, renewal_date, id) 순으로 keyset 페이지네이션하여 조회
+        :param cursor: Optional[OnSaleCursor] 이전 페이지의 next_cursor, 첫 페이지라면 None
+        :param limit: int 페이지 크기
+        :return: [domain] OnSalePage
+        """
+        raise NotImplementedError()
+
+    async def afind_photo_card_by_card_id(self, card_id: int) -> Optional[PhotoCard]:
+        """
+        포토카드 id를 가진 포토카드 조회
+        :param card_id: int
+        :return: Optional[PhotoCardDomain]
+        """
+        raise NotImplementedError()
+
+    async def afind_recently_sold_photo_card(self, card_id: int, number_of_cards: int = 5) -> List[PhotoCardSale]:
+        """
+        포토카드의 최근 거래 내역 조회
+        :param card_id: int
+        :param number_of_cards: int default: 5
+        :return: [domain] List:PhotoCardSale
+        """
+        raise NotImplementedError()
+
+    async def afind_min_price_photo_card_on_sale(self, card_id: int) -> Optional[PhotoCardSale]:
+        """
+        최소 가격의 판매중인 포토카드 조회
+        :param card_id: int
+        :return: [domain] Optional[PhotoCardSale]
+        """
+        raise NotImplementedError()
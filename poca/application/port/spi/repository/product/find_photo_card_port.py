@@ -1,6 +1,6 @@
 from typing import Protocol, List, Optional
 
-from poca.application.domain.model.photo_card import PhotoCard, PhotoCardSale
+from poca.application.domain.model.photo_card import OnSaleCursor, OnSalePage, PhotoCard, PhotoCardSale
 
 
 class FindPhotoCardSalePort(Protocol):
@@ -11,6 +11,15 @@ class FindPhotoCardSalePort(Protocol):
         """
         raise NotImplementedError()
 
+    def find_photo_card_renewal_old_page(self, cursor: Optional[OnSaleCursor], limit: int) -> OnSalePage:
+        """
+        find_photo_card_renewal_old 결과를 (total_price, renewal_date, id) 순으로 keyset 페이지네이션하여 조회
+        :param cursor: Optional[OnSaleCursor] 이전 페이지의 next_cursor, 첫 페이지라면 None
+        :param limit: int 페이지 크기
+        :return: [domain] OnSalePage
+        """
+        raise NotImplementedError()
+
     def find_photo_card_by_card_id(self, card_id: int) -> Optional[PhotoCard]:
         """
         포토카드 id를 가진 포토카드 조회
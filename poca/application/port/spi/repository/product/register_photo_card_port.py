@@ -0,0 +1,31 @@
+from typing import Optional, Protocol
+
+from poca.application.domain.model.photo_card import PhotoCardImage
+from poca.application.port.api.command.photo_card_command import CreatePhotoCardCommand
+
+
+class RegisterPhotoCardPort(Protocol):
+    def register_new_photo_card(self, photo_card: CreatePhotoCardCommand, image: PhotoCardImage = None) -> int:
+        """
+        신규 포토카드 등록, 저장되지 않은 이미지의 url은 업로드가 끝난 뒤 update_photo_card_image로 반영한다.
+        :param photo_card: CreatePhotoCardCommand
+        :param image: PhotoCardImage 포토카드 이미지, 이미 저장된 이미지라면 url도 함께 등록한다.
+        :return: int 포토카드 id
+        """
+        raise NotImplementedError()
+
+    def find_photo_card_image(self, image_hash: str) -> Optional[PhotoCardImage]:
+        """
+        이미 저장된 이미지 조회
+        :param image_hash: str 이미지 SHA-256
+        :return: [domain] Optional[PhotoCardImage] 저장된 적 없는 이미지라면 None
+        """
+        raise NotImplementedError()
+
+    def update_photo_card_image(self, image: PhotoCardImage) -> int:
+        """
+        같은 이미지를 사용하는 포토카드의 이미지 url 갱신
+        :param image: PhotoCardImage
+        :return: int 갱신된 포토카드 수
+        """
+        raise NotImplementedError()
@@ -1,7 +1,8 @@
-from typing import Protocol
+from typing import List, Optional, Protocol
 
-from poca.application.domain.model.photo_card import PhotoCardSale
-from poca.application.port.api.command.photo_card_trade_command import UpdatePhotoCardCommand
+from poca.application.domain.model.photo_card import PhotoCardCheckout, PhotoCardPurchase, PhotoCardSale
+from poca.application.port.api.command.photo_card_trade_command import CheckoutPhotoCardCommand, \
+    PurchasePhotoCardCommand, UpdatePhotoCardCommand
 
 
 class SavePhotoCardSalePort(Protocol):
@@ -12,9 +13,46 @@ class SavePhotoCardSalePort(Protocol):
         """
         raise NotImplementedError()
 
+    def save_photo_card_sales(self, photo_cards: List[PhotoCardSale],
+                              batch_size: int = 500) -> List[Optional[PhotoCardSale]]:
+        """
+        신규 포토카드 판매 정보 일괄 저장, batch_size 건씩 나누어 한번의 INSERT로 저장한다.
+        :param photo_cards: List[PhotoCardSale]
+        :param batch_size: int INSERT 한번에 저장하는 최대 건수
+        :return: [domain] List:Optional[PhotoCardSale] 요청 순서의 저장 결과, 저장에 실패한 항목은 None
+        """
+        raise NotImplementedError()
+
     def update_photo_card_sale(self, command: UpdatePhotoCardCommand):
         """
         포토 카드 구매 정보 업데이트 version을 이용한 동시성 제어
         :param command: UpdatePhotoCardCommand
+        :info: version이 일치하지 않으면 OptimisticLockException
+        """
+        raise NotImplementedError()
+
+    def purchase_photo_card_sale(self, command: PurchasePhotoCardCommand) -> PhotoCardPurchase:
+        """
+        판매 기록을 판매완료로 변경하고 구매자 잔액을 차감한다. 둘 중 하나라도 실패하면 모두 반영되지 않는다.
+        :param command: PurchasePhotoCardCommand
+        :return: [domain] PhotoCardPurchase 실패한 경우 실패 조건(outcome)을 담아 반환
+        """
+        raise NotImplementedError()
+
+    def checkout_photo_card_sales(self, command: CheckoutPhotoCardCommand) -> PhotoCardCheckout:
+        """
+        여러 판매 기록을 하나의 트랜잭션으로 구매하고 구매자 잔액은 합계 금액으로 한번만 차감한다.
+        구매자, 판매 기록(record_id 순) 순서로 잠그므로 동시에 일괄 구매해도 교착 상태가 발생하지 않는다.
+        :param command: CheckoutPhotoCardCommand
+        :return: [domain] PhotoCardCheckout 항목별 구매 결과
+        """
+        raise NotImplementedError()
+
+    def claim_min_price_photo_card_sale(self, card_id: int) -> Optional[PhotoCardSale]:
+        """
+        포토카드의 판매중인 매물 중 (price, renewal_date) 순으로 가장 우선인 매물을 현재 트랜잭션에서 잠근다.
+        다른 트랜잭션이 잠근 매물은 건너뛰므로 동시에 호출한 구매자들은 서로 다른 매물을 잠근다.
+        :param card_id: int
+        :return: [domain] Optional[PhotoCardSale] 잠글 수 있는 매물이 없다면 None
         """
         raise NotImplementedError()
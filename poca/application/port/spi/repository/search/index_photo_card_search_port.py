@@ -0,0 +1,21 @@
+from typing import Protocol
+
+
+class IndexPhotoCardSearchPort(Protocol):
+    def index_photo_card(self, card_id: int, name: str, description: str) -> int:
+        """
+        포토카드 검색 색인(n-gram, 정규화된 이름/설명) 추가, 포토카드 등록과 같은 트랜잭션에서 호출한다.
+        :param card_id: int
+        :param name: str
+        :param description: str
+        :return: int 색인된 n-gram 수
+        """
+        raise NotImplementedError()
+
+    def rebuild_photo_card_search_index(self, chunk_size: int = 1000) -> int:
+        """
+        전체 포토카드를 chunk_size 단위로 스트리밍 조회하여 검색 색인을 다시 생성
+        :param chunk_size: int
+        :return: int 색인된 포토카드 수
+        """
+        raise NotImplementedError()
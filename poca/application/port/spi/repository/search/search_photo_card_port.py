@@ -0,0 +1,13 @@
+from typing import List, Protocol
+
+from poca.application.domain.model.photo_card_search import PhotoCardSearchHit, PhotoCardSearchQuery
+
+
+class SearchPhotoCardPort(Protocol):
+    def search_photo_cards(self, query: PhotoCardSearchQuery) -> List[PhotoCardSearchHit]:
+        """
+        포토카드 검색, 판매중인 최소 가격 매물을 같은 쿼리에서 함께 조회한다.
+        :param query: PhotoCardSearchQuery
+        :return: [domain] List[PhotoCardSearchHit] 정렬 조건 순서로 최대 limit개
+        """
+        raise NotImplementedError()
@@ -0,0 +1,11 @@
+from typing import Optional, Protocol
+
+
+class FindRevokedTokenPort(Protocol):
+    def find_revoked_token_expires_at(self, jti: str) -> Optional[int]:
+        """
+        폐기된 토큰 조회
+        :param jti: str 토큰 id
+        :return: Optional[int] 토큰 만료 시각(epoch 초), 폐기되지 않았다면 None
+        """
+        raise NotImplementedError()
@@ -0,0 +1,20 @@
+from typing import Protocol
+
+
+class SaveRevokedTokenPort(Protocol):
+    def save_revoked_token(self, jti: str, expires_at: int) -> bool:
+        """
+        폐기된 토큰 저장, 토큰 만료 시각까지 유지한다.
+        :param jti: str 토큰 id
+        :param expires_at: int 토큰 만료 시각(epoch 초)
+        :return: bool 이미 폐기된 토큰이라면 False
+        """
+        raise NotImplementedError()
+
+    def delete_expired_revoked_tokens(self, now: int) -> int:
+        """
+        만료된 토큰 삭제, 만료된 토큰은 서명 검증에서 거부되므로 폐기 목록에 남겨둘 필요가 없다.
+        :param now: int 현재 시각(epoch 초)
+        :return: int 삭제한 건수
+        """
+        raise NotImplementedError()
@@ -1,13 +1,14 @@
-import decimal
 from typing import Protocol
 
+from poca.application.domain.model.money import Won
+
 
 class SaveUserPort(Protocol):
-    def save_user_balance(self, user_id: int, balance: decimal.Decimal) -> bool:
+    def save_user_balance(self, user_id: int, balance: Won) -> bool:
         """
         유저 잔액 저장
         :param user_id: int
-        :param balance: decimal.Decimal
+        :param balance: Won 원 단위 정수 잔액
         :return: bool
         """
         raise NotImplementedError()
@@ -0,0 +1,29 @@
+from typing import Dict, Iterable, Protocol
+
+
+class ImageDerivativePort(Protocol):
+    """
+    원본 이미지로부터 고정 크기의 파생 이미지(썸네일, 미리보기 등)를 생성한다.
+    """
+
+    def names(self) -> Iterable[str]:
+        """
+        생성하는 파생 이미지 이름 목록
+        """
+        raise NotImplementedError()
+
+    def extension(self, name: str) -> str:
+        """
+        파생 이미지 파일 확장자
+        :param name: str 파생 이미지 이름
+        """
+        raise NotImplementedError()
+
+    def render(self, source_path: str, names: Iterable[str]) -> Dict[str, str]:
+        """
+        파생 이미지 생성
+        :param source_path: str 원본 이미지 파일 경로
+        :param names: Iterable[str] 생성할 파생 이미지 이름
+        :return: Dict[str, str] 이름별 생성된 임시 파일 경로, 생성할 수 없다면 빈 dict. 호출한 쪽에서 삭제해야 한다.
+        """
+        raise NotImplementedError()
@@ -0,0 +1,38 @@
+from typing import Iterable, Optional, Protocol
+
+
+class ObjectStore(Protocol):
+    """
+    이미지 등 바이너리 객체 저장소, 청크 단위로 전달받아 저장하므로 파일 전체를 메모리에 올리지 않는다.
+    """
+
+    def put(self, key: str, chunks: Iterable[bytes], content_type: Optional[str] = None) -> str:
+        """
+        객체 저장, 같은 key가 있다면 덮어쓴다.
+        :param key: str 저장소 내 객체 key
+        :param chunks: Iterable[bytes] 객체 데이터 청크
+        :param content_type: Optional[str]
+        :return: str 객체 url
+        """
+        raise NotImplementedError()
+
+    def exists(self, key: str) -> bool:
+        """
+        객체 존재 여부
+        :param key: str
+        """
+        raise NotImplementedError()
+
+    def url(self, key: str) -> str:
+        """
+        객체 url
+        :param key: str
+        """
+        raise NotImplementedError()
+
+    def delete(self, key: str) -> None:
+        """
+        객체 삭제, 없는 객체라면 무시한다.
+        :param key: str
+        """
+        raise NotImplementedError()
@@ -0,0 +1,39 @@
+import logging
+from typing import Optional
+
+from poca.application.domain.model import photo_card_trade_result
+from poca.application.domain.model.photo_card import OnSaleCursor, OnSaleQueryStrategy
+from poca.application.port.api.async_photo_card_trade_use_case import AsyncPhotoCardTradeUseCase
+from poca.application.port.spi.repository.product.async_find_photo_card_port import AsyncFindPhotoCardSalePort
+
+
+class AsyncPhotoCardTradeService(
+    AsyncPhotoCardTradeUseCase
+):
+    _find_photo_card_port: AsyncFindPhotoCardSalePort
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, find_photo_card_port: AsyncFindPhotoCardSalePort):
+        self._find_photo_card_port = find_photo_card_port
+
+    async def on_sale_photo_card_page(self, method: OnSaleQueryStrategy, cursor: Optional[OnSaleCursor] = None,
+                                      limit: int = 20) -> photo_card_trade_result.PhotoCardTradeResult:
+        match method:
+            case OnSaleQueryStrategy.MIN_PRICE_RENEWAL_LATE_FIRST:
+                page = await self._find_photo_card_port.afind_photo_card_renewal_old_page(cursor, limit)
+                return photo_card_trade_result.PhotoCardTradeOnSalePageResult(page.records, page.next_cursor)
+
+    async def get_recently_sold_photo_card(self, card_id,
+                                           number_of_cards=5) -> photo_card_trade_result.PhotoCardTradeResult:
+        if photo_card := await self._find_photo_card_port.afind_photo_card_by_card_id(card_id):
+            trade_list = await self._find_photo_card_port.afind_recently_sold_photo_card(card_id, number_of_cards)
+            return photo_card_trade_result.PhotoCardTradeRecentlySoldResult(trade_list, photo_card)
+        else:
+            return photo_card_trade_result.NoPhotoCardOnSaleResult(card_id)
+
+    async def get_min_price_photo_card_on_sale(self, card_id) -> photo_card_trade_result.PhotoCardTradeResult:
+        if result := await self._find_photo_card_port.afind_min_price_photo_card_on_sale(card_id):
+            return photo_card_trade_result.PhotoCardTradeResultObject(result.set_total_price())
+        else:
+            return photo_card_trade_result.NoPhotoCardOnSaleResult(card_id)
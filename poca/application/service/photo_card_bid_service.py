@@ -0,0 +1,37 @@
+import logging
+
+from django.db import transaction
+
+from poca.application.domain.model import photo_card_trade_result
+from poca.application.domain.model.money import to_won
+from poca.application.domain.model.photo_card_bid import PhotoCardBid
+from poca.application.port.api.command.photo_card_trade_command import PlacePhotoCardBidCommand
+from poca.application.port.api.photo_card_bid_use_case import PhotoCardBidUseCase
+from poca.application.port.spi.repository.bid.save_photo_card_bid_port import SavePhotoCardBidPort
+from poca.application.service.photo_card_matching_engine import PhotoCardMatchingEngine
+
+
+class PhotoCardBidService(
+    PhotoCardBidUseCase
+):
+    _save_bid_port: SavePhotoCardBidPort
+    _matching_engine: PhotoCardMatchingEngine
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, save_bid_port: SavePhotoCardBidPort, matching_engine: PhotoCardMatchingEngine):
+        self._save_bid_port = save_bid_port
+        self._matching_engine = matching_engine
+
+    def place_photo_card_bid(self, command: PlacePhotoCardBidCommand) -> photo_card_trade_result.PhotoCardTradeResult:
+        bid = self._save_bid_port.save_photo_card_bid(PhotoCardBid(
+            photo_card_id=command.card_id,
+            buyer_id=command.buyer_id,
+            max_price=to_won(command.max_price),
+        ))
+        if bid is None:
+            return photo_card_trade_result.PhotoCardBidPlaceFailResult(command.card_id)
+
+        # 매칭 엔진은 다른 트랜잭션에서 주문을 처리하므로 저장이 커밋된 이후에 전달
+        transaction.on_commit(lambda: self._matching_engine.submit_bid(bid))
+        return photo_card_trade_result.PhotoCardBidPlacedResult(bid.id, command.card_id)
@@ -0,0 +1,219 @@
+import heapq
+import logging
+import queue
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from django.db import close_old_connections, transaction
+
+from poca.application.domain.model.photo_card import PurchaseOutcome
+from poca.application.domain.model.photo_card_bid import PhotoCardBid
+from poca.application.domain.model.photo_card_trade_event import PhotoCardSaleCompletedEvent, \
+    PhotoCardSaleRegisteredEvent
+from poca.application.port.api.command.photo_card_trade_command import PurchasePhotoCardCommand
+from poca.application.port.spi.event.photo_card_trade_event_listener import PhotoCardTradeEventListener
+from poca.application.port.spi.repository.bid.find_photo_card_bid_port import FindPhotoCardBidPort
+from poca.application.port.spi.repository.bid.save_photo_card_bid_port import SavePhotoCardBidPort
+from poca.application.port.spi.repository.product.save_photo_card_port import SavePhotoCardSalePort
+
+# (photo_card_id, 신규 구매 주문), 매물 등록 이벤트는 구매 주문 없이 전달된다.
+_MatchRequest = Tuple[int, Optional[PhotoCardBid]]
+_STOP = object()
+
+
+class _BidBook:
+    """
+    포토카드 하나의 대기중인 구매 주문, (최고 가격, 먼저 등록된 주문) 순으로 꺼낸다.
+    """
+
+    def __init__(self, bids: List[PhotoCardBid]):
+        self._heap: List[Tuple] = []
+        self._ids: Set[int] = set()
+        for bid in bids:
+            self.push(bid)
+
+    def push(self, bid: PhotoCardBid) -> None:
+        if bid.id in self._ids:
+            return
+        self._ids.add(bid.id)
+        heapq.heappush(self._heap, (-bid.max_price, bid.id, bid))
+
+    def peek(self) -> Optional[PhotoCardBid]:
+        return self._heap[0][-1] if self._heap else None
+
+    def pop(self) -> None:
+        _, bid_id, _ = heapq.heappop(self._heap)
+        self._ids.discard(bid_id)
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class PhotoCardMatchingEngine(PhotoCardTradeEventListener):
+    """
+    포토카드 가격-시간 우선 매칭 엔진
+    구매 주문(bid)은 포토카드별 메모리 호가창에, 매물(ask)은 PhotoCardSale 판매중 매물로 관리한다.
+    구매 주문 등록/매물 등록 시 최고가 구매 주문과 최우선 매물의 가격이 교차하면 체결한다.
+
+    포토카드는 photo_card_id % workers 로 하나의 워커 스레드에만 배정되므로 같은 포토카드의 매칭은 항상 순서대로 처리되고
+    엔진 내부에서 같은 매물을 두고 경합하지 않는다. 워커는 대기중인 요청을 batch_size 만큼 모아 하나의 트랜잭션으로 처리한다.
+    workers=0 이면 호출한 스레드에서 바로 처리한다. (테스트, 관리 명령)
+
+    호가창은 프로세스 메모리에 있으므로 다른 프로세스에서 등록된 구매 주문은 호가창에 없을 수 있다.
+    매물 등록 시에는 포토카드의 대기중인 구매 주문을 DB에서 다시 적재하여 다른 프로세스의 구매 주문과도 매칭하고,
+    구매 주문 등록 시에는 매물을 DB에서 조회하므로 다른 프로세스에서 등록된 매물과도 매칭한다.
+    여러 프로세스가 같은 구매 주문을 들고 있을 수 있으나, 체결 전에 구매 주문을 대기 상태 조건으로 먼저 체결 처리하므로
+    같은 구매 주문이 두 번 체결되지 않는다.
+    """
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, save_photo_card_port: SavePhotoCardSalePort, find_bid_port: FindPhotoCardBidPort,
+                 save_bid_port: SavePhotoCardBidPort, workers: int = 4, batch_size: int = 50):
+        self._save_photo_card_port = save_photo_card_port
+        self._find_bid_port = find_bid_port
+        self._save_bid_port = save_bid_port
+        self._workers = workers
+        self._batch_size = batch_size
+        # 포토카드별 호가창, 각 포토카드는 배정된 워커 스레드에서만 접근한다.
+        self._books: Dict[int, _BidBook] = {}
+        self._queues: List[queue.Queue] = []
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+
+    def submit_bid(self, bid: PhotoCardBid) -> None:
+        """
+        저장된 신규 구매 주문을 호가창에 등록하고 매칭, 주문 저장이 커밋된 이후에 호출해야 한다.
+        :param bid: PhotoCardBid
+        """
+        self._submit((bid.photo_card_id, bid))
+
+    def on_sale_registered(self, event: PhotoCardSaleRegisteredEvent) -> None:
+        # 신규 매물이 최고가 구매 주문과 교차하는지 확인
+        self._submit((event.photo_card_id, None))
+
+    def on_sale_completed(self, event: PhotoCardSaleCompletedEvent) -> None:
+        # 판매 완료된 매물은 다음 매칭에서 조회되지 않으므로 처리할 것이 없다.
+        pass
+
+    def stop(self) -> None:
+        """
+        대기중인 요청을 모두 처리한 뒤 워커 스레드 종료
+        """
+        with self._start_lock:
+            for q in self._queues:
+                q.put(_STOP)
+            for thread in self._threads:
+                thread.join()
+            self._queues, self._threads = [], []
+
+    def _submit(self, request: _MatchRequest) -> None:
+        if self._workers <= 0:
+            self._process([request])
+            return
+
+        self._ensure_started()
+        card_id = request[0]
+        self._queues[card_id % self._workers].put(request)
+
+    def _ensure_started(self) -> None:
+        if self._threads:
+            return
+        with self._start_lock:
+            if self._threads:
+                return
+            self._queues = [queue.Queue() for _ in range(self._workers)]
+            for index, q in enumerate(self._queues):
+                thread = threading.Thread(target=self._run, args=(q,), name=f'photo-card-matching-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _run(self, q: queue.Queue) -> None:
+        stopping = False
+        while not stopping:
+            request = q.get()
+            if request is _STOP:
+                break
+
+            # 대기중인 요청을 batch_size 만큼 모아 하나의 트랜잭션으로 처리
+            batch = [request]
+            while len(batch) < self._batch_size:
+                try:
+                    request = q.get_nowait()
+                except queue.Empty:
+                    break
+                if request is _STOP:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            close_old_connections()
+            try:
+                self._process(batch)
+            except Exception as e:
+                self.logger.error(f'PhotoCardMatchingEngine worker error: {e}')
+
+        close_old_connections()
+
+    def _process(self, batch: List[_MatchRequest]) -> None:
+        card_ids, reloaded = [], set()
+        for card_id, bid in batch:
+            if bid is None and card_id not in reloaded:
+                # 매물 등록: 다른 프로세스에서 등록된 구매 주문도 매칭하도록 DB에서 다시 적재
+                self._books.pop(card_id, None)
+                reloaded.add(card_id)
+            book = self._book(card_id)
+            if bid is not None:
+                book.push(bid)
+            if card_id not in card_ids:
+                card_ids.append(card_id)
+
+        try:
+            with transaction.atomic():
+                for card_id in card_ids:
+                    self._match(card_id)
+        except Exception as e:
+            # 롤백된 체결이 호가창에 반영되지 않도록 다음 요청에서 DB로부터 다시 적재
+            self.logger.error(f'PhotoCardMatchingEngine match error on {card_ids}: {e}')
+            for card_id in card_ids:
+                self._books.pop(card_id, None)
+
+    def _book(self, card_id: int) -> _BidBook:
+        book = self._books.get(card_id)
+        if book is None:
+            book = self._books[card_id] = _BidBook(self._find_bid_port.find_open_photo_card_bids(card_id))
+        return book
+
+    def _match(self, card_id: int) -> None:
+        book = self._books[card_id]
+        while (bid := book.peek()) is not None:
+            # 최우선 매물을 잠그고 최고가 구매 주문으로 체결 가능한지 확인
+            ask = self._save_photo_card_port.claim_min_price_photo_card_sale(card_id)
+            if ask is None or not bid.can_fill(ask.get_total_price()):
+                return
+
+            # 다른 프로세스의 매칭 엔진이 같은 구매 주문을 체결하지 않도록 대기 상태 조건으로 구매 주문을 먼저 체결 처리한다.
+            # 구매하지 못하면 savepoint로 되돌려 구매 주문을 다시 대기 상태로 둔다.
+            savepoint = transaction.savepoint()
+            if not self._save_bid_port.fill_photo_card_bid(bid.id, ask.id):
+                transaction.savepoint_rollback(savepoint)
+                self.logger.info(f'PhotoCardMatchingEngine bid {bid.id} already processed')
+                book.pop()
+                continue
+
+            # 잠근 매물의 version으로 구매하므로 충돌 재시도가 필요없다.
+            purchase = self._save_photo_card_port.purchase_photo_card_sale(
+                PurchasePhotoCardCommand(record_id=ask.id, buyer_id=bid.buyer_id, version=ask.version))
+            if purchase.outcome == PurchaseOutcome.PURCHASED:
+                transaction.savepoint_commit(savepoint)
+                book.pop()
+                continue
+
+            transaction.savepoint_rollback(savepoint)
+            if purchase.outcome == PurchaseOutcome.INSUFFICIENT_BALANCE:
+                # 잔액이 부족한 구매 주문은 취소하고 다음 구매 주문으로 매칭
+                self._save_bid_port.cancel_photo_card_bid(bid.id)
+                book.pop()
+            else:
+                # 잠금을 지원하지 않는 DB에서 다른 구매자가 먼저 구매한 경우, 다음 요청에서 다시 매칭
+                self.logger.info(f'PhotoCardMatchingEngine ask {ask.id} not filled: {purchase.outcome}')
+                return
@@ -0,0 +1,57 @@
+import datetime
+import itertools
+import operator
+from typing import Dict, Optional, Tuple
+
+from poca.application.domain.model import photo_card_trade_result
+from poca.application.domain.model.photo_card_price_candle import CandleResolution, PhotoCardPriceCandle
+from poca.application.port.api.photo_card_price_candle_use_case import PhotoCardPriceCandleUseCase
+from poca.application.port.spi.repository.candle.find_photo_card_price_candle_port import \
+    FindPhotoCardPriceCandlePort
+from poca.application.port.spi.repository.candle.find_photo_card_trade_port import FindPhotoCardTradePort
+from poca.application.port.spi.repository.candle.record_photo_card_price_candle_port import \
+    RecordPhotoCardPriceCandlePort
+from poca.application.port.spi.repository.product.find_photo_card_port import FindPhotoCardSalePort
+
+
+class PhotoCardPriceCandleService(
+    PhotoCardPriceCandleUseCase
+):
+    _find_photo_card_port: FindPhotoCardSalePort
+    _find_candle_port: FindPhotoCardPriceCandlePort
+    _find_trade_port: Optional[FindPhotoCardTradePort]
+    _record_candle_port: Optional[RecordPhotoCardPriceCandlePort]
+
+    def __init__(self, find_photo_card_port: FindPhotoCardSalePort, find_candle_port: FindPhotoCardPriceCandlePort,
+                 find_trade_port: FindPhotoCardTradePort = None, record_candle_port: RecordPhotoCardPriceCandlePort = None):
+        self._find_photo_card_port = find_photo_card_port
+        self._find_candle_port = find_candle_port
+        self._find_trade_port = find_trade_port
+        self._record_candle_port = record_candle_port
+
+    def get_photo_card_price_candles(self, card_id: int, resolution: CandleResolution,
+                                     start: Optional[datetime.datetime] = None,
+                                     end: Optional[datetime.datetime] = None,
+                                     limit: int = 100) -> photo_card_trade_result.PhotoCardTradeResult:
+        candles = self._find_candle_port.find_photo_card_price_candles(card_id, resolution, start, end, limit)
+        # 캔들이 없는 경우에만 포토카드 존재 여부 확인
+        if not candles and self._find_photo_card_port.find_photo_card_by_card_id(card_id) is None:
+            return photo_card_trade_result.NoPhotoCardOnSaleResult(card_id)
+        return photo_card_trade_result.PhotoCardPriceCandleResult(card_id, resolution, candles)
+
+    def backfill_photo_card_price_candles(self) -> int:
+        count = 0
+        # 거래는 포토카드 순서로 조회되므로 한번에 하나의 포토카드 캔들만 메모리에 유지한다.
+        trades = self._find_trade_port.iter_photo_card_trades()
+        for photo_card_id, card_trades in itertools.groupby(trades, key=operator.itemgetter(0)):
+            candles: Dict[Tuple[CandleResolution, datetime.datetime], PhotoCardPriceCandle] = {}
+            for _, price, traded_at in card_trades:
+                for resolution in CandleResolution:
+                    bucket = resolution.floor(traded_at)
+                    if (candle := candles.get((resolution, bucket))) is None:
+                        candles[(resolution, bucket)] = PhotoCardPriceCandle.first_trade(
+                            photo_card_id, resolution, price, traded_at, bucket=bucket)
+                    else:
+                        candle.merge(price, traded_at)
+            count += self._record_candle_port.replace_photo_card_price_candles(photo_card_id, candles.values())
+        return count
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from poca.application.domain.model.photo_card import PhotoCardSale
+from poca.application.domain.model.photo_card_price_feed import PhotoCardPriceUpdate
+from poca.application.domain.model.photo_card_trade_event import PhotoCardSaleCompletedEvent, \
+    PhotoCardSaleRegisteredEvent
+from poca.application.port.api.photo_card_price_feed_use_case import PhotoCardPriceFeedLaggedException, \
+    PhotoCardPriceFeedUseCase, PhotoCardPriceSubscription
+from poca.application.port.spi.event.photo_card_trade_event_listener import PhotoCardTradeEventListener
+from poca.application.port.spi.repository.product.async_find_photo_card_port import AsyncFindPhotoCardSalePort
+
+_LAGGED = object()
+
+
+class _Subscription(PhotoCardPriceSubscription):
+    """
+    연결 하나의 구독, 대기 알림은 첫 알림(포토카드 수)에 더해 max_pending 개까지만 보관한다.
+    이벤트 루프 스레드에서만 사용한다.
+    """
+
+    def __init__(self, feed: 'PhotoCardPriceFeed', card_ids: FrozenSet[int], max_pending: int):
+        self.card_ids = card_ids
+        self._feed = feed
+        self._queue: asyncio.Queue = asyncio.Queue(max_pending + len(card_ids))
+        self._closed = False
+
+    async def get(self, timeout: float) -> Optional[PhotoCardPriceUpdate]:
+        try:
+            update = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if update is _LAGGED:
+            raise PhotoCardPriceFeedLaggedException()
+        return update
+
+    def close(self) -> None:
+        self._closed = True
+        self._feed._unsubscribe(self)
+
+    def offer(self, update: PhotoCardPriceUpdate) -> None:
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(update)
+        except asyncio.QueueFull:
+            # 느린 구독자는 대기 알림을 버리고 해지, 클라이언트는 다시 연결하여 첫 알림부터 받는다.
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(_LAGGED)
+            self.close()
+
+
+class PhotoCardPriceFeed(PhotoCardPriceFeedUseCase, PhotoCardTradeEventListener):
+    """
+    포토카드 시세 변경 구독(fan-out)
+    판매 등록/거래 완료 이벤트는 구독자가 있는 포토카드만 기록하고, interval 초 동안 모아서 포토카드별로 한번만
+    최소 가격 매물을 조회하여 구독자에게 전달한다. 같은 포토카드에 변경이 몰려도 구독자에게는 interval 마다 최신 상태 하나만 전달된다.
+
+    이벤트는 커밋 이후 요청 스레드에서 수신하고, 조회/전달은 구독자가 연결된 이벤트 루프(ASGI 서버)에서 처리한다.
+    :info: 프로세스 안에서 완료된 판매 등록/거래만 전달하며, 다른 프로세스의 변경은 전달되지 않는다.
+    """
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, find_photo_card_port: AsyncFindPhotoCardSalePort, interval: float = 0.1,
+                 max_pending: int = 64, max_trades: int = 20):
+        self._find_photo_card_port = find_photo_card_port
+        self._interval = interval
+        self._max_pending = max_pending
+        self._max_trades = max_trades
+
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, Set[_Subscription]] = {}
+        # 다음 전송에서 첫 알림을 받을 구독
+        self._joined: List[_Subscription] = []
+        # 포토카드별 전송 주기 동안 완료된 거래, 판매 등록만 있었다면 빈 리스트
+        self._dirty: Dict[int, List[PhotoCardSaleCompletedEvent]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def subscribe(self, card_ids: Iterable[int]) -> PhotoCardPriceSubscription:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is not loop:
+                self._bind(loop)
+            subscription = _Subscription(self, frozenset(card_ids), self._max_pending)
+            for card_id in subscription.card_ids:
+                self._subscribers.setdefault(card_id, set()).add(subscription)
+            # 첫 알림도 전송 작업에서 만들어 이후 알림보다 먼저 전달되도록 한다.
+            self._joined.append(subscription)
+        self._wakeup.set()
+        return subscription
+
+    def on_sale_registered(self, event: PhotoCardSaleRegisteredEvent) -> None:
+        self._mark(event.photo_card_id)
+
+    def on_sale_completed(self, event: PhotoCardSaleCompletedEvent) -> None:
+        self._mark(event.photo_card_id, event)
+
+    def _mark(self, card_id: int, trade: Optional[PhotoCardSaleCompletedEvent] = None) -> None:
+        with self._lock:
+            if card_id not in self._subscribers:
+                return
+            wakeup = not self._dirty
+            trades = self._dirty.setdefault(card_id, [])
+            if trade is not None:
+                trades.append(trade)
+                del trades[:-self._max_trades]
+            loop, event = self._loop, self._wakeup
+        # 전송 주기 동안 첫 이벤트만 전송 작업을 깨운다.
+        if wakeup:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # 이벤트 루프가 종료되어 전달할 구독자가 없다.
+                pass
+
+    def _unsubscribe(self, subscription: _Subscription) -> None:
+        with self._lock:
+            for card_id in subscription.card_ids:
+                if (subscribers := self._subscribers.get(card_id)) is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[card_id]
+            if subscription in self._joined:
+                self._joined.remove(subscription)
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        구독자가 연결된 이벤트 루프에서 전송 작업 시작, 이전 루프의 구독은 더 이상 읽히지 않으므로 정리한다.
+        """
+        if self._loop is not None and self._loop.is_running():
+            raise RuntimeError('PhotoCardPriceFeed is already bound to another running event loop')
+        self._subscribers.clear()
+        self._joined.clear()
+        self._dirty.clear()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._flusher = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            # 전송 주기 동안 이벤트를 모은다.
+            await asyncio.sleep(self._interval)
+            self._wakeup.clear()
+            try:
+                await self._flush()
+            except Exception as e:
+                self.logger.error(f'PhotoCardPriceFeed flush error: {e}')
+
+    async def _flush(self) -> None:
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            joined, self._joined = self._joined, []
+            subscribers = {card_id: list(self._subscribers.get(card_id, ())) for card_id in dirty}
+
+        card_ids = set(dirty).union(*(subscription.card_ids for subscription in joined))
+        min_prices = {card_id: await self._min_price(card_id) for card_id in sorted(card_ids)}
+
+        for subscription in joined:
+            for card_id in sorted(subscription.card_ids):
+                subscription.offer(PhotoCardPriceUpdate(card_id, min_prices[card_id]))
+        for card_id, trades in dirty.items():
+            update = PhotoCardPriceUpdate(card_id, min_prices[card_id], tuple(trades))
+            for subscription in subscribers[card_id]:
+                subscription.offer(update)
+
+    async def _min_price(self, card_id: int) -> Optional[PhotoCardSale]:
+        if record := await self._find_photo_card_port.afind_min_price_photo_card_on_sale(card_id):
+            return record.set_total_price()
+        return None
@@ -0,0 +1,23 @@
+from typing import List
+
+from poca.application.domain.model.photo_card_search import PhotoCardSearchHit, PhotoCardSearchQuery
+from poca.application.port.api.photo_card_search_use_case import PhotoCardSearchUseCase
+from poca.application.port.spi.repository.search.index_photo_card_search_port import IndexPhotoCardSearchPort
+from poca.application.port.spi.repository.search.search_photo_card_port import SearchPhotoCardPort
+
+
+class PhotoCardSearchService(
+    PhotoCardSearchUseCase
+):
+    _search_port: SearchPhotoCardPort
+    _index_port: IndexPhotoCardSearchPort
+
+    def __init__(self, search_port: SearchPhotoCardPort, index_port: IndexPhotoCardSearchPort):
+        self._search_port = search_port
+        self._index_port = index_port
+
+    def search_photo_cards(self, query: PhotoCardSearchQuery) -> List[PhotoCardSearchHit]:
+        return self._search_port.search_photo_cards(query)
+
+    def rebuild_photo_card_search_index(self) -> int:
+        return self._index_port.rebuild_photo_card_search_index()
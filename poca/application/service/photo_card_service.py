@@ -0,0 +1,132 @@
+import contextlib
+import logging
+import os
+import threading
+from typing import Dict, Iterator, List, Optional
+
+from django.db import transaction
+
+from poca.application.domain.model.photo_card import PhotoCardImage
+from poca.application.port.api.command.photo_card_command import CreatePhotoCardCommand
+from poca.application.port.api.photo_card_use_case import PhotoCardUseCase
+from poca.application.port.spi.repository.product.register_photo_card_port import RegisterPhotoCardPort
+from poca.application.port.spi.storage.image_derivative_port import ImageDerivativePort
+from poca.application.port.spi.storage.object_store import ObjectStore
+from poca.application.util.background import BackgroundJobRunner
+from poca.application.util.staging import DEFAULT_CHUNK_SIZE, StagedFile, iter_file_chunks, stage_chunks
+
+
+class PhotoCardService(
+    PhotoCardUseCase
+):
+    """
+    포토카드 이미지는 내용 해시(SHA-256)를 key로 저장하여 같은 이미지는 한번만 업로드하고,
+    썸네일/미리보기 파생 이미지도 해시당 한번만 생성한다.
+    """
+    _register_photo_card_port: RegisterPhotoCardPort
+    _object_store: ObjectStore
+    _job_runner: BackgroundJobRunner
+    _derivatives: Optional[ImageDerivativePort]
+
+    logger = logging.getLogger(__name__)
+
+    # 같은 이미지를 동시에 저장하지 않도록 해시별 잠금과 대기 수 (프로세스 단위)
+    _hash_locks: Dict[str, List] = {}
+    _hash_locks_guard = threading.Lock()
+
+    def __init__(self, register_photo_card_port: RegisterPhotoCardPort, object_store: ObjectStore,
+                 job_runner: BackgroundJobRunner, derivatives: ImageDerivativePort = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._register_photo_card_port = register_photo_card_port
+        self._object_store = object_store
+        self._job_runner = job_runner
+        self._derivatives = derivatives
+        self._chunk_size = chunk_size
+
+    def register_new_photo_card(self, command: CreatePhotoCardCommand) -> int:
+        # 업로드 파일은 요청이 끝나면 삭제되므로 임시 파일로 옮겨두고, 등록이 커밋된 이후에 업로드한다.
+        staged = stage_chunks(command.image_chunks)
+        try:
+            # 이미 저장된 이미지라면 업로드하지 않고 저장된 url로 등록
+            stored = self._register_photo_card_port.find_photo_card_image(staged.sha256)
+            with transaction.atomic():
+                photo_card_id = self._register_photo_card_port.register_new_photo_card(
+                    command, stored or PhotoCardImage(staged.sha256))
+                if stored is None:
+                    transaction.on_commit(
+                        lambda: self._job_runner.submit(self._store_image, staged, command.content_type))
+        except BaseException:
+            staged.unlink()
+            raise
+
+        if stored is not None:
+            staged.unlink()
+        return photo_card_id
+
+    def _store_image(self, staged: StagedFile, content_type: str = None) -> None:
+        try:
+            with self._hash_lock(staged.sha256):
+                image_key = f'images/{staged.sha256}'
+                if self._object_store.exists(image_key):
+                    image_url = self._object_store.url(image_key)
+                else:
+                    image_url = self._object_store.put(
+                        image_key, iter_file_chunks(staged.path, self._chunk_size), content_type)
+
+                derived = self._store_derivatives(staged)
+                self._register_photo_card_port.update_photo_card_image(PhotoCardImage(
+                    image_hash=staged.sha256,
+                    image_url=image_url,
+                    thumbnail_url=derived.get('thumbnail'),
+                    preview_url=derived.get('preview'),
+                ))
+        except Exception:
+            self.logger.exception(f'Photo card image upload failed {staged.sha256}')
+        finally:
+            staged.unlink()
+
+    def _store_derivatives(self, staged: StagedFile) -> Dict[str, str]:
+        """
+        저장되지 않은 파생 이미지만 생성하여 저장한다.
+        :return: Dict[str, str] 파생 이미지 이름별 url
+        """
+        if self._derivatives is None:
+            return {}
+
+        urls, missing = {}, {}
+        for name in self._derivatives.names():
+            key = f'{name}s/{staged.sha256}.{self._derivatives.extension(name)}'
+            if self._object_store.exists(key):
+                urls[name] = self._object_store.url(key)
+            else:
+                missing[name] = key
+        if not missing:
+            return urls
+
+        rendered = {}
+        try:
+            rendered = self._derivatives.render(staged.path, missing.keys())
+            for name, path in rendered.items():
+                urls[name] = self._object_store.put(missing[name], iter_file_chunks(path, self._chunk_size))
+        except Exception:
+            # 파생 이미지가 없으면 원본 이미지를 사용하므로 원본 저장은 유지
+            self.logger.exception(f'Photo card image derivatives failed {staged.sha256}')
+        finally:
+            for path in rendered.values():
+                os.unlink(path)
+        return urls
+
+    @classmethod
+    @contextlib.contextmanager
+    def _hash_lock(cls, image_hash: str) -> Iterator[None]:
+        with cls._hash_locks_guard:
+            entry = cls._hash_locks.setdefault(image_hash, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with cls._hash_locks_guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del cls._hash_locks[image_hash]
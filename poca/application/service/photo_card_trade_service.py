@@ -1,20 +1,27 @@
 import decimal
 import logging
-from typing import List
+from typing import List, Optional
 
 from django.db import transaction
 from django.utils.timezone import now
 
 from poca.application.adapter.spi.persistence.repository.user_repository import FindUserPort
 from poca.application.domain.model import photo_card_trade_result
-from poca.application.domain.model.photo_card import PhotoCardSale, PhotoCardState, FeePolicy, OnSaleQueryStrategy
-from poca.application.port.api.command.photo_card_trade_command import UpdatePhotoCardCommand, \
-    RegisterPhotoCardOnSaleCommand
+from poca.application.domain.model.money import to_won
+from poca.application.domain.model.photo_card import PhotoCardSale, PhotoCardState, FeePolicy, OnSaleQueryStrategy, \
+    OnSaleCursor, PhotoCardPurchase, PurchaseOutcome, CheckoutMode
+from poca.application.port.api.command.photo_card_trade_command import CheckoutPhotoCardCommand, \
+    PurchasePhotoCardCommand, RegisterPhotoCardOnSaleCommand
 from poca.application.port.api.photo_card_trade_use_case import PhotoCardTradeUseCase
 from poca.application.port.spi.repository.product.find_photo_card_port import FindPhotoCardSalePort
 from poca.application.port.spi.repository.product.save_photo_card_port import SavePhotoCardSalePort
 from poca.application.port.spi.repository.user.save_user_port import SaveUserPort
-from poca.application.util.transactional import MaxRetriesExceededException
+from poca.application.util.contention import ContentionManager
+from poca.application.util.transactional import MaxRetriesExceededException, OptimisticLockException
+
+
+# 수수료 입력이 없는 판매 등록에 적용하는 기본 수수료 정책
+DEFAULT_FEE_POLICY = FeePolicy(decimal.Decimal(5))
 
 
 class PhotoCardTradeService(
@@ -28,22 +35,26 @@ class PhotoCardTradeService(
     logger = logging.getLogger(__name__)
 
     def __init__(self, find_user_port: FindUserPort, save_user_port: SaveUserPort,
-                 find_photo_card_port: FindPhotoCardSalePort, save_photo_card_port: SavePhotoCardSalePort):
+                 find_photo_card_port: FindPhotoCardSalePort, save_photo_card_port: SavePhotoCardSalePort,
+                 contention_manager: Optional[ContentionManager] = None):
         self._find_user_port = find_user_port
         self._save_user_port = save_user_port
         self._find_photo_card_port = find_photo_card_port
         self._save_photo_card_port = save_photo_card_port
+        # 최저가 매물 구매의 version 충돌 재시도
+        self._contention_manager = contention_manager or ContentionManager()
 
     def register_photo_card_on_sale(self, command: RegisterPhotoCardOnSaleCommand):
 
         # 판매 등록 성공시 도메인 반환, 실패시 None
 
         # 수수료에 대한 입력이 없을 경우 수수료 정책에 따른다.
-        fee = command.fee if command.fee > 0 else FeePolicy(decimal.Decimal(5))
+        price = to_won(command.price)
+        fee = to_won(command.fee) if command.fee > 0 else DEFAULT_FEE_POLICY.apply(price)
         trade_record = PhotoCardSale(
             state=PhotoCardState.ON_SALE.value,
-            price=decimal.Decimal(command.price),
-            fee=decimal.Decimal(fee),
+            price=price,
+            fee=fee,
             seller_id=command.seller_id,
             photo_card_id=command.card_id,
             renewal_date=now()
@@ -54,6 +65,33 @@ class PhotoCardTradeService(
         else:
             return photo_card_trade_result.PhotoCardSaleRegisterFailResult(command.card_id)
 
+    def register_photo_card_on_sale_bulk(
+            self, commands: List[RegisterPhotoCardOnSaleCommand]) -> photo_card_trade_result.PhotoCardTradeResult:
+        renewal_date = now()
+        prices = [to_won(command.price) for command in commands]
+
+        # 수수료 입력이 없는 항목은 수수료 정책을 한번에 적용
+        policy_fees = iter(DEFAULT_FEE_POLICY.apply_many(
+            price for command, price in zip(commands, prices) if not command.fee > 0))
+        trade_records = [
+            PhotoCardSale(
+                state=PhotoCardState.ON_SALE.value,
+                price=price,
+                fee=to_won(command.fee) if command.fee > 0 else next(policy_fees),
+                seller_id=command.seller_id,
+                photo_card_id=command.card_id,
+                renewal_date=renewal_date
+            )
+            for command, price in zip(commands, prices)
+        ]
+
+        saved = self._save_photo_card_port.save_photo_card_sales(trade_records)
+        return photo_card_trade_result.PhotoCardSaleBulkRegisteredResult([
+            photo_card_trade_result.PhotoCardSaleRegisteredResult(command.card_id, record.id) if record
+            else photo_card_trade_result.PhotoCardSaleRegisterFailResult(command.card_id)
+            for command, record in zip(commands, saved)
+        ])
+
     def on_sale_photo_card(self, method: OnSaleQueryStrategy):
         match method:
             # 검색 대상인 판매중인 포토카드가 여러개라면 최소 가격, 리뉴얼이 오래된 순으로 조회하는 전략
@@ -66,6 +104,13 @@ class PhotoCardTradeService(
 
         return cards
 
+    def on_sale_photo_card_page(self, method: OnSaleQueryStrategy, cursor: Optional[OnSaleCursor] = None,
+                                limit: int = 20) -> photo_card_trade_result.PhotoCardTradeResult:
+        match method:
+            case OnSaleQueryStrategy.MIN_PRICE_RENEWAL_LATE_FIRST:
+                page = self._find_photo_card_port.find_photo_card_renewal_old_page(cursor, limit)
+                return photo_card_trade_result.PhotoCardTradeOnSalePageResult(page.records, page.next_cursor)
+
     def get_recently_sold_photo_card(self, card_id, number_of_cards=5) -> photo_card_trade_result.PhotoCardTradeResult:
         if photo_card := self._find_photo_card_port.find_photo_card_by_card_id(card_id):
             trade_list = self._find_photo_card_port.find_recently_sold_photo_card(card_id, number_of_cards)
@@ -82,30 +127,66 @@ class PhotoCardTradeService(
     def buy_photo_card_on_record(self, record_id: int,
                                  buyer_id: int) -> photo_card_trade_result.PhotoCardTradeResult:
 
-        user = self._find_user_port.get_user_by_user_id(buyer_id)
-        record = self._find_photo_card_port.find_sales_record_by_id(record_id)
+        # 유저/판매 기록 조회 없이 판매완료 처리와 잔액 차감을 한번에 처리하고 실패 조건에 따라 결과 리턴
+        # 판매중 상태 조건으로 갱신하므로 먼저 구매한 유저만 성공한다.
+        try:
+            purchase = self._save_photo_card_port.purchase_photo_card_sale(
+                PurchasePhotoCardCommand(record_id=record_id, buyer_id=buyer_id))
+        except Exception as e:
+            self.logger.error(f"Failed to buy photo card: {e}")
+            return photo_card_trade_result.PhotoCardTradeNotProcessedResult(record_id)
 
-        # 유저가 가진 돈이 충분하지 않을 경우 결과 리턴
-        if not user.is_user_can_purchase(record.get_total_price()):
-            return photo_card_trade_result.InsufficientBalanceResult(buyer_id)
+        return self._to_purchase_result(purchase, buyer_id)
 
-        # 포토카드가 판매 중이 아닐 경우 결과 리턴
-        if record.is_sold():
-            return photo_card_trade_result.NoPhotoCardOnSaleResult(record_id)
+    def buy_min_price_photo_card(self, card_id: int, buyer_id: int) -> photo_card_trade_result.PhotoCardTradeResult:
+        try:
+            # 잠근 매물을 다른 구매자가 먼저 구매했다면(행 잠금을 지원하지 않는 DB) 남은 최우선 매물을 다시 잠가 재시도
+            purchase = self._contention_manager.run(
+                f'photo_card:{card_id}', self._buy_min_price_photo_card, card_id, buyer_id)
+        except MaxRetriesExceededException as e:
+            self.logger.warning(f"Gave up buying min price photo card: {e}")
+            return photo_card_trade_result.PhotoCardPurchaseNotProcessedResult(card_id)
+        except Exception as e:
+            self.logger.error(f"Failed to buy min price photo card: {e}")
+            return photo_card_trade_result.PhotoCardPurchaseNotProcessedResult(card_id)
 
+        if purchase is None:
+            return photo_card_trade_result.NoPhotoCardOnSaleResult(card_id)
+        return self._to_purchase_result(purchase, buyer_id)
+
+    def _buy_min_price_photo_card(self, card_id: int, buyer_id: int) -> Optional[PhotoCardPurchase]:
+        with transaction.atomic():
+            # 다른 구매자가 잠근 매물은 건너뛰고 남은 매물 중 최우선 매물을 잠근 뒤 구매
+            record = self._save_photo_card_port.claim_min_price_photo_card_sale(card_id)
+            if record is None:
+                return None
+
+            purchase = self._save_photo_card_port.purchase_photo_card_sale(
+                PurchasePhotoCardCommand(record_id=record.id, buyer_id=buyer_id, version=record.version))
+            if purchase.outcome in (PurchaseOutcome.VERSION_CONFLICT, PurchaseOutcome.NOT_ON_SALE):
+                raise OptimisticLockException(f'PhotoCardSale {record.id} version mismatch')
+            return purchase
+
+    def checkout_photo_cards(self, record_ids: List[int], buyer_id: int,
+                             mode: CheckoutMode = CheckoutMode.ALL_OR_NOTHING) -> photo_card_trade_result.PhotoCardTradeResult:
+        # 유저/판매 기록을 건별로 조회하지 않고 잠금, 판매완료 처리, 잔액 차감을 일괄로 처리
         try:
-            with transaction.atomic():
-                self._save_photo_card_port.update_photo_card_sale(UpdatePhotoCardCommand(
-                    record_id=record_id,
-                    buyer_id=buyer_id,
-                    version=record.version
-                ))
-                user.buy_photo_card(record.get_total_price())
-                self._save_user_port.save_user_balance(buyer_id, user.balance)
-            return photo_card_trade_result.PhotoCardTradeProcessedResult(record_id)
-
-        except MaxRetriesExceededException:
-            return photo_card_trade_result.PhotoCardTradeNotProcessedResult(record_id)
+            checkout = self._save_photo_card_port.checkout_photo_card_sales(
+                CheckoutPhotoCardCommand(record_ids=record_ids, buyer_id=buyer_id, mode=mode))
         except Exception as e:
-            self.logger.error(f"Failed to buy photo card: {e}")
-            return photo_card_trade_result.PhotoCardTradeNotProcessedResult(record_id)
+            self.logger.error(f"Failed to checkout photo cards: {e}")
+            return photo_card_trade_result.PhotoCardTradeNotProcessedResult(record_ids[0])
+
+        return photo_card_trade_result.PhotoCardCheckoutResult(checkout)
+
+    @staticmethod
+    def _to_purchase_result(purchase: PhotoCardPurchase, buyer_id: int) -> photo_card_trade_result.PhotoCardTradeResult:
+        match purchase.outcome:
+            case PurchaseOutcome.PURCHASED:
+                return photo_card_trade_result.PhotoCardTradeProcessedResult(purchase.record_id)
+            case PurchaseOutcome.INSUFFICIENT_BALANCE:
+                return photo_card_trade_result.InsufficientBalanceResult(buyer_id)
+            case PurchaseOutcome.NOT_FOUND | PurchaseOutcome.NOT_ON_SALE:
+                return photo_card_trade_result.NoPhotoCardOnSaleResult(purchase.record_id)
+            case _:
+                return photo_card_trade_result.PhotoCardTradeNotProcessedResult(purchase.record_id)
@@ -0,0 +1,58 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundJobRunner:
+    """
+    요청 스레드 밖에서 처리할 작업(이미지 업로드 등)을 실행하는 제한된 크기의 워커 풀
+    대기 작업이 max_pending 개를 넘으면 submit을 호출한 스레드가 자리가 날 때까지 기다린다.
+    max_workers가 0이라면 호출한 스레드에서 바로 실행한다. (테스트 환경)
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 64, name: str = 'poca-background'):
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=name) if max_workers > 0 else None
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending) if max_workers > 0 else None
+
+    def submit(self, job: Callable[..., Any], *args, **kwargs) -> Optional[Future]:
+        """
+        작업 등록, 작업에서 발생한 예외는 로그로 남기고 전파하지 않는다.
+        :param job: 실행할 함수
+        :return: Optional[Future] 바로 실행한 경우 None
+        """
+        if self._executor is None:
+            self._run(job, *args, **kwargs)
+            return None
+
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._run_in_worker, job, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def _run_in_worker(self, job: Callable[..., Any], *args, **kwargs) -> None:
+        # 워커 스레드는 요청 사이클 밖이므로 끊어진 커넥션을 직접 정리한다.
+        close_old_connections()
+        try:
+            self._run(job, *args, **kwargs)
+        finally:
+            close_old_connections()
+
+    @staticmethod
+    def _run(job: Callable[..., Any], *args, **kwargs) -> None:
+        try:
+            job(*args, **kwargs)
+        except Exception:
+            logger.exception(f'Background job {getattr(job, "__name__", job)} failed')
@@ -0,0 +1,237 @@
+import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from poca.application.util.transactional import MaxRetriesExceededException, OptimisticLockException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class BackoffPolicy:
+    """
+    지수 백오프 + full jitter 대기 시간 정책
+    n번째 재시도는 0 ~ min(cap, base * multiplier^n) 사이의 임의의 시간만큼 대기한다.
+    """
+    base: float = 0.01
+    cap: float = 0.2
+    multiplier: float = 2.0
+
+    def delay(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        return rand() * min(self.cap, self.base * self.multiplier ** attempt)
+
+
+class Deadline:
+    """
+    요청 단위 처리 시간 예산
+    """
+
+    def __init__(self, budget: float, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._expires_at = clock() + budget
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires_at - self._clock())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar('poca_deadline', default=None)
+
+
+@contextlib.contextmanager
+def deadline_scope(budget: float) -> Iterator[Deadline]:
+    """
+    현재 요청(스레드/코루틴)의 처리 시간 예산 설정, 범위 안의 모든 재시도가 하나의 예산을 공유한다.
+    :param budget: float 초 단위 예산
+    """
+    deadline = Deadline(budget)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+@dataclasses.dataclass
+class ConflictStats:
+    attempts: int = 0
+    conflicts: int = 0
+    waits: int = 0
+    wait_seconds: float = 0.0
+    give_ups: int = 0
+
+
+class ConflictMetrics:
+    """
+    레코드별 충돌 지표 (시도, 충돌, 대기, 포기 횟수)
+    레코드별 지표는 최근 충돌한 레코드만 유지하고, 전체 합계는 별도로 누적한다.
+    """
+
+    def __init__(self, max_records: int = 1000):
+        self._max_records = max_records
+        self._lock = threading.Lock()
+        self._records: OrderedDict[str, ConflictStats] = OrderedDict()
+        self._totals = ConflictStats()
+
+    def record_attempt(self, key: str) -> None:
+        with self._lock:
+            self._stats(key).attempts += 1
+            self._totals.attempts += 1
+
+    def record_conflict(self, key: str) -> None:
+        with self._lock:
+            self._stats(key).conflicts += 1
+            self._totals.conflicts += 1
+
+    def record_wait(self, key: str, seconds: float) -> None:
+        with self._lock:
+            for stats in (self._stats(key), self._totals):
+                stats.waits += 1
+                stats.wait_seconds += seconds
+
+    def record_give_up(self, key: str) -> None:
+        with self._lock:
+            self._stats(key).give_ups += 1
+            self._totals.give_ups += 1
+
+    def snapshot(self) -> Dict[str, ConflictStats]:
+        with self._lock:
+            return {key: dataclasses.replace(stats) for key, stats in self._records.items()}
+
+    def totals(self) -> ConflictStats:
+        """
+        프로세스 시작 이후 모든 레코드의 지표 합계, 레코드별 지표가 삭제되어도 줄어들지 않는다.
+        """
+        with self._lock:
+            return dataclasses.replace(self._totals)
+
+    def most_conflicted(self, limit: int) -> List[Tuple[str, ConflictStats]]:
+        """
+        충돌 횟수가 많은 순으로 limit 개 레코드의 지표
+        """
+        snapshot = self.snapshot()
+        return sorted(snapshot.items(), key=lambda item: item[1].conflicts, reverse=True)[:limit]
+
+    def _stats(self, key: str) -> ConflictStats:
+        # 최근 충돌한 레코드만 유지하여 메모리 사용량을 제한
+        if key not in self._records:
+            self._records[key] = ConflictStats()
+            if len(self._records) > self._max_records:
+                self._records.popitem(last=False)
+        self._records.move_to_end(key)
+        return self._records[key]
+
+
+class HotRecordDetector:
+    """
+    window 초 안에 threshold 번 이상 충돌한 레코드를 hot 레코드로 판단한다.
+    hot 레코드는 재시도해도 성공할 가능성이 낮으므로 대기하지 않고 바로 포기한다.
+    """
+
+    def __init__(self, threshold: int = 5, window: float = 1.0, max_records: int = 1000,
+                 clock: Callable[[], float] = time.monotonic):
+        self._threshold = threshold
+        self._window = window
+        self._max_records = max_records
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conflicts: OrderedDict[str, Deque[float]] = OrderedDict()
+
+    def record(self, key: str) -> None:
+        with self._lock:
+            conflicts = self._conflicts.setdefault(key, deque(maxlen=self._threshold))
+            conflicts.append(self._clock())
+            self._conflicts.move_to_end(key)
+            if len(self._conflicts) > self._max_records:
+                self._conflicts.popitem(last=False)
+
+    def is_hot(self, key: str) -> bool:
+        with self._lock:
+            conflicts = self._conflicts.get(key)
+            return (conflicts is not None and len(conflicts) >= self._threshold
+                    and self._clock() - conflicts[0] <= self._window)
+
+
+class ContentionManager:
+    """
+    낙관적 락 충돌(OptimisticLockException) 재시도 관리
+    지수 백오프 + jitter로 대기하며, 최대 시도 횟수/요청 예산을 넘거나 hot 레코드라면 MaxRetriesExceededException을 발생시킨다.
+    """
+
+    def __init__(self, policy: BackoffPolicy = BackoffPolicy(), max_attempts: int = 3, budget: float = 0.5,
+                 detector: Optional[HotRecordDetector] = None, metrics: Optional[ConflictMetrics] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.policy = policy
+        self.max_attempts = max_attempts
+        self.budget = budget
+        self.detector = detector or HotRecordDetector()
+        self.metrics = metrics or ConflictMetrics()
+        self._sleep = sleep
+
+    def run(self, key: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        충돌(OptimisticLockException)이 발생하면 func를 다시 호출, func는 시도마다 대상 레코드의 version을 다시 조회해야 한다.
+        :param key: str 충돌 대상 레코드 키
+        """
+        deadline = self._deadline()
+        attempt = 0
+        while True:
+            self.metrics.record_attempt(key)
+            try:
+                return func(*args, **kwargs)
+            except OptimisticLockException as e:
+                delay = self._on_conflict(key, attempt, deadline, e)
+            self._sleep(delay)
+            attempt += 1
+
+    async def arun(self, key: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        run의 코루틴 버전, 이벤트 루프를 막지 않도록 asyncio.sleep으로 대기한다. (ASGI 경로)
+        """
+        deadline = self._deadline()
+        attempt = 0
+        while True:
+            self.metrics.record_attempt(key)
+            try:
+                return await func(*args, **kwargs)
+            except OptimisticLockException as e:
+                delay = self._on_conflict(key, attempt, deadline, e)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _deadline(self) -> Deadline:
+        # 요청 예산이 설정되어 있고 더 짧다면 요청 예산을 따른다.
+        scoped = _current_deadline.get()
+        own = Deadline(self.budget)
+        return scoped if scoped is not None and scoped.remaining() < own.remaining() else own
+
+    def _on_conflict(self, key: str, attempt: int, deadline: Deadline, error: OptimisticLockException) -> float:
+        self.metrics.record_conflict(key)
+        self.detector.record(key)
+
+        delay = self.policy.delay(attempt)
+        reason = None
+        if attempt + 1 >= self.max_attempts:
+            reason = 'max attempts'
+        elif self.detector.is_hot(key):
+            reason = 'hot record'
+        elif delay >= deadline.remaining():
+            reason = 'deadline'
+
+        if reason is not None:
+            self.metrics.record_give_up(key)
+            logger.warning(f'Optimistic lock conflict on {key}, giving up ({reason}) after {attempt + 1} attempts')
+            raise MaxRetriesExceededException(f'Max retries exceeded due to version conflict on {key}') from error
+
+        self.metrics.record_wait(key, delay)
+        logger.info(f'Optimistic lock conflict on {key}, retrying in {delay * 1000:.1f}ms (attempt {attempt + 1})')
+        return delay
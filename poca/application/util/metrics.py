@@ -0,0 +1,280 @@
+import bisect
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+# 초 단위 지연시간 버킷, 캐시/오더북 조회(수백 µs)부터 느린 트랜잭션(수 초)까지
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+Labels = Tuple[str, ...]
+
+
+class _Family:
+    """
+    이름과 label 이름이 같은 시계열 묶음, label 값별 시계열은 처음 사용할 때 생성한다.
+    """
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Labels, object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        """
+        label 값의 시계열, 호출마다 조회하지 않도록 호출하는 쪽에서 보관하여 사용한다.
+        """
+        if (series := self._series.get(values)) is not None:
+            return series
+        if len(values) != len(self.labelnames):
+            raise ValueError(f'{self.name} expects labels {self.labelnames}, got {values}')
+        with self._lock:
+            return self._series.setdefault(values, self._new_series())
+
+    def _new_series(self):
+        raise NotImplementedError()
+
+    def samples(self) -> Iterable[Tuple[str, Labels, Tuple[Tuple[str, str], ...], float]]:
+        """
+        :return: (sample 이름, label 값, 추가 label, 값)
+        """
+        raise NotImplementedError()
+
+
+class _CounterSeries:
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Family):
+    type_name = 'counter'
+
+    def _new_series(self):
+        return _CounterSeries()
+
+    def samples(self):
+        for values, series in list(self._series.items()):
+            yield f'{self.name}_total', values, (), series.value
+
+
+class _HistogramSeries:
+    __slots__ = ('bounds', 'counts', 'sum', '_lock')
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # 버킷별 (누적이 아닌) 관측 수, 마지막은 +Inf
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self.counts), self.sum
+
+
+class Histogram(_Family):
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_series(self):
+        return _HistogramSeries(self.buckets)
+
+    def samples(self):
+        for values, series in list(self._series.items()):
+            counts, total = series.snapshot()
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f'{self.name}_bucket', values, (('le', _format_value(bound)),), cumulative
+            yield f'{self.name}_sum', values, (), total
+            yield f'{self.name}_count', values, (), cumulative
+
+
+class Gauge(_Family):
+    """
+    수집할 때 collect를 호출하여 값을 읽는 gauge (커넥션 풀 크기 등 다른 객체가 가진 값)
+    :param collect: () -> Iterable[(label 값, 값)]
+    """
+    type_name = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 collect: Callable[[], Iterable[Tuple[Labels, float]]]):
+        super().__init__(name, documentation, labelnames)
+        self._collect = collect
+
+    def samples(self):
+        for values, value in self._collect():
+            yield self.name, tuple(values), (), value
+
+
+class MetricsRegistry:
+    """
+    프로세스의 메트릭 레지스트리, Prometheus text format(0.0.4)으로 노출한다.
+    같은 이름으로 다시 등록하면 등록된 메트릭을 반환하므로 요청마다 생성되는 객체에서도 사용할 수 있다.
+    :info: 프로세스별로 집계하므로 여러 워커 프로세스의 값은 수집하는 쪽(Prometheus)에서 합산한다.
+    """
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str],
+              collect: Callable[[], Iterable[Tuple[Labels, float]]]) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames, collect=collect)
+
+    def _register(self, family_type: Type[_Family], name: str, documentation: str, labelnames: Sequence[str],
+                  **kwargs) -> _Family:
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = family_type(name, documentation, labelnames, **kwargs)
+            elif type(family) is not family_type or family.labelnames != tuple(labelnames):
+                raise ValueError(f'Metric {name} is already registered as {family.type_name} {family.labelnames}')
+            return family
+
+    def expose(self) -> str:
+        lines = []
+        for family in sorted(self._families.values(), key=lambda f: f.name):
+            lines.append(f'# HELP {family.name} {_escape_help(family.documentation)}')
+            lines.append(f'# TYPE {family.name} {family.type_name}')
+            for sample_name, values, extra, value in family.samples():
+                pairs = list(zip(family.labelnames, values)) + list(extra)
+                labels = ','.join(f'{key}="{_escape_label(str(label))}"' for key, label in pairs)
+                lines.append(f'{sample_name}{{{labels}}} {_format_value(value)}' if labels
+                             else f'{sample_name} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+_proxy_types: Dict[tuple, type] = {}
+_proxy_lock = threading.Lock()
+
+
+def instrument(target, interface: type, latency: Histogram, results: Optional[Counter] = None,
+               result_type: Optional[type] = None):
+    """
+    interface에 정의된 메서드 호출의 지연시간을 latency(label: component, method)에 기록하는 프록시
+    results가 주어지면 반환값이 result_type인 경우 반환 타입별로 results(label: component, method, result)를 증가시킨다.
+    interface에 없는 속성은 계측 없이 target의 속성을 반환한다.
+    :info: 메서드별 시계열은 프록시 타입을 만들 때 한번만 조회하므로 호출마다 label을 조회하지 않는다.
+    """
+    key = (interface, latency, results, result_type)
+    if (proxy_type := _proxy_types.get(key)) is None:
+        with _proxy_lock:
+            if (proxy_type := _proxy_types.get(key)) is None:
+                proxy_type = _proxy_types[key] = _build_proxy_type(interface, latency, results, result_type)
+    return proxy_type(target)
+
+
+def _interface_methods(interface: type) -> List[str]:
+    names = []
+    for klass in reversed(interface.__mro__):
+        if klass.__module__ in ('builtins', 'typing', 'abc'):
+            continue
+        names += [name for name, value in vars(klass).items()
+                  if callable(value) and not name.startswith('_') and name not in names]
+    return names
+
+
+def _build_proxy_type(interface: type, latency: Histogram, results: Optional[Counter],
+                      result_type: Optional[type]) -> type:
+    component = interface.__name__
+    namespace = {
+        '__slots__': ('_target',),
+        '__init__': _proxy_init,
+        '__getattr__': _proxy_getattr,
+        '__repr__': lambda self: f'<instrumented {component} {self._target!r}>',
+    }
+    for name in _interface_methods(interface):
+        namespace[name] = _instrumented_method(name, latency.labels(component, name),
+                                               results, result_type, component)
+    return type(f'Instrumented{component}', (interface,), namespace)
+
+
+def _proxy_init(self, target) -> None:
+    self._target = target
+
+
+def _proxy_getattr(self, name: str):
+    if name == '_target':
+        raise AttributeError(name)
+    return getattr(self._target, name)
+
+
+def _instrumented_method(name: str, series: _HistogramSeries, results: Optional[Counter],
+                         result_type: Optional[type], component: str):
+    perf_counter = time.perf_counter
+
+    if results is None:
+        def method(self, *args, **kwargs):
+            started = perf_counter()
+            try:
+                return getattr(self._target, name)(*args, **kwargs)
+            finally:
+                series.observe(perf_counter() - started)
+    else:
+        # 반환 타입별 시계열
+        result_series: Dict[type, _CounterSeries] = {}
+
+        def method(self, *args, **kwargs):
+            started = perf_counter()
+            try:
+                result = getattr(self._target, name)(*args, **kwargs)
+            finally:
+                series.observe(perf_counter() - started)
+            if isinstance(result, result_type):
+                result_class = type(result)
+                if (counter := result_series.get(result_class)) is None:
+                    counter = result_series[result_class] = results.labels(component, name, result_class.__name__)
+                counter.inc()
+            return result
+
+    method.__name__ = name
+    return method
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    if value != value:
+        return 'NaN'
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _escape_label(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
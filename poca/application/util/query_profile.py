@@ -0,0 +1,105 @@
+import contextlib
+import contextvars
+import re
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+# 문자열/숫자 리터럴과 IN (%s, %s, ...) 목록은 쿼리 형태에서 제외
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*(?:%s|\?)(?:\s*,\s*(?:%s|\?))*\s*\)")
+_SPACES = re.compile(r'\s+')
+# transaction.atomic이 생성하는 savepoint 이름 (s<thread id>_x<순번>)
+_SAVEPOINT = re.compile(r'"s\d+_x\d+"')
+
+# 계측 중인 블록의 결과, 중첩된 블록은 바깥 블록의 결과에도 기록한다.
+_active: contextvars.ContextVar[Tuple['QueryProfile', ...]] = contextvars.ContextVar('poca_query_profiles', default=())
+
+
+def query_shape(sql: str) -> str:
+    """
+    파라미터, 리터럴, IN 목록 길이가 달라도 같은 형태의 쿼리는 같은 문자열로 변환한다.
+    """
+    sql = _IN_LIST.sub('(...)', _LITERAL.sub('?', _SAVEPOINT.sub('"s?"', sql)))
+    return _SPACES.sub(' ', sql).strip()
+
+
+class QueryProfile:
+    """
+    요청(또는 블록) 하나에서 실행된 쿼리 계측 결과
+    쿼리 형태별 실행 횟수를 집계하여 같은 형태가 반복된 쿼리(N+1)를 찾는다.
+    """
+    __slots__ = ('count', 'duration', 'shapes', 'slowest_sql', 'slowest_duration')
+
+    def __init__(self):
+        self.count = 0
+        # 초 단위 DB 실행 시간 합계
+        self.duration = 0.0
+        self.shapes: Dict[str, int] = {}
+        self.slowest_sql: Optional[str] = None
+        self.slowest_duration = 0.0
+
+    def record(self, sql: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        shape = query_shape(sql)
+        self.shapes[shape] = self.shapes.get(shape, 0) + 1
+        if self.slowest_sql is None or duration > self.slowest_duration:
+            self.slowest_sql, self.slowest_duration = shape, duration
+
+    def duplicates(self, min_count: int = 2) -> List[Tuple[str, int]]:
+        """
+        min_count 번 이상 실행된 쿼리 형태, 실행 횟수가 많은 순서
+        """
+        return sorted(((shape, count) for shape, count in self.shapes.items() if count >= min_count),
+                      key=lambda item: -item[1])
+
+    def to_dict(self, min_count: int = 2) -> dict:
+        return {
+            'queries': self.count,
+            'db_ms': round(self.duration * 1000, 3),
+            'duplicates': [{'sql': shape, 'count': count} for shape, count in self.duplicates(min_count)],
+            'slowest': {'sql': self.slowest_sql, 'ms': round(self.slowest_duration * 1000, 3)}
+            if self.slowest_sql is not None else None,
+        }
+
+
+def _record(execute, sql, params, many, context):
+    profiles = _active.get()
+    if not profiles:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started
+        for profile in profiles:
+            profile.record(sql, duration)
+
+
+def install(connection: BaseDatabaseWrapper, **kwargs) -> None:
+    """
+    커넥션에 계측 wrapper 등록, connection_created 수신자로 사용한다.
+    계측 중이 아닌 쿼리는 context 변수 조회 외의 비용 없이 실행된다.
+    """
+    if _record not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record)
+
+
+@contextlib.contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    """
+    블록 안에서 실행된 쿼리 계측, context 변수로 전달되므로 sync_to_async로 실행된 ORM 쿼리도 포함된다.
+    :info: 블록에서 시작한 다른 스레드(워커 스레드 등)의 쿼리는 포함되지 않는다.
+    """
+    # connection_created 수신자 등록 이전에 연결된 커넥션
+    for connection in connections.all(initialized_only=True):
+        install(connection)
+    profile = QueryProfile()
+    token = _active.set(_active.get() + (profile,))
+    try:
+        yield profile
+    finally:
+        _active.reset(token)
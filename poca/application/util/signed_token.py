@@ -0,0 +1,108 @@
+import base64
+import binascii
+import dataclasses
+import enum
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from typing import Callable, Dict, Tuple
+
+
+class InvalidTokenException(Exception):
+    pass
+
+
+class TokenType(enum.Enum):
+    ACCESS = "access"
+    REFRESH = "refresh"
+
+
+@dataclasses.dataclass(frozen=True)
+class TokenClaims:
+    user_id: int
+    token_type: TokenType
+    # 토큰 id, 폐기 목록의 키로 사용
+    jti: str
+    issued_at: int
+    expires_at: int
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+class TokenSigner:
+    """
+    HMAC-SHA256 서명 토큰 발급/검증, 토큰 형식은 v1.<key id>.<payload>.<signature>
+    검증은 DB/캐시를 조회하지 않고 CPU에서만 처리한다.
+    키 교체: 새 키를 keys에 추가하고 active_key로 지정하면 새 토큰은 새 키로 서명되고,
+    이전 키로 서명된 토큰은 keys에서 제거될 때까지 검증된다.
+    """
+    VERSION = 'v1'
+
+    def __init__(self, keys: Dict[str, str], active_key: str, access_ttl: int = 300, refresh_ttl: int = 1209600,
+                 clock: Callable[[], float] = time.time):
+        if active_key not in keys:
+            raise ValueError(f'Active token key {active_key} is not configured')
+        # 키별 HMAC 객체를 미리 만들어두고 서명마다 복사하여 사용
+        self._macs = {kid: hmac.new(secret.encode(), digestmod=hashlib.sha256) for kid, secret in keys.items()}
+        self._active_key = active_key
+        self._ttls = {TokenType.ACCESS: access_ttl, TokenType.REFRESH: refresh_ttl}
+        self._clock = clock
+
+    def ttl(self, token_type: TokenType) -> int:
+        return self._ttls[token_type]
+
+    def issue(self, user_id: int, token_type: TokenType) -> Tuple[str, TokenClaims]:
+        """
+        :return: Tuple[str, TokenClaims] 토큰, 토큰 내용
+        """
+        issued_at = int(self._clock())
+        claims = TokenClaims(user_id, token_type, secrets.token_urlsafe(12), issued_at,
+                             issued_at + self._ttls[token_type])
+        payload = _b64encode(json.dumps({
+            'sub': claims.user_id,
+            'typ': claims.token_type.value,
+            'jti': claims.jti,
+            'iat': claims.issued_at,
+            'exp': claims.expires_at,
+        }, separators=(',', ':')).encode())
+        signing_input = f'{self.VERSION}.{self._active_key}.{payload}'
+        return f'{signing_input}.{self._sign(self._active_key, signing_input)}', claims
+
+    def verify(self, token: str, token_type: TokenType) -> TokenClaims:
+        """
+        서명, 만료 시각, 토큰 종류를 검증한다.
+        :raise InvalidTokenException: 올바르지 않거나 만료된 토큰
+        """
+        try:
+            signing_input, signature = token.rsplit('.', 1)
+            version, kid, payload = signing_input.split('.')
+        except ValueError:
+            raise InvalidTokenException('Malformed token')
+        if version != self.VERSION or kid not in self._macs:
+            raise InvalidTokenException('Unknown token key')
+        if not hmac.compare_digest(signature, self._sign(kid, signing_input)):
+            raise InvalidTokenException('Invalid token signature')
+
+        try:
+            data = json.loads(_b64decode(payload))
+            claims = TokenClaims(int(data['sub']), TokenType(data['typ']), data['jti'], data['iat'], data['exp'])
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise InvalidTokenException('Malformed token payload')
+        if claims.token_type != token_type:
+            raise InvalidTokenException(f'Expected {token_type.value} token')
+        if claims.expires_at <= self._clock():
+            raise InvalidTokenException('Token has expired')
+        return claims
+
+    def _sign(self, kid: str, signing_input: str) -> str:
+        mac = self._macs[kid].copy()
+        mac.update(signing_input.encode())
+        return _b64encode(mac.digest())
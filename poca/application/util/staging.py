@@ -0,0 +1,58 @@
+import dataclasses
+import hashlib
+import os
+import tempfile
+from typing import Iterable, Iterator
+
+# 스트리밍 처리 기본 청크 크기
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class StagedFile:
+    """
+    임시 파일로 옮겨둔 업로드 데이터
+    """
+    path: str
+    size: int
+    sha256: str
+
+    def unlink(self) -> None:
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def stage_chunks(chunks: Iterable[bytes], directory: str = None) -> StagedFile:
+    """
+    요청이 끝난 뒤에도 읽을 수 있도록 청크를 임시 파일에 기록한다. 한번에 하나의 청크만 메모리에 올린다.
+    기록하면서 내용의 SHA-256을 함께 계산한다.
+    :param chunks: Iterable[bytes] 데이터 청크
+    :param directory: str 임시 파일 디렉토리, 없다면 시스템 기본값
+    :return: StagedFile 사용한 뒤 호출한 쪽에서 삭제해야 한다.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(dir=directory, prefix='poca-staging-')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            for chunk in chunks:
+                digest.update(chunk)
+                size += len(chunk)
+                file.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return StagedFile(path, size, digest.hexdigest())
+
+
+def iter_file_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    파일을 chunk_size 단위로 읽는다.
+    :param path: str 파일 경로
+    :param chunk_size: int
+    """
+    with open(path, 'rb') as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
@@ -6,13 +6,89 @@ class PocaConfig(AppConfig):
     name = "poca"
 
     def ready(self):
+        from django.conf import settings
+
         from poca.dependency_containers import Container
         # 의존성 컨테이너 객체 생성
         container = Container()
+        container.config.from_dict({
+            "sale_cache": {
+                "backend": settings.POCA_SALE_CACHE["BACKEND"],
+                "max_entries": settings.POCA_SALE_CACHE["MAX_ENTRIES"],
+                "ttl": settings.POCA_SALE_CACHE["TTL"],
+            },
+            "principal_cache": {
+                "backend": settings.POCA_PRINCIPAL_CACHE["BACKEND"],
+                "max_entries": settings.POCA_PRINCIPAL_CACHE["MAX_ENTRIES"],
+                "ttl": settings.POCA_PRINCIPAL_CACHE["TTL"],
+            },
+            "token_auth": {
+                "keys": settings.POCA_TOKEN_AUTH["KEYS"],
+                "active_key": settings.POCA_TOKEN_AUTH["ACTIVE_KEY"],
+                "access_ttl": settings.POCA_TOKEN_AUTH["ACCESS_TTL"],
+                "refresh_ttl": settings.POCA_TOKEN_AUTH["REFRESH_TTL"],
+            },
+            "recent_trades": {
+                "capacity": settings.POCA_RECENT_TRADES["CAPACITY"],
+                "max_cards": settings.POCA_RECENT_TRADES["MAX_CARDS"],
+                "max_age": settings.POCA_RECENT_TRADES["MAX_AGE"],
+            },
+            "matching_engine": {
+                "workers": settings.POCA_MATCHING_ENGINE["WORKERS"],
+                "batch_size": settings.POCA_MATCHING_ENGINE["BATCH_SIZE"],
+            },
+            "price_feed": {
+                "interval": settings.POCA_PRICE_FEED["INTERVAL"],
+                "max_pending": settings.POCA_PRICE_FEED["MAX_PENDING"],
+                "max_trades": settings.POCA_PRICE_FEED["MAX_TRADES"],
+            },
+            "object_store": {
+                "backend": settings.POCA_OBJECT_STORE["BACKEND"],
+                "local_root": settings.POCA_OBJECT_STORE["LOCAL_ROOT"],
+                "local_base_url": settings.POCA_OBJECT_STORE["LOCAL_BASE_URL"],
+                "s3_bucket": settings.POCA_OBJECT_STORE["S3_BUCKET"],
+                "s3_region": settings.POCA_OBJECT_STORE["S3_REGION"],
+                "s3_endpoint_url": settings.POCA_OBJECT_STORE["S3_ENDPOINT_URL"],
+            },
+            "image_upload": {
+                "chunk_size": settings.POCA_IMAGE_UPLOAD["CHUNK_SIZE"],
+                "workers": settings.POCA_IMAGE_UPLOAD["WORKERS"],
+                "max_pending": settings.POCA_IMAGE_UPLOAD["MAX_PENDING"],
+                "derivative_workers": settings.POCA_IMAGE_UPLOAD["DERIVATIVE_WORKERS"],
+            },
+            "metrics": {
+                "allowed_networks": settings.POCA_METRICS["ALLOWED_NETWORKS"],
+            },
+            "contention": {
+                "max_attempts": settings.POCA_CONTENTION["MAX_ATTEMPTS"],
+                "budget": settings.POCA_CONTENTION["BUDGET"],
+            },
+        })
         container.init_resources()
+        # DB 커넥션 풀, 낙관적 락 충돌, 캐시 적중률 gauge 등록
+        container.db_pool_metrics()
+        container.contention_metrics()
+        container.cache_metrics()
+
+        # ORM으로 저장/삭제된 유저는 principal 캐시에서 삭제 (잔액은 캐시하지 않으므로 잔액 update() 쿼리는 삭제하지 않는다.)
+        from django.db.models.signals import post_delete, post_save
+        from poca.application.adapter.spi.persistence.entity.user import User
+        principal_cache = container.user_principal_cache()
+        post_save.connect(principal_cache.on_user_changed, sender=User, weak=False)
+        post_delete.connect(principal_cache.on_user_changed, sender=User, weak=False)
 
         # view에서 사용할 서비스를 정의한 컨테이너를 연결
         container.wire(modules=[
+            "poca.application.adapter.api.http.user_views",
+            "poca.application.adapter.api.http.token_authentication",
+            "poca.application.adapter.api.http.photo_card_views",
             "poca.application.adapter.api.http.photo_card_trade_views",
+            "poca.application.adapter.api.http.async_photo_card_trade_views",
+            "poca.application.adapter.api.http.metrics_views",
+            "poca.auth_backend",
+            "poca.management.commands.backfill_price_candles",
+            "poca.management.commands.bench_api",
+            "poca.management.commands.purge_revoked_tokens",
+            "poca.management.commands.rebuild_search_index",
             "poca.dependency_containers",
         ])
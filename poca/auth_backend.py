@@ -1,10 +1,26 @@
+from dependency_injector.wiring import Provide, inject
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import BaseBackend
 
+from poca.application.adapter.spi.cache.user_principal_cache import UserPrincipalCache
+
 
 class EmailBackend(BaseBackend):
+    """
+    인증된 요청마다 호출되는 get_user는 principal 캐시에서 유저를 조회한다.
+    캐시에는 principal 컬럼(PRINCIPAL_FIELDS)과 세션 검증 해시만 저장하고, 비밀번호 해시와 잔액은 저장하지 않는다.
+    캐시에서 만든 유저의 password, balance는 지연 로딩(deferred) 컬럼이므로 사용할 때 DB에서 조회한다.
+    :info: 비밀번호 변경/비활성화는 캐시에서 삭제된 이후에 반영된다. (UserPrincipalCache 참고)
+    """
+
+    @inject
+    def __init__(self, principal_cache: UserPrincipalCache = Provide["user_principal_cache"]):
+        self.principal_cache = principal_cache
+
     def authenticate(self, request, email=None, password=None, **kwargs):
         User = get_user_model()
+        # 로그인 view는 USERNAME_FIELD(user_email)로 전달한다.
+        email = email or kwargs.get(User.USERNAME_FIELD)
         try:
             user = User.objects.get(user_email=email)
         except User.DoesNotExist:
@@ -16,7 +32,22 @@ class EmailBackend(BaseBackend):
 
     def get_user(self, user_id):
         User = get_user_model()
+        cached = self.principal_cache.get(user_id)
+        if cached is not None:
+            fields = cached['fields']
+            # from_db는 컬럼 선언 순서의 값을 받는다.
+            names = [f.attname for f in User._meta.concrete_fields if f.attname in fields]
+            user = User.from_db(User.objects.db, names, [fields[name] for name in names])
+            user.cached_session_auth_hash = cached['session_auth_hash']
+            return user
+
         try:
-            return User.objects.get(id=user_id)
+            user = User.objects.get(id=user_id)
         except User.DoesNotExist:
             return None
+        self.principal_cache.set(user_id, {
+            'fields': {name: getattr(user, name) for name in User.PRINCIPAL_FIELDS},
+            # 세션 검증에는 password 대신 password로 만든 해시만 필요
+            'session_auth_hash': user.get_session_auth_hash(),
+        })
+        return user
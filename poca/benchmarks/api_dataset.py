@@ -0,0 +1,158 @@
+"""
+API 부하 테스트 데이터셋
+포토카드 N개, 판매중 매물 M개, 유저 K명을 기존 레포지토리로 생성한다. 같은 seed라면 같은 데이터셋이 생성된다.
+매물은 판매 등록과 같이 원 단위 가격(Won)에 기본 수수료 정책(DEFAULT_FEE_POLICY)을 적용하여 생성한다.
+"""
+import dataclasses
+import datetime
+import random
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from django.contrib.auth.hashers import make_password
+from django.db import DatabaseError
+from django.utils.timezone import now
+
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.adapter.spi.persistence.repository.photo_card_repository import PhotoCardRepository
+from poca.application.adapter.spi.persistence.repository.photo_card_search_repository import \
+    PhotoCardSearchRepository
+from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
+from poca.application.domain.model.money import to_won
+from poca.application.domain.model.photo_card import PhotoCardSale, PhotoCardState
+from poca.application.port.api.command.photo_card_command import CreatePhotoCardCommand
+from poca.application.port.spi.repository.product.save_photo_card_port import SavePhotoCardSalePort
+from poca.application.service.photo_card_trade_service import DEFAULT_FEE_POLICY
+
+# 구매가 잔액 부족으로 실패하지 않도록 충분한 잔액 지급
+USER_BALANCE = 100_000_000
+
+_GROUPS = ['뉴진스', '르세라핌', '아이브', '에스파', '세븐틴', '스트레이키즈']
+
+
+def _listing(rnd: random.Random, card_ids: Sequence[int], user_ids: Sequence[int],
+             renewal_date: datetime.datetime) -> PhotoCardSale:
+    return PhotoCardSale(
+        state=PhotoCardState.ON_SALE.value,
+        price=to_won(rnd.randrange(1000, 50000, 100)),
+        fee=to_won(0),
+        seller_id=rnd.choice(user_ids),
+        photo_card_id=rnd.choice(card_ids),
+        renewal_date=renewal_date,
+    ).apply_fee_policy(DEFAULT_FEE_POLICY)
+
+
+class ListingPool:
+    """
+    구매 요청이 고르는 판매중 매물, 판매된 매물은 제외하고 새 매물로 보충하여 매물 수를 유지한다.
+    판매되었다고 확인된 매물은 다시 고르지 않으므로 구매 417은 다른 가상 유저와의 경합에서만 발생한다.
+    가상 유저 스레드가 공유하므로 lock으로 보호한다.
+    """
+
+    def __init__(self, record_ids: Sequence[int], card_ids: Sequence[int], user_ids: Sequence[int], seed: int = 0):
+        self._record_ids = list(record_ids)
+        # 판매된 매물을 O(1)로 제외하기 위한 record_id별 위치
+        self._positions: Dict[int, int] = {record_id: i for i, record_id in enumerate(self._record_ids)}
+        self._card_ids, self._user_ids = card_ids, user_ids
+        self._rnd = random.Random(seed)
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._record_ids)
+
+    def choice(self, rnd: random.Random) -> int:
+        with self._lock:
+            return rnd.choice(self._record_ids)
+
+    def sold(self, record_id: int) -> bool:
+        """
+        판매된 매물을 제외하고 보충할 매물 수를 늘린다. 이미 제외된 매물이라면 무시한다.
+        :return: bool 제외 여부
+        """
+        with self._lock:
+            position = self._positions.pop(record_id, None)
+            if position is None:
+                return False
+            # 마지막 매물을 빈 자리로 옮겨 제외
+            last = self._record_ids.pop()
+            if last != record_id:
+                self._record_ids[position] = last
+                self._positions[last] = position
+            self._pending += 1
+            return True
+
+    def replenish(self, save_port: SavePhotoCardSalePort) -> int:
+        """
+        판매된 매물 수만큼 새 매물을 등록, 측정 구간 밖에서 호출한다.
+        등록에 실패하면(DB 잠금 등) 보충할 매물 수를 유지하고 다음 호출에서 다시 등록한다.
+        :param save_port: SavePhotoCardSalePort 오더북/조회 캐시에 반영되도록 운영 구성의 레포지토리를 사용한다.
+        :return: int 등록된 매물 수
+        """
+        with self._lock:
+            count, self._pending = self._pending, 0
+            sales = [_listing(self._rnd, self._card_ids, self._user_ids, now()) for _ in range(count)]
+        if not sales:
+            return 0
+
+        try:
+            record_ids = [sale.id for sale in save_port.save_photo_card_sales(sales) if sale is not None]
+        except DatabaseError:
+            with self._lock:
+                self._pending += count
+            return 0
+        with self._lock:
+            for record_id in record_ids:
+                self._positions[record_id] = len(self._record_ids)
+                self._record_ids.append(record_id)
+        return len(record_ids)
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkDataset:
+    card_ids: List[int]
+    record_ids: List[int]
+    user_ids: List[int]
+    # 구매 요청이 고르는 판매중 매물, 측정 중에 판매된 매물은 보충된다.
+    listings: Optional[ListingPool] = None
+
+
+def seed_dataset(cards: int, listings: int, users: int, seed: int = 0, batch_size: int = 500) -> BenchmarkDataset:
+    """
+    부하 테스트 데이터셋 생성
+    :param cards: int 포토카드 수, 검색 색인도 함께 생성한다.
+    :param listings: int 판매중 매물 수, 포토카드와 판매자는 무작위로 배정한다.
+    :param users: int 유저 수, 로그인은 세션으로 처리하므로 비밀번호는 사용할 수 없는 값으로 저장한다.
+    :param seed: int 난수 seed
+    """
+    rnd = random.Random(seed)
+
+    unusable_password = make_password(None)
+    User.objects.bulk_create(
+        [User(user_email=f'bench-{seed}-{i}@poca.com', password=unusable_password, balance=USER_BALANCE)
+         for i in range(users)],
+        batch_size=batch_size,
+    )
+    # bulk_create가 pk를 반환하지 않는 DB도 있으므로 다시 조회
+    user_ids = list(User.objects.filter(user_email__startswith=f'bench-{seed}-').order_by('id')
+                    .values_list('id', flat=True))
+
+    photo_card_repository = PhotoCardRepository(search_index=PhotoCardSearchRepository())
+    card_ids = [
+        photo_card_repository.register_new_photo_card(CreatePhotoCardCommand(
+            name=f'{rnd.choice(_GROUPS)} 포토카드 {i}',
+            description=f'벤치마크 포토카드 {i}',
+        ))
+        for i in range(cards)
+    ]
+
+    renewal_date = now()
+    sales = PhotoCardSaleRepository().save_photo_card_sales([
+        _listing(rnd, card_ids, user_ids, renewal_date - datetime.timedelta(seconds=i))
+        for i in range(listings)
+    ], batch_size=batch_size)
+
+    record_ids = [sale.id for sale in sales if sale is not None]
+    return BenchmarkDataset(card_ids=card_ids, record_ids=record_ids, user_ids=user_ids,
+                            listings=ListingPool(record_ids, card_ids, user_ids, seed=seed))
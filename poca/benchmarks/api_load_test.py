@@ -0,0 +1,248 @@
+"""
+API 부하 테스트
+가상 유저(스레드)마다 로그인한 django.test.Client로 API를 가중치에 따라 무작위로 요청하여
+엔드포인트별 지연시간(p50, p95, p99), req/s, 요청당 쿼리 수, 충돌/오류(5xx) 비율을 측정한다.
+충돌은 엔드포인트별로 경합에서 밀린 응답 상태 코드로 집계한다. (구매는 이미 판매된 매물 417, 처리 실패 409)
+구매는 판매중 매물(ListingPool)에서만 고르고 판매된 매물은 측정 구간 밖에서 보충하므로,
+매물이 모두 판매되어 발생하는 417은 충돌로 집계되지 않는다.
+요청은 같은 프로세스의 Django 핸들러로 전달되므로 네트워크/서버 비용은 포함되지 않는다. (async_read_path 참고)
+
+    python manage.py bench_api --cards 200 --listings 5000 --users 50 --concurrency 8 --duration 10 \\
+        --baseline benchmarks/api.json --save-baseline
+    python manage.py bench_api ... --baseline benchmarks/api.json --threshold 0.2
+"""
+import base64
+import dataclasses
+import json
+import math
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.http import HttpResponse
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
+from poca.application.port.spi.repository.product.save_photo_card_port import SavePhotoCardSalePort
+from poca.benchmarks.api_dataset import BenchmarkDataset
+
+# 1x1 PNG, 같은 이미지는 해시로 중복 제거되므로 포토카드 등록 요청마다 파일이 저장되지 않는다.
+_IMAGE = base64.b64decode('iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII=')
+
+
+def _purchase(client: Client, rnd: random.Random, dataset: BenchmarkDataset) -> HttpResponse:
+    if dataset.listings is None:
+        return client.post('/api/purchase', {'record_id': rnd.choice(dataset.record_ids)},
+                           content_type='application/json')
+
+    record_id = dataset.listings.choice(rnd)
+    response = client.post('/api/purchase', {'record_id': record_id}, content_type='application/json')
+    # 구매했거나 다른 가상 유저가 먼저 구매한 매물은 다시 고르지 않는다.
+    if response.status_code in (200, 417):
+        dataset.listings.sold(record_id)
+    return response
+
+
+@dataclasses.dataclass(frozen=True)
+class Endpoint:
+    name: str
+    # 요청 비율 가중치
+    weight: int
+    request: Callable[[Client, random.Random, BenchmarkDataset], HttpResponse]
+    # 경합에서 밀린 요청의 응답 상태 코드
+    conflict_statuses: Tuple[int, ...] = (409,)
+
+
+# 엔드포인트에 충돌 상태 코드가 지정되지 않은 경우
+DEFAULT_CONFLICT_STATUSES = (409,)
+ENDPOINTS = (
+    Endpoint('GET /api/sales', 30,
+             lambda client, rnd, dataset: client.get('/api/sales', {'limit': 20})),
+    Endpoint('GET /api/sales/<id>', 20,
+             lambda client, rnd, dataset: client.get(f'/api/sales/{rnd.choice(dataset.card_ids)}')),
+    Endpoint('GET /api/sales/min_price/<id>', 30,
+             lambda client, rnd, dataset: client.get(f'/api/sales/min_price/{rnd.choice(dataset.card_ids)}')),
+    Endpoint('POST /api/purchase', 15, _purchase,
+             # 먼저 구매한 유저에게 밀린 구매는 NoPhotoCardOnSaleResult(417)
+             conflict_statuses=(409, 417)),
+    Endpoint('POST /api/cards', 5,
+             lambda client, rnd, dataset: client.post('/api/cards', {
+                 'name': f'부하 테스트 {rnd.randrange(1 << 30)}',
+                 'description': '부하 테스트',
+                 'image_file': SimpleUploadedFile('card.png', _IMAGE, content_type='image/png'),
+             })),
+)
+
+
+@dataclasses.dataclass
+class _Sample:
+    endpoint: str
+    latency: float
+    status: int
+    queries: int
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """
+    nearest-rank 백분위수
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(len(ordered) * p) - 1)]
+
+
+def summarize(samples: Sequence[_Sample], elapsed: float,
+              conflict_statuses: Optional[Mapping[str, Tuple[int, ...]]] = None) -> dict:
+    """
+    :param conflict_statuses: 엔드포인트 이름별 충돌 상태 코드, 없는 엔드포인트는 DEFAULT_CONFLICT_STATUSES
+    """
+    if conflict_statuses is None:
+        conflict_statuses = {endpoint.name: endpoint.conflict_statuses for endpoint in ENDPOINTS}
+    latencies = [sample.latency * 1000 for sample in samples]
+    statuses: Dict[str, int] = {}
+    for sample in samples:
+        statuses[str(sample.status)] = statuses.get(str(sample.status), 0) + 1
+    conflicts = sum(1 for sample in samples
+                    if sample.status in conflict_statuses.get(sample.endpoint, DEFAULT_CONFLICT_STATUSES))
+    count = len(samples)
+    return {
+        'requests': count,
+        'rps': round(count / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 0.50), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'queries_per_request': round(sum(sample.queries for sample in samples) / count, 2) if count else 0.0,
+        'conflict_rate': round(conflicts / count, 4) if count else 0.0,
+        'error_rate': round(sum(1 for sample in samples if sample.status >= 500) / count, 4) if count else 0.0,
+        'statuses': statuses,
+    }
+
+
+def run(dataset: BenchmarkDataset, concurrency: int = 8, duration: float = 10, warmup: int = 5, seed: int = 0,
+        endpoints: Sequence[Endpoint] = ENDPOINTS, save_port: Optional[SavePhotoCardSalePort] = None) -> dict:
+    """
+    concurrency 명의 가상 유저로 duration 초 동안 요청
+    가상 유저는 측정 전에 warmup 건씩 요청하여 오더북/캐시 적재를 측정에서 제외한다.
+    :param save_port: 판매된 매물을 보충할 레포지토리, 없다면 오더북에 반영하지 않는 레포지토리를 사용한다.
+    :return: dict 엔드포인트별/전체 측정 결과
+    """
+    if save_port is None:
+        save_port = PhotoCardSaleRepository()
+    results: List[List[_Sample]] = [[] for _ in range(concurrency)]
+    # 모든 가상 유저의 warmup이 끝나면 동시에 측정 시작
+    ready = threading.Barrier(concurrency + 1)
+
+    # 로그인(세션 저장)은 측정 전에 순서대로 처리, 처리되지 않은 예외는 500 응답으로 집계
+    clients = [Client(raise_request_exception=False) for _ in range(concurrency)]
+    for index, client in enumerate(clients):
+        client.force_login(User.objects.get(id=dataset.user_ids[index % len(dataset.user_ids)]))
+
+    def virtual_user(index: int) -> None:
+        rnd = random.Random(seed * 1000 + index)
+        weights = [endpoint.weight for endpoint in endpoints]
+        client = clients[index]
+        try:
+            try:
+                for _ in range(warmup):
+                    rnd.choices(endpoints, weights)[0].request(client, rnd, dataset)
+            except BaseException:
+                ready.abort()
+                raise
+            ready.wait()
+
+            samples = results[index]
+            deadline = time.perf_counter() + duration
+            while time.perf_counter() < deadline:
+                endpoint = rnd.choices(endpoints, weights)[0]
+                # 요청은 가상 유저 스레드에서 처리되므로 스레드의 DB 커넥션에서 실행된 쿼리만 집계된다.
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    try:
+                        status = endpoint.request(client, rnd, dataset).status_code
+                    except Exception:
+                        status = 599
+                    latency = time.perf_counter() - started
+                samples.append(_Sample(endpoint.name, latency, status, len(queries)))
+                # 판매된 매물 보충은 측정에서 제외
+                if dataset.listings is not None:
+                    dataset.listings.replenish(save_port)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=virtual_user, args=(i,), name=f'poca-bench-{i}') for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    try:
+        ready.wait()
+    except threading.BrokenBarrierError:
+        for thread in threads:
+            thread.join()
+        raise RuntimeError('Virtual user failed during warmup')
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    samples = [sample for samples in results for sample in samples]
+    conflict_statuses = {endpoint.name: endpoint.conflict_statuses for endpoint in endpoints}
+    return {
+        'config': {'concurrency': concurrency, 'duration': duration, 'seed': seed,
+                   'cards': len(dataset.card_ids), 'listings': len(dataset.record_ids), 'users': len(dataset.user_ids)},
+        'endpoints': {endpoint.name: summarize([s for s in samples if s.endpoint == endpoint.name], elapsed,
+                                               conflict_statuses)
+                      for endpoint in endpoints},
+        'total': summarize(samples, elapsed, conflict_statuses),
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float = 0.2) -> List[str]:
+    """
+    기준 결과와 비교하여 threshold 비율을 넘은 성능 저하 목록을 반환한다.
+    p95 지연시간 증가, req/s 감소, 요청당 쿼리 수 증가(1개 이상), 오류 비율 증가(1%p 이상),
+    충돌 비율 증가(threshold 비율과 1%p를 모두 넘은 경우)를 성능 저하로 본다.
+    p99는 표본이 적으면 변동이 크므로 보고만 하고 비교하지 않는다.
+    """
+    regressions = []
+    for name, base in baseline.get('endpoints', {}).items():
+        current = report['endpoints'].get(name)
+        if not current or not current['requests'] or not base['requests']:
+            continue
+        if current['p95_ms'] > base['p95_ms'] * (1 + threshold):
+            regressions.append(f'{name}: p95 {base["p95_ms"]:.2f}ms -> {current["p95_ms"]:.2f}ms')
+        if current['rps'] < base['rps'] * (1 - threshold):
+            regressions.append(f'{name}: {base["rps"]:.1f} req/s -> {current["rps"]:.1f} req/s')
+        if current['queries_per_request'] >= base['queries_per_request'] + 1:
+            regressions.append(f'{name}: queries/request {base["queries_per_request"]} '
+                               f'-> {current["queries_per_request"]}')
+        if current['error_rate'] >= base['error_rate'] + 0.01:
+            regressions.append(f'{name}: error rate {base["error_rate"]:.2%} -> {current["error_rate"]:.2%}')
+        base_conflict, conflict = base.get('conflict_rate', 0.0), current['conflict_rate']
+        if conflict > base_conflict * (1 + threshold) and conflict >= base_conflict + 0.01:
+            regressions.append(f'{name}: conflict rate {base_conflict:.2%} -> {conflict:.2%}')
+    return regressions
+
+
+def load_baseline(path: Path) -> Optional[dict]:
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def save_baseline(path: Path, report: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + '\n')
+
+
+def format_report(report: dict) -> List[str]:
+    lines = [f'{"endpoint":<32} {"req":>7} {"req/s":>8} {"p50":>8} {"p95":>8} {"p99":>8} {"q/req":>6} '
+             f'{"conf":>6} {"5xx":>6}']
+    for name, result in list(report['endpoints'].items()) + [('total', report['total'])]:
+        lines.append(f'{name:<32} {result["requests"]:>7} {result["rps"]:>8.1f} {result["p50_ms"]:>7.2f}ms '
+                     f'{result["p95_ms"]:>7.2f}ms {result["p99_ms"]:>7.2f}ms {result["queries_per_request"]:>6.2f} '
+                     f'{result["conflict_rate"]:>6.1%} {result["error_rate"]:>6.1%}')
+    return lines
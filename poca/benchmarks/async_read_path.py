@@ -0,0 +1,150 @@
+"""
+ASGI/WSGI 조회 경로 처리량 비교 벤치마크
+같은 조회 API를 동기 경로(WSGI, /api/sales/...)와 비동기 경로(ASGI, /api/async/sales/...)로 동시 요청하여
+req/s, 지연시간(p50, p99)을 비교한다. 외부 의존성 없이 asyncio 소켓으로 HTTP/1.1 keep-alive 요청을 보낸다.
+
+    # 동일한 워커 수로 서버 실행
+    gunicorn PocaApp.wsgi -w 4 -b 127.0.0.1:8000
+    uvicorn PocaApp.asgi:application --workers 4 --port 8001
+
+    python -m poca.benchmarks.async_read_path \\
+        --target wsgi=http://127.0.0.1:8000/api/sales/min_price/1 \\
+        --target asgi=http://127.0.0.1:8001/api/async/sales/min_price/1 \\
+        --cookie "sessionid=<로그인 세션>" --concurrency 500 --requests 20000
+"""
+import argparse
+import asyncio
+import dataclasses
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    label: str
+    requests: int
+    errors: int
+    elapsed: float
+    latencies: List[float]
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, p: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    def __str__(self):
+        return (f'{self.label:>6}: {self.throughput:8.1f} req/s | '
+                f'p50 {self.percentile(0.5) * 1000:7.1f}ms | p99 {self.percentile(0.99) * 1000:7.1f}ms | '
+                f'errors {self.errors}/{self.requests}')
+
+
+class _Connection:
+    """
+    keep-alive HTTP/1.1 연결, 서버가 연결을 닫으면 다음 요청에서 다시 연결한다.
+    """
+
+    def __init__(self, host: str, port: int, path: str, cookie: Optional[str]):
+        self._host, self._port = host, port
+        headers = [f'GET {path} HTTP/1.1', f'Host: {host}:{port}', 'Connection: keep-alive']
+        if cookie:
+            headers.append(f'Cookie: {cookie}')
+        self._request = ('\r\n'.join(headers) + '\r\n\r\n').encode()
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def get(self) -> int:
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self._host, self._port)
+
+        self._writer.write(self._request)
+        await self._writer.drain()
+
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionResetError('connection closed by server')
+        status = int(status_line.split()[1])
+        headers = {}
+        while (line := await self._reader.readline()) not in (b'\r\n', b''):
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding') == 'chunked':
+            while size := int((await self._reader.readline()).strip(), 16):
+                await self._reader.readexactly(size + 2)
+            await self._reader.readline()
+        else:
+            await self._reader.readexactly(int(headers.get('content-length', 0)))
+
+        # HTTP/1.0 응답은 keep-alive 헤더가 없다면 연결이 닫힌다.
+        keep_alive = status_line.startswith(b'HTTP/1.1') or headers.get('connection', '').lower() == 'keep-alive'
+        if not keep_alive or headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer, self._reader = None, None
+
+
+async def run(label: str, url: str, concurrency: int, total: int, cookie: Optional[str] = None) -> BenchmarkResult:
+    """
+    concurrency 개의 연결로 url에 총 total 건의 GET 요청
+    """
+    parts = urlsplit(url)
+    path = parts.path + (f'?{parts.query}' if parts.query else '')
+    remaining = total
+    latencies: List[float] = []
+    errors = 0
+
+    async def client():
+        nonlocal remaining, errors
+        connection = _Connection(parts.hostname, parts.port or 80, path, cookie)
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                if await connection.get() >= 400:
+                    errors += 1
+            except (OSError, ValueError, asyncio.IncompleteReadError):
+                errors += 1
+                await connection.close()
+            latencies.append(time.perf_counter() - started)
+        await connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return BenchmarkResult(label, total, errors, time.perf_counter() - started, latencies)
+
+
+def _parse_target(value: str) -> Tuple[str, str]:
+    label, _, url = value.partition('=')
+    if not url:
+        raise argparse.ArgumentTypeError('target은 label=url 형식이어야 합니다.')
+    return label, url
+
+
+def main(argv: Optional[List[str]] = None) -> List[BenchmarkResult]:
+    parser = argparse.ArgumentParser(description='ASGI/WSGI 조회 경로 처리량 비교')
+    parser.add_argument('--target', type=_parse_target, action='append', required=True, help='label=url')
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=10000)
+    parser.add_argument('--cookie', default=None, help='인증 세션 쿠키 (sessionid=...)')
+    args = parser.parse_args(argv)
+
+    results = []
+    for label, url in args.target:
+        result = asyncio.run(run(label, url, args.concurrency, args.requests, args.cookie))
+        print(result)
+        results.append(result)
+    return results
+
+
+if __name__ == '__main__':
+    main()
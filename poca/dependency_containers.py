@@ -1,8 +1,47 @@
 from dependency_injector import containers, providers
 
+from poca.application.adapter.spi.cache.cache_backend import DjangoCacheBackend, LocalLRUCacheBackend
+from poca.application.adapter.spi.cache.cached_find_photo_card_sale_port import CachedFindPhotoCardSalePort
+from poca.application.adapter.spi.cache.photo_card_order_book import PhotoCardOrderBook
+from poca.application.adapter.spi.cache.photo_card_recent_trades import PhotoCardRecentTrades
+from poca.application.adapter.spi.cache.photo_card_sale_version import PhotoCardSaleVersion
+from poca.application.adapter.spi.cache.token_revocation_list import TokenRevocationList
+from poca.application.adapter.spi.cache.user_principal_cache import UserPrincipalCache
+from poca.application.adapter.spi.metrics.cache_metrics import CacheMetrics
+from poca.application.adapter.spi.metrics.contention_metrics import ContentionMetrics
+from poca.application.adapter.spi.metrics.trade_metrics import instrumented_port, instrumented_use_case
+from poca.application.adapter.spi.persistence.db_pool_metrics import DatabasePoolMetrics
+from poca.application.adapter.spi.persistence.repository.async_photo_card_trade_repository import \
+    AsyncPhotoCardSaleRepository
+from poca.application.adapter.spi.persistence.repository.photo_card_bid_repository import PhotoCardBidRepository
+from poca.application.adapter.spi.persistence.repository.photo_card_price_candle_repository import \
+    PhotoCardPriceCandleRepository
+from poca.application.adapter.spi.persistence.repository.photo_card_repository import PhotoCardRepository
+from poca.application.adapter.spi.persistence.repository.photo_card_search_repository import \
+    PhotoCardSearchRepository
 from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
+from poca.application.adapter.spi.persistence.repository.revoked_token_repository import RevokedTokenRepository
 from poca.application.adapter.spi.persistence.repository.user_repository import UserRepository
+from poca.application.adapter.spi.storage.image_derivatives import ImageDerivativePipeline
+from poca.application.adapter.spi.storage.local_object_store import LocalObjectStore
+from poca.application.adapter.spi.storage.s3_object_store import S3ObjectStore
+from poca.application.port.api.photo_card_trade_use_case import PhotoCardTradeUseCase
+from poca.application.port.spi.repository.product.find_photo_card_port import FindPhotoCardSalePort
+from poca.application.port.spi.repository.product.save_photo_card_port import SavePhotoCardSalePort
+from poca.application.port.spi.repository.user.find_user_port import FindUserPort
+from poca.application.port.spi.repository.user.save_user_port import SaveUserPort
+from poca.application.service.async_photo_card_trade_service import AsyncPhotoCardTradeService
+from poca.application.service.photo_card_bid_service import PhotoCardBidService
+from poca.application.service.photo_card_matching_engine import PhotoCardMatchingEngine
+from poca.application.service.photo_card_price_candle_service import PhotoCardPriceCandleService
+from poca.application.service.photo_card_price_feed import PhotoCardPriceFeed
+from poca.application.service.photo_card_search_service import PhotoCardSearchService
+from poca.application.service.photo_card_service import PhotoCardService
 from poca.application.service.photo_card_trade_service import PhotoCardTradeService
+from poca.application.util.background import BackgroundJobRunner
+from poca.application.util.contention import ContentionManager
+from poca.application.util.metrics import MetricsRegistry
+from poca.application.util.signed_token import TokenSigner
 
 
 class Container(containers.DeclarativeContainer):
@@ -11,17 +50,205 @@ class Container(containers.DeclarativeContainer):
     """
     wiring_config = containers.WiringConfiguration(modules=[".application.adapter.api.http", ])
 
+    # settings.POCA_SALE_CACHE, settings.POCA_PRINCIPAL_CACHE, settings.POCA_TOKEN_AUTH, settings.POCA_RECENT_TRADES,
+    # settings.POCA_MATCHING_ENGINE, settings.POCA_PRICE_FEED, settings.POCA_OBJECT_STORE, settings.POCA_IMAGE_UPLOAD,
+    # settings.POCA_METRICS, settings.POCA_CONTENTION
+    # 설정 값 (apps.ready 에서 주입)
+    config = providers.Configuration()
+
+    # metrics container
+    # 메트릭 레지스트리는 프로세스당 하나만 생성, /metrics 에서 Prometheus text format으로 노출
+    metrics_registry = providers.Singleton(MetricsRegistry)
+    db_pool_metrics = providers.Singleton(DatabasePoolMetrics, registry=metrics_registry)
+
+    # 낙관적 락 충돌 재시도 관리자는 프로세스당 하나만 생성하여 hot 레코드 판단과 충돌 지표를 공유
+    contention_manager = providers.Singleton(
+        ContentionManager,
+        max_attempts=config.contention.max_attempts,
+        budget=config.contention.budget,
+    )
+    contention_metrics = providers.Singleton(ContentionMetrics, registry=metrics_registry, manager=contention_manager)
+
+    # cache container
+    # 판매중 매물 오더북은 프로세스당 하나만 생성, 60초 주기로 DB와 정합성 보정
+    photo_card_order_book = providers.Singleton(PhotoCardOrderBook, reconcile_interval=60)
+    # 포토카드별 최근 거래 링 버퍼는 프로세스당 하나만 생성
+    photo_card_recent_trades = providers.Singleton(
+        PhotoCardRecentTrades,
+        capacity=config.recent_trades.capacity,
+        max_cards=config.recent_trades.max_cards,
+        max_age=config.recent_trades.max_age,
+    )
+
+    # 판매 조회 캐시 백엔드, 조회 결과는 프로세스의 오더북에서 채우므로 항상 프로세스 로컬 LRU에 저장한다.
+    sale_cache_backend = providers.Singleton(LocalLRUCacheBackend,
+                                             max_entries=config.sale_cache.max_entries, ttl=config.sale_cache.ttl)
+    # 버전 카운터는 조회 결과와 별도의 백엔드에 저장하여 캐시 적중률 집계에 섞이지 않도록 한다.
+    # (local: 프로세스 로컬 LRU, django: settings.CACHES)
+    sale_version_backend = providers.Selector(
+        config.sale_cache.backend,
+        local=providers.Singleton(LocalLRUCacheBackend,
+                                  max_entries=config.sale_cache.max_entries, ttl=config.sale_cache.ttl),
+        django=providers.Singleton(DjangoCacheBackend, alias='default', ttl=config.sale_cache.ttl),
+    )
+    photo_card_sale_version = providers.Singleton(PhotoCardSaleVersion, backend=sale_version_backend)
+
+    # 인증된 유저 캐시, 적중률 집계를 위해 판매 조회 캐시와 별도의 백엔드 사용
+    principal_cache_backend = providers.Selector(
+        config.principal_cache.backend,
+        local=providers.Singleton(LocalLRUCacheBackend,
+                                  max_entries=config.principal_cache.max_entries, ttl=config.principal_cache.ttl),
+        django=providers.Singleton(DjangoCacheBackend, alias='default', ttl=config.principal_cache.ttl),
+    )
+    user_principal_cache = providers.Singleton(UserPrincipalCache, backend=principal_cache_backend)
+    # 판매 조회/principal 캐시 적중률 gauge
+    cache_metrics = providers.Singleton(
+        CacheMetrics,
+        registry=metrics_registry,
+        backends=providers.Dict(sale=sale_cache_backend, principal=principal_cache_backend),
+    )
+
+    # auth container
+    # 서명 토큰 발급/검증, 키 교체 전까지 프로세스당 하나만 생성
+    token_signer = providers.Singleton(
+        TokenSigner,
+        keys=config.token_auth.keys,
+        active_key=config.token_auth.active_key,
+        access_ttl=config.token_auth.access_ttl,
+        refresh_ttl=config.token_auth.refresh_ttl,
+    )
+    # 폐기된 토큰은 모든 프로세스가 공유하는 DB에 토큰 만료 시각까지 유지
+    revoked_token_repository = providers.Factory(RevokedTokenRepository)
+    token_revocation_list = providers.Singleton(
+        TokenRevocationList,
+        find_port=revoked_token_repository,
+        save_port=revoked_token_repository,
+    )
+
+    # storage container
+    # 이미지 저장소 (local: 로컬 파일시스템, s3: S3 호환 저장소)
+    object_store = providers.Selector(
+        config.object_store.backend,
+        local=providers.Singleton(LocalObjectStore,
+                                  root=config.object_store.local_root, base_url=config.object_store.local_base_url),
+        s3=providers.Singleton(S3ObjectStore,
+                               bucket=config.object_store.s3_bucket, region=config.object_store.s3_region,
+                               endpoint_url=config.object_store.s3_endpoint_url),
+    )
+    # 이미지 업로드 워커 풀은 프로세스당 하나만 생성
+    image_upload_runner = providers.Singleton(
+        BackgroundJobRunner,
+        max_workers=config.image_upload.workers,
+        max_pending=config.image_upload.max_pending,
+        name='poca-image-upload',
+    )
+
+    # 썸네일/미리보기 생성 프로세스 풀은 프로세스당 하나만 생성
+    image_derivative_pipeline = providers.Singleton(
+        ImageDerivativePipeline,
+        max_workers=config.image_upload.derivative_workers,
+    )
+
     # repository container
     # 레포지토리 객체 생성
     user_repository = providers.Factory(UserRepository)
-    photo_card_sales_repository = providers.Factory(PhotoCardSaleRepository)
+    # 포토카드 검색 색인은 포토카드 등록과 같은 트랜잭션에서 추가
+    photo_card_search_repository = providers.Factory(PhotoCardSearchRepository)
+    photo_card_repository = providers.Factory(PhotoCardRepository, search_index=photo_card_search_repository)
+    # 거래가 캔들은 거래 완료 커밋 이후에 갱신
+    photo_card_price_candle_repository = providers.Factory(PhotoCardPriceCandleRepository)
+    photo_card_bid_repository = providers.Factory(PhotoCardBidRepository)
+
+    # ASGI 조회 경로는 같은 오더북을 공유하는 async ORM 레포지토리 사용
+    async_photo_card_sales_repository = providers.Factory(
+        AsyncPhotoCardSaleRepository,
+        order_book=photo_card_order_book,
+        recent_trades=photo_card_recent_trades,
+    )
+
+    # 시세 구독(SSE) fan-out은 프로세스당 하나만 생성, 최소 가격 매물은 오더북에서 조회
+    photo_card_price_feed = providers.Singleton(
+        PhotoCardPriceFeed,
+        find_photo_card_port=async_photo_card_sales_repository,
+        interval=config.price_feed.interval,
+        max_pending=config.price_feed.max_pending,
+        max_trades=config.price_feed.max_trades,
+    )
+
+    # 매칭 엔진은 프로세스당 하나만 생성, 엔진이 체결한 거래도 오더북/조회 캐시에 반영한다.
+    photo_card_matching_engine = providers.Singleton(
+        PhotoCardMatchingEngine,
+        save_photo_card_port=providers.Factory(
+            PhotoCardSaleRepository,
+            order_book=photo_card_order_book,
+            listeners=providers.List(photo_card_sale_version, photo_card_recent_trades, photo_card_price_feed),
+            candles=photo_card_price_candle_repository,
+        ),
+        find_bid_port=photo_card_bid_repository,
+        save_bid_port=photo_card_bid_repository,
+        workers=config.matching_engine.workers,
+        batch_size=config.matching_engine.batch_size,
+    )
+
+    photo_card_sales_repository = providers.Factory(
+        PhotoCardSaleRepository,
+        order_book=photo_card_order_book,
+        # 신규 매물 등록은 매칭 엔진에 전달되어 대기중인 구매 주문과 매칭된다.
+        listeners=providers.List(photo_card_sale_version, photo_card_recent_trades,
+                                 photo_card_price_feed, photo_card_matching_engine),
+        candles=photo_card_price_candle_repository,
+        recent_trades=photo_card_recent_trades,
+    )
+    cached_find_photo_card_port = providers.Factory(
+        CachedFindPhotoCardSalePort,
+        delegate=photo_card_sales_repository,
+        backend=sale_cache_backend,
+        versions=photo_card_sale_version,
+    )
 
     # service container
-    # 유즈케이스에 필요한 레포지토리 주입
+    # 유즈케이스에 필요한 레포지토리 주입, 유즈케이스와 포트의 메서드별 처리 시간을 기록한다.
     photo_card_trade_use_case = providers.Factory(
-        PhotoCardTradeService,
-        find_user_port=user_repository,
-        save_user_port=user_repository,
+        instrumented_use_case,
+        providers.Factory(
+            PhotoCardTradeService,
+            find_user_port=providers.Factory(instrumented_port, user_repository, FindUserPort, metrics_registry),
+            save_user_port=providers.Factory(instrumented_port, user_repository, SaveUserPort, metrics_registry),
+            find_photo_card_port=providers.Factory(
+                instrumented_port, cached_find_photo_card_port, FindPhotoCardSalePort, metrics_registry),
+            save_photo_card_port=providers.Factory(
+                instrumented_port, photo_card_sales_repository, SavePhotoCardSalePort, metrics_registry),
+            contention_manager=contention_manager,
+        ),
+        PhotoCardTradeUseCase,
+        metrics_registry,
+    )
+    async_photo_card_trade_use_case = providers.Factory(
+        AsyncPhotoCardTradeService,
+        find_photo_card_port=async_photo_card_sales_repository,
+    )
+    photo_card_use_case = providers.Factory(
+        PhotoCardService,
+        register_photo_card_port=photo_card_repository,
+        object_store=object_store,
+        job_runner=image_upload_runner,
+        derivatives=image_derivative_pipeline,
+        chunk_size=config.image_upload.chunk_size,
+    )
+    photo_card_price_candle_use_case = providers.Factory(
+        PhotoCardPriceCandleService,
         find_photo_card_port=photo_card_sales_repository,
-        save_photo_card_port=photo_card_sales_repository,
+        find_candle_port=photo_card_price_candle_repository,
+        find_trade_port=photo_card_sales_repository,
+        record_candle_port=photo_card_price_candle_repository,
+    )
+    photo_card_search_use_case = providers.Factory(
+        PhotoCardSearchService,
+        search_port=photo_card_search_repository,
+        index_port=photo_card_search_repository,
+    )
+    photo_card_bid_use_case = providers.Factory(
+        PhotoCardBidService,
+        save_bid_port=photo_card_bid_repository,
+        matching_engine=photo_card_matching_engine,
     )
@@ -0,0 +1,20 @@
+from dependency_injector.wiring import Provide, inject
+from django.core.management.base import BaseCommand
+
+from poca.application.port.api.photo_card_price_candle_use_case import PhotoCardPriceCandleUseCase
+
+
+class Command(BaseCommand):
+    """
+    기존 판매 기록으로 포토카드 거래가 캔들을 생성한다.
+    완료된 거래를 (포토카드 id, 거래 시각) 순서로 한번만 스트리밍 조회하며, 포토카드별로 캔들을 교체한다.
+    이후의 거래는 거래 완료시 캔들에 반영된다.
+    """
+    help = '판매 기록으로 포토카드 거래가 캔들(1m/1h/1d)을 다시 생성합니다.'
+
+    @inject
+    def handle(self, *args,
+               photo_card_price_candle_use_case: PhotoCardPriceCandleUseCase = Provide["photo_card_price_candle_use_case"],
+               **options):
+        count = photo_card_price_candle_use_case.backfill_photo_card_price_candles()
+        self.stdout.write(self.style.SUCCESS(f'{count}개의 캔들을 생성했습니다.'))
@@ -0,0 +1,78 @@
+import logging
+from pathlib import Path
+
+from dependency_injector.wiring import Provide, inject
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from poca.application.port.spi.repository.product.save_photo_card_port import SavePhotoCardSalePort
+from poca.benchmarks import api_load_test
+from poca.benchmarks.api_dataset import seed_dataset
+
+
+class Command(BaseCommand):
+    """
+    API 부하 테스트, 테스트 DB를 생성하여 데이터셋을 적재하고 가상 유저로 API를 요청한다.
+    --baseline 파일이 있다면 결과를 비교하여 threshold를 넘은 성능 저하가 있으면 실패하고,
+    --save-baseline이라면 결과를 기준으로 저장한다.
+    """
+    help = 'API 엔드포인트별 지연시간, 처리량, 쿼리 수를 측정하고 기준 결과와 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--cards', type=int, default=200)
+        parser.add_argument('--listings', type=int, default=5000)
+        parser.add_argument('--users', type=int, default=50)
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--duration', type=float, default=10, help='측정 시간(초)')
+        parser.add_argument('--warmup', type=int, default=5, help='가상 유저별 측정 전 요청 수')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--baseline', type=Path, default=None, help='기준 결과 JSON 파일')
+        parser.add_argument('--save-baseline', action='store_true', help='결과를 기준 결과로 저장')
+        parser.add_argument('--threshold', type=float, default=0.2, help='허용하는 성능 저하 비율')
+        parser.add_argument('--keepdb', action='store_true', help='테스트 DB를 삭제하지 않고 재사용')
+
+    @inject
+    def handle(self, *args, cards, listings, users, concurrency, duration, warmup, seed, baseline, save_baseline,
+               threshold, keepdb,
+               photo_card_sales_repository: SavePhotoCardSalePort = Provide["photo_card_sales_repository"],
+               **options):
+        if save_baseline and baseline is None:
+            raise CommandError('--save-baseline은 --baseline 경로가 필요합니다.')
+
+        # 운영 DB에 데이터셋을 적재하지 않도록 테스트 DB에서 실행
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+        # 5xx 응답은 오류 비율로 집계하므로 요청별 오류 로그는 출력하지 않는다.
+        request_logger = logging.getLogger('django.request')
+        level = request_logger.level
+        request_logger.setLevel(logging.CRITICAL)
+        try:
+            dataset = seed_dataset(cards, listings, users, seed=seed)
+            # 판매된 매물은 운영 구성의 레포지토리로 보충하여 오더북/조회 캐시에도 반영
+            report = api_load_test.run(dataset, concurrency=concurrency, duration=duration, warmup=warmup, seed=seed,
+                                       save_port=photo_card_sales_repository)
+        finally:
+            request_logger.setLevel(level)
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+            teardown_test_environment()
+
+        for line in api_load_test.format_report(report):
+            self.stdout.write(line)
+
+        if save_baseline:
+            api_load_test.save_baseline(baseline, report)
+            self.stdout.write(self.style.SUCCESS(f'기준 결과 저장: {baseline}'))
+            return
+
+        if baseline is None:
+            return
+        if (base := api_load_test.load_baseline(baseline)) is None:
+            self.stdout.write(self.style.WARNING(f'기준 결과가 없습니다: {baseline}'))
+            return
+        if regressions := api_load_test.compare(report, base, threshold):
+            for regression in regressions:
+                self.stderr.write(self.style.ERROR(regression))
+            raise CommandError(f'{len(regressions)}건의 성능 저하가 {threshold:.0%}를 넘었습니다.')
+        self.stdout.write(self.style.SUCCESS(f'기준 결과 대비 성능 저하 없음 (threshold {threshold:.0%})'))
@@ -0,0 +1,108 @@
+import dataclasses
+import decimal
+import gc
+import timeit
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from poca.application.domain.model.money import Won
+from poca.application.domain.model.photo_card import FeePolicy, PhotoCardSale, PhotoCardState
+
+
+@dataclasses.dataclass
+class _DecimalPhotoCardSale:
+    """
+    비교 기준, __slots__ 없이 금액을 Decimal로 보관하던 이전 판매 기록
+    """
+    state: PhotoCardState
+    price: decimal.Decimal
+    fee: decimal.Decimal
+    renewal_date: str
+    version: int = 0
+    id: int = None
+    sold_date: str = None
+    photo_card: object = None
+    seller: object = None
+    buyer: object = None
+    create_date: str = None
+    total_price: decimal.Decimal = None
+    photo_card_id: int = None
+    buyer_id: int = None
+    seller_id: int = None
+
+    def set_total_price(self):
+        self.total_price = self.price + self.fee
+        return self
+
+    def apply_fee_policy(self, rate: decimal.Decimal):
+        self.fee = decimal.Decimal(self.price * (rate / decimal.Decimal('100')))
+        return self
+
+
+class Command(BaseCommand):
+    """
+    판매 기록 도메인 객체 micro-benchmark, DB 없이 도메인 객체만으로 측정한다.
+    __slots__ + 원 단위 정수(Won) 판매 기록과 이전 방식(__dict__ + Decimal)의
+    --rows 건당 메모리(tracemalloc)와 수수료 적용 + 합계 계산(apply_fee_policy, set_total_price) 처리 시간을 비교한다.
+    """
+    help = '판매 기록 도메인 객체의 메모리 사용량과 금액 계산 처리 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100_000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, rows, repeat, **options):
+        fee_policy = FeePolicy(decimal.Decimal(5))
+        rate = decimal.Decimal(5)
+
+        def build_won():
+            return [PhotoCardSale(state=PhotoCardState.ON_SALE, price=Won(1000 + i * 100), fee=Won(0),
+                                  renewal_date='', id=i, photo_card_id=i % 100, seller_id=i % 50)
+                    for i in range(rows)]
+
+        def build_decimal():
+            return [_DecimalPhotoCardSale(state=PhotoCardState.ON_SALE, price=decimal.Decimal(1000 + i * 100),
+                                          fee=decimal.Decimal(0), renewal_date='', id=i, photo_card_id=i % 100,
+                                          seller_id=i % 50)
+                    for i in range(rows)]
+
+        won_sales, decimal_sales = build_won(), build_decimal()
+        for sale in won_sales:
+            sale.apply_fee_policy(fee_policy).set_total_price()
+        for sale in decimal_sales:
+            sale.apply_fee_policy(rate).set_total_price()
+        if [sale.total_price for sale in won_sales] != [int(sale.total_price) for sale in decimal_sales]:
+            self.stderr.write(self.style.ERROR('합계 금액이 다릅니다.'))
+            return
+
+        results = {}
+        for name, build, compute in (
+                ('decimal', build_decimal, lambda sale: sale.apply_fee_policy(rate).set_total_price()),
+                ('won', build_won, lambda sale: sale.apply_fee_policy(fee_policy).set_total_price()),
+        ):
+            memory = self._allocated(build)
+            sales = build()
+            elapsed = min(timeit.repeat(lambda: [compute(sale) for sale in sales], number=1, repeat=repeat))
+            results[name] = memory, elapsed
+            self.stdout.write(f'{name:>8}: {memory / 1024 / 1024:8.2f} MiB / {rows} rows, '
+                              f'fee + total {elapsed * 1000:8.2f} ms')
+
+        (decimal_memory, decimal_elapsed), (won_memory, won_elapsed) = results['decimal'], results['won']
+        self.stdout.write(self.style.SUCCESS(
+            f'memory {1 - won_memory / decimal_memory:.0%} less, fee + total {decimal_elapsed / won_elapsed:.1f}x faster'))
+
+    @staticmethod
+    def _allocated(build) -> int:
+        """
+        build가 생성한 객체가 점유한 메모리(byte)
+        """
+        gc.collect()
+        tracemalloc.start()
+        try:
+            objects = build()
+            allocated, _ = tracemalloc.get_traced_memory()
+            del objects
+        finally:
+            tracemalloc.stop()
+        return allocated
@@ -0,0 +1,60 @@
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+
+from poca.application.adapter.spi.metrics.trade_metrics import instrumented_port, instrumented_use_case
+from poca.application.domain.model.photo_card_trade_result import PhotoCardTradeProcessedResult
+from poca.application.port.api.photo_card_trade_use_case import PhotoCardTradeUseCase
+from poca.application.port.spi.repository.user.find_user_port import FindUserPort
+from poca.application.util.metrics import MetricsRegistry
+
+
+class _Port:
+    def get_user_by_user_id(self, user_id):
+        return user_id
+
+
+class _UseCase:
+    _result = PhotoCardTradeProcessedResult(1)
+
+    def buy_photo_card_on_record(self, record_id, buyer_id):
+        return self._result
+
+
+class Command(BaseCommand):
+    """
+    메트릭 계측 overhead micro-benchmark, DB 없이 아무 일도 하지 않는 포트/유즈케이스로 측정한다.
+    계측하지 않은 호출과의 호출당 시간 차이가 --budget(µs)을 넘으면 실패한다.
+    """
+    help = '유즈케이스/포트 메트릭 계측의 호출당 overhead를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--number', type=int, default=200_000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--budget', type=float, default=3.0, help='허용하는 호출당 overhead(µs)')
+
+    def handle(self, *args, number, repeat, budget, **options):
+        registry = MetricsRegistry()
+        port, use_case = _Port(), _UseCase()
+        instrumented = instrumented_port(port, FindUserPort, registry)
+        instrumented_trade = instrumented_use_case(use_case, PhotoCardTradeUseCase, registry)
+
+        def per_call(func) -> float:
+            return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+        cases = (
+            ('port', lambda: port.get_user_by_user_id(1), lambda: instrumented.get_user_by_user_id(1)),
+            ('use case + result', lambda: use_case.buy_photo_card_on_record(1, 2),
+             lambda: instrumented_trade.buy_photo_card_on_record(1, 2)),
+        )
+        exceeded = []
+        for name, direct, wrapped in cases:
+            base, measured = per_call(direct), per_call(wrapped)
+            overhead = measured - base
+            self.stdout.write(f'{name:>18}: {base:6.3f} µs -> {measured:6.3f} µs (overhead {overhead:6.3f} µs)')
+            if overhead > budget:
+                exceeded.append(name)
+
+        if exceeded:
+            raise CommandError(f'계측 overhead가 {budget} µs를 넘었습니다: {", ".join(exceeded)}')
+        self.stdout.write(self.style.SUCCESS(f'호출당 overhead {budget} µs 이하'))
@@ -0,0 +1,50 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from poca.application.adapter.api.http.renderer import FastJSONRenderer
+from poca.application.adapter.api.http.serializer.photo_card_trade_serializer import \
+    PhotoCardTradeOnSaleListSerializer, encode_photo_card_trade_on_sale_list
+from poca.application.domain.model.money import Won
+from poca.application.domain.model.photo_card import PhotoCard, PhotoCardSale, PhotoCardState
+
+
+class Command(BaseCommand):
+    """
+    판매 목록 응답 직렬화 micro-benchmark, DB 없이 도메인 객체만으로 측정한다.
+    Serializer + JSONRenderer와 컴파일된 인코더 + FastJSONRenderer의 1,000건당 처리 시간을 비교하고,
+    두 경로의 출력 바이트가 같은지 확인한다.
+    """
+    help = '판매 목록 직렬화(Serializer, 컴파일된 인코더) 처리 시간을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, rows, repeat, **options):
+        sales = [
+            PhotoCardSale(
+                state=PhotoCardState.ON_SALE, price=Won(1000 + i), fee=Won(100),
+                renewal_date='', id=i,
+                photo_card=PhotoCard(id=i % 100, name=f'포토카드 {i % 100}', description='설명', release_date='',
+                                     image_url=f'https://img/{i % 100}'),
+            ).set_total_price()
+            for i in range(rows)
+        ]
+
+        def drf():
+            return JSONRenderer().render({'results': PhotoCardTradeOnSaleListSerializer(sales, many=True).data})
+
+        def compiled():
+            return FastJSONRenderer().render({'results': encode_photo_card_trade_on_sale_list(sales)})
+
+        if drf() != compiled():
+            self.stderr.write(self.style.ERROR('출력 바이트가 다릅니다.'))
+            return
+
+        per_1k = {}
+        for name, func in (('serializer', drf), ('compiled', compiled)):
+            per_1k[name] = min(timeit.repeat(func, number=1, repeat=repeat)) * 1000 / rows * 1000
+            self.stdout.write(f'{name:>10}: {per_1k[name]:8.2f} ms / 1k rows')
+        self.stdout.write(self.style.SUCCESS(f'{per_1k["serializer"] / per_1k["compiled"]:.1f}x faster'))
@@ -0,0 +1,20 @@
+import time
+
+from dependency_injector.wiring import Provide, inject
+from django.core.management.base import BaseCommand
+
+from poca.application.port.spi.repository.token.save_revoked_token_port import SaveRevokedTokenPort
+
+
+class Command(BaseCommand):
+    """
+    만료된 폐기 토큰 삭제, 만료된 토큰은 서명 검증에서 거부되므로 폐기 목록에서 삭제해도 다시 사용할 수 없다.
+    """
+    help = '만료된 폐기 토큰을 삭제합니다.'
+
+    @inject
+    def handle(self, *args,
+               revoked_token_repository: SaveRevokedTokenPort = Provide["revoked_token_repository"],
+               **options):
+        count = revoked_token_repository.delete_expired_revoked_tokens(int(time.time()))
+        self.stdout.write(self.style.SUCCESS(f'만료된 폐기 토큰 {count}건을 삭제했습니다.'))
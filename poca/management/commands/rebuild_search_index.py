@@ -0,0 +1,19 @@
+from dependency_injector.wiring import Provide, inject
+from django.core.management.base import BaseCommand
+
+from poca.application.port.api.photo_card_search_use_case import PhotoCardSearchUseCase
+
+
+class Command(BaseCommand):
+    """
+    기존 포토카드로 검색 색인(n-gram)을 다시 생성한다.
+    이후 등록되는 포토카드는 등록시 색인된다.
+    """
+    help = '포토카드 이름/설명 검색 색인을 다시 생성합니다.'
+
+    @inject
+    def handle(self, *args,
+               photo_card_search_use_case: PhotoCardSearchUseCase = Provide["photo_card_search_use_case"],
+               **options):
+        count = photo_card_search_use_case.rebuild_photo_card_search_index()
+        self.stdout.write(self.style.SUCCESS(f'{count}개의 포토카드를 색인했습니다.'))
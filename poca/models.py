@@ -1,8 +1,18 @@
 from poca.application.adapter.spi.persistence.entity.user import User
 from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard, PhotoCardSale
+from poca.application.adapter.spi.persistence.entity.photo_card_bid import PhotoCardBid
+from poca.application.adapter.spi.persistence.entity.photo_card_price_candle import PhotoCardPriceCandle
+from poca.application.adapter.spi.persistence.entity.photo_card_search_gram import PhotoCardSearchGram
+from poca.application.adapter.spi.persistence.entity.photo_card_search_text import PhotoCardSearchText
+from poca.application.adapter.spi.persistence.entity.revoked_token import RevokedToken
 
 __all__ = [
     'PhotoCard',
     'PhotoCardSale',
+    'PhotoCardBid',
+    'PhotoCardPriceCandle',
+    'PhotoCardSearchGram',
+    'PhotoCardSearchText',
+    'RevokedToken',
     'User',
 ]
@@ -0,0 +1,49 @@
+import decimal
+from unittest import TestCase
+
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+
+from poca.application.adapter.api.http.renderer import FastJSONRenderer
+from poca.application.adapter.api.http.serializer.photo_card_trade_serializer import \
+    PhotoCardTradeOnSaleListSerializer, PhotoCardTradeRecentlyTradeListSerializer, \
+    encode_photo_card_trade_on_sale_list, encode_photo_card_trade_recently_trade
+from poca.application.domain.model.photo_card import PhotoCard, PhotoCardSale, PhotoCardState
+from poca.application.domain.model.photo_card_trade_result import PhotoCardTradeRecentlySoldResult
+
+
+def _sales():
+    photo_cards = [
+        PhotoCard(id=1, name='뉴진스 하니', description='설명 줄바꿈 "따옴표"', release_date='2024-01-01',
+                  image_url='https://img/1', thumbnail_url='https://thumb/1'),
+        PhotoCard(id=2, name='IVE', description='', release_date='2024-01-01', image_url=None),
+    ]
+    prices = [decimal.Decimal(1000), decimal.Decimal('99.5'), 300, decimal.Decimal('1E+3')]
+    sales = []
+    for i, price in enumerate(prices):
+        sale = PhotoCardSale(state=PhotoCardState.ON_SALE, price=price, fee=decimal.Decimal(100), renewal_date='',
+                             id=i + 1, photo_card=photo_cards[i % 2])
+        sales.append(sale.set_total_price() if i != 3 else sale)
+    return sales
+
+
+class TestCompiledEncoder(TestCase):
+    def test_Serializer와_같은_값으로_인코딩한다(self):
+        sales = _sales()
+        recently_sold = PhotoCardTradeRecentlySoldResult(photo_card=sales[0].photo_card, photo_card_sales=sales)
+
+        self.assertEqual(encode_photo_card_trade_on_sale_list(sales),
+                         PhotoCardTradeOnSaleListSerializer(sales, many=True).data)
+        self.assertEqual(encode_photo_card_trade_recently_trade(recently_sold),
+                         PhotoCardTradeRecentlyTradeListSerializer(recently_sold).data)
+
+    def test_FastJSONRenderer는_JSONRenderer와_같은_바이트를_출력한다(self):
+        sales = _sales()
+        data = [
+            {'results': PhotoCardTradeOnSaleListSerializer(sales, many=True).data, 'next': None},
+            {'message': [ErrorDetail('잘못된 값', code='invalid')], 1: True, 'big': 2 ** 70},
+            '\x00\x1f\x7f/\\ \u2028\u2029',
+        ]
+
+        for value in data:
+            self.assertEqual(FastJSONRenderer().render(value), JSONRenderer().render(value))
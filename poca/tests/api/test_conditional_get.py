@@ -0,0 +1,66 @@
+import hashlib
+
+from django.test import TestCase
+from django.utils.http import quote_etag
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard
+from poca.application.adapter.spi.persistence.entity.user import User
+
+
+class TestConditionalGet(TestCase):
+    def setUp(self):
+        # 롤백으로 재사용되는 유저 id의 principal 캐시는 커밋 이후에 삭제된다.
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create_user(user_email="seller@test.com", password="password")
+        self.client.force_login(user)
+        self.card_id = PhotoCard.objects.create(name='테스트').id
+
+    def _register(self, price: int):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/sales', {'card_id': self.card_id, 'price': price},
+                                        content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+
+    def test_응답_본문이_같다면_304를_반환한다(self):
+        # given
+        self._register(10000)
+        response = self.client.get(f'/api/sales/min_price/{self.card_id}')
+        etag = response['ETag']
+
+        # when
+        not_modified = self.client.get(f'/api/sales/min_price/{self.card_id}', HTTP_IF_NONE_MATCH=etag)
+
+        # then
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Cache-Control'], 'public, no-cache')
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], etag)
+        self.assertFalse(not_modified.content)
+
+    def test_판매가_등록되면_이전_ETag로_요청해도_200을_반환한다(self):
+        # given
+        self._register(10000)
+        card = self.client.get(f'/api/sales/min_price/{self.card_id}')
+        card_etag = card['ETag']
+        market_etag = self.client.get('/api/sales')['ETag']
+
+        # when
+        self._register(9000)
+        card_response = self.client.get(f'/api/sales/min_price/{self.card_id}', HTTP_IF_NONE_MATCH=card_etag)
+        market_response = self.client.get('/api/sales', HTTP_IF_NONE_MATCH=market_etag)
+
+        # then
+        self.assertEqual(card_response.status_code, 200)
+        self.assertNotEqual(card_response.json()['id'], card.json()['id'])
+        self.assertNotEqual(card_response['ETag'], card_etag)
+        self.assertEqual(market_response.status_code, 200)
+
+    def test_ETag는_응답_본문으로_생성한다(self):
+        # given
+        self._register(10000)
+
+        # when
+        page = self.client.get('/api/sales')
+
+        # then
+        self.assertEqual(page['ETag'], quote_etag(hashlib.sha1(page.content).hexdigest()))
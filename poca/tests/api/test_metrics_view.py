@@ -0,0 +1,35 @@
+from django.test import TestCase
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard
+from poca.application.adapter.spi.persistence.entity.user import User
+
+
+class TestMetricsView(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create_user(user_email="seller@test.com", password="password")
+        self.client.force_login(user)
+        self.card_id = PhotoCard.objects.create(name='테스트').id
+
+    def test_유즈케이스와_포트_호출을_노출한다(self):
+        # given
+        self.client.get(f'/api/sales/{self.card_id}')
+
+        # when
+        response = self.client.get('/metrics', REMOTE_ADDR='127.0.0.1')
+
+        # then
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        body = response.content.decode()
+        self.assertIn('poca_use_case_duration_seconds_count{component="PhotoCardTradeUseCase",'
+                      'method="get_recently_sold_photo_card"}', body)
+        self.assertIn('poca_use_case_results_total{component="PhotoCardTradeUseCase",'
+                      'method="get_recently_sold_photo_card",result="PhotoCardTradeRecentlySoldResult"}', body)
+        self.assertIn('poca_port_duration_seconds_count{component="FindPhotoCardSalePort",'
+                      'method="find_photo_card_by_card_id"}', body)
+
+    def test_허용되지_않은_네트워크는_조회할_수_없다(self):
+        response = self.client.get('/metrics', REMOTE_ADDR='203.0.113.10')
+
+        self.assertEqual(response.status_code, 403)
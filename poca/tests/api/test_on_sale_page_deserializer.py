@@ -0,0 +1,29 @@
+import base64
+import datetime
+import json
+
+from django.test import SimpleTestCase
+from django.utils.timezone import now
+
+from poca.application.adapter.api.http.serializer.photo_card_trade_deserializer import OnSalePageDeSerializer, \
+    encode_on_sale_cursor
+from poca.application.domain.model.money import Won
+from poca.application.domain.model.photo_card import OnSaleCursor
+
+
+class TestOnSalePageDeSerializer(SimpleTestCase):
+    def test_다음_페이지_커서를_그대로_읽는다(self):
+        cursor = OnSaleCursor(total_price=Won(1100), renewal_date=now(), id=3)
+
+        serializer = OnSalePageDeSerializer(data={'cursor': encode_on_sale_cursor(cursor)})
+
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.create()['cursor'], cursor)
+
+    def test_시간대가_없는_커서는_거부한다(self):
+        raw = json.dumps(['1100', datetime.datetime(2024, 5, 1, 13, 0).isoformat(), 3]).encode()
+
+        serializer = OnSalePageDeSerializer(data={'cursor': base64.urlsafe_b64encode(raw).decode()})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('cursor', serializer.errors)
@@ -0,0 +1,35 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard
+from poca.application.adapter.spi.persistence.entity.user import User
+
+
+class TestPhotoCardPriceFeedView(TestCase):
+    def setUp(self):
+        # 롤백으로 재사용되는 유저 id의 principal 캐시는 커밋 이후에 삭제된다.
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create_user(user_email="user@test.com", password="password")
+        self.async_client.force_login(user)
+        self.card_id = PhotoCard.objects.create(name='테스트').id
+
+    async def test_구독한_포토카드의_현재_최소_가격을_SSE로_전달한다(self):
+        # when
+        invalid = await self.async_client.get('/api/async/sales/feed', {'card_id': 'x'})
+        response = await self.async_client.get('/api/async/sales/feed', {'card_id': self.card_id})
+        chunks = aiter(response.streaming_content)
+        retry = await anext(chunks)
+        event = (await anext(chunks)).decode()
+        await sync_to_async(response.close)()
+
+        # then
+        self.assertEqual(invalid.status_code, 400)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(retry, b'retry: 3000\n\n')
+        name, data = event.strip().split('\n')
+        self.assertEqual(name, 'event: price')
+        payload = json.loads(data.removeprefix('data: '))
+        self.assertEqual((payload['card_id'], payload['trades']), (self.card_id, []))
+        self.assertIn('min_price', payload)
@@ -0,0 +1,88 @@
+from django.test import TestCase, override_settings
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.tests.query_budget import QueryBudgetMixin
+
+
+class TestViewQueryBudget(QueryBudgetMixin, TestCase):
+    """
+    판매 조회/구매 view의 쿼리 예산, 판매 기록 수가 늘어도 쿼리 수는 늘지 않아야 한다.
+    """
+
+    def setUp(self):
+        # 롤백으로 재사용되는 유저 id의 principal 캐시는 커밋 이후에 삭제된다.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.seller = User.objects.create_user(user_email="seller@test.com", password="password")
+            self.buyer = User.objects.create_user(user_email="buyer@test.com", password="password")
+        self.client.force_login(self.seller)
+        self.card_ids = [PhotoCard.objects.create(name=f'테스트 {i}').id for i in range(5)]
+        for card_id in self.card_ids:
+            for price in (5000, 6000, 7000):
+                with self.captureOnCommitCallbacks(execute=True):
+                    response = self.client.post('/api/sales', {'card_id': card_id, 'price': price},
+                                                content_type='application/json')
+                self.assertEqual(response.status_code, 201)
+        # 세션/인증 캐시 적재
+        self.client.get('/api/sales')
+
+    def test_판매중_목록(self):
+        # 정렬키 인덱스로 페이지 조회 + 포토카드/유저 일괄 적재
+        with self.assertQueryBudget(3):
+            response = self.client.get('/api/sales', {'limit': 20})
+        self.assertEqual(response.status_code, 200)
+
+    def test_포토카드_판매_상세(self):
+        with self.assertQueryBudget(2):
+            response = self.client.get(f'/api/sales/{self.card_ids[0]}')
+        self.assertEqual(response.status_code, 200)
+
+    def test_최소_가격_매물(self):
+        with self.assertQueryBudget(1):
+            response = self.client.get(f'/api/sales/min_price/{self.card_ids[0]}')
+        self.assertEqual(response.status_code, 200)
+
+    def test_구매(self):
+        record_id = self.client.get(f'/api/sales/min_price/{self.card_ids[0]}').json()['id']
+        self.client.force_login(self.buyer)
+        self.client.get('/api/sales')
+
+        # 캔들은 커밋 이후에 갱신하므로 구매 트랜잭션의 쿼리에 포함되지 않는다.
+        with self.captureOnCommitCallbacks(execute=True), \
+                self.assertQueryBudget(5):
+            response = self.client.post('/api/purchase', {'record_id': record_id}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+
+
+class TestQueryInstrumentationMiddleware(TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create_user(user_email="seller@test.com", password="password")
+        self.client.force_login(user)
+        self.card_id = PhotoCard.objects.create(name='테스트').id
+
+    @override_settings(POCA_QUERY_INSTRUMENTATION={'HEADERS': True, 'LOG': False, 'N_PLUS_ONE_THRESHOLD': 5})
+    def test_개발_환경에서는_응답_헤더로_전달한다(self):
+        # when
+        response = self.client.get(f'/api/sales/{self.card_id}')
+
+        # then
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(int(response['X-DB-Query-Count']), 0)
+        self.assertGreaterEqual(float(response['X-DB-Time-Ms']), 0)
+        self.assertIn('X-DB-Duplicate-Queries', response)
+        self.assertIn('SELECT', response['X-DB-Slowest-Query'])
+
+    @override_settings(POCA_QUERY_INSTRUMENTATION={'HEADERS': False, 'LOG': True, 'N_PLUS_ONE_THRESHOLD': 1})
+    def test_운영_환경에서는_구조화_로그로_기록한다(self):
+        # when
+        with self.assertLogs('poca.application.adapter.api.http.query_instrumentation', 'INFO') as logs:
+            response = self.client.get(f'/api/sales/{self.card_id}')
+
+        # then
+        self.assertNotIn('X-DB-Query-Count', response)
+        payload = logs.records[0].query_profile
+        self.assertEqual(payload['route'], 'api/sales/<int:card_id>')
+        self.assertEqual(payload['status'], 200)
+        self.assertGreater(payload['queries'], 0)
+        self.assertIn('db_ms', payload)
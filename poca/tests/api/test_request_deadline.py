@@ -0,0 +1,29 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from poca.application.adapter.api.http.request_deadline import RequestDeadlineMiddleware
+from poca.application.util.contention import ContentionManager
+from poca.application.util.transactional import MaxRetriesExceededException, OptimisticLockException
+
+
+def _conflict():
+    raise OptimisticLockException('version mismatch')
+
+
+class TestRequestDeadlineMiddleware(SimpleTestCase):
+    @override_settings(POCA_CONTENTION={"MAX_ATTEMPTS": 3, "BUDGET": 0.5, "REQUEST_BUDGET": 1e-9})
+    def test_요청_예산이_소진되면_충돌_재시도를_대기하지_않고_포기한다(self):
+        # given
+        waits = []
+        manager = ContentionManager(max_attempts=10, budget=10, sleep=waits.append)
+
+        def view(request):
+            with self.assertRaises(MaxRetriesExceededException):
+                manager.run('photo_card:1', _conflict)
+            return HttpResponse()
+
+        # when
+        RequestDeadlineMiddleware(view)(RequestFactory().get('/'))
+
+        # then
+        self.assertEqual(waits, [])
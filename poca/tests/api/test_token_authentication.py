@@ -0,0 +1,62 @@
+from django.test import RequestFactory, TestCase
+
+from poca.application.adapter.api.http.token_authentication import SignedTokenAuthentication, TokenPrincipal
+from poca.application.adapter.spi.persistence.entity.user import User
+
+
+class TestSignedTokenAuthentication(TestCase):
+    def setUp(self):
+        User.objects.create_user(user_email="user@test.com", password="password")
+
+    def _issue(self) -> dict:
+        return self.client.post('/api/auth/token', {'user_email': 'user@test.com', 'password': 'password'},
+                                content_type='application/json').json()
+
+    def test_access_토큰은_세션과_DB_조회_없이_인증한다(self):
+        # given
+        tokens = self._issue()
+
+        # when
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/cards/search', {'q': ' '},
+                                       HTTP_AUTHORIZATION=f'Bearer {tokens["access_token"]}')
+        unauthenticated = self.client.get('/api/cards/search', {'q': ' '}, HTTP_AUTHORIZATION='Bearer invalid')
+
+        # then
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(unauthenticated.status_code, 403)
+        self.assertNotIn('sessionid', self.client.cookies)
+
+    def test_access_토큰의_유저는_모델이_아닌_id만_가진_principal이다(self):
+        # given
+        tokens = self._issue()
+        request = RequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {tokens["access_token"]}')
+
+        # when
+        principal, _ = SignedTokenAuthentication().authenticate(request)
+
+        # then
+        self.assertEqual(principal, TokenPrincipal(id=User.objects.get().id))
+        self.assertTrue(principal.is_authenticated)
+        # 잔액 등 기본값을 읽거나 저장하지 않도록 유저 컬럼과 save()가 없다.
+        self.assertFalse(hasattr(principal, 'balance'))
+        self.assertFalse(hasattr(principal, 'save'))
+
+    def test_refresh_토큰은_한번만_사용할_수_있고_폐기된_access_토큰은_인증하지_않는다(self):
+        # given
+        tokens = self._issue()
+
+        # when
+        refreshed = self.client.post('/api/auth/token/refresh', {'refresh_token': tokens['refresh_token']},
+                                     content_type='application/json')
+        reused = self.client.post('/api/auth/token/refresh', {'refresh_token': tokens['refresh_token']},
+                                  content_type='application/json')
+        self.client.post('/api/auth/token/revoke', HTTP_AUTHORIZATION=f'Bearer {tokens["access_token"]}')
+        revoked = self.client.get('/api/cards/search', {'q': ' '},
+                                  HTTP_AUTHORIZATION=f'Bearer {tokens["access_token"]}')
+
+        # then
+        self.assertEqual(refreshed.status_code, 200)
+        self.assertNotEqual(refreshed.json()['refresh_token'], tokens['refresh_token'])
+        self.assertEqual(reused.status_code, 401)
+        self.assertEqual(revoked.status_code, 403)
@@ -0,0 +1,40 @@
+import random
+
+from django.test import TestCase
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCardSale
+from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
+from poca.application.service.photo_card_trade_service import DEFAULT_FEE_POLICY
+from poca.benchmarks.api_dataset import seed_dataset
+
+
+class TestBenchmarkDataset(TestCase):
+    def setUp(self):
+        self.dataset = seed_dataset(cards=3, listings=5, users=2, seed=1)
+
+    def test_매물은_기본_수수료_정책을_적용하여_생성한다(self):
+        # when
+        sales = PhotoCardSale.objects.filter(id__in=self.dataset.record_ids)
+
+        # then
+        self.assertEqual(len(sales), 5)
+        for sale in sales:
+            self.assertEqual(sale.fee, DEFAULT_FEE_POLICY.apply(sale.price))
+            self.assertGreater(sale.fee, 0)
+
+    def test_판매된_매물은_고르지_않고_새_매물로_보충한다(self):
+        # given
+        listings = self.dataset.listings
+        sold = self.dataset.record_ids[0]
+
+        # when
+        excluded = listings.sold(sold)
+        excluded_again = listings.sold(sold)
+        picked = {listings.choice(random.Random(i)) for i in range(50)}
+        replenished = listings.replenish(PhotoCardSaleRepository())
+
+        # then
+        self.assertEqual((excluded, excluded_again), (True, False))
+        self.assertNotIn(sold, picked)
+        self.assertEqual((replenished, len(listings)), (1, 5))
+        self.assertEqual(listings.replenish(PhotoCardSaleRepository()), 0)
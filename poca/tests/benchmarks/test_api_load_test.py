@@ -0,0 +1,54 @@
+from django.test import SimpleTestCase
+
+from poca.benchmarks.api_load_test import _Sample, compare, percentile, summarize
+
+
+class TestApiLoadTestReport(SimpleTestCase):
+    def test_엔드포인트별_지연시간_백분위수와_충돌_오류_비율을_집계한다(self):
+        # given
+        samples = [_Sample('POST /api/purchase', latency=(i + 1) / 1000, status=200, queries=4) for i in range(96)]
+        samples += [_Sample('POST /api/purchase', latency=0.5, status=409, queries=3) for _ in range(3)]
+        samples.append(_Sample('POST /api/purchase', latency=1.0, status=500, queries=1))
+
+        # when
+        result = summarize(samples, elapsed=2)
+
+        # then
+        self.assertEqual(percentile([3, 1, 2], 0.5), 2)
+        self.assertEqual((result['requests'], result['rps']), (100, 50.0))
+        self.assertEqual((result['p50_ms'], result['p95_ms'], result['p99_ms']), (50.0, 95.0, 500.0))
+        self.assertEqual(result['queries_per_request'], 3.94)
+        self.assertEqual((result['conflict_rate'], result['error_rate']), (0.03, 0.01))
+        self.assertEqual(result['statuses'], {'200': 96, '409': 3, '500': 1})
+
+    def test_경합에서_밀린_구매_417은_구매_엔드포인트에서만_충돌로_집계한다(self):
+        # given
+        samples = [_Sample('POST /api/purchase', latency=0.01, status=417, queries=2) for _ in range(2)]
+        samples += [_Sample('GET /api/sales/min_price/1', latency=0.01, status=417, queries=1),
+                    _Sample('POST /api/purchase', latency=0.01, status=200, queries=4)]
+
+        # when
+        purchase = summarize([sample for sample in samples if sample.endpoint == 'POST /api/purchase'], elapsed=1)
+        total = summarize(samples, elapsed=1)
+
+        # then
+        self.assertEqual(purchase['conflict_rate'], 0.6667)
+        self.assertEqual(total['conflict_rate'], 0.5)
+
+    def test_threshold를_넘은_성능_저하만_보고한다(self):
+        # given
+        def report(p95_ms, rps, queries, error_rate=0.0, conflict_rate=0.1):
+            return {'endpoints': {'GET /api/sales': {'requests': 100, 'p95_ms': p95_ms, 'rps': rps,
+                                                     'queries_per_request': queries, 'error_rate': error_rate,
+                                                     'conflict_rate': conflict_rate}}}
+        baseline = report(p95_ms=10, rps=1000, queries=1)
+
+        # when
+        within = compare(report(p95_ms=11.9, rps=810, queries=1.5, conflict_rate=0.11), baseline, threshold=0.2)
+        regressed = compare(report(p95_ms=12.1, rps=790, queries=2, error_rate=0.02, conflict_rate=0.13), baseline,
+                            threshold=0.2)
+
+        # then
+        self.assertEqual(within, [])
+        self.assertEqual(len(regressed), 5)
+        self.assertIn('GET /api/sales: conflict rate 10.00% -> 13.00%', regressed)
@@ -0,0 +1,94 @@
+from unittest import TestCase
+
+from poca.application.adapter.spi.cache.cache_backend import LocalLRUCacheBackend
+from poca.application.adapter.spi.cache.cached_find_photo_card_sale_port import CachedFindPhotoCardSalePort
+from poca.application.adapter.spi.cache.photo_card_sale_version import PhotoCardSaleVersion
+from poca.application.domain.model.money import Won
+from poca.application.domain.model.photo_card import PhotoCardSale, PhotoCardState
+from poca.application.domain.model.user import UserDomain
+from poca.application.domain.model.photo_card_trade_event import PhotoCardSaleCompletedEvent
+
+
+class FakeFindPhotoCardSalePort:
+    def __init__(self):
+        self.calls = 0
+        self.min_price = {1: 'record-1'}
+
+    def find_min_price_photo_card_on_sale(self, card_id):
+        self.calls += 1
+        return self.min_price.get(card_id)
+
+
+class TestLocalLRUCacheBackend(TestCase):
+    def setUp(self):
+        self.now = 0
+        self.backend = LocalLRUCacheBackend(max_entries=2, ttl=10, clock=lambda: self.now)
+
+    def test_최대_갯수를_넘으면_가장_오래_사용되지_않은_항목을_축출한다(self):
+        # given
+        self.backend.set('a', 1)
+        self.backend.set('b', 2)
+        self.backend.get('a')
+
+        # when
+        self.backend.set('c', 3)
+
+        # then
+        self.assertIsNone(self.backend.get('b'))
+        self.assertEqual(self.backend.get('a'), 1)
+        self.assertEqual(self.backend.stats.evictions, 1)
+
+    def test_ttl이_지난_항목은_조회되지_않는다(self):
+        # given
+        self.backend.set('a', 1)
+
+        # when
+        self.now = 10
+
+        # then
+        self.assertIsNone(self.backend.get('a'))
+        self.assertEqual((self.backend.stats.hits, self.backend.stats.misses), (0, 1))
+
+
+class TestCachedFindPhotoCardSalePort(TestCase):
+    def setUp(self):
+        self.delegate = FakeFindPhotoCardSalePort()
+        self.versions = PhotoCardSaleVersion(LocalLRUCacheBackend())
+        self.port = CachedFindPhotoCardSalePort(self.delegate, LocalLRUCacheBackend(), self.versions)
+
+    def test_같은_버전이라면_캐시에서_조회한다(self):
+        self.port.find_min_price_photo_card_on_sale(1)
+        self.port.find_min_price_photo_card_on_sale(1)
+        # 조회 결과가 없는 경우도 캐시한다.
+        self.port.find_min_price_photo_card_on_sale(2)
+        self.port.find_min_price_photo_card_on_sale(2)
+
+        self.assertEqual(self.delegate.calls, 2)
+
+    def test_거래가_완료되면_버전이_올라가_이전_결과를_조회하지_않는다(self):
+        # given
+        self.port.find_min_price_photo_card_on_sale(1)
+        self.delegate.min_price[1] = 'record-2'
+
+        # when
+        self.versions.on_sale_completed(PhotoCardSaleCompletedEvent(photo_card_id=1, record_id=1, buyer_id=1))
+
+        # then
+        self.assertEqual(self.port.find_min_price_photo_card_on_sale(1), 'record-2')
+        self.assertEqual(self.delegate.calls, 2)
+
+    def test_캐시된_판매_기록을_변경해도_다음_조회에_반영되지_않는다(self):
+        # given
+        seller = UserDomain(user_id=1, balance=Won(1000), email='seller@test.com', active=True)
+        self.delegate.min_price[1] = PhotoCardSale(PhotoCardState.ON_SALE, price=Won(100), fee=Won(5),
+                                                   renewal_date='2024-05-01', id=1, seller=seller)
+
+        # when
+        sale = self.port.find_min_price_photo_card_on_sale(1)
+        sale.price = Won(1)
+        sale.seller.buy_photo_card(Won(100))
+
+        # then
+        cached = self.port.find_min_price_photo_card_on_sale(1)
+        self.assertEqual((cached.price, cached.seller.balance), (100, 1000))
+        self.assertEqual(self.delegate.calls, 1)
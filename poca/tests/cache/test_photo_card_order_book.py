@@ -0,0 +1,80 @@
+import decimal
+from unittest import TestCase
+
+from poca.application.adapter.spi.cache.photo_card_order_book import PhotoCardOrderBook
+from poca.application.domain.model.photo_card import PhotoCardSale, PhotoCardState
+
+
+def _entry(card_id, record_id, price, renewal_date):
+    sale = PhotoCardSale(
+        id=record_id,
+        state=PhotoCardState.ON_SALE,
+        price=decimal.Decimal(price),
+        fee=decimal.Decimal(100),
+        renewal_date=renewal_date,
+        photo_card_id=card_id,
+    )
+    return card_id, record_id, (decimal.Decimal(price), renewal_date, record_id), sale
+
+
+class TestPhotoCardOrderBook(TestCase):
+    def setUp(self):
+        self.order_book = PhotoCardOrderBook()
+        self.order_book.ensure_loaded(lambda: [
+            _entry(1, 1, 1000, "2021-01-02"),
+            _entry(1, 2, 100, "2021-01-02"),
+            _entry(1, 3, 100, "2021-01-01"),
+            _entry(2, 4, 500, "2021-01-01"),
+        ])
+
+    def test_best_최소가격이_같다면_리뉴얼이_오래된_매물을_조회한다(self):
+        self.assertEqual(self.order_book.best(1).id, 3)
+
+    def test_best_of_each_포토카드별_최우선_매물만_조회한다(self):
+        result = {record.photo_card_id: record.id for record in self.order_book.best_of_each()}
+
+        self.assertEqual(result, {1: 3, 2: 4})
+
+    def test_remove_판매완료된_매물은_다음_매물로_대체된다(self):
+        # when
+        self.order_book.remove(3)
+        self.order_book.remove(4)
+
+        # then
+        self.assertEqual(self.order_book.best(1).id, 2)
+        self.assertIsNone(self.order_book.best(2))
+
+    def test_add_더_저렴한_매물이_등록되면_최우선_매물이_된다(self):
+        # when
+        self.order_book.add(*_entry(1, 5, 50, "2021-01-03"))
+
+        # then
+        self.assertEqual(self.order_book.best(1).id, 5)
+
+    def test_reconcile_DB와_다른_포토카드_수를_반환하고_보정한다(self):
+        # when
+        drifted = self.order_book.reconcile(lambda: [
+            _entry(1, 1, 1000, "2021-01-02"),
+            _entry(2, 4, 500, "2021-01-01"),
+        ])
+
+        # then
+        self.assertEqual(drifted, 1)
+        self.assertEqual(self.order_book.best(1).id, 1)
+
+    def test_reconcile_스냅샷을_읽는_동안_반영된_추가_삭제는_유지한다(self):
+        # given
+        def loader():
+            # 스냅샷을 읽은 뒤 커밋된 구매(3번 매물)와 신규 매물(5번 매물)
+            snapshot = [_entry(1, 1, 1000, "2021-01-02"), _entry(1, 3, 100, "2021-01-01"),
+                        _entry(2, 4, 500, "2021-01-01")]
+            self.order_book.remove(3)
+            self.order_book.add(*_entry(2, 5, 50, "2021-01-03"))
+            return snapshot
+
+        # when
+        self.order_book.reconcile(loader)
+
+        # then
+        self.assertEqual(self.order_book.best(1).id, 1)
+        self.assertEqual(self.order_book.best(2).id, 5)
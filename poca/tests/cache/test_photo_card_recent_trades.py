@@ -0,0 +1,85 @@
+import datetime
+import decimal
+from unittest import TestCase
+
+from poca.application.adapter.spi.cache.photo_card_recent_trades import PhotoCardRecentTrades, RecentTrade
+from poca.application.domain.model.photo_card_trade_event import PhotoCardSaleCompletedEvent
+
+
+def _trade(record_id, minute):
+    return RecentTrade(record_id, decimal.Decimal(100 * record_id), decimal.Decimal(10),
+                       datetime.datetime(2024, 5, 1, 13, minute))
+
+
+class TestPhotoCardRecentTrades(TestCase):
+    def setUp(self):
+        self.now = 0
+        self.loads = []
+        self.trades = {1: [_trade(2, 2), _trade(1, 1)], 2: [_trade(3, 0)]}
+        self.recent_trades = PhotoCardRecentTrades(capacity=3, max_cards=2, max_age=60, clock=lambda: self.now)
+
+    def _loader(self, card_id):
+        self.loads.append(card_id)
+        return self.trades.get(card_id, [])
+
+    def _recent(self, card_id, limit=3):
+        return [trade.record_id for trade in self.recent_trades.recent(card_id, limit, self._loader)]
+
+    def test_recent_적재된_포토카드는_다시_조회하지_않고_거래_완료를_반영한다(self):
+        # given
+        self._recent(1)
+
+        # when
+        for record_id in (4, 5):
+            self.recent_trades.on_sale_completed(PhotoCardSaleCompletedEvent(
+                photo_card_id=1, record_id=record_id, buyer_id=1, price=decimal.Decimal(100),
+                fee=decimal.Decimal(10), sold_date=datetime.datetime(2024, 5, 1, 13, 10 + record_id)))
+
+        # then
+        # capacity 건만 최신순으로 유지
+        self.assertEqual(self._recent(1), [5, 4, 2])
+        self.assertEqual(self._recent(1, limit=1), [5])
+        self.assertEqual(self.loads, [1])
+
+    def test_recent_거래_시각이_이전인_거래는_순서에_맞게_반영한다(self):
+        self._recent(1)
+
+        self.recent_trades.append(1, _trade(9, 0))
+
+        self.assertEqual(self._recent(1), [2, 1, 9])
+
+    def test_recent_max_cards를_넘으면_가장_오래_조회되지_않은_포토카드를_축출한다(self):
+        # given
+        self._recent(1)
+        self._recent(2)
+        self._recent(1)
+
+        # when
+        self._recent(3)
+
+        # then
+        self.assertIsNone(self.recent_trades.peek(2, 3))
+        self.assertIsNotNone(self.recent_trades.peek(1, 3))
+
+    def test_recent_적재하는_동안_반영된_거래가_있다면_적재_결과를_저장하지_않는다(self):
+        # given
+        def loader(card_id):
+            # DB 조회 이후 커밋된 거래
+            self.recent_trades.append(card_id, _trade(9, 30))
+            return self.trades[card_id]
+
+        # when
+        self.recent_trades.recent(1, 3, loader)
+
+        # then
+        self.assertIsNone(self.recent_trades.peek(1, 3))
+
+    def test_recent_capacity보다_많은_거래나_오래된_버퍼는_다시_조회한다(self):
+        self._recent(1)
+
+        self.now = 60
+
+        self.assertIsNone(self.recent_trades.recent(1, 4, self._loader))
+        self.assertIsNone(self.recent_trades.peek(1, 3))
+        self._recent(1)
+        self.assertEqual(self.loads, [1, 1])
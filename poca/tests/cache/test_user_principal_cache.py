@@ -0,0 +1,77 @@
+from django.test import TestCase
+
+from poca.application.adapter.spi.cache.cache_backend import LocalLRUCacheBackend
+from poca.application.adapter.spi.cache.user_principal_cache import UserPrincipalCache
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.adapter.spi.persistence.repository.user_repository import UserRepository
+from poca.auth_backend import EmailBackend
+
+
+class TestUserPrincipalCache(TestCase):
+    def setUp(self):
+        self.principal_cache = UserPrincipalCache(LocalLRUCacheBackend())
+        self.backend = EmailBackend(principal_cache=self.principal_cache)
+        self.user = User.objects.create_user(user_email="user@test.com", password="password")
+
+    def test_get_user_캐시된_유저는_조회하지_않는다(self):
+        # given
+        self.backend.get_user(self.user.id)
+
+        # when
+        with self.assertNumQueries(0):
+            user = self.backend.get_user(self.user.id)
+
+        # then
+        self.assertEqual((user.id, user.user_email), (self.user.id, self.user.user_email))
+        self.assertEqual(user.get_session_auth_hash(), self.user.get_session_auth_hash())
+        self.assertEqual((self.principal_cache.stats.hits, self.principal_cache.stats.misses), (1, 1))
+
+    def test_비밀번호_해시와_잔액은_캐시하지_않는다(self):
+        # given
+        self.backend.get_user(self.user.id)
+        UserRepository().save_user_balance(self.user.id, 500)
+
+        # when
+        cached = self.principal_cache.get(self.user.id)
+        user = self.backend.get_user(self.user.id)
+
+        # then
+        self.assertNotIn('password', cached['fields'])
+        self.assertNotIn('balance', cached['fields'])
+        # 잔액은 사용할 때 DB에서 조회
+        with self.assertNumQueries(1):
+            self.assertEqual(user.balance, 500)
+
+    def test_활성_상태가_바뀌면_커밋_이후에_다시_조회한다(self):
+        # given
+        self.backend.get_user(self.user.id)
+
+        # when
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(id=self.user.id).update(is_active=False)
+            # 유저 post_save 시그널
+            self.principal_cache.on_user_changed(User, self.user)
+
+        # then
+        self.assertFalse(self.backend.get_user(self.user.id).is_active)
+
+
+class TestAuthenticatedRequest(TestCase):
+    def setUp(self):
+        # 롤백으로 재사용되는 유저 id가 이전 테스트의 principal 캐시로 조회되지 않도록 삭제
+        EmailBackend().principal_cache.clear()
+
+    def test_로그인_이후_요청은_인증을_위해_DB를_조회하지_않는다(self):
+        # given
+        User.objects.create_user(user_email="user@test.com", password="password")
+        self.client.post('/api/auth', {'user_email': 'user@test.com', 'password': 'password'},
+                         content_type='application/json')
+        # 첫 요청에서 principal 캐시 적재
+        self.client.get('/api/cards/search', {'q': ' '})
+
+        # when
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/cards/search', {'q': ' '})
+
+        # then
+        self.assertEqual(response.status_code, 400)
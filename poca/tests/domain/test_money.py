@@ -0,0 +1,37 @@
+import decimal
+from unittest import TestCase
+
+from poca.application.domain.model.money import fraction_of, to_won
+from poca.application.domain.model.photo_card import FeePolicy
+
+
+class TestWon(TestCase):
+    def test_to_won(self):
+        self.assertEqual(to_won(1000), 1000)
+        self.assertIs(type(to_won(decimal.Decimal('1000'))), int)
+        self.assertEqual(to_won(decimal.Decimal('1000.00')), 1000)
+        self.assertEqual(to_won('1500'), 1500)
+
+    def test_to_won_원_미만_금액은_변환하지_않는다(self):
+        for value in (decimal.Decimal('1000.5'), '10.01', 'abc', decimal.Decimal('NaN'), None):
+            with self.assertRaises(ValueError):
+                to_won(value)
+
+    def test_fraction_of_원_단위_반올림(self):
+        self.assertEqual(fraction_of(1010, 5, 100), 51)   # 50.5
+        self.assertEqual(fraction_of(1009, 5, 100), 50)   # 50.45
+        self.assertEqual(fraction_of(1000, 5, 100), 50)
+
+
+class TestFeePolicy(TestCase):
+    def test_apply는_decimal_반올림과_같다(self):
+        for percentage in (decimal.Decimal(5), decimal.Decimal('2.5'), decimal.Decimal('0.3')):
+            fee_policy = FeePolicy(percentage)
+            for price in range(0, 20000, 37):
+                expected = (decimal.Decimal(price) * percentage / 100).quantize(
+                    decimal.Decimal(1), rounding=decimal.ROUND_HALF_UP)
+                self.assertEqual(fee_policy.apply(price), expected)
+
+    def test_apply_many(self):
+        fee_policy = FeePolicy(decimal.Decimal(5))
+        self.assertEqual(fee_policy.apply_many([1000, decimal.Decimal(1010)]), [50, 51])
@@ -35,3 +35,11 @@ class TestPhotoCardSale(TestCase):
         promotion = FeePolicy(discount_percentage=decimal.Decimal(5))
         self.photo_card_sale.apply_fee_policy(promotion)
         self.assertEqual(self.photo_card_sale.get_total_price(), decimal.Decimal(1050))
+
+
+class TestFeePolicy(TestCase):
+    def test_apply_many(self):
+        policy = FeePolicy(discount_percentage=decimal.Decimal(5))
+        prices = [decimal.Decimal(1000), decimal.Decimal(30), decimal.Decimal(0)]
+
+        self.assertEqual(policy.apply_many(prices), [policy.apply(price) for price in prices])
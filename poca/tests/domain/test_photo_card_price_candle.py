@@ -0,0 +1,27 @@
+import datetime
+import decimal
+from unittest import TestCase
+
+from poca.application.domain.model.photo_card_price_candle import CandleResolution, PhotoCardPriceCandle
+
+
+class TestCandleResolution(TestCase):
+    def test_floor(self):
+        traded_at = datetime.datetime(2024, 5, 1, 13, 45, 30, 100)
+
+        self.assertEqual(CandleResolution.MINUTE.floor(traded_at), datetime.datetime(2024, 5, 1, 13, 45))
+        self.assertEqual(CandleResolution.HOUR.floor(traded_at), datetime.datetime(2024, 5, 1, 13))
+        self.assertEqual(CandleResolution.DAY.floor(traded_at), datetime.datetime(2024, 5, 1))
+
+
+class TestPhotoCardPriceCandle(TestCase):
+    def test_merge_거래_순서와_무관하게_시가와_종가는_가장_이른_늦은_거래로_결정된다(self):
+        base = datetime.datetime(2024, 5, 1, 13)
+        candle = PhotoCardPriceCandle.first_trade(1, CandleResolution.HOUR, decimal.Decimal(200),
+                                                  base + datetime.timedelta(minutes=30))
+
+        candle.merge(decimal.Decimal(300), base + datetime.timedelta(minutes=50))
+        candle.merge(decimal.Decimal(100), base + datetime.timedelta(minutes=10))
+
+        self.assertEqual((candle.open, candle.high, candle.low, candle.close, candle.volume), (100, 300, 100, 300, 3))
+        self.assertEqual(candle.bucket, base)
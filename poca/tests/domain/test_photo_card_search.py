@@ -0,0 +1,15 @@
+from unittest import TestCase
+
+from poca.application.domain.model.photo_card_search import PhotoCardSearchQuery, index_grams
+
+
+class TestPhotoCardSearch(TestCase):
+    def test_index_grams_글자와_bigram을_토큰별로_색인한다(self):
+        self.assertEqual(index_grams('뉴진스 하니', None),
+                         {'뉴', '진', '스', '뉴진', '진스', '하', '니', '하니'})
+
+    def test_검색어는_전각_대소문자를_정규화하고_중복_토큰을_제거한다(self):
+        query = PhotoCardSearchQuery('ＩＶＥ  ive 원')
+
+        self.assertEqual(query.tokens, ['ive', '원'])
+        self.assertEqual(query.grams(), {'iv', 've', '원'})
@@ -0,0 +1,28 @@
+import contextlib
+from typing import Iterator
+
+from poca.application.util.query_profile import QueryProfile, profile_queries
+
+
+class QueryBudgetMixin:
+    """
+    view별 쿼리 예산 확인, TestCase와 함께 상속하여 사용한다.
+    assertNumQueries와 달리 예산 이하라면 통과하므로 쿼리가 줄어드는 변경에는 테스트를 고치지 않아도 된다.
+    """
+
+    @contextlib.contextmanager
+    def assertQueryBudget(self, queries: int, repeats: int = 1) -> Iterator[QueryProfile]:
+        """
+        :param queries: int 블록에서 실행할 수 있는 최대 쿼리 수
+        :param repeats: int 같은 형태의 쿼리를 실행할 수 있는 최대 횟수, 넘으면 N+1로 본다.
+        """
+        with profile_queries() as profile:
+            yield profile
+
+        shapes = '\n'.join(f'  {count}x {shape}' for shape, count in
+                           sorted(profile.shapes.items(), key=lambda item: -item[1]))
+        if profile.count > queries:
+            self.fail(f'{profile.count} queries executed, budget is {queries}\n{shapes}')
+        if (duplicates := profile.duplicates(repeats + 1)):
+            shape, count = duplicates[0]
+            self.fail(f'query repeated {count} times (N+1), budget is {repeats}: {shape}\n{shapes}')
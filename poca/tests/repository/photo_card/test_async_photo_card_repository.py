@@ -0,0 +1,79 @@
+import datetime
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+from django.utils.timezone import now
+
+from poca.application.adapter.spi.cache.photo_card_order_book import PhotoCardOrderBook
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard, PhotoCardSale
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.adapter.spi.persistence.repository.async_photo_card_trade_repository import \
+    AsyncPhotoCardSaleRepository
+from poca.application.domain.model.photo_card import PhotoCardState
+
+
+class TestAsyncPhotoCardRepository(TestCase):
+    def setUp(self):
+        self.repository = AsyncPhotoCardSaleRepository()
+        self.seller = User.objects.create(user_email="seller@test.com")
+        self.buyer = User.objects.create(user_email="buyer@test.com")
+        self.card_ids = []
+        for i in range(5):
+            card = PhotoCard.objects.create(name=f'카드{i}')
+            self.card_ids.append(card.id)
+            for price in (100 * (i % 2), 300):
+                PhotoCardSale.objects.create(
+                    seller=self.seller,
+                    photo_card=card,
+                    price=price,
+                    fee=100,
+                    renewal_date=now(),
+                    state=PhotoCardState.ON_SALE.value,
+                )
+        PhotoCardSale.objects.create(
+            seller=self.seller,
+            buyer=self.buyer,
+            photo_card_id=self.card_ids[0],
+            price=500,
+            fee=100,
+            renewal_date=now(),
+            sold_date=now() - datetime.timedelta(days=1),
+            state=PhotoCardState.SOLD.value,
+        )
+
+    async def test_afind_photo_card_renewal_old_page_동기_조회와_같은_페이지를_조회한다(self):
+        # when
+        records, cursor = [], None
+        while True:
+            page = await self.repository.afind_photo_card_renewal_old_page(cursor, 2)
+            records.extend(page.records)
+            if (cursor := page.next_cursor) is None:
+                break
+        expected = await sync_to_async(self.repository.find_photo_card_renewal_old_page)(None, 10)
+
+        # then
+        self.assertEqual([r.id for r in records], [r.id for r in expected.records])
+        self.assertEqual(len(records), 5)
+
+    async def test_afind_min_price_photo_card_on_sale_오더북이_주입되면_메모리에서_조회한다(self):
+        # given
+        repository = AsyncPhotoCardSaleRepository(order_book=PhotoCardOrderBook())
+
+        # when
+        from_db = await self.repository.afind_min_price_photo_card_on_sale(self.card_ids[1])
+        from_order_book = await repository.afind_min_price_photo_card_on_sale(self.card_ids[1])
+
+        # then
+        self.assertEqual(from_db.id, from_order_book.id)
+        self.assertEqual(from_db.price, 100)
+
+    async def test_afind_recently_sold_photo_card(self):
+        # when
+        photo_card = await self.repository.afind_photo_card_by_card_id(self.card_ids[0])
+        missing = await self.repository.afind_photo_card_by_card_id(-1)
+        result = await self.repository.afind_recently_sold_photo_card(self.card_ids[0])
+
+        # then
+        self.assertEqual(photo_card.id, self.card_ids[0])
+        self.assertIsNone(missing)
+        self.assertEqual([(r.price, r.buyer.user_id) for r in result], [(500, self.buyer.id)])
@@ -0,0 +1,109 @@
+import datetime
+
+from django.test import TestCase
+from django.utils.timezone import localtime, make_aware, now
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard, PhotoCardSale
+from poca.application.adapter.spi.persistence.entity.photo_card_price_candle import PhotoCardPriceCandle
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.adapter.spi.persistence.repository.photo_card_price_candle_repository import \
+    PhotoCardPriceCandleRepository
+from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
+from poca.application.domain.model.money import Won
+from poca.application.domain.model.photo_card import PhotoCardState
+from poca.application.domain.model.photo_card_price_candle import CandleResolution
+from poca.application.port.api.command.photo_card_trade_command import PurchasePhotoCardCommand
+from poca.application.service.photo_card_price_candle_service import PhotoCardPriceCandleService
+
+
+class TestPhotoCardPriceCandleRepository(TestCase):
+    def setUp(self):
+        self.repository = PhotoCardPriceCandleRepository()
+        self.card_id = PhotoCard.objects.create(name='테스트').id
+        self.base = make_aware(datetime.datetime(2024, 5, 1, 13, 0))
+
+    def _trade(self, price: int, minutes: float):
+        self.repository.record_photo_card_trade(
+            self.card_id, Won(price), self.base + datetime.timedelta(minutes=minutes))
+
+    def test_record_photo_card_trade_해상도별_캔들을_갱신한다(self):
+        # when
+        self._trade(200, 0.5)
+        self._trade(300, 1.5)
+        self._trade(100, 0.2)
+
+        # then
+        minutes = self.repository.find_photo_card_price_candles(self.card_id, CandleResolution.MINUTE)
+        hour, = self.repository.find_photo_card_price_candles(self.card_id, CandleResolution.HOUR)
+        self.assertEqual([(c.open, c.close, c.volume) for c in minutes], [(100, 200, 2), (300, 300, 1)])
+        self.assertEqual((hour.open, hour.high, hour.low, hour.close, hour.volume), (100, 300, 100, 300, 3))
+        self.assertEqual(hour.bucket, CandleResolution.HOUR.floor(localtime(self.base)))
+        # 도메인 금액은 원 단위 정수
+        self.assertIs(type(hour.high), int)
+
+    def test_record_photo_card_trade_캔들이_있다면_한번의_쿼리로_처리한다(self):
+        # given
+        self._trade(200, 0)
+
+        # when
+        with self.assertNumQueries(1):
+            self._trade(300, 0.5)
+
+    def test_find_photo_card_price_candles_구간_안의_최근_캔들을_시간_순서로_조회한다(self):
+        # given
+        for minute in range(5):
+            self._trade(100 + minute, minute)
+
+        # when
+        candles = self.repository.find_photo_card_price_candles(
+            self.card_id, CandleResolution.MINUTE, end=self.base + datetime.timedelta(minutes=4), limit=2)
+
+        # then
+        self.assertEqual([c.close for c in candles], [102, 103])
+
+
+class TestPhotoCardSaleRepositoryCandles(TestCase):
+    def setUp(self):
+        self.candles = PhotoCardPriceCandleRepository()
+        self.repository = PhotoCardSaleRepository(candles=self.candles)
+        self.seller = User.objects.create(user_email="seller@test.com")
+        self.buyer = User.objects.create(user_email="buyer@test.com", balance=10000)
+        self.card = PhotoCard.objects.create(name='테스트')
+
+    def _create_sale(self, price: int) -> PhotoCardSale:
+        return PhotoCardSale.objects.create(seller=self.seller, photo_card=self.card, price=price, fee=0,
+                                            renewal_date=now(), state=PhotoCardState.ON_SALE.value)
+
+    def test_purchase_거래_완료시_캔들에_반영하고_백필_결과와_같다(self):
+        # given
+        sales = [self._create_sale(price) for price in (300, 100, 200)]
+
+        # when
+        for sale in sales:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(sale.id, self.buyer.id))
+        live = self.candles.find_photo_card_price_candles(self.card.id, CandleResolution.DAY)
+        service = PhotoCardPriceCandleService(self.repository, self.candles, self.repository, self.candles)
+        count = service.backfill_photo_card_price_candles()
+        backfilled = self.candles.find_photo_card_price_candles(self.card.id, CandleResolution.DAY)
+
+        # then
+        day, = live
+        self.assertEqual((day.open, day.high, day.low, day.close, day.volume), (300, 300, 100, 200, 3))
+        self.assertEqual(backfilled, live)
+        self.assertEqual(count, PhotoCardPriceCandle.objects.count())
+
+    def test_purchase_캔들은_구매_트랜잭션의_커밋_이후에_갱신한다(self):
+        # given
+        sale = self._create_sale(300)
+
+        # when
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(sale.id, self.buyer.id))
+        before_commit = PhotoCardPriceCandle.objects.count()
+        for callback in callbacks:
+            callback()
+
+        # then
+        self.assertEqual(before_commit, 0)
+        self.assertEqual(PhotoCardPriceCandle.objects.count(), len(CandleResolution))
@@ -0,0 +1,228 @@
+import threading
+import unittest
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+
+from poca.application.adapter.spi.cache.photo_card_recent_trades import PhotoCardRecentTrades
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCardSale, PhotoCard
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
+from poca.application.adapter.spi.persistence.repository.user_repository import UserRepository
+from poca.application.domain.model.photo_card import CheckoutMode, PhotoCardState, PurchaseOutcome
+from poca.application.port.api.command.photo_card_trade_command import CheckoutPhotoCardCommand, \
+    PurchasePhotoCardCommand, UpdatePhotoCardCommand
+
+
+def _create_sale(seller: User, price: int, fee: int = 100) -> PhotoCardSale:
+    return PhotoCardSale.objects.create(
+        seller=seller,
+        photo_card=PhotoCard.objects.create(name='테스트'),
+        price=price,
+        fee=fee,
+        renewal_date=now(),
+        state=PhotoCardState.ON_SALE.value,
+    )
+
+
+class TestPhotoCardRepositoryPurchase(TestCase):
+    def setUp(self):
+        self.repository = PhotoCardSaleRepository()
+        self.seller = User.objects.create(user_email="seller@test.com")
+        self.buyer = User.objects.create(user_email="buyer@test.com", balance=1000)
+
+    def test_purchase_판매완료_처리와_잔액_차감을_함께_반영한다(self):
+        # given
+        sale = _create_sale(self.seller, price=800)
+
+        # when
+        result = self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(sale.id, self.buyer.id))
+
+        # then
+        sale.refresh_from_db()
+        self.buyer.refresh_from_db()
+        self.assertEqual(result.outcome, PurchaseOutcome.PURCHASED)
+        self.assertEqual(sale.state, PhotoCardState.SOLD.value)
+        self.assertEqual(sale.buyer_id, self.buyer.id)
+        self.assertEqual(self.buyer.balance, 100)
+
+    def test_purchase_잔액이_부족하면_판매완료_처리도_반영하지_않는다(self):
+        # given
+        sale = _create_sale(self.seller, price=1000)
+
+        # when
+        result = self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(sale.id, self.buyer.id))
+
+        # then
+        sale.refresh_from_db()
+        self.buyer.refresh_from_db()
+        self.assertEqual(result.outcome, PurchaseOutcome.INSUFFICIENT_BALANCE)
+        self.assertEqual(sale.state, PhotoCardState.ON_SALE.value)
+        self.assertEqual(self.buyer.balance, 1000)
+
+    def test_purchase_실패한_조건을_반환한다(self):
+        # given
+        sale = _create_sale(self.seller, price=100)
+        sold = _create_sale(self.seller, price=100)
+        self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(sold.id, self.buyer.id))
+
+        # when
+        not_found = self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(-1, self.buyer.id))
+        not_on_sale = self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(sold.id, self.buyer.id))
+        conflict = self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(sale.id, self.buyer.id, version=9))
+
+        # then
+        self.assertEqual(not_found.outcome, PurchaseOutcome.NOT_FOUND)
+        self.assertEqual(not_on_sale.outcome, PurchaseOutcome.NOT_ON_SALE)
+        self.assertEqual(conflict.outcome, PurchaseOutcome.VERSION_CONFLICT)
+
+    def test_purchase_기존_구매_처리보다_적은_쿼리로_처리한다(self):
+        # given
+        first, second = _create_sale(self.seller, price=100), _create_sale(self.seller, price=100)
+        user_repository = UserRepository()
+
+        # when
+        # 기존 구매 처리: 유저 조회, 판매 기록 조회, 판매완료 처리, 잔액 저장
+        with CaptureQueriesContext(connection) as legacy:
+            user = user_repository.get_user_by_user_id(self.buyer.id)
+            record = self.repository.find_sales_record_by_id(first.id)
+            self.repository.update_photo_card_sale(UpdatePhotoCardCommand(first.id, self.buyer.id, record.version))
+            user_repository.save_user_balance(self.buyer.id, user.buy_photo_card(record.get_total_price()).balance)
+        with CaptureQueriesContext(connection) as single:
+            self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(second.id, self.buyer.id))
+
+        # then
+        def statements(context):
+            return [q for q in context.captured_queries if 'SAVEPOINT' not in q['sql']]
+
+        self.assertLess(len(statements(single)), len(statements(legacy)))
+        if connection.vendor == 'postgresql':
+            self.assertEqual(len(statements(single)), 1)
+
+
+class TestPhotoCardRepositoryCheckout(TestCase):
+    def setUp(self):
+        self.repository = PhotoCardSaleRepository()
+        self.seller = User.objects.create(user_email="seller@test.com")
+        self.buyer = User.objects.create(user_email="buyer@test.com", balance=1000)
+
+    def test_checkout_모두_구매하고_잔액은_합계로_한번만_차감한다(self):
+        # given
+        sales = [_create_sale(self.seller, price=100) for _ in range(3)]
+
+        # when
+        checkout = self.repository.checkout_photo_card_sales(
+            CheckoutPhotoCardCommand([sale.id for sale in reversed(sales)], self.buyer.id))
+
+        # then
+        self.buyer.refresh_from_db()
+        self.assertTrue(checkout.is_all_purchased())
+        # 항목별 결과는 record_id 순
+        self.assertEqual([p.record_id for p in checkout.purchases], [sale.id for sale in sales])
+        self.assertEqual(checkout.total_price, 600)
+        self.assertEqual(self.buyer.balance, 400)
+        self.assertEqual(PhotoCardSale.objects.filter(state=PhotoCardState.SOLD.value, buyer=self.buyer).count(), 3)
+
+    def test_checkout_ALL_OR_NOTHING_하나라도_구매할_수_없다면_모두_구매하지_않는다(self):
+        # given
+        sale = _create_sale(self.seller, price=100)
+        sold = _create_sale(self.seller, price=100)
+        self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(sold.id, self.buyer.id))
+
+        # when
+        checkout = self.repository.checkout_photo_card_sales(
+            CheckoutPhotoCardCommand([sale.id, sold.id], self.buyer.id, CheckoutMode.ALL_OR_NOTHING))
+
+        # then
+        sale.refresh_from_db()
+        self.assertEqual([p.outcome for p in checkout.purchases], [PurchaseOutcome.ABORTED, PurchaseOutcome.NOT_ON_SALE])
+        self.assertEqual(sale.state, PhotoCardState.ON_SALE.value)
+        self.assertEqual(checkout.total_price, 0)
+
+    def test_checkout_BEST_EFFORT_잔액_한도까지_구매할_수_있는_항목만_구매한다(self):
+        # given
+        sales = [_create_sale(self.seller, price=400) for _ in range(3)]
+
+        # when
+        checkout = self.repository.checkout_photo_card_sales(
+            CheckoutPhotoCardCommand([sale.id for sale in sales] + [-1], self.buyer.id, CheckoutMode.BEST_EFFORT))
+
+        # then
+        self.buyer.refresh_from_db()
+        self.assertEqual([p.outcome for p in checkout.purchases], [
+            PurchaseOutcome.NOT_FOUND, PurchaseOutcome.PURCHASED, PurchaseOutcome.PURCHASED,
+            PurchaseOutcome.INSUFFICIENT_BALANCE])
+        self.assertEqual(self.buyer.balance, 0)
+
+    def test_checkout_구매_건수와_무관한_쿼리로_처리한다(self):
+        # given
+        sales = [_create_sale(self.seller, price=10, fee=0) for _ in range(20)]
+
+        # when
+        with CaptureQueriesContext(connection) as context:
+            self.repository.checkout_photo_card_sales(CheckoutPhotoCardCommand([sale.id for sale in sales], self.buyer.id))
+
+        # then
+        # 구매자 잠금, 판매 기록 잠금, 판매완료 처리, 잔액 차감
+        statements = [q for q in context.captured_queries if 'SAVEPOINT' not in q['sql']]
+        self.assertEqual(len(statements), 4)
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', '동시성 검증은 PostgreSQL에서만 수행')
+class TestPhotoCardRepositoryConcurrentPurchase(TransactionTestCase):
+    def setUp(self):
+        self.repository = PhotoCardSaleRepository()
+        self.seller = User.objects.create(user_email="seller@test.com")
+        self.buyer = User.objects.create(user_email="buyer@test.com", balance=1000)
+
+    def test_같은_유저가_동시에_구매해도_잔액_갱신이_유실되지_않는다(self):
+        # given
+        # 잔액으로는 10건 중 5건만 구매할 수 있다.
+        sales = [_create_sale(self.seller, price=100) for _ in range(10)]
+        results = []
+
+        def buy(record_id):
+            results.append(self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(record_id, self.buyer.id)))
+            connection.close()
+
+        # when
+        threads = [threading.Thread(target=buy, args=(sale.id,)) for sale in sales]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # then
+        purchased = [r for r in results if r.is_purchased()]
+        self.buyer.refresh_from_db()
+        self.assertEqual(len(purchased), 5)
+        self.assertEqual(self.buyer.balance, 1000 - sum(r.total_price for r in purchased))
+        self.assertEqual(PhotoCardSale.objects.filter(state=PhotoCardState.SOLD.value).count(), 5)
+
+
+class TestPhotoCardRepositoryRecentTrades(TestCase):
+    def setUp(self):
+        self.recent_trades = PhotoCardRecentTrades(capacity=5)
+        self.repository = PhotoCardSaleRepository(listeners=[self.recent_trades], recent_trades=self.recent_trades)
+        self.seller = User.objects.create(user_email="seller@test.com")
+        self.buyer = User.objects.create(user_email="buyer@test.com", balance=1000)
+
+    def test_find_recently_sold_photo_card_적재_이후에는_DB를_조회하지_않고_구매를_반영한다(self):
+        # given
+        first, second = _create_sale(self.seller, price=100), _create_sale(self.seller, price=200)
+        second.photo_card = first.photo_card
+        second.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(first.id, self.buyer.id))
+        self.repository.find_recently_sold_photo_card(first.photo_card_id)
+
+        # when
+        with self.captureOnCommitCallbacks(execute=True):
+            self.repository.purchase_photo_card_sale(PurchasePhotoCardCommand(second.id, self.buyer.id))
+        with self.assertNumQueries(0):
+            result = self.repository.find_recently_sold_photo_card(first.photo_card_id)
+
+        # then
+        self.assertEqual([(r.id, r.total_price) for r in result], [(second.id, 300), (first.id, 200)])
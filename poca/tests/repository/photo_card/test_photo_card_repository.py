@@ -1,7 +1,8 @@
 import datetime
 import threading
+import unittest
 
-from django.db import OperationalError, transaction
+from django.db import OperationalError, connection, transaction
 from django.test import TestCase, TransactionTestCase
 from django.utils.timezone import now
 from sqlalchemy.dialects.postgresql import psycopg2
@@ -9,7 +10,8 @@ from sqlalchemy.dialects.postgresql import psycopg2
 from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCardSale, PhotoCard
 from poca.application.adapter.spi.persistence.entity.user import User
 from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
-from poca.application.domain.model.photo_card import PhotoCardState
+from poca.application.domain.model.money import Won
+from poca.application.domain.model.photo_card import OnSaleCursor, PhotoCardState
 from poca.application.port.api.command.photo_card_trade_command import UpdatePhotoCardCommand
 from poca.application.util import transactional
 from poca.application.util.transactional import MaxRetriesExceededException
@@ -137,6 +139,70 @@ class TestPhotoCardRepository(TestCase):
         for r in result:
             self.assertEqual(r.state, PhotoCardState.ON_SALE)
 
+    def test_find_photo_card_renewal_old_포토카드가_여러개여도_연관객체는_테이블당_한번만_조회한다(self):
+        # given
+        for i in range(10):
+            PhotoCardSale.objects.create(
+                seller=self.seller,
+                buyer=self.buyer,
+                photo_card=PhotoCard.objects.create(name=f'카드{i}'),
+                price=100,
+                fee=100,
+                renewal_date=now(),
+                state=PhotoCardState.ON_SALE.value,
+            )
+
+        # when
+        # 판매 기록 1회, 포토카드 1회, 유저 1회
+        with self.assertNumQueries(3):
+            result = self.repository.find_photo_card_renewal_old()
+
+        # then
+        # 같은 유저는 하나의 도메인 객체를 공유한다.
+        self.assertEqual(len(result), 11)
+        self.assertTrue(all(r.seller is result[0].seller for r in result))
+
+    def test_find_photo_card_renewal_old_page_커서로_모든_페이지를_순서대로_조회한다(self):
+        # given
+        for i in range(4):
+            PhotoCardSale.objects.create(
+                seller=self.seller,
+                photo_card=PhotoCard.objects.create(name=f'카드{i}'),
+                price=100 * (i % 2),
+                fee=100,
+                renewal_date=now(),
+                state=PhotoCardState.ON_SALE.value,
+            )
+
+        # when
+        records, cursor = [], None
+        while True:
+            page = self.repository.find_photo_card_renewal_old_page(cursor, 2)
+            records.extend(page.records)
+            if (cursor := page.next_cursor) is None:
+                break
+
+        # then
+        # 포토카드별 최소가격 매물 5건이 total_price 순으로 중복 없이 조회된다.
+        self.assertEqual([r.id for r in records], [r.id for r in sorted(records, key=lambda r: (r.total_price, r.id))])
+        self.assertEqual(len({r.photo_card.id for r in records}), 5)
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', '실행 계획 검증은 PostgreSQL에서만 수행')
+    def test_find_photo_card_renewal_old_page_커서_위치부터_정렬키_인덱스를_탐색한다(self):
+        # given
+        cursor = OnSaleCursor(total_price=Won(1100), renewal_date=now(), id=0)
+        with connection.cursor() as db_cursor:
+            # 데이터가 적으면 순차 탐색을 선택하므로 인덱스로 탐색할 수 있는지만 확인
+            db_cursor.execute('SET LOCAL enable_seqscan = off')
+
+        # when
+        plan = PhotoCardSaleRepository._on_sale_page_query(cursor, 10).explain()
+
+        # then
+        # 처음부터 읽지 않고 커서의 total_price 부터 인덱스를 탐색한다.
+        self.assertIn('photo_card_sale_on_sale_page', plan)
+        self.assertRegex(plan, r'Index Cond: \(+price \+ fee\)+ >= ')
+
     def test_최근거래가_6건_있을_때_디폴트_5건만_조회한다(self):
         # given
         sold_date = now()
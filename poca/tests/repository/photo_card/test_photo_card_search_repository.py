@@ -0,0 +1,107 @@
+from django.test import TestCase
+from django.utils.timezone import now
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard, PhotoCardSale
+from poca.application.adapter.spi.persistence.entity.photo_card_search_gram import PhotoCardSearchGram
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.adapter.spi.persistence.repository.photo_card_repository import PhotoCardRepository
+from poca.application.adapter.spi.persistence.repository.photo_card_search_repository import \
+    PhotoCardSearchRepository
+from poca.application.domain.model.photo_card import PhotoCardState
+from poca.application.domain.model.photo_card_search import PhotoCardSearchQuery, SearchOrder
+from poca.application.port.api.command.photo_card_command import CreatePhotoCardCommand
+
+
+class TestPhotoCardSearchRepository(TestCase):
+    def setUp(self):
+        self.repository = PhotoCardSearchRepository()
+        self.photo_card_repository = PhotoCardRepository(search_index=self.repository)
+        self.seller = User.objects.create(user_email="seller@test.com")
+
+    def _register(self, name: str, description: str = '포토카드') -> int:
+        return self.photo_card_repository.register_new_photo_card(CreatePhotoCardCommand(name, description))
+
+    def _sell(self, card_id: int, price: int, state: PhotoCardState = PhotoCardState.ON_SALE) -> PhotoCardSale:
+        return PhotoCardSale.objects.create(seller=self.seller, photo_card_id=card_id, price=price, fee=0,
+                                            renewal_date=now(), state=state.value)
+
+    def test_search_포토카드_등록시_색인되어_부분_문자열로_검색된다(self):
+        # given
+        hanni = self._register('뉴진스 하니')
+        self._register('아이브 원영')
+
+        # when
+        result = self.repository.search_photo_cards(PhotoCardSearchQuery('진스'))
+
+        # then
+        self.assertEqual([hit.photo_card.id for hit in result], [hanni])
+
+    def test_search_bigram이_모두_있어도_토큰이_포함되지_않으면_제외한다(self):
+        # given
+        # '스뉴'와 '뉴진'은 있지만 '스뉴진'은 없다.
+        self._register('스뉴 뉴진')
+
+        # when
+        result = self.repository.search_photo_cards(PhotoCardSearchQuery('스뉴진'))
+
+        # then
+        self.assertEqual(result, [])
+
+    def test_search_전각이나_호환_문자로_등록된_이름도_정규화하여_확인한다(self):
+        # given
+        fullwidth = self._register('ＮｅｗＪｅａｎｓ　하니')
+        compatibility = self._register('㈜하이브 뉴진스', description='Ⅱ 시즌')
+
+        # when
+        by_name = self.repository.search_photo_cards(PhotoCardSearchQuery('newjeans 하니'))
+        by_compatibility = self.repository.search_photo_cards(PhotoCardSearchQuery('(주)하이브 ii'))
+
+        # then
+        self.assertEqual([hit.photo_card.id for hit in by_name], [fullwidth])
+        self.assertEqual([hit.photo_card.id for hit in by_compatibility], [compatibility])
+
+    def test_search_이름_일치_접두어_부분일치_설명_순서로_정렬한다(self):
+        # given
+        in_description = self._register('민지', description='뉴진스 멤버')
+        contains = self._register('2024 뉴진스')
+        prefix = self._register('뉴진스 하니')
+        exact = self._register('뉴진스')
+
+        # when
+        result = self.repository.search_photo_cards(PhotoCardSearchQuery('뉴진스'))
+
+        # then
+        self.assertEqual([hit.photo_card.id for hit in result], [exact, prefix, contains, in_description])
+
+    def test_search_판매중인_최소가격_매물을_한번의_쿼리로_함께_조회한다(self):
+        # given
+        expensive = self._register('뉴진스 하니')
+        cheap = self._register('뉴진스 민지')
+        not_on_sale = self._register('뉴진스 해린')
+        self._sell(expensive, 3000)
+        self._sell(cheap, 2000)
+        min_price = self._sell(cheap, 1000)
+        self._sell(not_on_sale, 10, state=PhotoCardState.SOLD)
+
+        # when
+        with self.assertNumQueries(1):
+            result = self.repository.search_photo_cards(
+                PhotoCardSearchQuery('뉴진스', order=SearchOrder.PRICE, on_sale_only=True))
+
+        # then
+        self.assertEqual([hit.photo_card.id for hit in result], [cheap, expensive])
+        self.assertEqual((result[0].min_price_record_id, result[0].min_total_price), (min_price.id, 1000))
+
+    def test_rebuild_photo_card_search_index_기존_포토카드를_색인한다(self):
+        # given
+        card_id = PhotoCard.objects.create(name='르세라핌 카즈하', description='').id
+        PhotoCardSearchGram.objects.create(gram='xx', photo_card_id=card_id)
+
+        # when
+        count = self.repository.rebuild_photo_card_search_index(chunk_size=1)
+
+        # then
+        self.assertEqual(count, 1)
+        self.assertFalse(PhotoCardSearchGram.objects.filter(gram='xx').exists())
+        self.assertEqual([hit.photo_card.id for hit in self.repository.search_photo_cards(PhotoCardSearchQuery('카'))],
+                         [card_id])
@@ -0,0 +1,124 @@
+from django.test import TestCase
+from django.utils.timezone import now
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard, PhotoCardSale
+from poca.application.adapter.spi.persistence.entity.photo_card_bid import PhotoCardBid
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.adapter.spi.persistence.repository.photo_card_bid_repository import PhotoCardBidRepository
+from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
+from poca.application.adapter.spi.persistence.repository.user_repository import UserRepository
+from poca.application.domain.model.photo_card import PhotoCardSale as PhotoCardSaleDomain, PhotoCardState
+from poca.application.domain.model.photo_card_bid import PhotoCardBidState
+from poca.application.domain.model.photo_card_trade_result import PhotoCardBidPlacedResult
+from poca.application.port.api.command.photo_card_trade_command import PlacePhotoCardBidCommand
+from poca.application.service.photo_card_bid_service import PhotoCardBidService
+from poca.application.service.photo_card_matching_engine import PhotoCardMatchingEngine
+
+
+class TestPhotoCardMatchingEngine(TestCase):
+    def setUp(self):
+        bid_repository = PhotoCardBidRepository()
+        # workers=0: 요청 스레드에서 바로 매칭
+        self.engine = PhotoCardMatchingEngine(PhotoCardSaleRepository(), bid_repository, bid_repository, workers=0)
+        self.sale_repository = PhotoCardSaleRepository(listeners=[self.engine])
+        self.service = PhotoCardBidService(bid_repository, self.engine)
+
+        self.seller = User.objects.create(user_email="seller@poca.com")
+        self.buyers = [User.objects.create(user_email=f"buyer{i}@poca.com", balance=10000) for i in range(3)]
+        self.card_id = PhotoCard.objects.create(name='테스트').id
+
+    def _place_bid(self, buyer: User, max_price: int) -> int:
+        with self.captureOnCommitCallbacks(execute=True):
+            result = self.service.place_photo_card_bid(PlacePhotoCardBidCommand(self.card_id, buyer.id, max_price))
+        self.assertIsInstance(result, PhotoCardBidPlacedResult)
+        return result.bid_id
+
+    def _register_sale(self, price: int, fee: int = 100) -> int:
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.sale_repository.save_photo_card_sale(PhotoCardSaleDomain(
+                state=PhotoCardState.ON_SALE.value,
+                price=price,
+                fee=fee,
+                seller_id=self.seller.id,
+                photo_card_id=self.card_id,
+                renewal_date=now(),
+            )).id
+
+    def test_신규_매물은_가장_높은_가격의_먼저_등록된_구매_주문과_체결된다(self):
+        # given
+        low = self._place_bid(self.buyers[0], 1000)
+        first = self._place_bid(self.buyers[1], 2000)
+        second = self._place_bid(self.buyers[2], 2000)
+
+        # when
+        record_id = self._register_sale(price=1500)
+
+        # then
+        self.assertEqual(PhotoCardBid.objects.get(id=first).state, PhotoCardBidState.FILLED.value)
+        self.assertEqual(PhotoCardBid.objects.get(id=first).record_id, record_id)
+        self.assertEqual(PhotoCardBid.objects.filter(id__in=[low, second], state=PhotoCardBidState.OPEN.value).count(), 2)
+        sale = PhotoCardSale.objects.get(id=record_id)
+        self.assertEqual((sale.state, sale.buyer_id), (PhotoCardState.SOLD.value, self.buyers[1].id))
+        self.assertEqual(UserRepository().get_user_by_user_id(self.buyers[1].id).balance, 10000 - 1600)
+
+    def test_구매_주문_가격보다_비싼_매물은_체결되지_않는다(self):
+        # given
+        bid_id = self._place_bid(self.buyers[0], 1000)
+
+        # when
+        record_id = self._register_sale(price=1000)
+
+        # then
+        self.assertEqual(PhotoCardBid.objects.get(id=bid_id).state, PhotoCardBidState.OPEN.value)
+        self.assertEqual(PhotoCardSale.objects.get(id=record_id).state, PhotoCardState.ON_SALE.value)
+
+    def test_신규_구매_주문은_판매중인_최저가_매물부터_체결된다(self):
+        # given
+        self._register_sale(price=1500)
+        cheapest = self._register_sale(price=900)
+
+        # when
+        bid_id = self._place_bid(self.buyers[0], 1200)
+
+        # then
+        self.assertEqual(PhotoCardBid.objects.get(id=bid_id).record_id, cheapest)
+        self.assertEqual(PhotoCardSale.objects.filter(state=PhotoCardState.ON_SALE.value).count(), 1)
+
+    def test_잔액이_부족한_구매_주문은_취소되고_다음_주문과_체결된다(self):
+        # given
+        poor = User.objects.create(user_email="poor@poca.com", balance=0)
+        poor_bid = self._place_bid(poor, 5000)
+        bid_id = self._place_bid(self.buyers[0], 2000)
+
+        # when
+        self._register_sale(price=1000)
+
+        # then
+        self.assertEqual(PhotoCardBid.objects.get(id=poor_bid).state, PhotoCardBidState.CANCELLED.value)
+        self.assertEqual(PhotoCardBid.objects.get(id=bid_id).state, PhotoCardBidState.FILLED.value)
+
+    def test_다른_프로세스에서_체결된_구매_주문은_다시_체결하지_않는다(self):
+        # given: 호가창에 적재된 구매 주문을 다른 프로세스의 매칭 엔진이 먼저 체결
+        bid_id = self._place_bid(self.buyers[0], 2000)
+        other_record_id = self._register_sale(price=5000)
+        PhotoCardBid.objects.filter(id=bid_id).update(state=PhotoCardBidState.FILLED.value, record_id=other_record_id)
+
+        # when
+        record_id = self._register_sale(price=1000)
+
+        # then
+        self.assertEqual(PhotoCardBid.objects.get(id=bid_id).record_id, other_record_id)
+        self.assertEqual(PhotoCardSale.objects.get(id=record_id).state, PhotoCardState.ON_SALE.value)
+        self.assertEqual(UserRepository().get_user_by_user_id(self.buyers[0].id).balance, 10000)
+
+    def test_신규_매물은_다른_프로세스에서_등록된_구매_주문과도_체결된다(self):
+        # given: 호가창을 적재한 뒤 다른 프로세스에서 더 높은 가격의 구매 주문을 등록
+        self._place_bid(self.buyers[0], 1500)
+        other_bid = PhotoCardBid.objects.create(photo_card_id=self.card_id, buyer=self.buyers[1], max_price=2000)
+
+        # when
+        record_id = self._register_sale(price=1000)
+
+        # then
+        self.assertEqual(PhotoCardBid.objects.get(id=other_bid.id).record_id, record_id)
+        self.assertEqual(PhotoCardSale.objects.get(id=record_id).buyer_id, self.buyers[1].id)
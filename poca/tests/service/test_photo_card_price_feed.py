@@ -0,0 +1,78 @@
+import asyncio
+import decimal
+from typing import Dict, Optional
+
+from django.test import SimpleTestCase
+
+from poca.application.domain.model.photo_card import PhotoCardSale, PhotoCardState
+from poca.application.domain.model.photo_card_trade_event import PhotoCardSaleCompletedEvent, \
+    PhotoCardSaleRegisteredEvent
+from poca.application.port.api.photo_card_price_feed_use_case import PhotoCardPriceFeedLaggedException
+from poca.application.service.photo_card_price_feed import PhotoCardPriceFeed
+
+
+class _OrderBookPort:
+    """
+    포토카드별 최소 가격 매물만 반환하는 조회 포트
+    """
+
+    def __init__(self):
+        self.best: Dict[int, PhotoCardSale] = {}
+        self.calls = 0
+
+    async def afind_min_price_photo_card_on_sale(self, card_id: int) -> Optional[PhotoCardSale]:
+        self.calls += 1
+        return self.best.get(card_id)
+
+    def register(self, card_id: int, record_id: int, price: int) -> PhotoCardSaleRegisteredEvent:
+        self.best[card_id] = PhotoCardSale(id=record_id, state=PhotoCardState.ON_SALE, price=decimal.Decimal(price),
+                                           fee=decimal.Decimal(0), renewal_date=None, photo_card_id=card_id)
+        return PhotoCardSaleRegisteredEvent(card_id, record_id, decimal.Decimal(price), decimal.Decimal(0))
+
+
+class TestPhotoCardPriceFeed(SimpleTestCase):
+    def setUp(self):
+        self.port = _OrderBookPort()
+        self.port.register(1, record_id=10, price=5000)
+        self.feed = PhotoCardPriceFeed(self.port, interval=0.01, max_pending=2)
+
+    async def test_구독하면_현재_최소_가격을_받고_변경은_포토카드별로_합쳐서_받는다(self):
+        # given
+        subscription = await self.feed.subscribe([1, 2])
+        initial = [await subscription.get(timeout=1), await subscription.get(timeout=1)]
+        calls = self.port.calls
+
+        # when
+        # 이벤트는 커밋 이후 요청 스레드에서 전달된다.
+        await asyncio.to_thread(self.feed.on_sale_registered, self.port.register(1, record_id=11, price=4000))
+        await asyncio.to_thread(self.feed.on_sale_registered, self.port.register(1, record_id=12, price=3000))
+        await asyncio.to_thread(self.feed.on_sale_completed, PhotoCardSaleCompletedEvent(1, 12, buyer_id=7))
+        await asyncio.to_thread(self.feed.on_sale_registered, self.port.register(3, record_id=13, price=1000))
+        update = await subscription.get(timeout=1)
+        idle = await subscription.get(timeout=0.05)
+        subscription.close()
+
+        # then
+        self.assertEqual([(u.photo_card_id, u.min_price and u.min_price.id) for u in initial], [(1, 10), (2, None)])
+        self.assertEqual((update.photo_card_id, update.min_price.id), (1, 12))
+        self.assertEqual([trade.record_id for trade in update.trades], [12])
+        # 구독자가 없는 포토카드는 조회하지 않는다.
+        self.assertEqual(self.port.calls - calls, 1)
+        self.assertIsNone(idle)
+
+    async def test_알림을_읽지_않는_구독자는_해지된다(self):
+        # given
+        slow = await self.feed.subscribe([1])
+        fast = await self.feed.subscribe([1])
+        await fast.get(timeout=1)
+
+        # when
+        for record_id in range(20, 24):
+            self.feed.on_sale_registered(self.port.register(1, record_id=record_id, price=1000))
+            await fast.get(timeout=1)
+
+        # then
+        with self.assertRaises(PhotoCardPriceFeedLaggedException):
+            await slow.get(timeout=1)
+        self.assertNotIn(slow, self.feed._subscribers[1])
+        self.assertIn(fast, self.feed._subscribers[1])
@@ -0,0 +1,114 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard
+from poca.application.adapter.spi.persistence.repository.photo_card_repository import PhotoCardRepository
+from poca.application.adapter.spi.storage.local_object_store import LocalObjectStore
+from poca.application.port.api.command.photo_card_command import CreatePhotoCardCommand
+from poca.application.service.photo_card_service import PhotoCardService
+from poca.application.util.background import BackgroundJobRunner
+
+
+class FailingObjectStore(LocalObjectStore):
+    def put(self, key, chunks, content_type=None):
+        raise IOError()
+
+
+class CountingObjectStore(LocalObjectStore):
+    def __init__(self, root):
+        super().__init__(root, base_url='/media/')
+        self.puts = []
+
+    def put(self, key, chunks, content_type=None):
+        self.puts.append(key)
+        return super().put(key, chunks, content_type)
+
+
+class FakeImageDerivatives:
+    def __init__(self):
+        self.rendered = 0
+
+    def names(self):
+        return ['thumbnail', 'preview']
+
+    def extension(self, name):
+        return 'jpg'
+
+    def render(self, source_path, names):
+        self.rendered += 1
+        rendered = {}
+        for name in names:
+            fd, path = tempfile.mkstemp()
+            with os.fdopen(fd, 'wb') as file:
+                file.write(name.encode())
+            rendered[name] = path
+        return rendered
+
+
+class TestPhotoCardService(TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.store = CountingObjectStore(self.root.name)
+        self.derivatives = FakeImageDerivatives()
+        # 테스트에서는 업로드를 요청 스레드에서 바로 처리
+        self.service = PhotoCardService(PhotoCardRepository(), self.store, BackgroundJobRunner(max_workers=0),
+                                        derivatives=self.derivatives)
+
+    def tearDown(self):
+        self.root.cleanup()
+
+    def _register(self, image: bytes, service: PhotoCardService = None) -> int:
+        with self.captureOnCommitCallbacks(execute=True):
+            return (service or self.service).register_new_photo_card(CreatePhotoCardCommand(
+                name='test', description='test', image_chunks=[image[:2], image[2:]]))
+
+    def test_register_new_photo_card_커밋된_이후에_이미지를_해시로_업로드하고_url을_채운다(self):
+        # when
+        with self.captureOnCommitCallbacks() as callbacks:
+            card_id = self.service.register_new_photo_card(CreatePhotoCardCommand(
+                name='test', description='test', image_chunks=[b'ab', b'cd']))
+            # 커밋 전에는 image_url이 비어있다.
+            self.assertIsNone(PhotoCard.objects.get(id=card_id).image_url)
+        for callback in callbacks:
+            callback()
+
+        # then
+        image_hash = hashlib.sha256(b'abcd').hexdigest()
+        card = PhotoCard.objects.get(id=card_id)
+        self.assertEqual(card.image_hash, image_hash)
+        self.assertEqual(card.image_url, f'/media/images/{image_hash}')
+        self.assertEqual(card.thumbnail_url, f'/media/thumbnails/{image_hash}.jpg')
+        self.assertEqual(card.preview_url, f'/media/previews/{image_hash}.jpg')
+        self.assertEqual((Path(self.root.name) / 'images' / image_hash).read_bytes(), b'abcd')
+
+    def test_register_new_photo_card_같은_이미지는_한번만_저장하고_파생_이미지도_한번만_생성한다(self):
+        # given
+        first = self._register(b'abcd')
+
+        # when
+        # 이미 저장된 이미지는 업로드 작업 없이 저장된 url로 등록된다.
+        with self.captureOnCommitCallbacks() as callbacks:
+            second = self.service.register_new_photo_card(CreatePhotoCardCommand(
+                name='test', description='test', image_chunks=[b'abcd']))
+
+        # then
+        self.assertEqual(callbacks, [])
+        self.assertEqual(len(self.store.puts), 3)
+        self.assertEqual(self.derivatives.rendered, 1)
+        first, second = PhotoCard.objects.get(id=first), PhotoCard.objects.get(id=second)
+        self.assertEqual((second.image_url, second.thumbnail_url), (first.image_url, first.thumbnail_url))
+
+    def test_register_new_photo_card_업로드에_실패해도_등록은_유지된다(self):
+        # given
+        service = PhotoCardService(PhotoCardRepository(), FailingObjectStore(self.root.name),
+                                   BackgroundJobRunner(max_workers=0))
+
+        # when
+        card_id = self._register(b'abcd', service)
+
+        # then
+        self.assertIsNone(PhotoCard.objects.get(id=card_id).image_url)
@@ -1,16 +1,21 @@
 import decimal
+import time
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from poca.application.adapter.spi.persistence.entity.user import User
 from poca.application.adapter.spi.persistence.repository.photo_card_repository import PhotoCardRepository
 from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
 from poca.application.adapter.spi.persistence.repository.user_repository import UserRepository
 from poca.application.domain.model.photo_card import OnSaleQueryStrategy, PhotoCardSale, PhotoCardState
-from poca.application.domain.model.photo_card_trade_result import PhotoCardSaleRegisteredResult, NoPhotoCardOnSaleResult
+from poca.application.domain.model.photo_card_trade_result import PhotoCardSaleRegisteredResult, NoPhotoCardOnSaleResult, \
+    PhotoCardTradeProcessedResult, PhotoCardSaleRegisterFailResult, PhotoCardPurchaseNotProcessedResult
 from poca.application.port.api.command.photo_card_command import CreatePhotoCardCommand
 from poca.application.port.api.command.photo_card_trade_command import RegisterPhotoCardOnSaleCommand
 from poca.application.service.photo_card_trade_service import PhotoCardTradeService
+from poca.application.util.contention import ContentionManager
 
 
 class TestPhotoCardTradeService(TestCase):
@@ -40,7 +45,7 @@ class TestPhotoCardTradeService(TestCase):
         card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
             name="test",
             description="test",
-            image_data=b"test"
+            image_chunks=[b"test"]
         ))
 
         # when
@@ -54,12 +59,64 @@ class TestPhotoCardTradeService(TestCase):
         print(result.to_message())
         self.assertIsInstance(result, PhotoCardSaleRegisteredResult)
 
+    def test_register_photo_card_on_sale_bulk_항목별_등록_결과를_반환한다(self):
+        # given
+        card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
+            name="test",
+            description="test",
+            image_chunks=[b"test"]
+        ))
+
+        # when
+        # 존재하지 않는 포토카드는 실패, 수수료 입력이 없다면 수수료 정책(5%) 적용
+        result = self.service.register_photo_card_on_sale_bulk([
+            RegisterPhotoCardOnSaleCommand(card_id=card_id, price=1000, seller_id=self.buyer_1.id, fee=100),
+            RegisterPhotoCardOnSaleCommand(card_id=-1, price=1000, seller_id=self.buyer_1.id, fee=100),
+            RegisterPhotoCardOnSaleCommand(card_id=card_id, price=2000, seller_id=self.buyer_1.id),
+        ])
+
+        # then
+        self.assertEqual([type(r) for r in result.results],
+                         [PhotoCardSaleRegisteredResult, PhotoCardSaleRegisterFailResult, PhotoCardSaleRegisteredResult])
+        record = self.photo_trade_repository.find_sales_record_by_id(result.results[2].record_id)
+        self.assertEqual(record.get_total_price(), decimal.Decimal(2100))
+
+    def test_register_photo_card_on_sale_bulk_한건씩_등록하는_것보다_적은_쿼리로_등록한다(self):
+        # given
+        n = 200
+        card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
+            name="test",
+            description="test",
+            image_chunks=[b"test"]
+        ))
+        commands = [RegisterPhotoCardOnSaleCommand(card_id=card_id, price=1000 + i, seller_id=self.buyer_1.id, fee=100)
+                    for i in range(n)]
+
+        # when
+        with CaptureQueriesContext(connection) as single:
+            started = time.perf_counter()
+            for command in commands:
+                self.service.register_photo_card_on_sale(command)
+            single_elapsed = time.perf_counter() - started
+        with CaptureQueriesContext(connection) as bulk:
+            started = time.perf_counter()
+            result = self.service.register_photo_card_on_sale_bulk(commands)
+            bulk_elapsed = time.perf_counter() - started
+
+        # then
+        print(f'\n[{n} listings] single: {len(single)} queries {n / single_elapsed:.0f} listings/s | '
+              f'bulk: {len(bulk)} queries {n / bulk_elapsed:.0f} listings/s')
+        self.assertTrue(result.is_all_registered())
+        # 포토카드/판매자 확인, 청크별 INSERT, 연관 객체 조회만 수행하므로 등록 건수와 무관하다.
+        self.assertGreaterEqual(len(single), n)
+        self.assertLess(len(bulk), n / 10)
+
     def test_on_sale_photo_card_동일한_판매가_여러건이라면_최소가격만_조회(self):
         # given
         card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
             name="test",
             description="test",
-            image_data=b"test"
+            image_chunks=[b"test"]
         ))
 
         # when
@@ -87,7 +144,7 @@ class TestPhotoCardTradeService(TestCase):
         card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
             name="test",
             description="test",
-            image_data=b"test"
+            image_chunks=[b"test"]
         ))
 
         # when
@@ -124,7 +181,7 @@ class TestPhotoCardTradeService(TestCase):
         card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
             name="test",
             description="test",
-            image_data=b"test"
+            image_chunks=[b"test"]
         ))
 
         # when
@@ -156,7 +213,7 @@ class TestPhotoCardTradeService(TestCase):
         card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
             name="test",
             description="test",
-            image_data=b"test"
+            image_chunks=[b"test"]
         ))
 
         # when
@@ -190,7 +247,7 @@ class TestPhotoCardTradeService(TestCase):
         card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
             name="test",
             description="test",
-            image_data=b"test"
+            image_chunks=[b"test"]
         ))
 
         # when
@@ -220,3 +277,107 @@ class TestPhotoCardTradeService(TestCase):
 
         self.assertEqual(result.record.get_total_price(), decimal.Decimal(1100))
         self.assertIsInstance(result2, NoPhotoCardOnSaleResult)
+
+    def test_buy_min_price_photo_card(self):
+        card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
+            name="test",
+            description="test",
+            image_chunks=[b"test"]
+        ))
+        self.photo_trade_repository.save_photo_card_sale(PhotoCardSale(
+            state=PhotoCardState.ON_SALE.value,
+            price=decimal.Decimal(1000),
+            fee=decimal.Decimal(100),
+            seller_id=self.buyer_1.id,
+            photo_card_id=card_id,
+            renewal_date="2021-01-01"
+        ))
+        cheapest = self.photo_trade_repository.save_photo_card_sale(PhotoCardSale(
+            state=PhotoCardState.ON_SALE.value,
+            price=decimal.Decimal(500),
+            fee=decimal.Decimal(100),
+            seller_id=self.buyer_1.id,
+            photo_card_id=card_id,
+            renewal_date="2021-01-01"
+        ))
+
+        # when
+        # 포토카드 id로 구매하면 가장 저렴한 매물을 구매한다.
+        result = self.service.buy_min_price_photo_card(card_id, self.buyer_2.id)
+
+        # then
+        self.assertIsInstance(result, PhotoCardTradeProcessedResult)
+        self.assertEqual(result.record_id, cheapest.id)
+        self.assertEqual(self.photo_trade_repository.find_sales_record_by_id(cheapest.id).state, PhotoCardState.SOLD)
+
+    def test_buy_min_price_photo_card_잠근_매물의_version이_바뀌었다면_다시_조회하여_재시도한다(self):
+        # given
+        card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
+            name="test",
+            description="test",
+            image_chunks=[b"test"]
+        ))
+        cheapest = self.photo_trade_repository.save_photo_card_sale(PhotoCardSale(
+            state=PhotoCardState.ON_SALE.value,
+            price=decimal.Decimal(500),
+            fee=decimal.Decimal(100),
+            seller_id=self.buyer_1.id,
+            photo_card_id=card_id,
+            renewal_date="2021-01-01"
+        ))
+        claimed_versions = []
+
+        class RacingRepository(PhotoCardSaleRepository):
+            # 행 잠금을 지원하지 않는 DB에서 조회 이후 다른 트랜잭션이 매물을 갱신한 상황
+            def claim_min_price_photo_card_sale(self, card_id):
+                record = super().claim_min_price_photo_card_sale(card_id)
+                claimed_versions.append(record.version)
+                if len(claimed_versions) == 1:
+                    record.version -= 1
+                return record
+
+        repository = RacingRepository()
+        manager = ContentionManager(budget=10, sleep=lambda delay: None)
+        service = PhotoCardTradeService(self.user_repository, self.user_repository, repository, repository, manager)
+
+        # when
+        result = service.buy_min_price_photo_card(card_id, self.buyer_2.id)
+
+        # then
+        self.assertIsInstance(result, PhotoCardTradeProcessedResult)
+        self.assertEqual(result.record_id, cheapest.id)
+        self.assertEqual(len(claimed_versions), 2)
+        self.assertEqual(manager.metrics.totals().conflicts, 1)
+
+    def test_buy_min_price_photo_card_재시도에_실패하면_포토카드_id를_담아_반환한다(self):
+        # given
+        card_id = self.photo_repository.register_new_photo_card(CreatePhotoCardCommand(
+            name="test",
+            description="test",
+            image_chunks=[b"test"]
+        ))
+        self.photo_trade_repository.save_photo_card_sale(PhotoCardSale(
+            state=PhotoCardState.ON_SALE.value,
+            price=decimal.Decimal(500),
+            fee=decimal.Decimal(100),
+            seller_id=self.buyer_1.id,
+            photo_card_id=card_id,
+            renewal_date="2021-01-01"
+        ))
+
+        class ConflictingRepository(PhotoCardSaleRepository):
+            # 매번 다른 트랜잭션이 먼저 매물을 갱신한 상황
+            def claim_min_price_photo_card_sale(self, card_id):
+                record = super().claim_min_price_photo_card_sale(card_id)
+                record.version -= 1
+                return record
+
+        repository = ConflictingRepository()
+        service = PhotoCardTradeService(self.user_repository, self.user_repository, repository, repository,
+                                        ContentionManager(budget=10, sleep=lambda delay: None))
+
+        # when
+        result = service.buy_min_price_photo_card(card_id, self.buyer_2.id)
+
+        # then
+        self.assertEqual(result, PhotoCardPurchaseNotProcessedResult(card_id))
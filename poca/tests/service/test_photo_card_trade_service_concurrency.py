@@ -0,0 +1,80 @@
+import threading
+import time
+import unittest
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils.timezone import now
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard, PhotoCardSale
+from poca.application.adapter.spi.persistence.entity.user import User
+from poca.application.adapter.spi.persistence.repository.photo_card_trade_repository import PhotoCardSaleRepository
+from poca.application.adapter.spi.persistence.repository.user_repository import UserRepository
+from poca.application.domain.model.photo_card import PhotoCardState
+from poca.application.domain.model.photo_card_trade_result import NoPhotoCardOnSaleResult, \
+    PhotoCardTradeProcessedResult
+from poca.application.service.photo_card_trade_service import PhotoCardTradeService
+
+
+@unittest.skipUnless(connection.features.has_select_for_update_skip_locked, 'SKIP LOCKED를 지원하는 DB에서만 수행')
+class TestPhotoCardTradeServiceConcurrentBuyers(TransactionTestCase):
+    """
+    동시에 같은 포토카드의 최저가 매물을 구매하는 N명의 구매자 처리량 비교
+    - 낙관적 경로: 최저가 매물 id를 조회한 뒤 buy_photo_card_on_record, 같은 매물을 노린 구매자는 충돌하여
+      NoPhotoCardOnSaleResult(이미 판매된 매물)를 받는다.
+    - SKIP LOCKED 경로: buy_min_price_photo_card, 구매자마다 서로 다른 매물을 잠가 충돌 없음
+    """
+    buyers = 16
+
+    def setUp(self):
+        user_repository = UserRepository()
+        sale_repository = PhotoCardSaleRepository()
+        self.service = PhotoCardTradeService(user_repository, user_repository, sale_repository, sale_repository)
+
+        seller = User.objects.create(user_email="seller@poca.com")
+        self.buyer_ids = [User.objects.create(user_email=f"buyer{i}@poca.com", balance=100000).id
+                          for i in range(self.buyers)]
+        self.card_id = PhotoCard.objects.create(name='테스트').id
+        PhotoCardSale.objects.bulk_create([
+            PhotoCardSale(seller=seller, photo_card_id=self.card_id, price=1000 + i, fee=100,
+                          renewal_date=now(), state=PhotoCardState.ON_SALE.value)
+            for i in range(self.buyers)
+        ])
+
+    def _run(self, buy) -> tuple:
+        results = []
+        barrier = threading.Barrier(self.buyers)
+
+        def worker(buyer_id):
+            barrier.wait()
+            results.append(buy(buyer_id))
+            connection.close()
+
+        threads = [threading.Thread(target=worker, args=(buyer_id,)) for buyer_id in self.buyer_ids]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        processed = sum(isinstance(r, PhotoCardTradeProcessedResult) for r in results)
+        # 먼저 구매한 구매자에게 밀려 이미 판매된 매물을 구매하려 한 경우
+        lost_races = sum(isinstance(r, NoPhotoCardOnSaleResult) for r in results)
+        return processed, lost_races, elapsed
+
+    def test_skip_locked_경로는_동시_구매자가_충돌없이_서로_다른_매물을_구매한다(self):
+        # when
+        def buy_optimistic(buyer_id):
+            record = self.service.get_min_price_photo_card_on_sale(self.card_id).record
+            return self.service.buy_photo_card_on_record(record.id, buyer_id)
+
+        optimistic = self._run(buy_optimistic)
+        PhotoCardSale.objects.update(state=PhotoCardState.ON_SALE.value, buyer=None, sold_date=None)
+        skip_locked = self._run(lambda buyer_id: self.service.buy_min_price_photo_card(self.card_id, buyer_id))
+
+        # then
+        # 낙관적 경로는 같은 매물을 노린 구매자만큼 구매에 실패하고, SKIP LOCKED 경로는 모두 구매한다.
+        self.assertEqual(optimistic[0] + optimistic[1], self.buyers)
+        self.assertEqual(skip_locked[:2], (self.buyers, 0))
+        self.assertGreaterEqual(skip_locked[0], optimistic[0])
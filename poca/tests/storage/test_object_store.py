@@ -0,0 +1,147 @@
+import importlib.util
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+from unittest import TestCase
+
+from poca.application.adapter.spi.storage.image_derivatives import ImageDerivativePipeline
+from poca.application.adapter.spi.storage.local_object_store import LocalObjectStore
+from poca.application.adapter.spi.storage.s3_object_store import S3ObjectStore
+from poca.application.util.staging import iter_file_chunks, stage_chunks
+
+MB = 1024 * 1024
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.objects = {}
+        self.parts = {}
+        self.aborted = []
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            error = Exception()
+            error.response = {'Error': {'Code': '404'}}
+            raise error
+        return {}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[Key] = Body
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        self.parts[Key] = []
+        return {'UploadId': Key}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.parts[Key].append(Body)
+        return {'ETag': f'etag-{PartNumber}'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.objects[Key] = b''.join(self.parts.pop(Key))
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.append(Key)
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+
+def _chunks(size: int, chunk_size: int = 256 * 1024):
+    for offset in range(0, size, chunk_size):
+        yield b'x' * min(chunk_size, size - offset)
+
+
+class TestLocalObjectStore(TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.store = LocalObjectStore(self.root.name, base_url='/media/')
+
+    def tearDown(self):
+        self.root.cleanup()
+
+    def test_put_청크를_이어서_저장하고_url을_반환한다(self):
+        url = self.store.put('1', [b'ab', b'cd'])
+
+        self.assertEqual(url, '/media/1')
+        self.assertEqual((Path(self.root.name) / '1').read_bytes(), b'abcd')
+
+    def test_put_저장소_밖의_key는_허용하지_않는다(self):
+        with self.assertRaises(ValueError):
+            self.store.put('../1', [b'ab'])
+
+    def test_put_파일_크기와_무관하게_청크_크기만큼의_메모리만_사용한다(self):
+        # given
+        # 8MB 업로드를 256KB 청크로 임시 파일에 옮긴 뒤 저장소에 저장
+        tracemalloc.start()
+
+        # when
+        staged = stage_chunks(_chunks(8 * MB))
+        try:
+            self.store.put('1', iter_file_chunks(staged.path))
+        finally:
+            staged.unlink()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # then
+        self.assertEqual((Path(self.root.name) / '1').stat().st_size, 8 * MB)
+        self.assertLess(peak, 2 * MB)
+
+
+class TestS3ObjectStore(TestCase):
+    def setUp(self):
+        self.client = FakeS3Client()
+        self.store = S3ObjectStore('bucket', region='ap-northeast-2', prefix='photo-cards',
+                                   part_size=S3ObjectStore.MIN_PART_SIZE, client=self.client)
+
+    def test_put_part_크기보다_작으면_한번에_업로드한다(self):
+        url = self.store.put('1', [b'ab', b'cd'])
+
+        self.assertEqual(url, 'https://bucket.s3.ap-northeast-2.amazonaws.com/photo-cards/1')
+        self.assertEqual(self.client.objects['photo-cards/1'], b'abcd')
+
+    def test_put_part_크기_단위로_multipart_업로드한다(self):
+        self.store.put('1', _chunks(12 * MB))
+
+        self.assertEqual(len(self.client.objects['photo-cards/1']), 12 * MB)
+
+    def test_put_업로드_중_실패하면_multipart_업로드를_취소한다(self):
+        def failing():
+            yield from _chunks(6 * MB)
+            raise IOError()
+
+        with self.assertRaises(IOError):
+            self.store.put('1', failing())
+
+        self.assertEqual(self.client.aborted, ['photo-cards/1'])
+        self.assertNotIn('photo-cards/1', self.client.objects)
+
+
+class TestImageDerivativePipeline(TestCase):
+    def test_render_Pillow가_없다면_파생_이미지를_생성하지_않는다(self):
+        pipeline = ImageDerivativePipeline(max_workers=0)
+        pipeline._available = False
+
+        self.assertEqual(pipeline.render('missing.png', pipeline.names()), {})
+
+    @unittest.skipUnless(importlib.util.find_spec('PIL'), 'Pillow가 설치된 환경에서만 수행')
+    def test_render_규격_크기_안으로_축소한다(self):
+        from PIL import Image
+
+        # given
+        with tempfile.NamedTemporaryFile(suffix='.png') as source:
+            Image.new('RGB', (1000, 1500), 'red').save(source, 'PNG')
+            source.flush()
+
+            # when
+            rendered = ImageDerivativePipeline(max_workers=0).render(source.name, ['thumbnail', 'preview'])
+
+        # then
+        try:
+            with Image.open(rendered['thumbnail']) as thumbnail, Image.open(rendered['preview']) as preview:
+                self.assertEqual(thumbnail.size, (160, 240))
+                self.assertEqual(preview.size, (480, 720))
+        finally:
+            for path in rendered.values():
+                Path(path).unlink()
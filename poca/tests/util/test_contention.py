@@ -0,0 +1,96 @@
+import asyncio
+from unittest import TestCase
+
+from poca.application.util.contention import BackoffPolicy, ConflictMetrics, ContentionManager, HotRecordDetector, \
+    deadline_scope
+from poca.application.util.transactional import MaxRetriesExceededException, OptimisticLockException
+
+
+class ConflictingFunction:
+    def __init__(self, conflicts: int):
+        self.conflicts = conflicts
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.conflicts:
+            raise OptimisticLockException('version mismatch')
+        return 'ok'
+
+
+class TestBackoffPolicy(TestCase):
+    def test_delay_대기시간은_cap을_넘지_않는다(self):
+        policy = BackoffPolicy(base=0.01, cap=0.05, multiplier=2)
+
+        self.assertEqual(policy.delay(0, rand=lambda: 1.0), 0.01)
+        self.assertEqual(policy.delay(10, rand=lambda: 1.0), 0.05)
+
+
+class TestContentionManager(TestCase):
+    def setUp(self):
+        self.waits = []
+        self.manager = ContentionManager(max_attempts=3, budget=10, sleep=self.waits.append)
+
+    def test_run_충돌이_해소되면_결과를_반환하고_지표를_남긴다(self):
+        # when
+        result = self.manager.run('record:1', ConflictingFunction(conflicts=2))
+
+        # then
+        stats = self.manager.metrics.snapshot()['record:1']
+        self.assertEqual(result, 'ok')
+        self.assertEqual((stats.attempts, stats.conflicts, stats.waits, stats.give_ups), (3, 2, 2, 0))
+        self.assertEqual(len(self.waits), 2)
+
+    def test_run_최대_시도_횟수를_넘으면_포기한다(self):
+        with self.assertRaises(MaxRetriesExceededException):
+            self.manager.run('record:1', ConflictingFunction(conflicts=3))
+
+        self.assertEqual(self.manager.metrics.snapshot()['record:1'].give_ups, 1)
+
+    def test_run_hot_레코드는_대기하지_않고_바로_포기한다(self):
+        # given
+        manager = ContentionManager(max_attempts=10, budget=10, sleep=self.waits.append,
+                                    detector=HotRecordDetector(threshold=1))
+
+        # when
+        with self.assertRaises(MaxRetriesExceededException):
+            manager.run('record:1', ConflictingFunction(conflicts=1))
+
+        # then
+        self.assertEqual(self.waits, [])
+
+    def test_run_요청_예산이_소진되면_대기하지_않고_포기한다(self):
+        with deadline_scope(0), self.assertRaises(MaxRetriesExceededException):
+            self.manager.run('record:1', ConflictingFunction(conflicts=1))
+
+        self.assertEqual(self.waits, [])
+
+    def test_arun_코루틴_함수도_재시도한다(self):
+        # given
+        manager = ContentionManager(policy=BackoffPolicy(base=0.001, cap=0.001), budget=10)
+        conflicting = ConflictingFunction(conflicts=1)
+
+        async def update():
+            return conflicting()
+
+        # when
+        result = asyncio.run(manager.arun('record:1', update))
+
+        # then
+        self.assertEqual(result, 'ok')
+        self.assertEqual(conflicting.calls, 2)
+
+    def test_metrics_레코드별_지표가_삭제되어도_합계는_유지된다(self):
+        # given
+        manager = ContentionManager(max_attempts=3, budget=10, sleep=self.waits.append,
+                                    metrics=ConflictMetrics(max_records=1))
+
+        # when
+        manager.run('record:1', ConflictingFunction(conflicts=1))
+        manager.run('record:2', ConflictingFunction(conflicts=2))
+
+        # then
+        totals = manager.metrics.totals()
+        self.assertEqual(list(manager.metrics.snapshot()), ['record:2'])
+        self.assertEqual((totals.attempts, totals.conflicts, totals.waits, totals.give_ups), (5, 3, 3, 0))
+        self.assertEqual(manager.metrics.most_conflicted(1)[0][0], 'record:2')
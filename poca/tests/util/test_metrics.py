@@ -0,0 +1,158 @@
+from unittest import TestCase
+
+from poca.application.adapter.spi.cache.cache_backend import LocalLRUCacheBackend
+from poca.application.adapter.spi.metrics.cache_metrics import CacheMetrics
+from poca.application.adapter.spi.metrics.contention_metrics import ContentionMetrics
+from poca.application.adapter.spi.metrics.trade_metrics import instrumented_port, instrumented_use_case
+from poca.application.adapter.spi.persistence.db_pool_metrics import queue_pool_stats
+from poca.application.domain.model.photo_card_trade_result import NoPhotoCardOnSaleResult, \
+    PhotoCardTradeNotProcessedResult, PhotoCardTradeProcessedResult
+from poca.application.port.api.photo_card_trade_use_case import PhotoCardTradeUseCase
+from poca.application.port.spi.repository.user.find_user_port import FindUserPort
+from poca.application.util.contention import ContentionManager
+from poca.application.util.metrics import MetricsRegistry
+from poca.application.util.transactional import OptimisticLockException
+
+
+class _UseCase:
+    def __init__(self, results):
+        self.results = iter(results)
+
+    def buy_photo_card_on_record(self, record_id, buyer_id):
+        return next(self.results)
+
+    def get_min_price_photo_card_on_sale(self, card_id):
+        raise RuntimeError('조회 실패')
+
+
+class TestMetricsRegistry(TestCase):
+    def test_prometheus_text_format(self):
+        # given
+        registry = MetricsRegistry()
+        registry.counter('poca_test', '테스트 "카운터"', ('kind',)).labels('a"b').inc(2)
+        histogram = registry.histogram('poca_test_seconds', '테스트', ('method',), buckets=(0.1, 1))
+        histogram.labels('get').observe(0.05)
+        histogram.labels('get').observe(0.5)
+        histogram.labels('get').observe(5)
+        registry.gauge('poca_test_pool', '테스트', ('alias',), lambda: [(('default',), 3)])
+
+        # when
+        lines = registry.expose().splitlines()
+
+        # then
+        self.assertIn('# TYPE poca_test counter', lines)
+        self.assertIn('poca_test_total{kind="a\\"b"} 2', lines)
+        self.assertIn('# TYPE poca_test_seconds histogram', lines)
+        self.assertIn('poca_test_seconds_bucket{method="get",le="0.1"} 1', lines)
+        self.assertIn('poca_test_seconds_bucket{method="get",le="1"} 2', lines)
+        self.assertIn('poca_test_seconds_bucket{method="get",le="+Inf"} 3', lines)
+        self.assertIn('poca_test_seconds_count{method="get"} 3', lines)
+        self.assertIn('poca_test_seconds_sum{method="get"} 5.55', lines)
+        self.assertIn('poca_test_pool{alias="default"} 3', lines)
+
+    def test_같은_이름의_다른_메트릭은_등록할_수_없다(self):
+        registry = MetricsRegistry()
+        self.assertIs(registry.counter('poca_test', '', ('kind',)), registry.counter('poca_test', '', ('kind',)))
+        with self.assertRaises(ValueError):
+            registry.histogram('poca_test', '', ('kind',))
+
+
+class TestInstrument(TestCase):
+    def test_유즈케이스_메서드별_지연시간과_결과_타입별_횟수를_기록한다(self):
+        # given
+        registry = MetricsRegistry()
+        use_case = instrumented_use_case(_UseCase([
+            PhotoCardTradeProcessedResult(1), PhotoCardTradeNotProcessedResult(1), PhotoCardTradeNotProcessedResult(1),
+            NoPhotoCardOnSaleResult(1),
+        ]), PhotoCardTradeUseCase, registry)
+
+        # when
+        results = [use_case.buy_photo_card_on_record(1, 2) for _ in range(4)]
+        with self.assertRaises(RuntimeError):
+            use_case.get_min_price_photo_card_on_sale(1)
+
+        # then
+        self.assertIn(PhotoCardTradeUseCase, type(use_case).__mro__)
+        self.assertIsInstance(results[0], PhotoCardTradeProcessedResult)
+        lines = registry.expose().splitlines()
+        self.assertIn('poca_use_case_duration_seconds_count'
+                      '{component="PhotoCardTradeUseCase",method="buy_photo_card_on_record"} 4', lines)
+        self.assertIn('poca_use_case_duration_seconds_count'
+                      '{component="PhotoCardTradeUseCase",method="get_min_price_photo_card_on_sale"} 1', lines)
+        self.assertIn('poca_use_case_results_total{component="PhotoCardTradeUseCase",'
+                      'method="buy_photo_card_on_record",result="PhotoCardTradeNotProcessedResult"} 2', lines)
+        self.assertIn('poca_use_case_results_total{component="PhotoCardTradeUseCase",'
+                      'method="buy_photo_card_on_record",result="PhotoCardTradeProcessedResult"} 1', lines)
+
+    def test_포트에_없는_속성은_계측하지_않고_전달한다(self):
+        class UserRepository:
+            principal_cache = 'cache'
+
+            def get_user_by_user_id(self, user_id):
+                return user_id
+
+        registry = MetricsRegistry()
+        port = instrumented_port(UserRepository(), FindUserPort, registry)
+
+        self.assertEqual(port.get_user_by_user_id(3), 3)
+        self.assertEqual(port.principal_cache, 'cache')
+        self.assertIn('poca_port_duration_seconds_count{component="FindUserPort",method="get_user_by_user_id"} 1',
+                      registry.expose().splitlines())
+
+
+class TestContentionMetrics(TestCase):
+    def test_낙관적_락_충돌_지표를_노출한다(self):
+        # given
+        registry = MetricsRegistry()
+        manager = ContentionManager(budget=10, sleep=lambda delay: None)
+        ContentionMetrics(registry, manager)
+        calls = []
+
+        def update():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OptimisticLockException('version mismatch')
+
+        # when
+        manager.run('photo_card:1', update)
+
+        # then
+        lines = registry.expose().splitlines()
+        self.assertIn('poca_optimistic_lock_events{event="attempt"} 2', lines)
+        self.assertIn('poca_optimistic_lock_events{event="conflict"} 1', lines)
+        self.assertIn('poca_optimistic_lock_record_conflicts{key="photo_card:1"} 1', lines)
+
+
+class TestCacheMetrics(TestCase):
+    def test_캐시별_적중률을_노출한다(self):
+        # given
+        registry = MetricsRegistry()
+        backend = LocalLRUCacheBackend(max_entries=1)
+        CacheMetrics(registry, {'principal': backend})
+
+        # when
+        backend.set('a', 1)
+        backend.get('a')
+        backend.set('b', 2)
+        backend.get('a')
+
+        # then
+        lines = registry.expose().splitlines()
+        self.assertIn('poca_cache_hit_ratio{cache="principal"} 0.5', lines)
+        self.assertIn('poca_cache_events{cache="principal",event="miss"} 1', lines)
+        self.assertIn('poca_cache_events{cache="principal",event="eviction"} 1', lines)
+
+
+class TestDatabasePoolMetrics(TestCase):
+    def test_queue_pool_stats(self):
+        class QueuePool:
+            def checkedout(self):
+                return 3
+
+            def checkedin(self):
+                return 2
+
+            def overflow(self):
+                return -5
+
+        self.assertEqual(queue_pool_stats(QueuePool()), {'size': 5, 'checked_out': 3, 'idle': 2, 'overflow': 0})
@@ -0,0 +1,37 @@
+from django.test import TestCase
+
+from poca.application.adapter.spi.persistence.entity.photo_card import PhotoCard
+from poca.application.util.query_profile import profile_queries, query_shape
+
+
+class TestQueryProfile(TestCase):
+    def test_query_shape는_리터럴과_IN_목록을_제외한다(self):
+        self.assertEqual(
+            query_shape('SELECT * FROM "t"  WHERE "t"."id" IN (%s, %s, %s)\n AND "name" = \'a\' LIMIT 21'),
+            query_shape('SELECT * FROM "t" WHERE "t"."id" IN (%s) AND "name" = \'b\' LIMIT 1'),
+        )
+
+    def test_같은_형태의_쿼리_반복을_집계한다(self):
+        card_ids = [PhotoCard.objects.create(name=f'테스트 {i}').id for i in range(3)]
+
+        # when
+        with profile_queries() as profile:
+            for card_id in card_ids:
+                PhotoCard.objects.get(id=card_id)
+            list(PhotoCard.objects.filter(id__in=card_ids))
+
+        # then
+        self.assertEqual(profile.count, 4)
+        self.assertEqual(len(profile.duplicates()), 1)
+        self.assertEqual(profile.duplicates()[0][1], 3)
+        self.assertGreaterEqual(profile.slowest_duration, 0)
+        self.assertIsNotNone(profile.slowest_sql)
+
+    def test_중첩된_계측은_바깥_계측에도_기록한다(self):
+        with profile_queries() as outer:
+            PhotoCard.objects.count()
+            with profile_queries() as inner:
+                PhotoCard.objects.count()
+
+        self.assertEqual(outer.count, 2)
+        self.assertEqual(inner.count, 1)
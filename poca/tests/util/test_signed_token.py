@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from django.test import TestCase as DatabaseTestCase
+
+from poca.application.adapter.spi.cache.token_revocation_list import TokenRevocationList
+from poca.application.adapter.spi.persistence.repository.revoked_token_repository import RevokedTokenRepository
+from poca.application.util.signed_token import InvalidTokenException, TokenSigner, TokenType
+
+
+class TestTokenSigner(TestCase):
+    def setUp(self):
+        self.now = 1000
+        self.signer = TokenSigner({'k1': 'secret-1'}, 'k1', access_ttl=60, clock=lambda: self.now)
+
+    def test_verify_발급한_토큰을_검증한다(self):
+        token, issued = self.signer.issue(7, TokenType.ACCESS)
+
+        self.assertEqual(self.signer.verify(token, TokenType.ACCESS), issued)
+        self.assertEqual((issued.user_id, issued.expires_at), (7, 1060))
+
+    def test_verify_변조_만료_다른_종류의_토큰은_검증하지_않는다(self):
+        token, _ = self.signer.issue(7, TokenType.ACCESS)
+        version, kid, payload, signature = token.split('.')
+        other, _ = self.signer.issue(8, TokenType.ACCESS)
+
+        invalid = [
+            (f'{version}.{kid}.{other.split(".")[2]}.{signature}', TokenType.ACCESS),
+            ('not-a-token', TokenType.ACCESS),
+            (token, TokenType.REFRESH),
+        ]
+        for candidate, token_type in invalid:
+            with self.assertRaises(InvalidTokenException):
+                self.signer.verify(candidate, token_type)
+
+        self.now = 1060
+        with self.assertRaises(InvalidTokenException):
+            self.signer.verify(token, TokenType.ACCESS)
+
+    def test_키를_교체해도_이전_키로_서명된_토큰은_제거될_때까지_검증한다(self):
+        token, _ = self.signer.issue(7, TokenType.ACCESS)
+
+        rotated = TokenSigner({'k1': 'secret-1', 'k2': 'secret-2'}, 'k2', clock=lambda: self.now)
+        removed = TokenSigner({'k2': 'secret-2'}, 'k2', clock=lambda: self.now)
+
+        self.assertEqual(rotated.verify(token, TokenType.ACCESS).user_id, 7)
+        self.assertTrue(rotated.issue(7, TokenType.ACCESS)[0].startswith('v1.k2.'))
+        with self.assertRaises(InvalidTokenException):
+            removed.verify(token, TokenType.ACCESS)
+
+
+class TestTokenRevocationList(DatabaseTestCase):
+    def setUp(self):
+        self.now = 1000
+        self.repository = RevokedTokenRepository()
+        self.revocation_list = self._new_process()
+
+    def _new_process(self) -> TokenRevocationList:
+        return TokenRevocationList(self.repository, self.repository, clock=lambda: self.now)
+
+    def test_revoke_한번만_폐기되고_다른_프로세스의_폐기도_DB로_확인한다(self):
+        other_process = self._new_process()
+
+        self.assertTrue(self.revocation_list.revoke('a', 2000))
+        self.assertFalse(other_process.revoke('a', 2000))
+        self.assertFalse(self._new_process().is_revoked_locally('a'))
+        self.assertTrue(self._new_process().is_revoked('a'))
+
+    def test_만료된_토큰만_DB에서_삭제한다(self):
+        self.revocation_list.revoke('a', 1100)
+        self.revocation_list.revoke('b', 3000)
+
+        self.assertEqual(self.repository.delete_expired_revoked_tokens(1100), 1)
+        self.assertIsNone(self.repository.find_revoked_token_expires_at('a'))
+        self.assertEqual(self.repository.find_revoked_token_expires_at('b'), 3000)
+
+    def test_만료된_토큰은_메모리에서_제거한다(self):
+        self.revocation_list.revoke('a', 1100)
+        self.revocation_list.revoke('b', 3000)
+
+        self.now = 1100
+        self.revocation_list.revoke('c', 3000)
+
+        self.assertEqual(len(self.revocation_list), 2)
+        self.assertFalse(self.revocation_list.is_revoked_locally('a'))
@@ -1,19 +1,42 @@
 from django.urls import path
 
-from poca.application.adapter.api.http import user_views, photo_card_views, photo_card_trade_views
+from poca.application.adapter.api.http import user_views, photo_card_views, photo_card_trade_views, \
+    async_photo_card_trade_views
 
 urlpatterns = [
     # auth user views
     path('auth', user_views.login_view, name='login'),
     path('auth/register', user_views.register_view, name='register'),
+    path('auth/token', user_views.token_view, name='token'),
+    path('auth/token/refresh', user_views.token_refresh_view, name='token_refresh'),
+    path('auth/token/revoke', user_views.token_revoke_view, name='token_revoke'),
 
     # photo card views
     path('cards', photo_card_views.PhotoCardAPIView.as_view(), name='photo_card_view'),
+    path('cards/search', photo_card_views.PhotoCardSearchAPIView.as_view(), name='photo_card_search_view'),
+    path('cards/<int:card_id>/candles', photo_card_trade_views.PhotoCardPriceCandleAPIView.as_view(),
+         name='photo_card_price_candle_view'),
     path('sales', photo_card_trade_views.PhotoCardTradeAPIView.as_view(), name='photo_card_trade_view'),
+    path('sales/bulk', photo_card_trade_views.PhotoCardTradeBulkAPIView.as_view(), name='photo_card_trade_bulk_view'),
     path('sales/<int:card_id>', photo_card_trade_views.PhotoCardDetailAPIView.as_view(),
          name='photo_card_trade_detail_view'),
     path('sales/min_price/<int:card_id>', photo_card_trade_views.PhotoCardMinPriceAPIView.as_view(),
          name='min_price_photo_card_trade_view'),
     path('purchase', photo_card_trade_views.PhotoCardPurchaseItemAPIView.as_view(),
          name='purchase_photo_card_trade_view'),
+    path('purchase/best', photo_card_trade_views.PhotoCardPurchaseBestItemAPIView.as_view(),
+         name='purchase_best_photo_card_trade_view'),
+    path('purchase/checkout', photo_card_trade_views.PhotoCardCheckoutAPIView.as_view(),
+         name='checkout_photo_card_trade_view'),
+    path('bids', photo_card_trade_views.PhotoCardBidAPIView.as_view(), name='photo_card_bid_view'),
+
+    # async(ASGI) 조회 경로, 응답 형식은 동기 경로와 같다.
+    path('async/sales', async_photo_card_trade_views.AsyncPhotoCardTradeView.as_view(),
+         name='async_photo_card_trade_view'),
+    path('async/sales/<int:card_id>', async_photo_card_trade_views.AsyncPhotoCardDetailView.as_view(),
+         name='async_photo_card_trade_detail_view'),
+    path('async/sales/min_price/<int:card_id>', async_photo_card_trade_views.AsyncPhotoCardMinPriceView.as_view(),
+         name='async_min_price_photo_card_trade_view'),
+    path('async/sales/feed', async_photo_card_trade_views.AsyncPhotoCardPriceFeedView.as_view(),
+         name='async_photo_card_price_feed_view'),
 ]